@@ -2,72 +2,51 @@
 """
 Cache Manager for LLM Discoveries
 
-This utility helps manage the persistent cache of LLM university discoveries.
+This utility helps manage the persistent cache of LLM university discoveries
+(see lynnapse.core.llm_discovery_cache).
 """
 
-import asyncio
-import json
 import time
 from pathlib import Path
 from typing import List, Dict, Any
 import argparse
 
+from lynnapse.core.llm_discovery_cache import get_llm_discovery_cache
+
 def list_cached_discoveries() -> List[Dict[str, Any]]:
     """List all cached discoveries."""
-    cache_dir = Path("cache/llm_discoveries")
-    
-    if not cache_dir.exists():
-        print("📂 No cache directory found.")
-        return []
-    
+    now = time.time()
     discoveries = []
-    for cache_file in cache_dir.glob("*.json"):
-        try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            
-            # Calculate age
-            discovery_time = data.get('discovery_timestamp', 0)
-            age_hours = (time.time() - discovery_time) / 3600 if discovery_time else 0
-            
-            discoveries.append({
-                'cache_key': cache_file.stem,
-                'file_name': cache_file.name,
-                'discovery_date': time.strftime('%Y-%m-%d %H:%M:%S', 
-                                               time.localtime(discovery_time)) if discovery_time else 'Unknown',
-                'age_hours': age_hours,
-                'faculty_paths': data.get('faculty_directory_paths', []),
-                'department_paths': data.get('department_paths', []),
-                'confidence': data.get('confidence_score', 0),
-                'cost': data.get('cost_estimate', 0),
-                'reasoning': data.get('reasoning', 'No reasoning provided')
-            })
-        except Exception as e:
-            print(f"⚠️  Failed to read cache file {cache_file}: {e}")
-    
-    return sorted(discoveries, key=lambda x: x['age_hours'])
+    for entry in get_llm_discovery_cache().list_entries():
+        discovery_time = entry['discovery_timestamp']
+        discoveries.append({
+            'cache_key': entry['cache_key'],
+            'discovery_date': time.strftime('%Y-%m-%d %H:%M:%S', 
+                                           time.localtime(discovery_time)) if discovery_time else 'Unknown',
+            'age_hours': (now - discovery_time) / 3600 if discovery_time else 0,
+            'faculty_paths': entry['faculty_directory_paths'],
+            'department_paths': entry['department_paths'],
+            'confidence': entry['confidence_score'],
+            'cost': entry['cost_estimate'],
+            'reasoning': entry['reasoning'] or 'No reasoning provided'
+        })
+    
+    return discoveries
 
 def show_cache_summary():
     """Show a summary of cached discoveries."""
-    discoveries = list_cached_discoveries()
+    summary = get_llm_discovery_cache().get_summary(fresh_hours=24.0)
     
-    if not discoveries:
+    if not summary['total_entries']:
         print("📂 No cached discoveries found.")
         return
     
     print(f"📊 CACHE SUMMARY")
     print("=" * 50)
-    print(f"Total cached discoveries: {len(discoveries)}")
-    
-    total_cost = sum(d['cost'] for d in discoveries)
-    print(f"Total LLM cost saved: ${total_cost:.4f}")
-    
-    # Group by age
-    fresh = len([d for d in discoveries if d['age_hours'] < 24])
-    old = len([d for d in discoveries if d['age_hours'] >= 24])
-    
-    print(f"Fresh (< 24h): {fresh}")
-    print(f"Old (>= 24h): {old}")
+    print(f"Total cached discoveries: {summary['total_entries']}")
+    print(f"Total LLM cost saved: ${summary['total_cost']:.4f}")
+    print(f"Fresh (< 24h): {summary['fresh_entries']}")
+    print(f"Old (>= 24h): {summary['old_entries']}")
     print()
 
 def show_cache_details():
@@ -95,14 +74,7 @@ def show_cache_details():
 
 def clean_expired_cache(hours: float = 24.0):
     """Clean expired cache entries."""
-    cache_dir = Path("cache/llm_discoveries")
-    
-    if not cache_dir.exists():
-        print("📂 No cache directory found.")
-        return
-    
-    discoveries = list_cached_discoveries()
-    expired = [d for d in discoveries if d['age_hours'] >= hours]
+    expired = get_llm_discovery_cache().delete_expired(max_age=hours * 3600)
     
     if not expired:
         print(f"🧹 No expired cache entries found (older than {hours} hours).")
@@ -112,48 +84,42 @@ def clean_expired_cache(hours: float = 24.0):
     print(f"Found {len(expired)} expired entries (older than {hours} hours):")
     
     for discovery in expired:
-        cache_file = cache_dir / discovery['file_name']
-        try:
-            cache_file.unlink()
-            print(f"   ✅ Deleted: {discovery['cache_key']} (age: {discovery['age_hours']:.1f}h)")
-        except Exception as e:
-            print(f"   ❌ Failed to delete {discovery['cache_key']}: {e}")
+        print(f"   ✅ Deleted: {discovery['cache_key']} (age: {discovery['age_hours']:.1f}h)")
     
     print(f"\n🧹 Cleanup complete!")
 
 def clean_all_cache():
     """Clean all cache entries."""
-    cache_dir = Path("cache/llm_discoveries")
-    
-    if not cache_dir.exists():
-        print("📂 No cache directory found.")
-        return
-    
-    cache_files = list(cache_dir.glob("*.json"))
+    removed = get_llm_discovery_cache().clear()
     
-    if not cache_files:
-        print("🧹 No cache files found.")
+    if not removed:
+        print("🧹 No cache entries found.")
         return
     
     print(f"🧹 CLEANING ALL CACHE")
-    print(f"Found {len(cache_files)} cache files:")
+    print(f"   ✅ Deleted {removed} cache entries")
+    print(f"\n🧹 All cache cleared!")
+
+def import_json_cache(source: str):
+    """Import JSON cache files written by earlier versions."""
+    source_dir = Path(source)
     
-    for cache_file in cache_files:
-        try:
-            cache_file.unlink()
-            print(f"   ✅ Deleted: {cache_file.name}")
-        except Exception as e:
-            print(f"   ❌ Failed to delete {cache_file.name}: {e}")
+    if not source_dir.is_dir():
+        print(f"📂 No cache directory found at {source_dir}.")
+        return
     
-    print(f"\n🧹 All cache cleared!")
+    imported = get_llm_discovery_cache().import_json_dir(source_dir)
+    print(f"📥 Imported {imported} cached discoveries from {source_dir}")
 
 def main():
     """Main CLI interface."""
     parser = argparse.ArgumentParser(description="Manage LLM discovery cache")
-    parser.add_argument('action', choices=['list', 'summary', 'clean', 'clean-all'], 
+    parser.add_argument('action', choices=['list', 'summary', 'clean', 'clean-all', 'import'], 
                        help='Action to perform')
     parser.add_argument('--hours', type=float, default=24.0,
                        help='Hours threshold for cleaning expired cache (default: 24)')
+    parser.add_argument('--source', default='cache/llm_discoveries',
+                       help='Directory of JSON cache files to import (default: cache/llm_discoveries)')
     
     args = parser.parse_args()
     
@@ -163,6 +129,8 @@ def main():
         show_cache_summary()
     elif args.action == 'clean':
         clean_expired_cache(args.hours)
+    elif args.action == 'import':
+        import_json_cache(args.source)
     elif args.action == 'clean-all':
         response = input("⚠️  Are you sure you want to delete ALL cached discoveries? (y/N): ")
         if response.lower() == 'y':
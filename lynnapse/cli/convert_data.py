@@ -29,6 +29,8 @@ from rich import box
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from lynnapse.core.data_manager import AcademicDataManager
+from lynnapse.core.academic_store import AcademicStore
+from lynnapse.core.record_stream import read_records, RecordDecodeError
 
 console = Console()
 
@@ -193,9 +195,14 @@ def display_sample_aggregated_view(view_data: Dict[str, Any], title: str):
     console.print(view_tree)
 
 
-def save_converted_data(data_manager: AcademicDataManager, output_dir: str) -> Dict[str, str]:
+def save_converted_data(data_manager: AcademicDataManager, output_dir: str,
+                        export_format: str = "json") -> Dict[str, str]:
     """Save all converted data in the new format."""
     
+    if export_format != "json":
+        # Columnar tables already cover entities, associations and enrichments
+        return data_manager.export_columnar(output_dir, format=export_format)
+    
     # Export aggregated views for LLM processing
     export_paths = data_manager.export_aggregated_views(output_dir)
     
@@ -249,47 +256,62 @@ def save_converted_data(data_manager: AcademicDataManager, output_dir: str) -> D
 
 
 async def run_data_conversion(input_file: str, output_dir: str = "converted_data", 
-                            verbose: bool = False, show_samples: bool = False) -> bool:
+                            verbose: bool = False, show_samples: bool = False,
+                            export_format: str = "json",
+                            store_path: Optional[str] = None, skip: int = 0,
+                            batch_size: int = 1000, resume: bool = False) -> bool:
     """
     Run the data architecture conversion.
     
     Args:
-        input_file: Legacy faculty data JSON file
+        input_file: Legacy faculty data JSON or JSONL file
         output_dir: Output directory for converted data
         verbose: Show detailed progress
         show_samples: Show sample aggregated views
+        export_format: ``json``, ``parquet`` or ``arrow``
+        store_path: SQLite store to ingest into incrementally; the export
+            then covers everything stored so far
+        skip: Number of leading input records to skip
+        batch_size: Records committed to the store per transaction
+        resume: Continue the last interrupted ``store_path`` ingest of
+            ``input_file`` after its committed records
         
     Returns:
         True if successful, False otherwise
     """
     
     try:
-        # Load legacy data
-        console.print(f"📂 [bold]Loading legacy data from:[/bold] {input_file}")
+        if resume and not store_path:
+            console.print("❌ [red]--resume requires --store[/red]")
+            return False
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        console.print(f"📂 [bold]Reading legacy data from:[/bold] {input_file}")
         
-        # Extract faculty list from various possible structures
-        if isinstance(data, dict):
-            faculty_list = (
-                data.get('faculty') or 
-                data.get('enhanced_faculty') or 
-                data.get('processed_faculty') or
-                data.get('results') or
-                []
-            )
+        # Initialize data manager
+        if store_path:
+            console.print(f"🗄️ Using persistent store: {store_path}")
+            data_manager = AcademicDataManager(store=AcademicStore(store_path))
         else:
-            faculty_list = data
+            data_manager = AcademicDataManager()
         
-        if not faculty_list:
-            console.print("❌ [red]No faculty data found in input file[/red]")
-            return False
+        source = str(Path(input_file).resolve())
+        scrape_session_id = f"conversion_{uuid.uuid4().hex[:8]}"
+        if resume:
+            interrupted = data_manager.find_interrupted_session(source)
+            if interrupted:
+                scrape_session_id, skip = interrupted
+                console.print(f"↩️ Resuming {scrape_session_id} after {skip} committed records")
+            else:
+                console.print("ℹ️ No interrupted ingest of this file in the store; starting from the beginning")
         
-        console.print(f"👥 Found {len(faculty_list)} faculty members in legacy format")
+        # Records are streamed into the data manager instead of loaded up front
+        records_read = 0
         
-        # Initialize data manager
-        data_manager = AcademicDataManager()
+        def legacy_records():
+            nonlocal records_read
+            for record in read_records(input_file, skip=skip):
+                records_read += 1
+                yield record
         
         # Show architecture benefits
         display_architecture_benefits()
@@ -305,12 +327,21 @@ async def run_data_conversion(input_file: str, output_dir: str = "converted_data
         ) as progress:
             
             # Step 1: Convert legacy data to entities
-            task1 = progress.add_task("🔄 Converting to ID-based entities...", total=len(faculty_list))
+            task1 = progress.add_task("🔄 Converting to ID-based entities...", total=None)
             
-            scrape_session_id = f"conversion_{uuid.uuid4().hex[:8]}"
-            conversion_report = data_manager.ingest_legacy_faculty_data(faculty_list, scrape_session_id)
+            conversion_report = data_manager.ingest_legacy_faculty_data(
+                legacy_records(), scrape_session_id,
+                batch_size=batch_size if store_path else None,
+                source=source, start_offset=skip
+            )
             
-            progress.update(task1, completed=len(faculty_list))
+            progress.update(task1, total=records_read, completed=records_read)
+            
+            if not records_read and not skip:
+                console.print("❌ [red]No faculty data found in input file[/red]")
+                return False
+            
+            console.print(f"👥 Converted {records_read} faculty records from legacy format")
             
             # Step 2: Generate aggregated views
             task2 = progress.add_task("📊 Generating LLM-ready views...", total=100)
@@ -320,7 +351,7 @@ async def run_data_conversion(input_file: str, output_dir: str = "converted_data
             output_path.mkdir(parents=True, exist_ok=True)
             
             # Save all converted data
-            export_paths = save_converted_data(data_manager, output_dir)
+            export_paths = save_converted_data(data_manager, output_dir, export_format)
             
             progress.update(task2, completed=100)
         
@@ -380,8 +411,8 @@ async def run_data_conversion(input_file: str, output_dir: str = "converted_data
     except FileNotFoundError:
         console.print(f"❌ [red]Input file not found:[/red] {input_file}")
         return False
-    except json.JSONDecodeError:
-        console.print(f"❌ [red]Invalid JSON in input file:[/red] {input_file}")
+    except RecordDecodeError as e:
+        console.print(f"❌ [red]Invalid JSON in input file:[/red] {input_file} ({e})")
         return False
     except Exception as e:
         console.print(f"❌ [red]Error during conversion:[/red] {e}")
@@ -406,16 +437,38 @@ Examples:
   
   # Specify custom output directory
   python -m lynnapse.cli.convert_data faculty_data.json -o my_converted_data
+  
+  # Export columnar tables for analytics
+  python -m lynnapse.cli.convert_data faculty_data.json --format parquet
+  
+  # Add a new scrape to a persistent store, deduplicating against earlier runs
+  python -m lynnapse.cli.convert_data new_scrape.json --store db/academic_data.db
+  
+  # Stream a large JSONL scrape into the store, committing every 5000 records
+  python -m lynnapse.cli.convert_data big_scrape.jsonl --store db/academic_data.db --batch-size 5000
+  
+  # Pick up an interrupted store ingest after its last committed batch
+  python -m lynnapse.cli.convert_data big_scrape.jsonl --store db/academic_data.db --resume
         """
     )
     
-    parser.add_argument('input_file', help='Legacy faculty data JSON file')
+    parser.add_argument('input_file', help='Legacy faculty data JSON or JSONL file')
     parser.add_argument('-o', '--output-dir', default='converted_data',
                        help='Output directory for converted data (default: converted_data)')
     parser.add_argument('--show-samples', action='store_true',
                        help='Display sample aggregated views')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Show detailed progress and error information')
+    parser.add_argument('--format', choices=['json', 'parquet', 'arrow'], default='json',
+                       help='Export format (default: json)')
+    parser.add_argument('--store', metavar='PATH',
+                       help='Persist entities in a SQLite store and ingest incrementally')
+    parser.add_argument('--skip', type=int, default=0, metavar='N',
+                       help='Skip the first N input records')
+    parser.add_argument('-b', '--batch-size', type=int, default=1000,
+                       help='Records committed to the store per transaction (default: 1000)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue the last interrupted --store ingest of this file after its committed records')
     
     args = parser.parse_args()
     
@@ -431,7 +484,12 @@ Examples:
         input_file=args.input_file,
         output_dir=args.output_dir,
         verbose=args.verbose,
-        show_samples=args.show_samples
+        show_samples=args.show_samples,
+        export_format=args.format,
+        store_path=args.store,
+        skip=args.skip,
+        batch_size=args.batch_size,
+        resume=args.resume
     ))
     
     sys.exit(0 if success else 1)
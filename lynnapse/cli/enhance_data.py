@@ -14,8 +14,9 @@ import asyncio
 import json
 import argparse
 import sys
+from contextlib import ExitStack
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 from rich.console import Console
@@ -30,6 +31,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from lynnapse.core.profile_enricher import ProfileEnricher
 from lynnapse.core.website_validator import validate_faculty_websites
+from lynnapse.core.record_stream import (
+    read_records, iter_batches, open_record_writer, count_written_records, is_jsonl, merge_stats,
+    RecordDecodeError
+)
 
 console = Console()
 
@@ -148,16 +153,21 @@ def display_enhanced_faculty_sample(faculty_list: List[Dict[str, Any]], limit: i
             console.print()
 
 
+def enhancement_metadata(total_faculty: int, stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the metadata block stored alongside enhanced faculty data."""
+    return {
+        'enhanced_at': datetime.now().isoformat(),
+        'total_faculty': total_faculty,
+        'enhancement_summary': stats,
+        'enhancement_type': 'comprehensive_profile_enrichment'
+    }
+
+
 def save_enhanced_results(faculty_list: List[Dict[str, Any]], output_file: str, stats: Dict[str, Any]):
     """Save enhanced faculty data to JSON file."""
     
     results = {
-        'enhancement_metadata': {
-            'enhanced_at': datetime.now().isoformat(),
-            'total_faculty': len(faculty_list),
-            'enhancement_summary': stats,
-            'enhancement_type': 'comprehensive_profile_enrichment'
-        },
+        'enhancement_metadata': enhancement_metadata(len(faculty_list), stats),
         'enhanced_faculty': faculty_list
     }
     
@@ -167,116 +177,144 @@ def save_enhanced_results(faculty_list: List[Dict[str, Any]], output_file: str,
     console.print(f"\n💾 [bold green]Enhanced results saved to:[/bold green] {output_file}")
 
 
+async def enhance_batch(faculty_list: List[Dict[str, Any]], enricher: ProfileEnricher,
+                        validate_links: bool = True) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Validate and enrich one batch of faculty records.
+    
+    Args:
+        faculty_list: Faculty records of the batch
+        enricher: Shared profile enricher
+        validate_links: Whether to validate links before enhancement
+        
+    Returns:
+        Tuple of (enhanced faculty records, enrichment stats of the batch)
+    """
+    if validate_links:
+        try:
+            faculty_list, validation_report = await validate_faculty_websites(faculty_list)
+        except Exception as e:
+            console.print(f"⚠️ [yellow]Link validation failed: {e}[/yellow]")
+    
+    return await enricher.enrich_sparse_faculty_data(faculty_list)
+
+
 async def run_data_enhancement(input_file: str, output_file: Optional[str] = None, 
                               max_concurrent: int = 3, timeout: int = 30,
-                              validate_links: bool = True, verbose: bool = False) -> bool:
+                              validate_links: bool = True, verbose: bool = False,
+                              batch_size: int = 100, resume: bool = False) -> bool:
     """
     Run comprehensive data enhancement on sparse faculty data.
     
+    Records are streamed from the input file and enhanced in batches of
+    ``batch_size``; each finished batch is appended to the outputs, so
+    memory stays bounded by the batch size.
+    
     Args:
-        input_file: JSON file with sparse faculty data
-        output_file: Output file for enhanced results
+        input_file: JSON or JSONL file with sparse faculty data
+        output_file: Output file for enhanced results (``.jsonl`` for one
+            record per line)
         max_concurrent: Maximum concurrent operations
         timeout: Timeout for network operations
         validate_links: Whether to validate links before enhancement
         verbose: Show detailed progress
+        batch_size: Faculty records enhanced and written per batch
+        resume: Continue an interrupted run into an existing JSONL output,
+            skipping the records it already holds
         
     Returns:
         True if successful, False otherwise
     """
     
     try:
-        # Load faculty data
-        console.print(f"📂 [bold]Loading faculty data from:[/bold] {input_file}")
-        
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Extract faculty list
-        if isinstance(data, dict):
-            faculty_list = data.get('faculty', data.get('enhanced_faculty', data.get('processed_faculty', [])))
-            if not faculty_list and 'results' in data:
-                faculty_list = data['results']
-        else:
-            faculty_list = data
-        
-        if not faculty_list:
-            console.print("❌ [red]No faculty data found in input file[/red]")
-            return False
+        skip = 0
+        if resume:
+            if not output_file or not is_jsonl(output_file):
+                console.print("❌ [red]--resume requires a .jsonl output file[/red]")
+                return False
+            skip = count_written_records(output_file)
+            if skip:
+                console.print(f"⏩ Resuming after {skip} records already in {output_file}")
         
-        console.print(f"👥 Found {len(faculty_list)} faculty members")
+        console.print(f"📂 [bold]Reading faculty data from:[/bold] {input_file}")
+        records = read_records(input_file, skip=skip)
         
-        # Check how many have sparse data
-        sparse_count = sum(1 for f in faculty_list if not _has_rich_data(f))
-        console.print(f"📉 {sparse_count} faculty members have sparse data that can be enhanced")
+        # Always save to scrape_results/adaptive folder for easy access
+        results_dir = Path("scrape_results/adaptive")
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        auto_filepath = results_dir / f"enhanced_faculty_{timestamp}.json"
         
-        if sparse_count == 0:
-            console.print("✅ [green]All faculty already have rich data, no enhancement needed[/green]")
-            return True
+        header = {'enhancement_type': 'comprehensive_profile_enrichment', 'source_file': str(input_file)}
+        enricher = ProfileEnricher(max_concurrent=max_concurrent, timeout=timeout)
+        stats: Dict[str, Any] = {}
+        total_read = 0
+        sparse_count = 0
+        sample: List[Dict[str, Any]] = []
         
-        # Run enhancement with progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
+        with ExitStack() as stack:
+            writers = [stack.enter_context(
+                open_record_writer(auto_filepath, header, records_key='enhanced_faculty')
+            )]
+            if output_file:
+                writers.append(stack.enter_context(
+                    open_record_writer(output_file, header, records_key='enhanced_faculty', append=resume)
+                ))
             
-            # Step 1: Validate links if requested
-            if validate_links:
-                task1 = progress.add_task("🔍 Validating existing links...", total=len(faculty_list))
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed} records"),
+                TimeElapsedColumn(),
+                console=console
+            ) as progress:
                 
-                try:
-                    validated_faculty, validation_report = await validate_faculty_websites(faculty_list)
-                    faculty_list = validated_faculty
-                    progress.update(task1, completed=len(faculty_list))
-                    console.print(f"✅ Link validation complete: {validation_report['validation_stats']['accessible_links']} accessible links")
-                except Exception as e:
-                    console.print(f"⚠️ [yellow]Link validation failed: {e}[/yellow]")
-                    progress.update(task1, completed=len(faculty_list))
-            
-            # Step 2: Enhanced profile enrichment
-            task2 = progress.add_task("🚀 Enhancing faculty profiles...", total=len(faculty_list))
-            
-            enricher = ProfileEnricher(max_concurrent=max_concurrent, timeout=timeout)
-            enhanced_faculty, stats = await enricher.enrich_sparse_faculty_data(faculty_list)
+                task = progress.add_task("🚀 Enhancing faculty profiles...", total=None)
+                
+                for batch in iter_batches(records, batch_size):
+                    total_read += len(batch)
+                    sparse_count += sum(1 for f in batch if not _has_rich_data(f))
+                    
+                    enhanced_batch, batch_stats = await enhance_batch(batch, enricher, validate_links)
+                    merge_stats(stats, batch_stats)
+                    
+                    for writer in writers:
+                        writer.write(enhanced_batch)
+                    if verbose and len(sample) < 5:
+                        sample.extend(enhanced_batch[:5 - len(sample)])
+                    
+                    progress.update(task, completed=total_read)
             
-            progress.update(task2, completed=len(enhanced_faculty))
+            footer = {'enhancement_metadata': enhancement_metadata(writers[0].count, stats)}
+            for writer in writers:
+                writer.close(footer)
+                console.print(f"\n💾 [bold green]Enhanced results saved to:[/bold green] {writer.file_path}")
+        
+        if not total_read:
+            if skip:
+                console.print("✅ [green]Nothing left to enhance; output is already complete[/green]")
+                return True
+            console.print("❌ [red]No faculty data found in input file[/red]")
+            return False
+        
+        console.print(f"👥 Processed {total_read} faculty members, {sparse_count} with sparse data")
         
         # Display enhancement summary
         console.print()
-        display_enrichment_summary(stats, len(faculty_list))
+        display_enrichment_summary(stats, total_read)
         
         if verbose:
-            display_enhanced_faculty_sample(enhanced_faculty)
-        
-        # Always save to scrape_results/adaptive folder for easy access
-        from pathlib import Path
-        results_dir = Path("scrape_results/adaptive")
-        results_dir.mkdir(parents=True, exist_ok=True)
-        
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        auto_filename = f"enhanced_faculty_{timestamp}.json"
-        auto_filepath = results_dir / auto_filename
-        
-        # Save to automatic location
-        save_enhanced_results(enhanced_faculty, str(auto_filepath), stats)
-        
-        # Also save to user-specified location if provided
-        if output_file:
-            save_enhanced_results(enhanced_faculty, output_file, stats)
+            display_enhanced_faculty_sample(sample)
         
         console.print(f"\n✅ [bold green]Data enhancement completed successfully![/bold green]")
-        console.print(f"📈 Enhanced {stats['successfully_enriched']}/{len(enhanced_faculty)} faculty profiles")
+        console.print(f"📈 Enhanced {stats.get('successfully_enriched', 0)}/{total_read} faculty profiles")
         return True
         
     except FileNotFoundError:
         console.print(f"❌ [red]Input file not found:[/red] {input_file}")
         return False
-    except json.JSONDecodeError:
-        console.print(f"❌ [red]Invalid JSON in input file:[/red] {input_file}")
+    except RecordDecodeError as e:
+        console.print(f"❌ [red]Invalid JSON in input file:[/red] {input_file} ({e})")
         return False
     except Exception as e:
         console.print(f"❌ [red]Error during enhancement:[/red] {e}")
@@ -313,17 +351,24 @@ Examples:
   
   # Skip link validation (faster but less accurate)
   python -m lynnapse.cli.enhance_data faculty_data.json --no-validate -v
+  
+  # Large inputs: stream to JSONL in batches and resume if interrupted
+  python -m lynnapse.cli.enhance_data faculty_data.jsonl -o enhanced.jsonl --batch-size 200 --resume
         """
     )
     
-    parser.add_argument('input_file', help='JSON file with sparse faculty data')
-    parser.add_argument('-o', '--output', help='Output file for enhanced results')
+    parser.add_argument('input_file', help='JSON or JSONL file with sparse faculty data')
+    parser.add_argument('-o', '--output', help='Output file for enhanced results (.json or .jsonl)')
     parser.add_argument('-c', '--max-concurrent', type=int, default=3, 
                        help='Maximum concurrent operations (default: 3)')
     parser.add_argument('-t', '--timeout', type=int, default=30,
                        help='Timeout for network operations in seconds (default: 30)')
     parser.add_argument('--no-validate', action='store_true',
                        help='Skip link validation before enhancement')
+    parser.add_argument('-b', '--batch-size', type=int, default=100,
+                       help='Faculty records enhanced and written per batch (default: 100)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Resume into an existing .jsonl output, skipping records already written')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Show detailed progress and results')
     
@@ -343,7 +388,9 @@ Examples:
         max_concurrent=args.max_concurrent,
         timeout=args.timeout,
         validate_links=not args.no_validate,
-        verbose=args.verbose
+        verbose=args.verbose,
+        batch_size=args.batch_size,
+        resume=args.resume
     ))
     
     sys.exit(0 if success else 1)
@@ -11,6 +11,7 @@ import asyncio
 import json
 import argparse
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
@@ -32,6 +33,9 @@ from lynnapse.core.link_enrichment import (
     analyze_academic_profiles,
     EnrichmentReport
 )
+from lynnapse.core.record_stream import (
+    read_records, iter_batches, open_record_writer, count_written_records, is_jsonl
+)
 
 console = Console()
 
@@ -152,23 +156,29 @@ def display_faculty_enrichment_details(faculty_list: List[Dict[str, Any]], limit
         if i < len(faculty_list[:limit]) - 1:
             console.print()  # Add spacing between faculty
 
-def save_enriched_results(faculty_list: List[Dict[str, Any]], output_file: str, report: EnrichmentReport):
+def enrichment_metadata(total_faculty: int, report: Optional[EnrichmentReport]) -> Dict[str, Any]:
+    """Build the metadata block stored alongside enriched faculty data."""
+    metadata = {
+        'enriched_at': datetime.now().isoformat(),
+        'total_faculty': total_faculty
+    }
+    if report is not None:
+        metadata['enrichment_summary'] = {
+            'total_links_processed': report.total_links_processed,
+            'successful_enrichments': report.successful_enrichments,
+            'failed_enrichments': report.failed_enrichments,
+            'scholar_profiles_enriched': report.scholar_profiles_enriched,
+            'lab_sites_enriched': report.lab_sites_enriched,
+            'university_profiles_enriched': report.university_profiles_enriched,
+            'processing_time_seconds': report.total_processing_time
+        }
+    return metadata
+
+def save_enriched_results(faculty_list: List[Dict[str, Any]], output_file: str, report: Optional[EnrichmentReport]):
     """Save enriched faculty data to JSON file."""
     
     results = {
-        'enrichment_metadata': {
-            'enriched_at': datetime.now().isoformat(),
-            'total_faculty': len(faculty_list),
-            'enrichment_summary': {
-                'total_links_processed': report.total_links_processed,
-                'successful_enrichments': report.successful_enrichments,
-                'failed_enrichments': report.failed_enrichments,
-                'scholar_profiles_enriched': report.scholar_profiles_enriched,
-                'lab_sites_enriched': report.lab_sites_enriched,
-                'university_profiles_enriched': report.university_profiles_enriched,
-                'processing_time_seconds': report.total_processing_time
-            }
-        },
+        'enrichment_metadata': enrichment_metadata(len(faculty_list), report),
         'enriched_faculty': faculty_list
     }
     
@@ -177,117 +187,162 @@ def save_enriched_results(faculty_list: List[Dict[str, Any]], output_file: str,
     
     console.print(f"\n💾 [bold green]Results saved to:[/bold green] {output_file}")
 
+def merge_enrichment_reports(total: Optional[EnrichmentReport], batch: EnrichmentReport) -> EnrichmentReport:
+    """Combine the report of one batch into the running report."""
+    if total is None:
+        return batch
+    
+    processed = total.total_links_processed + batch.total_links_processed
+    return EnrichmentReport(
+        total_links_processed=processed,
+        successful_enrichments=total.successful_enrichments + batch.successful_enrichments,
+        failed_enrichments=total.failed_enrichments + batch.failed_enrichments,
+        scholar_profiles_enriched=total.scholar_profiles_enriched + batch.scholar_profiles_enriched,
+        lab_sites_enriched=total.lab_sites_enriched + batch.lab_sites_enriched,
+        university_profiles_enriched=total.university_profiles_enriched + batch.university_profiles_enriched,
+        average_extraction_time=(
+            total.average_extraction_time * total.total_links_processed
+            + batch.average_extraction_time * batch.total_links_processed
+        ) / max(processed, 1),
+        total_processing_time=total.total_processing_time + batch.total_processing_time
+    )
+
+def _has_validated_links(faculty: Dict[str, Any]) -> bool:
+    """Check if faculty has at least one validated, accessible link."""
+    return any(
+        faculty.get(field) and faculty.get(f"{field}_validation", {}).get('is_accessible')
+        for field in ['profile_url', 'personal_website', 'lab_website']
+    )
+
 async def run_link_enrichment(input_file: str, output_file: Optional[str] = None, 
                             max_concurrent: int = 3, timeout: int = 30,
-                            analysis_type: str = 'enrichment', verbose: bool = False) -> bool:
+                            analysis_type: str = 'enrichment', verbose: bool = False,
+                            batch_size: int = 100, resume: bool = False) -> bool:
     """
     Run link enrichment on faculty data.
     
+    Records are streamed from the input file and processed in batches of
+    ``batch_size``; each finished batch is appended to the outputs.
+    
     Args:
-        input_file: JSON file with faculty data (with validated links)
-        output_file: Output file for enriched results
+        input_file: JSON or JSONL file with faculty data (with validated links)
+        output_file: Output file for enriched results (``.jsonl`` for one
+            record per line)
         max_concurrent: Maximum concurrent operations
         timeout: Timeout for network operations
         analysis_type: Type of processing ('enrichment', 'analysis', 'comprehensive')
         verbose: Show detailed progress
+        batch_size: Faculty records read and processed per batch
+        resume: Continue an interrupted run into an existing JSONL output;
+            the input records before the last one written are skipped
         
     Returns:
         True if successful, False otherwise
     """
     
     try:
-        # Load faculty data
-        console.print(f"📂 [bold]Loading faculty data from:[/bold] {input_file}")
+        records_to_skip = 0
+        if resume:
+            if not output_file or not is_jsonl(output_file):
+                console.print("❌ [red]--resume requires a .jsonl output file[/red]")
+                return False
+            records_to_skip = count_written_records(output_file)
+            if records_to_skip:
+                console.print(f"⏩ Resuming after {records_to_skip} records already in {output_file}")
         
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        console.print(f"📂 [bold]Reading faculty data from:[/bold] {input_file}")
         
-        # Extract faculty list
-        if isinstance(data, dict):
-            faculty_list = data.get('faculty', data.get('enriched_faculty', data.get('processed_faculty', [])))
-            if not faculty_list and 'results' in data:
-                faculty_list = data['results']
-        else:
-            faculty_list = data
+        # Only faculty with validated links are written, so resuming skips
+        # input records until that many of them have been seen
+        def pending_records():
+            skipped = 0
+            for faculty in read_records(input_file):
+                if skipped < records_to_skip:
+                    skipped += _has_validated_links(faculty)
+                    continue
+                yield faculty
         
-        if not faculty_list:
-            console.print("❌ [red]No faculty data found in input file[/red]")
-            return False
-        
-        console.print(f"👥 Found {len(faculty_list)} faculty members")
-        
-        # Check for validated links
-        faculty_with_links = [f for f in faculty_list if any(
-            f.get(field) and f.get(f"{field}_validation", {}).get('is_accessible')
-            for field in ['profile_url', 'personal_website', 'lab_website']
-        )]
-        
-        if not faculty_with_links:
-            console.print("⚠️ [yellow]No faculty members have validated accessible links. Please run link validation first.[/yellow]")
-            return False
+        # Always save to scrape_results/adaptive folder for easy access
+        results_dir = Path("scrape_results/adaptive")
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        auto_filepath = results_dir / f"enriched_data_{timestamp}.json"
         
-        console.print(f"🔗 {len(faculty_with_links)} faculty members have validated links")
+        header = {'analysis_type': analysis_type, 'source_file': str(input_file)}
+        report: Optional[EnrichmentReport] = None
+        total_read = 0
+        total_with_links = 0
+        sample: List[Dict[str, Any]] = []
         
-        # Run enrichment with progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
+        with ExitStack() as stack:
+            writers = [stack.enter_context(
+                open_record_writer(auto_filepath, header, records_key='enriched_faculty')
+            )]
+            if output_file:
+                writers.append(stack.enter_context(
+                    open_record_writer(output_file, header, records_key='enriched_faculty', append=resume)
+                ))
             
-            if analysis_type in ['enrichment', 'comprehensive']:
-                # Link enrichment
-                task = progress.add_task("🔍 Enriching academic links...", total=len(faculty_with_links))
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed} records"),
+                TimeElapsedColumn(),
+                console=console
+            ) as progress:
                 
-                enriched_faculty, report = await enrich_faculty_links_simple(
-                    faculty_with_links, 
-                    max_concurrent=max_concurrent,
-                    timeout=timeout
-                )
+                task = progress.add_task("🔍 Enriching academic links...", total=None)
                 
-                progress.update(task, completed=len(faculty_with_links))
-                
-                # Display enrichment summary
-                console.print()
-                display_enrichment_summary(report)
-                
-                if verbose:
-                    display_faculty_enrichment_details(enriched_faculty)
+                for batch in iter_batches(pending_records(), batch_size):
+                    total_read += len(batch)
+                    faculty_with_links = [f for f in batch if _has_validated_links(f)]
+                    total_with_links += len(faculty_with_links)
+                    
+                    final_faculty = faculty_with_links
+                    if faculty_with_links and analysis_type in ['enrichment', 'comprehensive']:
+                        # Link enrichment
+                        final_faculty, batch_report = await enrich_faculty_links_simple(
+                            faculty_with_links,
+                            max_concurrent=max_concurrent,
+                            timeout=timeout
+                        )
+                        report = merge_enrichment_reports(report, batch_report)
+                    
+                    if final_faculty and analysis_type in ['analysis', 'comprehensive']:
+                        # Profile analysis
+                        final_faculty = await analyze_academic_profiles(final_faculty, analysis_type='comprehensive')
+                    
+                    for writer in writers:
+                        writer.write(final_faculty)
+                    if verbose and len(sample) < 10:
+                        sample.extend(final_faculty[:10 - len(sample)])
+                    
+                    progress.update(task, completed=total_read)
             
-            if analysis_type in ['analysis', 'comprehensive']:
-                # Profile analysis
-                task2 = progress.add_task("🧠 Analyzing academic profiles...", total=len(enriched_faculty if 'enriched_faculty' in locals() else faculty_with_links))
-                
-                input_data = enriched_faculty if 'enriched_faculty' in locals() else faculty_with_links
-                analyzed_faculty = await analyze_academic_profiles(input_data, analysis_type='comprehensive')
-                
-                progress.update(task2, completed=len(analyzed_faculty))
-                
-                # Use analyzed data as final output
-                final_faculty = analyzed_faculty
-                
-                console.print(f"\n🧠 [bold green]Profile analysis complete[/bold green] for {len(analyzed_faculty)} faculty")
-            else:
-                final_faculty = enriched_faculty
+            footer = {'enrichment_metadata': enrichment_metadata(writers[0].count, report)}
+            for writer in writers:
+                writer.close(footer)
+                console.print(f"\n💾 [bold green]Results saved to:[/bold green] {writer.file_path}")
         
-        # Always save to scrape_results/adaptive folder for easy access
-        from pathlib import Path
-        results_dir = Path("scrape_results/adaptive")
-        results_dir.mkdir(parents=True, exist_ok=True)
+        if not total_with_links:
+            if records_to_skip:
+                console.print("✅ [green]Nothing left to enrich; output is already complete[/green]")
+                return True
+            console.print("⚠️ [yellow]No faculty members have validated accessible links. Please run link validation first.[/yellow]")
+            return False
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        auto_filename = f"enriched_data_{timestamp}.json"
-        auto_filepath = results_dir / auto_filename
+        console.print(f"👥 Read {total_read} faculty members, {total_with_links} with validated links")
+        
+        if report is not None:
+            # Display enrichment summary
+            console.print()
+            display_enrichment_summary(report)
         
-        # Save to automatic location
-        save_enriched_results(final_faculty, str(auto_filepath), report if 'report' in locals() else None)
+        if analysis_type in ['analysis', 'comprehensive']:
+            console.print(f"\n🧠 [bold green]Profile analysis complete[/bold green] for {total_with_links} faculty")
         
-        # Also save to user-specified location if provided
-        if output_file:
-            save_enriched_results(final_faculty, output_file, report if 'report' in locals() else None)
+        if verbose:
+            display_faculty_enrichment_details(sample)
         
         console.print(f"\n✅ [bold green]Link enrichment completed successfully![/bold green]")
         return True
@@ -295,8 +350,8 @@ async def run_link_enrichment(input_file: str, output_file: Optional[str] = None
     except FileNotFoundError:
         console.print(f"❌ [red]Input file not found:[/red] {input_file}")
         return False
-    except json.JSONDecodeError:
-        console.print(f"❌ [red]Invalid JSON in input file:[/red] {input_file}")
+    except (json.JSONDecodeError, ValueError) as e:
+        console.print(f"❌ [red]Invalid JSON in input file:[/red] {input_file} ({e})")
         return False
     except Exception as e:
         console.print(f"❌ [red]Error during enrichment:[/red] {e}")
@@ -323,11 +378,14 @@ Examples:
   
   # Profile analysis only
   python -m lynnapse.cli.enrich_links enriched_data.json --analysis analysis -o analyzed_results.json
+  
+  # Large inputs: stream to JSONL in batches and resume if interrupted
+  python -m lynnapse.cli.enrich_links validated.jsonl -o enriched.jsonl --batch-size 200 --resume
         """
     )
     
-    parser.add_argument('input_file', help='JSON file with faculty data (with validated links)')
-    parser.add_argument('-o', '--output', help='Output file for enriched results')
+    parser.add_argument('input_file', help='JSON or JSONL file with faculty data (with validated links)')
+    parser.add_argument('-o', '--output', help='Output file for enriched results (.json or .jsonl)')
     parser.add_argument('-c', '--max-concurrent', type=int, default=3, 
                        help='Maximum concurrent operations (default: 3)')
     parser.add_argument('-t', '--timeout', type=int, default=30,
@@ -335,6 +393,10 @@ Examples:
     parser.add_argument('--analysis', choices=['enrichment', 'analysis', 'comprehensive'], 
                        default='enrichment',
                        help='Type of processing (default: enrichment)')
+    parser.add_argument('-b', '--batch-size', type=int, default=100,
+                       help='Faculty records processed and written per batch (default: 100)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Resume into an existing .jsonl output, skipping records already written')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Show detailed progress and results')
     
@@ -354,7 +416,9 @@ Examples:
         max_concurrent=args.max_concurrent,
         timeout=args.timeout,
         analysis_type=args.analysis,
-        verbose=args.verbose
+        verbose=args.verbose,
+        batch_size=args.batch_size,
+        resume=args.resume
     ))
     
     sys.exit(0 if success else 1)
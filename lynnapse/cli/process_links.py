@@ -9,6 +9,8 @@ and lab enrichment capabilities of the Lynnapse system.
 import asyncio
 import json
 import sys
+from contextlib import ExitStack
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Any
 import click
@@ -27,14 +29,19 @@ from lynnapse.core.enhanced_link_processor import (
     identify_and_replace_social_media_links,
     discover_and_enrich_lab_websites
 )
+from lynnapse.core.record_stream import (
+    read_records, iter_batches, open_record_writer, count_written_records, is_jsonl
+)
 
 console = Console()
 
+RESUMABLE_MODES = ('full', 'social', 'categorize')
+
 @click.command()
 @click.option('--input', '-i', required=True, type=click.Path(exists=True), 
-              help='Input JSON file with faculty data')
+              help='Input JSON or JSONL file with faculty data')
 @click.option('--output', '-o', type=click.Path(), 
-              help='Output JSON file for processed results')
+              help='Output JSON or JSONL file for processed results')
 @click.option('--mode', '-m', type=click.Choice(['full', 'social', 'labs', 'categorize']), 
               default='full', help='Processing mode')
 @click.option('--max-concurrent', type=int, default=3, 
@@ -47,7 +54,12 @@ console = Console()
               help='Use GPT-4o-mini for AI-assisted link discovery and replacement')
 @click.option('--openai-key', 
               help='OpenAI API key for AI assistance (or set OPENAI_API_KEY environment variable)')
-def process_faculty_links(input, output, mode, max_concurrent, timeout, verbose, ai_assistance, openai_key):
+@click.option('--batch-size', '-b', type=int, default=100,
+              help='Faculty records processed and written per batch')
+@click.option('--resume', is_flag=True,
+              help='Resume into an existing JSONL output, skipping records already written')
+def process_faculty_links(input, output, mode, max_concurrent, timeout, verbose, ai_assistance, openai_key,
+                          batch_size, resume):
     """
     Process faculty links with enhanced categorization and enrichment.
     
@@ -56,57 +68,94 @@ def process_faculty_links(input, output, mode, max_concurrent, timeout, verbose,
     - social: Focus on social media detection and replacement
     - labs: Focus on lab website discovery and enrichment
     - categorize: Link categorization only
+    
+    Records are streamed from the input and processed in batches; each
+    finished batch is appended to the output file.
     """
     console.print(Panel.fit(
         f"🔗 [bold blue]Enhanced Faculty Link Processing[/bold blue]\n\n"
         f"Mode: {mode.upper()}\n"
         f"Input: {input}\n"
         f"Concurrency: {max_concurrent}\n"
-        f"Timeout: {timeout}s",
+        f"Timeout: {timeout}s\n"
+        f"Batch size: {batch_size}",
         title="🚀 Link Processing Configuration"
     ))
     
-    # Load faculty data
+    skip = 0
+    if resume:
+        if not output or not is_jsonl(output):
+            console.print("❌ --resume requires a .jsonl output file")
+            return
+        if mode not in RESUMABLE_MODES:
+            console.print(f"❌ --resume is not supported in {mode} mode (output is a subset of the input)")
+            return
+        skip = count_written_records(output)
+        if skip:
+            console.print(f"⏩ Resuming after {skip} records already in {output}")
+    
     try:
-        with open(input, 'r') as f:
-            faculty_data = json.load(f)
-        
-        # Handle different JSON structures
-        if isinstance(faculty_data, dict):
-            if 'faculty' in faculty_data:
-                faculty_list = faculty_data['faculty']
-            elif 'results' in faculty_data:
-                faculty_list = faculty_data['results']
-            else:
-                faculty_list = [faculty_data]
-        else:
-            faculty_list = faculty_data
+        with ExitStack() as stack:
+            writer = None
+            if output:
+                header = {'processing_mode': mode, 'source_file': str(input)}
+                writer = stack.enter_context(
+                    open_record_writer(output, header, records_key='processed_faculty', append=resume)
+                )
+            
+            total = asyncio.run(process_in_batches(
+                read_records(input, skip=skip), writer, mode, batch_size,
+                max_concurrent, timeout, verbose, ai_assistance, openai_key
+            ))
+            
+            if writer is not None:
+                writer.close({'processing_metadata': {'total_faculty': writer.count}})
+                console.print(f"💾 Results saved to: {writer.file_path}")
             
-        console.print(f"📊 Loaded {len(faculty_list)} faculty members")
-        
     except Exception as e:
-        console.print(f"❌ Error loading faculty data: {e}")
+        console.print(f"❌ Error during processing: {e}")
         return
     
-    # Process based on mode
-    try:
+    console.print(f"\n✅ [bold green]Processing completed successfully![/bold green] ({total} faculty members)")
+
+async def process_in_batches(records, writer, mode: str, batch_size: int, max_concurrent: int,
+                             timeout: int, verbose: bool, ai_assistance: bool, openai_key: str) -> int:
+    """
+    Run a processing mode over streamed faculty records, one batch at a time.
+    
+    Args:
+        records: Iterable of faculty records
+        writer: Record writer for the processed records, or None
+        mode: Processing mode
+        batch_size: Faculty records per batch
+        
+    Returns:
+        Number of faculty records processed
+    """
+    total = 0
+    for batch_number, faculty_list in enumerate(iter_batches(records, batch_size), 1):
+        console.print(f"\n📊 Batch {batch_number}: {len(faculty_list)} faculty members "
+                      f"(records {total + 1}-{total + len(faculty_list)})")
+        
         if mode == 'full':
-            asyncio.run(process_full_pipeline(faculty_list, max_concurrent, timeout, verbose))
+            processed = await process_full_pipeline(faculty_list, max_concurrent, timeout, verbose)
         elif mode == 'social':
-            asyncio.run(process_social_media_focus(faculty_list, max_concurrent, timeout, verbose, ai_assistance, openai_key))
+            processed = await process_social_media_focus(faculty_list, max_concurrent, timeout, verbose, ai_assistance, openai_key)
         elif mode == 'labs':
-            asyncio.run(process_lab_focus(faculty_list, max_concurrent, timeout, verbose))
-        elif mode == 'categorize':
-            asyncio.run(process_categorization_only(faculty_list, max_concurrent, timeout, verbose))
-            
-    except Exception as e:
-        console.print(f"❌ Error during processing: {e}")
-        return
+            processed = await process_lab_focus(faculty_list, max_concurrent, timeout, verbose)
+        else:
+            processed = await process_categorization_only(faculty_list, max_concurrent, timeout, verbose)
+        
+        if writer is not None:
+            writer.write(processed)
+        total += len(faculty_list)
     
-    console.print("\n✅ [bold green]Processing completed successfully![/bold green]")
+    if not total:
+        console.print("⚠️ No faculty records to process in input file")
+    return total
 
-async def process_full_pipeline(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool):
-    """Run the complete processing pipeline."""
+async def process_full_pipeline(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool) -> List[Dict[str, Any]]:
+    """Run the complete processing pipeline and return the processed faculty."""
     console.print(f"\n🔄 [bold blue]Full Processing Pipeline[/bold blue]")
     
     with Progress(
@@ -133,9 +182,11 @@ async def process_full_pipeline(faculty_list: List[Dict[str, Any]], max_concurre
     
     if verbose:
         display_detailed_results(processed_faculty[:5])  # Show first 5 for brevity
+    
+    return processed_faculty
 
-async def process_social_media_focus(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool, ai_assistance: bool, openai_key: str):
-    """Focus on social media detection and replacement."""
+async def process_social_media_focus(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool, ai_assistance: bool, openai_key: str) -> List[Dict[str, Any]]:
+    """Focus on social media detection and replacement; returns the processed faculty."""
     import os
     
     # Get OpenAI API key
@@ -197,9 +248,11 @@ async def process_social_media_focus(faculty_list: List[Dict[str, Any]], max_con
                 quality_table.add_row(metric.replace('_', ' ').title(), str(value))
         
         console.print(quality_table)
+    
+    return processed_faculty
 
-async def process_lab_focus(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool):
-    """Focus on lab website discovery and enrichment."""
+async def process_lab_focus(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool) -> List[Dict[str, Any]]:
+    """Focus on lab website discovery and enrichment; returns the faculty with lab data."""
     console.print(f"\n🔬 [bold blue]Lab Website Processing Focus[/bold blue]")
     
     with Progress(
@@ -240,9 +293,11 @@ async def process_lab_focus(faculty_list: List[Dict[str, Any]], max_concurrent:
         console.print(f"\n📋 [bold blue]Lab Enrichment Details[/bold blue]")
         for lab in enriched_labs[:3]:  # Show first 3 labs
             display_lab_details(lab)
+    
+    return faculty_with_labs
 
-async def process_categorization_only(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool):
-    """Run link categorization only."""
+async def process_categorization_only(faculty_list: List[Dict[str, Any]], max_concurrent: int, timeout: int, verbose: bool) -> List[Dict[str, Any]]:
+    """Run link categorization only; returns the faculty with their categorized links."""
     console.print(f"\n🏷️ [bold blue]Link Categorization Only[/bold blue]")
     
     async with EnhancedLinkProcessor(
@@ -268,6 +323,16 @@ async def process_categorization_only(faculty_list: List[Dict[str, Any]], max_co
     
     # Display categorization results
     display_categorization_results(results, verbose)
+    
+    return [
+        dict(
+            result.processed_data,
+            social_media_links=result.social_media_links,
+            academic_links=result.academic_links,
+            lab_links=result.lab_links
+        )
+        for result in results
+    ]
 
 def display_processing_report(report: Dict[str, Any], verbose: bool):
     """Display comprehensive processing report."""
@@ -411,21 +476,8 @@ def demo_enhanced_processing(input, output):
 
 async def run_demo(input_file: str, output_file: str):
     """Run the demonstration."""
-    # Load sample data
-    with open(input_file, 'r') as f:
-        faculty_data = json.load(f)
-    
-    # Handle different JSON structures
-    if isinstance(faculty_data, dict):
-        if 'faculty' in faculty_data:
-            faculty_list = faculty_data['faculty']
-        else:
-            faculty_list = [faculty_data]
-    else:
-        faculty_list = faculty_data
-    
-    # Limit to first 3 faculty for demo
-    demo_faculty = faculty_list[:3]
+    # Load sample data, limited to the first 3 faculty for the demo
+    demo_faculty = list(islice(read_records(input_file), 3))
     
     console.print(f"🎯 Running demo with {len(demo_faculty)} faculty members...\n")
     
@@ -182,6 +182,8 @@ class ProductionConfig:
             # Database
             mongodb_pool_size=int(os.getenv("MONGODB_POOL_SIZE", "10")),
             mongodb_timeout_ms=int(os.getenv("MONGODB_TIMEOUT_MS", "30000")),
+            mongodb_max_idle_time_ms=int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "60000")),
+            mongodb_heartbeat_frequency_ms=int(os.getenv("MONGODB_HEARTBEAT_FREQUENCY_MS", "10000")),
             
             # AI Configuration
             enable_ai_assistance=os.getenv("ENABLE_AI_ASSISTANCE", "false").lower() == "true",
@@ -527,12 +529,18 @@ def create_health_check_server(config: ProductionConfig):
 
 
 async def check_database_health(config: ProductionConfig) -> Dict[str, Any]:
-    """Check database connectivity and health."""
+    """
+    Check database connectivity and health.
+    
+    Probes the shared client, so the reported URL and database are those of
+    the registry (see ``configure_database``), not necessarily of ``config``.
+    """
+    from lynnapse.db.mongodb import get_connection_target, get_database, get_pool_metrics
+    
+    target = get_connection_target()
     try:
-        from lynnapse.db.mongodb import get_database
-        
         start_time = time.time()
-        db = get_database(config.mongodb_url, config.mongodb_database)
+        db = await get_database()
         
         # Simple ping operation
         await db.command("ping")
@@ -546,14 +554,14 @@ async def check_database_health(config: ProductionConfig) -> Dict[str, Any]:
             "message": "Database connection successful",
             "response_time_ms": response_time,
             "collections_found": len(collections),
-            "url": config.mongodb_url,
-            "database": config.mongodb_database
+            "connection_pool": get_pool_metrics(),
+            **target
         }
     except Exception as e:
         return {
             "status": "unhealthy",
             "message": f"Database connection failed: {str(e)}",
-            "url": config.mongodb_url
+            "url": target["url"]
         }
 
 
@@ -826,6 +834,10 @@ def initialize_production_environment() -> ProductionConfig:
         health_app = create_health_check_server(config)
         # Health check server would typically be started in a separate process
     
+    # Share one configured MongoDB connection pool across the process
+    from lynnapse.db.mongodb import configure_database
+    configure_database(config)
+    
     # Set up garbage collection tuning
     import gc
     gc.set_threshold(config.gc_threshold, config.gc_threshold // 10, config.gc_threshold // 100)
@@ -0,0 +1,319 @@
+"""
+Search Index - Prebuilt autocomplete index for university and department names.
+
+Autocomplete used to scan every name for a substring on each keystroke. A
+``SearchIndex`` is built once when the data is loaded and answers a query
+with a handful of binary searches over three structures:
+
+- a word-prefix trie: each prefix of each word maps to the sorted ids of the
+  documents containing a word with that prefix. The trie is stored
+  flattened, with node prefixes in sorted order and all doc id lists
+  concatenated in one ``array``, so a node is found by bisecting the prefix
+  list and its documents are a slice of the array.
+- the sorted list of whole names, where the names starting with the query
+  form one contiguous block.
+- a trigram index over the word vocabulary, for typo-tolerant matching.
+
+Results are ranked by match tier: the whole name starts with the query, then
+every query word is a prefix of a word in the name, then fuzzy matches
+ordered by trigram similarity. Within the first tier names are
+alphabetical; within the others documents keep their load order.
+
+The index serializes to a compact zlib-compressed snapshot that loads with
+no tokenizing, keyed by a fingerprint of the indexed names.
+"""
+
+import bisect
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import re
+import struct
+import sys
+import unicodedata
+import zlib
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Container, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+# Minimum Dice similarity of word trigrams for a fuzzy match
+FUZZY_THRESHOLD = 0.45
+
+# Vocabulary words tried per misspelled query word
+FUZZY_CANDIDATES = 3
+
+# Shorter query words are only matched as prefixes
+MIN_FUZZY_LENGTH = 3
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Posting range of a trie node in the postings array
+Span = Tuple[int, int]
+
+
+def normalize_name(text: str) -> str:
+    """Lowercase, strip accents and punctuation, and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _NON_ALNUM.sub(" ", text.lower().replace("&", " and ")).strip()
+
+
+def word_trigrams(word: str) -> Set[str]:
+    """Trigrams of a word, padded so that word starts weigh more."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def index_fingerprint(documents: Sequence[Sequence[str]]) -> str:
+    """Fingerprint of the names an index is built from."""
+    return hashlib.md5(json.dumps(documents, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _flatten(groups: Sequence[Sequence[int]]) -> Tuple[array, array]:
+    """Concatenate id lists into (starts, values) arrays."""
+    starts, values = array("I"), array("I")
+    for group in groups:
+        starts.append(len(values))
+        values.extend(group)
+    starts.append(len(values))
+    return starts, values
+
+
+class SearchIndex:
+    """Prefix-trie and trigram index over the names of a list of documents."""
+
+    # Arrays stored in the binary part of a snapshot, in order
+    ARRAYS = ("name_docs", "prefix_starts", "postings", "trigram_starts", "trigram_words", "word_trigram_counts")
+
+    def __init__(self, documents: Sequence[Sequence[str]]):
+        """
+        Build the index.
+
+        Args:
+            documents: For each document, the names it can be found by
+                (e.g. a department's name and its common variations)
+        """
+        self.size = len(documents)
+        self.fingerprint = index_fingerprint(documents)
+
+        entries = sorted({(normalize_name(name), doc) for doc, names in enumerate(documents) for name in names})
+        entries = [(name, doc) for name, doc in entries if name]
+        self.names = [name for name, _ in entries]
+        self.name_docs = array("I", (doc for _, doc in entries))
+
+        nodes: Dict[str, Set[int]] = defaultdict(set)
+        for name, doc in entries:
+            for word in name.split():
+                for end in range(1, len(word) + 1):
+                    nodes[word[:end]].add(doc)
+        self.prefixes = sorted(nodes)
+        self.prefix_starts, self.postings = _flatten([sorted(nodes[prefix]) for prefix in self.prefixes])
+
+        self.vocabulary = sorted({word for name in self.names for word in name.split()})
+        grams: Dict[str, List[int]] = defaultdict(list)
+        for word_id, word in enumerate(self.vocabulary):
+            for gram in word_trigrams(word):
+                grams[gram].append(word_id)
+        self.trigrams = sorted(grams)
+        self.trigram_starts, self.trigram_words = _flatten([grams[gram] for gram in self.trigrams])
+        self.word_trigram_counts = array("I", (len(word_trigrams(word)) for word in self.vocabulary))
+
+    def search(self, query: str, limit: int = 10, allowed: Optional[Container[int]] = None) -> List[int]:
+        """
+        Find the documents best matching a (partial) query.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of results
+            allowed: Only return documents in this set (e.g. one state)
+
+        Returns:
+            Document ids, best match first
+        """
+        normalized = normalize_name(query)
+        if not normalized or limit <= 0:
+            return []
+
+        results: List[int] = []
+        seen: Set[int] = set()
+
+        def take(doc: int) -> bool:
+            """Add a result; True once ``limit`` is reached."""
+            if doc not in seen and (allowed is None or doc in allowed):
+                seen.add(doc)
+                results.append(doc)
+            return len(results) >= limit
+
+        # Tier 1: the whole name starts with the query
+        for i in range(bisect.bisect_left(self.names, normalized), len(self.names)):
+            if not self.names[i].startswith(normalized):
+                break
+            if take(self.name_docs[i]):
+                return results
+
+        # Tier 2: every query word is a prefix of a word in the name
+        words = normalized.split()
+        spans = [self._node(word) for word in words]
+        if all(end > start for start, end in spans) and self._take_intersection(spans, take):
+            return results
+
+        # Tier 3: misspelled words matched by trigram similarity
+        self._take_fuzzy(words, spans, take)
+        return results
+
+    def _node(self, prefix: str) -> Span:
+        """Posting range of the trie node for ``prefix`` (empty if absent)."""
+        i = bisect.bisect_left(self.prefixes, prefix)
+        if i < len(self.prefixes) and self.prefixes[i] == prefix:
+            return self.prefix_starts[i], self.prefix_starts[i + 1]
+        return 0, 0
+
+    def _contains(self, span: Span, doc: int) -> bool:
+        start, end = span
+        i = bisect.bisect_left(self.postings, doc, start, end)
+        return i < end and self.postings[i] == doc
+
+    def _take_intersection(self, spans: Sequence[Span], take: Callable[[int], bool]) -> bool:
+        """Feed documents in every span to ``take`` in id order; True once it is full."""
+        spans = sorted(spans, key=lambda span: span[1] - span[0])
+        (start, end), others = spans[0], spans[1:]
+        for i in range(start, end):
+            doc = self.postings[i]
+            if all(self._contains(span, doc) for span in others) and take(doc):
+                return True
+        return False
+
+    def _similar_words(self, word: str) -> List[Tuple[float, str]]:
+        """Vocabulary words most similar to ``word`` by trigram Dice coefficient."""
+        grams = word_trigrams(word)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            i = bisect.bisect_left(self.trigrams, gram)
+            if i < len(self.trigrams) and self.trigrams[i] == gram:
+                for j in range(self.trigram_starts[i], self.trigram_starts[i + 1]):
+                    shared[self.trigram_words[j]] += 1
+
+        scored = []
+        for word_id, count in shared.items():
+            similarity = 2 * count / (len(grams) + self.word_trigram_counts[word_id])
+            if similarity >= FUZZY_THRESHOLD:
+                scored.append((similarity, self.vocabulary[word_id]))
+        return heapq.nlargest(FUZZY_CANDIDATES, scored)
+
+    def _take_fuzzy(self, words: Sequence[str], spans: Sequence[Span], take: Callable[[int], bool]) -> None:
+        """Try combinations of similar words, most similar combination first."""
+        options = []
+        for word, span in zip(words, spans):
+            if span[1] > span[0]:
+                options.append([(1.0, span)])
+            elif len(word) >= MIN_FUZZY_LENGTH:
+                similar = [(similarity, self._node(match)) for similarity, match in self._similar_words(word)]
+                if similar:
+                    options.append(similar)
+            # Short words with no prefix match are dropped as noise
+
+        # Nothing to relax if every word already had an exact prefix match
+        if not options or all(end > start for start, end in spans):
+            return
+        combinations = sorted(itertools.product(*options),
+                              key=lambda combination: -sum(similarity for similarity, _ in combination))
+        for combination in combinations:
+            if self._take_intersection([span for _, span in combination], take):
+                return
+
+    def to_snapshot(self) -> bytes:
+        """Serialize the index to a compact binary snapshot."""
+        header = json.dumps({
+            "version": SNAPSHOT_VERSION,
+            "fingerprint": self.fingerprint,
+            "size": self.size,
+            "names": self.names,
+            "prefixes": self.prefixes,
+            "vocabulary": self.vocabulary,
+            "trigrams": self.trigrams
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        parts = [struct.pack("<I", len(header)), header]
+        for name in self.ARRAYS:
+            values = array("I", getattr(self, name))
+            if sys.byteorder != "little":
+                values.byteswap()
+            parts += [struct.pack("<I", len(values)), values.tobytes()]
+        return zlib.compress(b"".join(parts), 6)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes) -> "SearchIndex":
+        """
+        Load an index from ``to_snapshot`` output.
+
+        Raises:
+            ValueError: If the snapshot is corrupt or from another version
+        """
+        try:
+            blob = zlib.decompress(data)
+            (header_length,) = struct.unpack_from("<I", blob, 0)
+            offset = 4 + header_length
+            header = json.loads(blob[4:offset].decode("utf-8"))
+            if header.get("version") != SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {header.get('version')}")
+
+            index = cls.__new__(cls)
+            index.fingerprint = header["fingerprint"]
+            index.size = header["size"]
+            index.names = header["names"]
+            index.prefixes = header["prefixes"]
+            index.vocabulary = header["vocabulary"]
+            index.trigrams = header["trigrams"]
+            for name in cls.ARRAYS:
+                (length,) = struct.unpack_from("<I", blob, offset)
+                offset += 4
+                values = array("I")
+                values.frombytes(blob[offset:offset + length * values.itemsize])
+                if sys.byteorder != "little":
+                    values.byteswap()
+                offset += length * values.itemsize
+                setattr(index, name, values)
+            return index
+        except (zlib.error, struct.error, UnicodeDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"corrupt search index snapshot: {e}")
+
+    @classmethod
+    def load_or_build(cls, documents: Sequence[Sequence[str]],
+                      snapshot_path: Optional[Union[str, Path]] = None) -> "SearchIndex":
+        """
+        Load the index from a snapshot of the same names, or build and save it.
+
+        Args:
+            documents: Names of each document, as for the constructor
+            snapshot_path: Snapshot file; without one the index is just built
+        """
+        if snapshot_path is None:
+            return cls(documents)
+
+        path = Path(snapshot_path)
+        fingerprint = index_fingerprint(documents)
+        if path.exists():
+            try:
+                index = cls.from_snapshot(path.read_bytes())
+                if index.fingerprint == fingerprint:
+                    return index
+                logger.info(f"Search index snapshot {path} is stale, rebuilding")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load search index snapshot {path}: {e}")
+
+        index = cls(documents)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_bytes(index.to_snapshot())
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not save search index snapshot {path}: {e}")
+        return index
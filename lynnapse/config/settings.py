@@ -43,6 +43,14 @@ class Settings(BaseSettings):
     llm_max_retries: int = Field(default=3, env="LLM_MAX_RETRIES")
     llm_cost_tracking: bool = Field(default=True, env="LLM_COST_TRACKING")
     
+    # External search result cache
+    search_cache_ttl: int = Field(default=30 * 24 * 3600, env="SEARCH_CACHE_TTL")  # 30 days
+    
+    # Web interface background jobs
+    web_job_workers: int = Field(default=2, env="WEB_JOB_WORKERS")
+    web_job_queue_size: int = Field(default=50, env="WEB_JOB_QUEUE_SIZE")
+    web_job_tracking: bool = Field(default=True, env="WEB_JOB_TRACKING")  # Mirror jobs to scrape_jobs
+    
     # Firecrawl
     firecrawl_api_key: Optional[str] = Field(default=None, env="FIRECRAWL_API_KEY")
     firecrawl_max_retries: int = Field(default=3, env="FIRECRAWL_MAX_RETRIES")
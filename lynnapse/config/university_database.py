@@ -9,11 +9,14 @@ import json
 import asyncio
 import aiohttp
 import logging
-from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
+from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import re
 
+from .search_index import SearchIndex
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -45,10 +48,17 @@ class UniversityDatabase:
     Provides search, filter, and selection functionality.
     """
     
-    def __init__(self, college_scorecard_api_key: Optional[str] = None):
+    def __init__(self, college_scorecard_api_key: Optional[str] = None,
+                 index_snapshot_path: Optional[str] = None):
         self.api_key = college_scorecard_api_key
         self.universities: List[University] = []
         self.departments: List[Department] = []
+        # Autocomplete index over university names, rebuilt when the list changes
+        self.index_snapshot_path = index_snapshot_path
+        self._university_index: Optional[SearchIndex] = None
+        self._indexed_universities: Optional[List[University]] = None
+        self._universities_by_state: Dict[str, Set[int]] = {}
+        self._department_index: Optional[SearchIndex] = None
         self._load_departments()
     
     def _load_departments(self):
@@ -165,6 +175,9 @@ class UniversityDatabase:
             )
             for dept in dept_data
         ]
+        self._department_index = SearchIndex(
+            [[dept.name] + dept.common_variations for dept in self.departments]
+        )
     
     async def load_universities_from_api(self, limit: int = 5000) -> bool:
         """
@@ -226,6 +239,7 @@ class UniversityDatabase:
                             break
                 
                 self.universities = universities
+                self._build_university_index()
                 logger.info(f"Loaded {len(self.universities)} universities from College Scorecard API")
                 return True
                 
@@ -276,37 +290,44 @@ class UniversityDatabase:
             )
             for i, (name, city, state, state_code, website, uni_type) in enumerate(backup_universities)
         ]
+        self._build_university_index()
         
         logger.info(f"Loaded {len(self.universities)} universities from backup data")
         return True
     
+    def _build_university_index(self) -> None:
+        """Build the university name index, or load it from the snapshot."""
+        self._university_index = SearchIndex.load_or_build(
+            [[uni.name] for uni in self.universities], self.index_snapshot_path
+        )
+        self._indexed_universities = self.universities
+        self._universities_by_state = defaultdict(set)
+        for i, uni in enumerate(self.universities):
+            self._universities_by_state[uni.state_code.lower()].add(i)
+    
     def search_universities(self, query: str, state: str = None, limit: int = 20) -> List[University]:
-        """Search universities by name, with optional state filter."""
+        """
+        Search universities by name, with optional state filter.
+        
+        Names starting with the query rank first, then names with a word
+        starting with each query word, then close misspellings.
+        """
         if not self.universities:
             return []
         
         # If no query provided, return all universities (for dropdown population)
         if not query.strip():
             results = self.universities
-        else:
-            query_lower = query.lower()
-            results = []
-            
-            for university in self.universities:
-                # Match by name
-                if query_lower in university.name.lower():
-                    if state is None or university.state_code.lower() == state.lower():
-                        results.append(university)
-                
-                if len(results) >= limit:
-                    break
+            if state:
+                results = [uni for uni in results if uni.state_code.lower() == state.lower()]
+            return results[:limit]
         
-        # Apply state filter if specified
-        if state:
-            results = [uni for uni in results if uni.state_code.lower() == state.lower()]
+        if (self._indexed_universities is not self.universities
+                or self._university_index.size != len(self.universities)):
+            self._build_university_index()
         
-        # Apply limit
-        return results[:limit]
+        allowed = self._universities_by_state.get(state.lower(), set()) if state else None
+        return [self.universities[i] for i in self._university_index.search(query, limit, allowed=allowed)]
     
     def get_universities_by_state(self, state_code: str) -> List[University]:
         """Get all universities in a specific state."""
@@ -325,25 +346,11 @@ class UniversityDatabase:
         return sorted([(code, name) for code, name in states.items()])
     
     def search_departments(self, query: str, limit: int = 10) -> List[Department]:
-        """Search departments by name or variation."""
+        """Search departments by name or variation, ranked like ``search_universities``."""
         if not query:
             return self.departments[:limit]
         
-        query_lower = query.lower()
-        results = []
-        
-        for dept in self.departments:
-            # Check name match
-            if query_lower in dept.name.lower():
-                results.append(dept)
-            # Check variations match
-            elif any(query_lower in var.lower() for var in dept.common_variations):
-                results.append(dept)
-            
-            if len(results) >= limit:
-                break
-        
-        return results
+        return [self.departments[i] for i in self._department_index.search(query, limit)]
     
     def get_departments_by_category(self, category: str) -> List[Department]:
         """Get departments by category."""
@@ -395,7 +402,7 @@ class UniversityDatabase:
             return self.load_universities_from_backup()
 
 # Global instance
-university_db = UniversityDatabase()
+university_db = UniversityDatabase(index_snapshot_path="cache/university_index.snapshot")
 
 async def get_university_suggestions(query: str, limit: int = 10) -> List[Dict]:
     """Get university suggestions for autocomplete."""
@@ -9,6 +9,7 @@ together to build flexible scraping pipelines:
 - LabCrawler: Processes research lab websites and information
 - DataCleaner: Normalizes and cleans scraped text data
 - MongoWriter: Handles all database operations and persistence
+- WriteBehindQueue: Batched, backpressured background persistence
 
 Enhanced Lab Discovery Components:
 - LinkHeuristics: Fast, zero-cost lab link extraction from HTML
@@ -21,6 +22,7 @@ from .faculty_crawler import FacultyCrawler
 from .lab_crawler import LabCrawler
 from .data_cleaner import DataCleaner
 from .mongo_writer import MongoWriter
+from .write_behind import WriteBehindQueue
 
 # Enhanced lab discovery components
 from .link_heuristics import LinkHeuristics
@@ -42,6 +44,7 @@ __all__ = [
     "LabCrawler",
     "DataCleaner",
     "MongoWriter",
+    "WriteBehindQueue",
     
     # Enhanced lab discovery
     "LinkHeuristics",
@@ -0,0 +1,341 @@
+"""
+Academic Store - Persistent backend for AcademicDataManager.
+
+Keeps entities, associations, enrichments and scrape sessions in one
+embedded SQLite database (WAL mode). Each manager map becomes a table
+with the entity JSON plus the columns the manager looks entities up by,
+and every lookup column is indexed.
+
+Tables are exposed as ``StoredEntityMap`` objects, which behave like the
+dictionaries AcademicDataManager uses in memory but load rows lazily:
+item access reads one row (through a small LRU cache) and iteration
+walks the table in pages, so large graphs are never fully resident.
+Loaded entities are copies; assign them back to persist changes.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import ItemsView, MutableMapping, ValuesView
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from ..models.entities import FacultyEntity, LabEntity, UniversityEntity, DepartmentEntity
+from ..models.associations import (
+    FacultyLabAssociation, FacultyDepartmentAssociation,
+    FacultyEnrichmentAssociation, LabDepartmentAssociation
+)
+from ..models.enrichments import (
+    LinkEnrichment, ProfileEnrichment, ResearchEnrichment, GoogleScholarEnrichment
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _lower(value: Optional[str]) -> Optional[str]:
+    return value.lower() if value else None
+
+
+# Manager attribute -> (table, model or None for plain JSON dicts,
+#                       {lookup column: value getter})
+STORE_TABLES: Dict[str, Tuple[str, Optional[Type[BaseModel]], Dict[str, Callable[[Any], Any]]]] = {
+    "faculty_entities": ("faculty", FacultyEntity, {
+        "normalized_name": lambda f: f.normalized_name,
+        "email": lambda f: _lower(f.email),
+        "primary_university_id": lambda f: f.primary_university_id,
+    }),
+    "lab_entities": ("labs", LabEntity, {
+        "normalized_name": lambda lab: lab.normalized_name,
+        "website_url": lambda lab: lab.website_url,
+    }),
+    "university_entities": ("universities", UniversityEntity, {}),
+    "department_entities": ("departments", DepartmentEntity, {
+        "university_id": lambda d: d.university_id,
+    }),
+    "faculty_lab_associations": ("faculty_lab_associations", FacultyLabAssociation, {
+        "faculty_id": lambda a: a.faculty_id,
+        "lab_id": lambda a: a.lab_id,
+    }),
+    "faculty_dept_associations": ("faculty_department_associations", FacultyDepartmentAssociation, {
+        "faculty_id": lambda a: a.faculty_id,
+        "department_id": lambda a: a.department_id,
+    }),
+    "faculty_enrichment_associations": ("faculty_enrichment_associations", FacultyEnrichmentAssociation, {
+        "faculty_id": lambda a: a.faculty_id,
+        "enrichment_id": lambda a: a.enrichment_id,
+    }),
+    "lab_dept_associations": ("lab_department_associations", LabDepartmentAssociation, {
+        "lab_id": lambda a: a.lab_id,
+        "department_id": lambda a: a.department_id,
+    }),
+    "link_enrichments": ("link_enrichments", LinkEnrichment, {}),
+    "profile_enrichments": ("profile_enrichments", ProfileEnrichment, {}),
+    "research_enrichments": ("research_enrichments", ResearchEnrichment, {}),
+    "scholar_enrichments": ("scholar_enrichments", GoogleScholarEnrichment, {}),
+    "scrape_sessions": ("scrape_sessions", None, {}),
+}
+
+
+class _StoredValuesView(ValuesView):
+    def __iter__(self):
+        for _, value in self._mapping.iter_rows():
+            yield value
+
+
+class _StoredItemsView(ItemsView):
+    def __iter__(self):
+        yield from self._mapping.iter_rows()
+
+
+class StoredEntityMap(MutableMapping):
+    """Dictionary-like view of one store table, loaded lazily."""
+
+    def __init__(self, store: "AcademicStore", table: str,
+                 model: Optional[Type[BaseModel]],
+                 columns: Dict[str, Callable[[Any], Any]],
+                 cache_size: int = 1024, page_size: int = 1000):
+        """
+        Initialize the table map.
+
+        Args:
+            store: Owning store
+            table: Table name
+            model: Model class of the values (None for JSON dictionaries)
+            columns: Lookup columns and how to compute them from a value
+            cache_size: Number of recently used values kept deserialized
+            page_size: Rows fetched per query while iterating
+        """
+        self.store = store
+        self.table = table
+        self.model = model
+        self.columns = columns
+        self.cache_size = cache_size
+        self.page_size = page_size
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+
+        column_names = ", ".join(["id", *columns, "data"])
+        placeholders = ", ".join("?" * (len(columns) + 2))
+        updates = ", ".join(f"{name} = excluded.{name}" for name in [*columns, "data"])
+        # Upsert keeps the rowid, so iteration stays in insertion order
+        self._upsert_sql = (
+            f"INSERT INTO {table} ({column_names}) VALUES ({placeholders}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+
+    def _encode(self, value: Any) -> str:
+        if self.model is not None:
+            return value.model_dump_json()
+        return json.dumps(value, default=str)
+
+    def _decode(self, data: str) -> Any:
+        if self.model is not None:
+            return self.model.model_validate_json(data)
+        return json.loads(data)
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        row = self.store.fetchone(f"SELECT data FROM {self.table} WHERE id = ?", (key,))
+        if row is None:
+            raise KeyError(key)
+        value = self._decode(row[0])
+        self._remember(key, value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        lookup_values = [getter(value) for getter in self.columns.values()]
+        self.store.execute(self._upsert_sql, (key, *lookup_values, self._encode(value)))
+        self._remember(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._cache.pop(key, None)
+        if not self.store.execute(f"DELETE FROM {self.table} WHERE id = ?", (key,)):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._cache:
+            return True
+        return self.store.fetchone(f"SELECT 1 FROM {self.table} WHERE id = ?", (key,)) is not None
+
+    def __len__(self) -> int:
+        return self.store.fetchone(f"SELECT COUNT(*) FROM {self.table}")[0]
+
+    def __bool__(self) -> bool:
+        return self.store.fetchone(f"SELECT 1 FROM {self.table} LIMIT 1") is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for rows in self._pages("id"):
+            for row in rows:
+                yield row[1]
+
+    def iter_rows(self) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(id, value)`` pairs page by page in insertion order."""
+        for rows in self._pages("id, data"):
+            for row in rows:
+                yield row[1], self._decode(row[2])
+
+    def _pages(self, columns: str) -> Iterator[List[tuple]]:
+        last_rowid = 0
+        while True:
+            rows = self.store.fetchall(
+                f"SELECT rowid, {columns} FROM {self.table} WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (last_rowid, self.page_size)
+            )
+            if not rows:
+                return
+            yield rows
+            last_rowid = rows[-1][0]
+
+    def values(self) -> ValuesView:
+        return _StoredValuesView(self)
+
+    def items(self) -> ItemsView:
+        return _StoredItemsView(self)
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.store.execute(f"DELETE FROM {self.table}")
+
+    def ids_where(self, column: str, value: Any) -> List[str]:
+        """IDs of rows whose lookup ``column`` equals ``value``, in insertion order."""
+        if column not in self.columns:
+            raise ValueError(f"{column} is not a lookup column of {self.table}")
+        rows = self.store.fetchall(
+            f"SELECT id FROM {self.table} WHERE {column} = ? ORDER BY rowid", (value,)
+        )
+        return [row[0] for row in rows]
+
+
+class StoredIndex:
+    """Lookup index over an indexed column of a store table."""
+
+    def __init__(self, table_map: StoredEntityMap, column: str):
+        self.table_map = table_map
+        self.column = column
+
+    def ids(self, key: Any) -> List[str]:
+        """IDs stored under ``key``, in insertion order."""
+        return self.table_map.ids_where(self.column, key) if key is not None else []
+
+    def first(self, key: Any) -> Optional[str]:
+        """First ID stored under ``key``."""
+        ids = self.ids(key)
+        return ids[0] if ids else None
+
+    def add(self, key: Any, entity_id: str) -> None:
+        """No-op: the column is written along with the row."""
+
+
+class AcademicStore:
+    """Embedded single-file store for AcademicDataManager data."""
+
+    def __init__(self, db_path: str = "db/academic_data.db", timeout: float = 30.0,
+                 cache_size: int = 1024, page_size: int = 1000):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: SQLite database file
+            timeout: Seconds to wait for a lock held by another process
+            cache_size: Deserialized values cached per table
+            page_size: Rows fetched per query while iterating a table
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._schema())
+
+        self.tables: Dict[str, StoredEntityMap] = {
+            attribute: StoredEntityMap(self, table, model, columns, cache_size, page_size)
+            for attribute, (table, model, columns) in STORE_TABLES.items()
+        }
+
+    @staticmethod
+    def _schema() -> str:
+        statements = []
+        for table, _, columns in STORE_TABLES.values():
+            column_defs = "".join(f"{name} TEXT, " for name in columns)
+            statements.append(
+                f"CREATE TABLE IF NOT EXISTS {table} (id TEXT PRIMARY KEY, {column_defs}data TEXT NOT NULL);"
+            )
+            for name in columns:
+                statements.append(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_{name} ON {table} ({name});"
+                )
+        return "\n".join(statements)
+
+    def table(self, attribute: str) -> StoredEntityMap:
+        """Get the map for an AcademicDataManager attribute name."""
+        return self.tables[attribute]
+
+    def index(self, attribute: str, column: str) -> StoredIndex:
+        """Get a lookup index over a table column."""
+        return StoredIndex(self.tables[attribute], column)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into one transaction.
+
+        Nested use joins the outer transaction; the outermost block
+        commits, or rolls back if it raises.
+        """
+        with self._lock:
+            if self._depth == 0:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute("ROLLBACK")
+                    for table_map in self.tables.values():
+                        table_map._cache.clear()
+                raise
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._conn.execute("COMMIT")
+
+    def execute(self, sql: str, params: tuple = ()) -> int:
+        """Run a write statement and return the number of changed rows."""
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def fetchone(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Row count of every table."""
+        return {attribute: len(table_map) for attribute, table_map in self.tables.items()}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
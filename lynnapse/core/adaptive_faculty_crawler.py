@@ -23,6 +23,7 @@ from .lab_classifier import LabNameClassifier
 from .site_search import SiteSearchTask
 from .data_cleaner import DataCleaner
 from .llm_assistant import LLMAssistant
+from .progress import ProgressCallback, report_progress
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +86,8 @@ class AdaptiveFacultyCrawler:
                                       university_name: str,
                                       department_filter: Optional[str] = None,
                                       max_faculty: Optional[int] = None,
-                                      base_url: Optional[str] = None) -> Dict[str, Any]:
+                                      base_url: Optional[str] = None,
+                                      progress_callback: Optional[ProgressCallback] = None) -> Dict[str, Any]:
         """
         Scrape faculty from any university by name with adaptive strategies.
         
@@ -94,6 +96,9 @@ class AdaptiveFacultyCrawler:
             department_filter: Specific department to target (optional)
             max_faculty: Maximum number of faculty to extract (optional)
             base_url: Base URL if known (optional)
+            progress_callback: Awaited with a ``"departments"`` event once
+                departments are discovered and a ``"department"`` event,
+                including the extracted records, after each one is scraped
             
         Returns:
             Dict containing extracted faculty data and metadata
@@ -123,6 +128,9 @@ class AdaptiveFacultyCrawler:
             
             logger.info(f"Found {len(departments)} departments")
             self.stats["departments_discovered"] += len(departments)
+            await report_progress(progress_callback, "departments", {
+                "departments": [dept.name for dept in departments]
+            })
             
             # Step 3: Extract faculty from each department
             all_faculty = []
@@ -142,6 +150,14 @@ class AdaptiveFacultyCrawler:
                     "structure_type": dept.structure_type,
                     "confidence": dept.confidence
                 }
+                await report_progress(progress_callback, "department", {
+                    "department": dept.name,
+                    "faculty_count": len(dept_faculty),
+                    "total_faculty": len(all_faculty),
+                    "departments_done": len(department_results),
+                    "departments_total": len(departments),
+                    "faculty": dept_faculty
+                })
             
             # Step 4: Deduplicate faculty across departments and enhance with lab associations
             deduplicated_faculty = self._deduplicate_and_enhance_faculty(all_faculty)
@@ -1184,15 +1200,13 @@ class AdaptiveFacultyCrawler:
                     except:
                         pass
                 
-                # Classify text blocks for lab names
-                for text in text_blocks:
-                    if len(text) > 10:
-                        is_lab, confidence = self.lab_classifier.predict(text)
-                        if is_lab and confidence > 0.7:
-                            lab_info["lab_names"].append(text[:100])  # Truncate long text
-                            lab_info["lab_discovery_method"] = "ml_classification"
-                            lab_info["lab_discovery_confidence"] = confidence
-                            break
+                # Classify all text blocks in one batch; the first lab name wins
+                found = self.lab_classifier.find_lab_names([text_blocks], confidence_threshold=0.7)[0]
+                if found:
+                    text, confidence = found
+                    lab_info["lab_names"].append(text[:100])  # Truncate long text
+                    lab_info["lab_discovery_method"] = "ml_classification"
+                    lab_info["lab_discovery_confidence"] = confidence
             
             # Method 3: External Search (if enabled and no local results)
             if (self.site_search and 
@@ -0,0 +1,233 @@
+"""
+Columnar Export - Parquet / Arrow IPC export of AcademicDataManager data.
+
+Writes one table per entity, association and enrichment map. Rows are
+read straight from the manager's dictionaries and written in fixed-size
+record batches (one Parquet row group per batch), so memory stays
+bounded by the batch size instead of the size of the dataset.
+
+Column types are derived from the Pydantic model annotations: scalars
+map to native Arrow types, lists of strings to ``list<string>``, and any
+other nested value (dicts, lists of dicts) is stored as a JSON string.
+"""
+
+import json
+import logging
+import typing
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from ..models.entities import FacultyEntity, LabEntity, UniversityEntity, DepartmentEntity
+from ..models.associations import (
+    FacultyLabAssociation, FacultyDepartmentAssociation,
+    FacultyEnrichmentAssociation, LabDepartmentAssociation
+)
+from ..models.enrichments import (
+    LinkEnrichment, ProfileEnrichment, ResearchEnrichment, GoogleScholarEnrichment
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+COLUMNAR_FORMATS = {"parquet": "parquet", "arrow": "arrow"}
+
+# Exported table -> (AcademicDataManager attribute, model class)
+COLUMNAR_TABLES: Dict[str, Tuple[str, Type[BaseModel]]] = {
+    "faculty": ("faculty_entities", FacultyEntity),
+    "labs": ("lab_entities", LabEntity),
+    "universities": ("university_entities", UniversityEntity),
+    "departments": ("department_entities", DepartmentEntity),
+    "faculty_lab_associations": ("faculty_lab_associations", FacultyLabAssociation),
+    "faculty_department_associations": ("faculty_dept_associations", FacultyDepartmentAssociation),
+    "faculty_enrichment_associations": ("faculty_enrichment_associations", FacultyEnrichmentAssociation),
+    "lab_department_associations": ("lab_dept_associations", LabDepartmentAssociation),
+    "link_enrichments": ("link_enrichments", LinkEnrichment),
+    "profile_enrichments": ("profile_enrichments", ProfileEnrichment),
+    "research_enrichments": ("research_enrichments", ResearchEnrichment),
+    "scholar_enrichments": ("scholar_enrichments", GoogleScholarEnrichment),
+}
+
+
+def _require_pyarrow() -> None:
+    """Raise a helpful error when pyarrow is missing."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Columnar export requires pyarrow: pip install pyarrow")
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    """Strip ``Optional[...]`` from a type annotation."""
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _to_json(value: Any) -> Optional[str]:
+    """Encode a nested value as JSON text."""
+    return None if value is None else json.dumps(value, default=str)
+
+
+def _enum_value(value: Any) -> Any:
+    """Store enums by value."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _column_for(annotation: Any) -> Tuple["pa.DataType", Optional[Callable[[Any], Any]]]:
+    """Map a model field annotation to an Arrow type and a value converter."""
+    annotation = _unwrap_optional(annotation)
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return pa.string(), _enum_value
+        if issubclass(annotation, bool):
+            return pa.bool_(), None
+        if issubclass(annotation, int):
+            return pa.int64(), None
+        if issubclass(annotation, float):
+            return pa.float64(), None
+        if issubclass(annotation, str):
+            return pa.string(), None
+        if issubclass(annotation, datetime):
+            return pa.timestamp("us"), None
+
+    if typing.get_origin(annotation) in (list, List) and typing.get_args(annotation) == (str,):
+        return pa.list_(pa.string()), None
+
+    return pa.string(), _to_json
+
+
+def build_table_schema(model: Type[BaseModel]) -> Tuple["pa.Schema", List[Tuple[str, Optional[Callable]]]]:
+    """
+    Build the Arrow schema for a model.
+
+    Args:
+        model: Pydantic model class
+
+    Returns:
+        Tuple of (schema, [(field name, converter or None), ...])
+    """
+    _require_pyarrow()
+
+    fields = []
+    converters = []
+    for name, field_info in model.model_fields.items():
+        arrow_type, converter = _column_for(field_info.annotation)
+        fields.append(pa.field(name, arrow_type))
+        converters.append((name, converter))
+
+    return pa.schema(fields), converters
+
+
+def _record_batches(records: Iterable[BaseModel], schema: "pa.Schema",
+                    converters: List[Tuple[str, Optional[Callable]]],
+                    batch_size: int) -> Iterable["pa.RecordBatch"]:
+    """Turn model instances into record batches of at most ``batch_size`` rows."""
+    columns: List[List[Any]] = [[] for _ in converters]
+    rows = 0
+
+    for record in records:
+        for column, (name, converter) in zip(columns, converters):
+            value = getattr(record, name)
+            column.append(converter(value) if converter else value)
+        rows += 1
+
+        if rows == batch_size:
+            yield pa.RecordBatch.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema
+            )
+            columns = [[] for _ in converters]
+            rows = 0
+
+    if rows:
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+            schema=schema
+        )
+
+
+def write_columnar_table(records: Iterable[BaseModel], model: Type[BaseModel],
+                         output_file: Path, format: str = "parquet",
+                         batch_size: int = 10000, compression: str = "zstd") -> int:
+    """
+    Stream model instances into a Parquet or Arrow IPC file.
+
+    Args:
+        records: Model instances to write
+        model: Model class (defines the schema)
+        output_file: Destination path
+        format: ``parquet`` or ``arrow``
+        batch_size: Rows per record batch / Parquet row group
+        compression: Compression codec
+
+    Returns:
+        Number of rows written
+    """
+    _require_pyarrow()
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {format}")
+
+    schema, converters = build_table_schema(model)
+    rows_written = 0
+
+    if format == "parquet":
+        with pq.ParquetWriter(str(output_file), schema, compression=compression) as writer:
+            for batch in _record_batches(records, schema, converters, batch_size):
+                writer.write_batch(batch, row_group_size=batch_size)
+                rows_written += batch.num_rows
+    else:
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.ipc.new_file(str(output_file), schema, options=options) as writer:
+            for batch in _record_batches(records, schema, converters, batch_size):
+                writer.write_batch(batch)
+                rows_written += batch.num_rows
+
+    return rows_written
+
+
+def export_columnar_tables(data_manager: Any, output_dir: str = "data_exports",
+                           format: str = "parquet", batch_size: int = 10000,
+                           compression: str = "zstd") -> Dict[str, str]:
+    """
+    Export every AcademicDataManager table in a columnar format.
+
+    Args:
+        data_manager: AcademicDataManager to export
+        output_dir: Output directory
+        format: ``parquet`` or ``arrow``
+        batch_size: Rows per record batch / Parquet row group
+        compression: Compression codec
+
+    Returns:
+        Mapping of table name to written file path
+    """
+    _require_pyarrow()
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {format}")
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    export_paths = {}
+    for table, (attribute, model) in COLUMNAR_TABLES.items():
+        output_file = output_path / f"{table}_{timestamp}.{COLUMNAR_FORMATS[format]}"
+        rows = write_columnar_table(
+            getattr(data_manager, attribute).values(), model, output_file,
+            format=format, batch_size=batch_size, compression=compression
+        )
+        export_paths[table] = str(output_file)
+        logger.debug(f"Exported {rows} rows to {output_file}")
+
+    return export_paths
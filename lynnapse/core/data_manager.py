@@ -8,8 +8,9 @@ and new ID-based relational structures, providing LLM-ready aggregated views.
 import json
 import uuid
 import logging
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from pathlib import Path
 
 from ..models.entities import (
@@ -27,10 +28,28 @@ from ..models.enrichments import (
 from ..models.aggregated import (
     FacultyAggregatedView, LabAggregatedView, DataRelationshipMap
 )
+from .duplicate_detection import DuplicateDetector, DuplicateCandidate
+from .academic_store import AcademicStore
+from .record_stream import iter_batches, merge_stats
 
 logger = logging.getLogger(__name__)
 
 
+class _MemoryIndex(dict):
+    """In-memory lookup index: key -> entity IDs in insertion order."""
+    
+    def ids(self, key: Any) -> List[str]:
+        return self.get(key, []) if key is not None else []
+    
+    def first(self, key: Any) -> Optional[str]:
+        ids = self.ids(key)
+        return ids[0] if ids else None
+    
+    def add(self, key: Any, entity_id: str) -> None:
+        if key is not None:
+            self.setdefault(key, []).append(entity_id)
+
+
 class AcademicDataManager:
     """
     Manages conversion and aggregation of academic data with fault tolerance.
@@ -42,8 +61,19 @@ class AcademicDataManager:
     - Detecting and handling data conflicts
     """
     
-    def __init__(self):
-        # In-memory storage (in production, this would be a database)
+    def __init__(self, store: Optional[AcademicStore] = None):
+        """
+        Initialize the data manager.
+        
+        Args:
+            store: Persistent store to keep all data in. Entities are then
+                loaded lazily and new ingests deduplicate against
+                everything stored before. Without a store, data lives in
+                memory for the lifetime of the manager.
+        """
+        self.store = store
+        
+        # In-memory storage unless a persistent store is given
         self.faculty_entities: Dict[str, FacultyEntity] = {}
         self.lab_entities: Dict[str, LabEntity] = {}
         self.university_entities: Dict[str, UniversityEntity] = {}
@@ -64,6 +94,12 @@ class AcademicDataManager:
         # Metadata
         self.scrape_sessions: Dict[str, Dict[str, Any]] = {}
         
+        if store is not None:
+            for attribute, table_map in store.tables.items():
+                setattr(self, attribute, table_map)
+        
+        self.rebuild_indexes()
+        
     def normalize_name(self, name: str) -> str:
         """Create normalized name for deduplication."""
         # Remove titles, punctuation, normalize spacing
@@ -86,14 +122,24 @@ class AcademicDataManager:
         name = re.sub(r'\s+', '::', name.strip())
         return name
     
-    def ingest_legacy_faculty_data(self, legacy_data: List[Dict[str, Any]], 
-                                  scrape_session_id: str) -> Dict[str, Any]:
+    def ingest_legacy_faculty_data(self, legacy_data: Iterable[Dict[str, Any]], 
+                                  scrape_session_id: str, batch_size: Optional[int] = None,
+                                  source: Optional[str] = None, start_offset: int = 0) -> Dict[str, Any]:
         """
         Convert legacy monolithic faculty data to ID-based entities.
         
         Args:
-            legacy_data: List of legacy faculty records
-            scrape_session_id: ID of the scrape session
+            legacy_data: Legacy faculty records; any iterable, consumed once,
+                so records can be streamed from disk
+            scrape_session_id: ID of the scrape session; ingesting into an
+                existing session extends it
+            batch_size: Commit every ``batch_size`` records instead of once
+                for the whole ingest. Each commit also records how far into
+                the input it got, so an interrupted ingest keeps its
+                committed batches (see ``find_interrupted_session``).
+            source: Input file the records come from, recorded on the session
+            start_offset: Input records skipped before ``legacy_data``, so
+                the recorded position counts from the start of ``source``
             
         Returns:
             Conversion report with statistics and issues
@@ -111,35 +157,81 @@ class AcademicDataManager:
             'issues': []
         }
         
-        # Track entities created in this session
-        session_faculty_ids = []
-        session_lab_ids = []
-        
-        for faculty_data in legacy_data:
-            try:
-                faculty_id = self._process_faculty_record(faculty_data, scrape_session_id, report)
-                if faculty_id:
-                    session_faculty_ids.append(faculty_id)
-                    report['faculty_processed'] += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing faculty {faculty_data.get('name')}: {e}")
-                report['issues'].append({
-                    'type': 'processing_error',
-                    'faculty': faculty_data.get('name'),
-                    'error': str(e)
-                })
+        # Track entities created in this session, continuing a resumed one
+        previous = self.scrape_sessions.get(scrape_session_id) or {}
+        session = {
+            'faculty_ids': list(previous.get('faculty_ids', [])),
+            'lab_ids': list(previous.get('lab_ids', [])),
+            'source_type': 'legacy_conversion',
+            'source': source,
+            'records_committed': start_offset,
+            'completed': False,
+        }
+        previous_report = previous.get('report') or {}
+        
+        # One transaction per batch (or per session) when backed by a persistent store
+        batches = iter_batches(legacy_data, batch_size) if batch_size is not None else [legacy_data]
+        for batch in batches:
+            with self._transaction():
+                for faculty_data in batch:
+                    session['records_committed'] += 1
+                    try:
+                        faculty_id = self._process_faculty_record(faculty_data, scrape_session_id, report)
+                        if faculty_id:
+                            session['faculty_ids'].append(faculty_id)
+                            report['faculty_processed'] += 1
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing faculty {faculty_data.get('name')}: {e}")
+                        report['issues'].append({
+                            'type': 'processing_error',
+                            'faculty': faculty_data.get('name'),
+                            'error': str(e)
+                        })
+                
+                self._save_session(scrape_session_id, session, previous_report, report)
         
-        # Store session metadata
+        with self._transaction():
+            session['completed'] = True
+            self._save_session(scrape_session_id, session, previous_report, report)
+        
+        return report
+    
+    def _save_session(self, scrape_session_id: str, session: Dict[str, Any],
+                      previous_report: Dict[str, Any], report: Dict[str, Any]) -> None:
+        """Store session metadata, with the report totalled across resumed runs."""
+        session_report = merge_stats(dict(previous_report), report)
+        session_report['issues'] = previous_report.get('issues', []) + report['issues']
         self.scrape_sessions[scrape_session_id] = {
+            **session,
             'processed_at': datetime.utcnow(),
-            'faculty_ids': session_faculty_ids,
-            'lab_ids': session_lab_ids,
-            'source_type': 'legacy_conversion',
-            'report': report
+            'report': session_report
         }
+    
+    def find_interrupted_session(self, source: str) -> Optional[Tuple[str, int]]:
+        """
+        Find the latest unfinished ingest of an input file.
         
-        return report
+        Args:
+            source: Input file, as passed to ``ingest_legacy_faculty_data``
+            
+        Returns:
+            ``(scrape_session_id, records_committed)`` to resume from, or
+            None if every ingest of ``source`` completed
+        """
+        interrupted = [
+            (str(session['processed_at']), session_id, session['records_committed'])
+            for session_id, session in self.scrape_sessions.items()
+            if session.get('source') == source and session.get('completed') is False
+        ]
+        if not interrupted:
+            return None
+        _, session_id, records_committed = max(interrupted)
+        return session_id, records_committed
+    
+    def _transaction(self):
+        """Transaction on the persistent store, or a no-op in memory."""
+        return self.store.transaction() if self.store is not None else nullcontext()
     
     def _process_faculty_record(self, faculty_data: Dict[str, Any], 
                                scrape_session_id: str, report: Dict[str, Any]) -> Optional[str]:
@@ -185,16 +277,114 @@ class AcademicDataManager:
     
     def _find_existing_faculty(self, normalized_name: str, faculty_data: Dict[str, Any]) -> Optional[str]:
         """Find existing faculty entity for deduplication."""
-        for faculty_id, faculty in self.faculty_entities.items():
-            if faculty.normalized_name == normalized_name:
-                # Additional verification using email or university
-                if faculty_data.get('email') and faculty.email == faculty_data.get('email'):
-                    return faculty_id
-                # Check if same university (loose matching)
-                if faculty_data.get('university') and faculty_data.get('university').lower() in faculty.primary_university_id.lower():
-                    return faculty_id
+        email = faculty_data.get('email')
+        university = (faculty_data.get('university') or '').lower()
+        
+        # Only faculty sharing the normalized name are candidates
+        for faculty_id in self._faculty_by_name.ids(normalized_name):
+            faculty = self.faculty_entities[faculty_id]
+            # Additional verification using email or university
+            if email and faculty.email == email:
+                return faculty_id
+            # Check if same university (loose matching)
+            if university and university in faculty.primary_university_id.lower():
+                return faculty_id
         return None
     
+    def _index_faculty(self, faculty: FacultyEntity) -> None:
+        """Add a faculty entity to the deduplication indexes."""
+        self._faculty_by_name.add(faculty.normalized_name, faculty.id)
+        if faculty.email:
+            self._faculty_by_email.add(faculty.email.lower(), faculty.id)
+        self._faculty_by_university.add(faculty.primary_university_id, faculty.id)
+    
+    def _index_lab(self, lab: LabEntity) -> None:
+        """Add a lab entity to the deduplication indexes."""
+        self._lab_by_name.add(lab.normalized_name, lab.id)
+        if lab.website_url:
+            self._lab_by_url.add(lab.website_url, lab.id)
+    
+    def _index_faculty_department_association(self, association: FacultyDepartmentAssociation) -> None:
+        """Add a faculty-department association to the adjacency maps."""
+        self._dept_assocs_by_faculty.add(association.faculty_id, association.id)
+    
+    def _index_faculty_lab_association(self, association: FacultyLabAssociation) -> None:
+        """Add a faculty-lab association to the adjacency maps."""
+        self._lab_assocs_by_faculty.add(association.faculty_id, association.id)
+        self._faculty_assocs_by_lab.add(association.lab_id, association.id)
+    
+    def _index_faculty_enrichment_association(self, association: FacultyEnrichmentAssociation) -> None:
+        """Add a faculty-enrichment association to the adjacency maps."""
+        self._enrichment_assocs_by_faculty.add(association.faculty_id, association.id)
+    
+    def _index_lab_department_association(self, association: LabDepartmentAssociation) -> None:
+        """Add a lab-department association to the adjacency maps."""
+        self._lab_assocs_by_department.add(association.department_id, association.id)
+    
+    def rebuild_indexes(self) -> None:
+        """
+        Rebuild the lookup indexes and adjacency maps from the entity maps.
+        
+        Call this after filling the entity or association maps directly
+        instead of through ingestion. With a persistent store the indexes
+        are columns of the stored tables and need no rebuilding.
+        """
+        if self.store is not None:
+            index = self.store.index
+            self._faculty_by_name = index('faculty_entities', 'normalized_name')
+            self._faculty_by_email = index('faculty_entities', 'email')
+            self._faculty_by_university = index('faculty_entities', 'primary_university_id')
+            self._lab_by_name = index('lab_entities', 'normalized_name')
+            self._lab_by_url = index('lab_entities', 'website_url')
+            self._dept_assocs_by_faculty = index('faculty_dept_associations', 'faculty_id')
+            self._lab_assocs_by_faculty = index('faculty_lab_associations', 'faculty_id')
+            self._enrichment_assocs_by_faculty = index('faculty_enrichment_associations', 'faculty_id')
+            self._faculty_assocs_by_lab = index('faculty_lab_associations', 'lab_id')
+            self._lab_assocs_by_department = index('lab_dept_associations', 'department_id')
+            return
+        
+        # Deduplication indexes, kept in sync by the create/merge paths
+        self._faculty_by_name = _MemoryIndex()
+        self._faculty_by_email = _MemoryIndex()
+        self._faculty_by_university = _MemoryIndex()
+        self._lab_by_name = _MemoryIndex()
+        self._lab_by_url = _MemoryIndex()
+        
+        # Adjacency maps (entity ID -> association IDs) for aggregated views
+        self._dept_assocs_by_faculty = _MemoryIndex()
+        self._lab_assocs_by_faculty = _MemoryIndex()
+        self._enrichment_assocs_by_faculty = _MemoryIndex()
+        self._faculty_assocs_by_lab = _MemoryIndex()
+        self._lab_assocs_by_department = _MemoryIndex()
+        
+        for faculty in self.faculty_entities.values():
+            self._index_faculty(faculty)
+        for lab in self.lab_entities.values():
+            self._index_lab(lab)
+        for association in self.faculty_dept_associations.values():
+            self._index_faculty_department_association(association)
+        for association in self.faculty_lab_associations.values():
+            self._index_faculty_lab_association(association)
+        for association in self.faculty_enrichment_associations.values():
+            self._index_faculty_enrichment_association(association)
+        for association in self.lab_dept_associations.values():
+            self._index_lab_department_association(association)
+    
+    def find_faculty_by_email(self, email: str) -> Optional[str]:
+        """Get the ID of the faculty member with this email, if any."""
+        return self._faculty_by_email.first(email.lower()) if email else None
+    
+    def get_faculty_ids_by_university(self, university_id: str) -> Set[str]:
+        """Get the IDs of faculty whose primary university is ``university_id``."""
+        return set(self._faculty_by_university.ids(university_id))
+    
+    def get_department_lab_ids(self, department_id: str) -> List[str]:
+        """Get the IDs of labs associated with a department."""
+        return [
+            self.lab_dept_associations[association_id].lab_id
+            for association_id in self._lab_assocs_by_department.ids(department_id)
+        ]
+    
     def _create_faculty_entity(self, faculty_data: Dict[str, Any], scrape_session_id: str) -> str:
         """Create new faculty entity."""
         faculty_id = f"fac_{uuid.uuid4().hex[:8]}"
@@ -222,6 +412,7 @@ class AcademicDataManager:
         )
         
         self.faculty_entities[faculty_id] = faculty
+        self._index_faculty(faculty)
         return faculty_id
     
     def _merge_faculty_data(self, existing_faculty_id: str, new_data: Dict[str, Any], 
@@ -232,6 +423,7 @@ class AcademicDataManager:
         # Update fields if new data has better information
         if new_data.get('email') and not faculty.email:
             faculty.email = new_data.get('email')
+            self._faculty_by_email.add(faculty.email.lower(), existing_faculty_id)
         if new_data.get('phone') and not faculty.phone:
             faculty.phone = new_data.get('phone')
         if new_data.get('title') and len(new_data.get('title', '')) > len(faculty.title or ''):
@@ -242,6 +434,8 @@ class AcademicDataManager:
         faculty.confidence_score = (faculty.confidence_score + new_confidence) / 2
         
         faculty.updated_at = datetime.utcnow()
+        # Write back so a persistent store sees the changes
+        self.faculty_entities[existing_faculty_id] = faculty
         return existing_faculty_id
     
     def _ensure_university_entity(self, faculty_data: Dict[str, Any], 
@@ -308,13 +502,10 @@ class AcademicDataManager:
         
         # Check if lab already exists
         existing_lab = None
-        for existing_id, lab in self.lab_entities.items():
-            if lab_name and lab.normalized_name == self.normalize_institution_name(lab_name):
-                existing_lab = existing_id
-                break
-            if lab_url and lab.website_url == lab_url:
-                existing_lab = existing_id
-                break
+        if lab_name:
+            existing_lab = self._lab_by_name.first(self.normalize_institution_name(lab_name))
+        if not existing_lab and lab_url:
+            existing_lab = self._lab_by_url.first(lab_url)
         
         if existing_lab:
             return existing_lab
@@ -332,6 +523,7 @@ class AcademicDataManager:
         )
         
         self.lab_entities[lab_id] = lab
+        self._index_lab(lab)
         
         # Create lab-department association
         lab_dept_assoc = LabDepartmentAssociation(
@@ -342,6 +534,7 @@ class AcademicDataManager:
             created_by_scrape_id=scrape_session_id
         )
         self.lab_dept_associations[lab_dept_assoc.id] = lab_dept_assoc
+        self._index_lab_department_association(lab_dept_assoc)
         
         report['labs_created'] += 1
         return lab_id
@@ -360,6 +553,7 @@ class AcademicDataManager:
         )
         
         self.faculty_dept_associations[association.id] = association
+        self._index_faculty_department_association(association)
     
     def _create_faculty_lab_association(self, faculty_id: str, lab_id: str,
                                        faculty_data: Dict[str, Any], scrape_session_id: str):
@@ -384,6 +578,7 @@ class AcademicDataManager:
         )
         
         self.faculty_lab_associations[association.id] = association
+        self._index_faculty_lab_association(association)
     
     def _process_faculty_enrichments(self, faculty_id: str, faculty_data: Dict[str, Any],
                                    scrape_session_id: str, report: Dict[str, Any]):
@@ -498,6 +693,7 @@ class AcademicDataManager:
         )
         
         self.faculty_enrichment_associations[association.id] = association
+        self._index_faculty_enrichment_association(association)
     
     def get_faculty_aggregated_view(self, faculty_id: str) -> Optional[FacultyAggregatedView]:
         """Get complete aggregated view of a faculty member for LLM processing."""
@@ -511,23 +707,23 @@ class AcademicDataManager:
         
         # Get all department associations
         dept_associations = []
-        for assoc in self.faculty_dept_associations.values():
-            if assoc.faculty_id == faculty_id:
-                dept = self.department_entities.get(assoc.department_id)
-                dept_associations.append({
-                    'association': assoc.dict(),
-                    'department': dept.dict() if dept else None
-                })
+        for assoc_id in self._dept_assocs_by_faculty.ids(faculty_id):
+            assoc = self.faculty_dept_associations[assoc_id]
+            dept = self.department_entities.get(assoc.department_id)
+            dept_associations.append({
+                'association': assoc.dict(),
+                'department': dept.dict() if dept else None
+            })
         
         # Get all lab associations
         lab_associations = []
-        for assoc in self.faculty_lab_associations.values():
-            if assoc.faculty_id == faculty_id:
-                lab = self.lab_entities.get(assoc.lab_id)
-                lab_associations.append({
-                    'association': assoc.dict(),
-                    'lab': lab.dict() if lab else None
-                })
+        for assoc_id in self._lab_assocs_by_faculty.ids(faculty_id):
+            assoc = self.faculty_lab_associations[assoc_id]
+            lab = self.lab_entities.get(assoc.lab_id)
+            lab_associations.append({
+                'association': assoc.dict(),
+                'lab': lab.dict() if lab else None
+            })
         
         # Get all enrichments
         enrichments = {
@@ -537,30 +733,30 @@ class AcademicDataManager:
             'research': []
         }
         
-        for assoc in self.faculty_enrichment_associations.values():
-            if assoc.faculty_id == faculty_id:
-                enrichment_data = None
-                
-                if assoc.enrichment_type == 'google_scholar':
-                    enrichment = self.scholar_enrichments.get(assoc.enrichment_id)
-                    if enrichment:
-                        enrichment_data = enrichment.dict()
-                        enrichment_data['association'] = assoc.dict()
-                        enrichments['google_scholar'].append(enrichment_data)
-                
-                elif assoc.enrichment_type == 'profile':
-                    enrichment = self.profile_enrichments.get(assoc.enrichment_id)
-                    if enrichment:
-                        enrichment_data = enrichment.dict()
-                        enrichment_data['association'] = assoc.dict()
-                        enrichments['profile'].append(enrichment_data)
-                
-                elif assoc.enrichment_type == 'links':
-                    enrichment = self.link_enrichments.get(assoc.enrichment_id)
-                    if enrichment:
-                        enrichment_data = enrichment.dict()
-                        enrichment_data['association'] = assoc.dict()
-                        enrichments['links'].append(enrichment_data)
+        for assoc_id in self._enrichment_assocs_by_faculty.ids(faculty_id):
+            assoc = self.faculty_enrichment_associations[assoc_id]
+            enrichment_data = None
+            
+            if assoc.enrichment_type == 'google_scholar':
+                enrichment = self.scholar_enrichments.get(assoc.enrichment_id)
+                if enrichment:
+                    enrichment_data = enrichment.dict()
+                    enrichment_data['association'] = assoc.dict()
+                    enrichments['google_scholar'].append(enrichment_data)
+            
+            elif assoc.enrichment_type == 'profile':
+                enrichment = self.profile_enrichments.get(assoc.enrichment_id)
+                if enrichment:
+                    enrichment_data = enrichment.dict()
+                    enrichment_data['association'] = assoc.dict()
+                    enrichments['profile'].append(enrichment_data)
+            
+            elif assoc.enrichment_type == 'links':
+                enrichment = self.link_enrichments.get(assoc.enrichment_id)
+                if enrichment:
+                    enrichment_data = enrichment.dict()
+                    enrichment_data['association'] = assoc.dict()
+                    enrichments['links'].append(enrichment_data)
         
         # Compute metrics
         data_sources = []
@@ -620,24 +816,24 @@ class AcademicDataManager:
         
         # Get faculty associations
         faculty_associations = []
-        for assoc in self.faculty_lab_associations.values():
-            if assoc.lab_id == lab_id:
-                faculty = self.faculty_entities.get(assoc.faculty_id)
-                if faculty:
-                    # Get faculty enrichments too
-                    faculty_enrichments = {}
-                    for enrich_assoc in self.faculty_enrichment_associations.values():
-                        if enrich_assoc.faculty_id == assoc.faculty_id:
-                            if enrich_assoc.enrichment_type not in faculty_enrichments:
-                                faculty_enrichments[enrich_assoc.enrichment_type] = []
-                    
-                    faculty_associations.append({
-                        'association': assoc.dict(),
-                        'faculty': {
-                            **faculty.dict(),
-                            'enrichments': faculty_enrichments
-                        }
-                    })
+        for assoc_id in self._faculty_assocs_by_lab.ids(lab_id):
+            assoc = self.faculty_lab_associations[assoc_id]
+            faculty = self.faculty_entities.get(assoc.faculty_id)
+            if faculty:
+                # Get faculty enrichments too
+                faculty_enrichments = {}
+                for enrich_assoc_id in self._enrichment_assocs_by_faculty.ids(assoc.faculty_id):
+                    enrich_assoc = self.faculty_enrichment_associations[enrich_assoc_id]
+                    if enrich_assoc.enrichment_type not in faculty_enrichments:
+                        faculty_enrichments[enrich_assoc.enrichment_type] = []
+                
+                faculty_associations.append({
+                    'association': assoc.dict(),
+                    'faculty': {
+                        **faculty.dict(),
+                        'enrichments': faculty_enrichments
+                    }
+                })
         
         # Calculate lab metrics
         member_count = len(faculty_associations)
@@ -661,8 +857,22 @@ class AcademicDataManager:
             confidence_score=lab.confidence_score
         )
     
-    def export_aggregated_views(self, output_dir: str = "data_exports") -> Dict[str, str]:
-        """Export all data as LLM-ready aggregated views."""
+    def export_aggregated_views(self, output_dir: str = "data_exports",
+                                format: str = "json") -> Dict[str, str]:
+        """
+        Export all data as LLM-ready aggregated views.
+        
+        Args:
+            output_dir: Output directory
+            format: ``json`` for aggregated view documents, or ``parquet`` /
+                ``arrow`` for columnar tables (see ``export_columnar``)
+            
+        Returns:
+            Mapping of export name to written file path
+        """
+        if format != "json":
+            return self.export_columnar(output_dir, format=format)
+        
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
@@ -702,8 +912,92 @@ class AcademicDataManager:
             'relationship_map': str(map_file)
         }
     
-    def generate_relationship_map(self) -> DataRelationshipMap:
-        """Generate a complete relationship map of all data."""
+    def export_columnar(self, output_dir: str = "data_exports", format: str = "parquet",
+                        batch_size: int = 10000, compression: str = "zstd") -> Dict[str, str]:
+        """
+        Export faculty, lab, association and enrichment tables as Parquet or Arrow IPC.
+        
+        Rows are streamed from the entity maps in record batches, so no
+        aggregated views are built. The relationship map is written as JSON
+        alongside the tables.
+        
+        Args:
+            output_dir: Output directory
+            format: ``parquet`` or ``arrow``
+            batch_size: Rows per record batch / Parquet row group
+            compression: Compression codec
+            
+        Returns:
+            Mapping of table name to written file path
+        """
+        from .columnar_export import export_columnar_tables
+        
+        export_paths = export_columnar_tables(
+            self, output_dir, format=format, batch_size=batch_size, compression=compression
+        )
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        map_file = Path(output_dir) / f"data_relationship_map_{timestamp}.json"
+        with open(map_file, 'w') as f:
+            json.dump(self.generate_relationship_map().dict(), f, indent=2, default=str)
+        export_paths['relationship_map'] = str(map_file)
+        
+        return export_paths
+    
+    def _faculty_research_terms(self, faculty_id: str) -> List[str]:
+        """Research keywords from a faculty member's profile and scholar enrichments."""
+        terms = []
+        for assoc_id in self._enrichment_assocs_by_faculty.ids(faculty_id):
+            assoc = self.faculty_enrichment_associations[assoc_id]
+            if assoc.enrichment_type == 'profile':
+                enrichment = self.profile_enrichments.get(assoc.enrichment_id)
+                if enrichment:
+                    terms.extend(enrichment.research_keywords)
+            elif assoc.enrichment_type == 'google_scholar':
+                enrichment = self.scholar_enrichments.get(assoc.enrichment_id)
+                if enrichment:
+                    terms.extend(enrichment.scholar_interests)
+        return terms
+    
+    def find_potential_duplicates(self, detector: Optional[DuplicateDetector] = None) -> Dict[str, List[str]]:
+        """
+        Find faculty entities that probably describe the same person.
+        
+        Uses blocked fuzzy matching (see ``DuplicateDetector``), so it
+        catches variants such as "J. Smith" / "John Smith" that exact
+        normalized-name deduplication misses.
+        
+        Args:
+            detector: Detector to use (defaults to ``DuplicateDetector()``)
+            
+        Returns:
+            Mapping of faculty ID to the IDs it may duplicate, best match first
+        """
+        detector = detector or DuplicateDetector()
+        candidates = [
+            DuplicateCandidate(
+                id=faculty.id,
+                name=faculty.name,
+                email=faculty.email,
+                research_interests=self._faculty_research_terms(faculty.id)
+            )
+            for faculty in self.faculty_entities.values()
+        ]
+        
+        duplicates: Dict[str, List[str]] = {}
+        for pair in detector.find_duplicates(candidates):
+            duplicates.setdefault(pair.id_a, []).append(pair.id_b)
+            duplicates.setdefault(pair.id_b, []).append(pair.id_a)
+        return duplicates
+    
+    def generate_relationship_map(self, detect_duplicates: bool = True) -> DataRelationshipMap:
+        """
+        Generate a complete relationship map of all data.
+        
+        Args:
+            detect_duplicates: Fill ``potential_duplicates`` using fuzzy
+                duplicate detection
+        """
         
         # Count entities
         total_faculty = len(self.faculty_entities)
@@ -760,6 +1054,6 @@ class AcademicDataManager:
             orphaned_faculty=orphaned_faculty,
             orphaned_labs=orphaned_labs,
             orphaned_enrichments=[],  # TODO: Implement
-            potential_duplicates={},  # TODO: Implement duplicate detection
+            potential_duplicates=self.find_potential_duplicates() if detect_duplicates else {},
             data_issues=[]  # TODO: Implement issue detection
         ) 
\ No newline at end of file
@@ -0,0 +1,339 @@
+"""
+Duplicate Detection - Blocked fuzzy matching of faculty entities.
+
+Comparing every pair of faculty is quadratic, so candidate pairs are
+generated from blocking keys instead:
+
+- last name plus first initial ("smith:j" matches "J. Smith" and "John Smith")
+- email domain plus last-name initial
+- MinHash/LSH bands over name trigrams and research-interest tokens
+
+Blocks that grow past ``max_block_size`` are not expanded into all pairs;
+their members are sorted by name and only compared within a sliding
+window. Candidate pairs are then scored in one vectorized pass over
+MinHash signatures and encoded name/email columns.
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_TITLES = {'dr', 'prof', 'professor', 'phd', 'md', 'mr', 'mrs', 'ms', 'jr', 'sr', 'ii', 'iii'}
+_TOKEN = re.compile(r'[a-z0-9]+')
+
+# MinHash permutations are h(x) = a * x + b with wrapping 64-bit arithmetic
+_EMPTY_SIGNATURE = np.iinfo(np.uint64).max
+
+
+class DuplicateCandidate(NamedTuple):
+    """Fields of an entity used for duplicate detection."""
+    id: str
+    name: str
+    email: Optional[str] = None
+    research_interests: Sequence[str] = ()
+
+
+class DuplicatePair(NamedTuple):
+    """A scored pair of potential duplicates."""
+    id_a: str
+    id_b: str
+    score: float
+
+
+def name_tokens(name: str) -> List[str]:
+    """Lowercase, ASCII-folded name tokens without titles."""
+    folded = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode().lower()
+    return [token for token in _TOKEN.findall(folded) if token not in _TITLES]
+
+
+def _hash_token(token: str) -> int:
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+class DuplicateDetector:
+    """Find likely duplicate faculty with blocking, MinHash/LSH and vectorized scoring."""
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = 64, bands: int = 8,
+                 max_block_size: int = 200, window: int = 10, seed: int = 1,
+                 chunk_size: int = 5000, score_chunk_size: int = 100000):
+        """
+        Initialize the detector.
+
+        Args:
+            threshold: Minimum score for a pair to be reported
+            num_perm: MinHash permutations per signature
+            bands: LSH bands (``num_perm`` must be divisible by it)
+            max_block_size: Blocks larger than this are compared by sliding window
+            window: Neighbours compared within an oversized block
+            seed: Seed for the MinHash permutations
+            chunk_size: Entities hashed per vectorized MinHash step
+            score_chunk_size: Candidate pairs scored per vectorized step
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_block_size = max_block_size
+        self.window = window
+        self.chunk_size = chunk_size
+        self.score_chunk_size = score_chunk_size
+
+        rng = np.random.default_rng(seed)
+        max_value = np.iinfo(np.uint64).max
+        # Odd multipliers make each permutation a bijection on 64-bit values
+        self._a = rng.integers(0, max_value, size=num_perm, dtype=np.uint64, endpoint=True) | np.uint64(1)
+        self._b = rng.integers(0, max_value, size=num_perm, dtype=np.uint64, endpoint=True)
+        self._band_mix = rng.integers(0, max_value, size=self.rows, dtype=np.uint64, endpoint=True) | np.uint64(1)
+
+        self.stats = {
+            'entities': 0,
+            'blocks': 0,
+            'windowed_blocks': 0,
+            'candidate_pairs': 0,
+            'duplicates_found': 0
+        }
+
+    def minhash(self, token_sets: Sequence[Sequence[str]]) -> np.ndarray:
+        """
+        Compute MinHash signatures.
+
+        Args:
+            token_sets: One token collection per entity
+
+        Returns:
+            ``(len(token_sets), num_perm)`` uint64 array; rows of empty token
+            sets are all ``2**64 - 1``
+        """
+        signatures = np.full((len(token_sets), self.num_perm), _EMPTY_SIGNATURE, dtype=np.uint64)
+        token_hashes: Dict[str, int] = {}
+
+        for start in range(0, len(token_sets), self.chunk_size):
+            chunk = token_sets[start:start + self.chunk_size]
+            hashes = []
+            owners = []
+            for offset, tokens in enumerate(chunk):
+                unique = set()
+                for token in tokens:
+                    token_hash = token_hashes.get(token)
+                    if token_hash is None:
+                        token_hash = token_hashes[token] = _hash_token(token)
+                    unique.add(token_hash)
+                hashes.extend(unique)
+                owners.extend([start + offset] * len(unique))
+            if not hashes:
+                continue
+
+            values = np.asarray(hashes, dtype=np.uint64)[:, None]
+            permuted = values * self._a + self._b
+            owners = np.asarray(owners)
+            # Owners are contiguous, so each entity's minimum is one reduceat segment
+            segment_starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+            signatures[owners[segment_starts]] = np.minimum.reduceat(permuted, segment_starts, axis=0)
+
+        return signatures
+
+    def _band_keys(self, signatures: np.ndarray) -> np.ndarray:
+        """Hash each LSH band of each signature to one uint64 bucket key."""
+        banded = signatures.reshape(len(signatures), self.bands, self.rows)
+        return (banded * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+    def _block_pairs(self, keys: np.ndarray, name_rank: np.ndarray) -> List[np.ndarray]:
+        """
+        Candidate pairs from one blocking key column.
+
+        Args:
+            keys: Block key per entity, ``-1`` for entities without a key
+            name_rank: Position of each entity in name order
+
+        Returns:
+            Arrays of ``(i, j)`` index pairs with ``i < j``
+        """
+        valid = np.flatnonzero(keys >= 0)
+        if len(valid) < 2:
+            return []
+
+        order = valid[np.argsort(keys[valid], kind='stable')]
+        sorted_keys = keys[order]
+        boundaries = np.flatnonzero(sorted_keys[1:] != sorted_keys[:-1]) + 1
+        starts = np.r_[0, boundaries]
+        ends = np.r_[boundaries, len(order)]
+
+        sizes = ends - starts
+        self.stats['blocks'] += int(np.count_nonzero(sizes > 1))
+
+        pairs = []
+        # Expand all blocks of the same size at once
+        for size in np.unique(sizes[(sizes > 1) & (sizes <= self.max_block_size)]):
+            block_starts = starts[sizes == size]
+            members = order[block_starts[:, None] + np.arange(size)]
+            i, j = np.triu_indices(size, k=1)
+            pairs.append(np.column_stack((members[:, i].ravel(), members[:, j].ravel())))
+
+        for start, end in zip(starts[sizes > self.max_block_size], ends[sizes > self.max_block_size]):
+            self.stats['windowed_blocks'] += 1
+            members = order[start:end]
+            members = members[np.argsort(name_rank[members])]
+            for shift in range(1, min(self.window, len(members) - 1) + 1):
+                pairs.append(np.column_stack((members[:-shift], members[shift:])))
+
+        return pairs
+
+    @staticmethod
+    def _encode(values: Sequence[Optional[str]]) -> np.ndarray:
+        """Encode strings as integer codes, ``-1`` for empty values."""
+        codes: Dict[str, int] = {}
+        return np.fromiter(
+            (codes.setdefault(value, len(codes)) if value else -1 for value in values),
+            dtype=np.int64, count=len(values)
+        )
+
+    def candidate_pairs(self, candidates: Sequence[DuplicateCandidate]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Generate candidate pairs and the per-entity columns used to score them.
+
+        Returns:
+            Tuple of (``(n, 2)`` array of unique index pairs, feature columns)
+        """
+        n = len(candidates)
+        tokens = [name_tokens(candidate.name) for candidate in candidates]
+        last = [t[-1] if t else '' for t in tokens]
+        first = [t[0] if len(t) > 1 else '' for t in tokens]
+        domains = [
+            candidate.email.rsplit('@', 1)[-1].lower() if candidate.email and '@' in candidate.email else ''
+            for candidate in candidates
+        ]
+
+        name_shingles = []
+        interest_tokens = []
+        for t, candidate in zip(tokens, candidates):
+            padded = f" {' '.join(t)} "
+            name_shingles.append([padded[k:k + 3] for k in range(len(padded) - 2)] if t else [])
+            interest_tokens.append([
+                token for interest in candidate.research_interests for token in name_tokens(interest)
+            ])
+
+        name_signatures = self.minhash(name_shingles)
+        interest_signatures = self.minhash(interest_tokens)
+        # The MinHash of a union is the elementwise minimum of the parts
+        combined_signatures = np.minimum(name_signatures, interest_signatures)
+
+        name_rank = np.empty(n, dtype=np.int64)
+        name_rank[sorted(range(n), key=lambda k: (last[k], ' '.join(tokens[k])))] = np.arange(n)
+
+        columns = {
+            'name_signatures': name_signatures,
+            'interest_signatures': interest_signatures,
+            'has_interests': np.fromiter((bool(t) for t in interest_tokens), dtype=bool, count=n),
+            'last': self._encode(last),
+            'first': self._encode(first),
+            'initial': self._encode([f[:1] for f in first]),
+            'is_initial': np.fromiter((len(f) == 1 for f in first), dtype=bool, count=n),
+            'email': self._encode([(c.email or '').lower() for c in candidates]),
+        }
+
+        pairs = []
+        pairs += self._block_pairs(
+            self._encode([f"{last_name}:{first_name[:1]}" if last_name else ''
+                          for last_name, first_name in zip(last, first)]), name_rank
+        )
+        pairs += self._block_pairs(
+            self._encode([f"{domain}:{last_name[:1]}" if domain and last_name else ''
+                          for domain, last_name in zip(domains, last)]), name_rank
+        )
+        band_keys = self._band_keys(combined_signatures)
+        has_tokens = np.fromiter((bool(s) for s in name_shingles), dtype=bool, count=n)
+        for band in range(self.bands):
+            keys = band_keys[:, band].astype(np.int64) & np.int64(0x7FFFFFFFFFFFFFFF)
+            keys[~has_tokens] = -1
+            pairs += self._block_pairs(keys, name_rank)
+
+        if not pairs:
+            return np.empty((0, 2), dtype=np.int64), columns
+
+        pairs = np.concatenate(pairs)
+        pairs.sort(axis=1)
+        unique_codes = np.unique(pairs[:, 0] * n + pairs[:, 1])
+        return np.column_stack((unique_codes // n, unique_codes % n)), columns
+
+    def score_pairs(self, pairs: np.ndarray, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Score candidate pairs in one vectorized pass.
+
+        The score combines name trigram similarity with a same last name /
+        compatible first name check, blends in research-interest similarity
+        when both entities have interests, and is overridden by email:
+        the same email scores 1.0, two different emails cost 0.2.
+        """
+        a, b = pairs[:, 0], pairs[:, 1]
+
+        name_similarity = (columns['name_signatures'][a] == columns['name_signatures'][b]).mean(axis=1)
+        interest_similarity = (columns['interest_signatures'][a] == columns['interest_signatures'][b]).mean(axis=1)
+
+        first, initial, is_initial = columns['first'], columns['initial'], columns['is_initial']
+        first_compatible = (first[a] == first[b]) | (
+            (initial[a] == initial[b]) & (is_initial[a] | is_initial[b])
+        )
+        last = columns['last']
+        same_person_name = (last[a] == last[b]) & (last[a] >= 0) & first_compatible
+
+        scores = 0.5 * name_similarity + 0.5 * same_person_name
+        both_interests = columns['has_interests'][a] & columns['has_interests'][b]
+        scores = np.where(both_interests, 0.8 * scores + 0.2 * interest_similarity, scores)
+
+        email = columns['email']
+        both_emails = (email[a] >= 0) & (email[b] >= 0)
+        scores = np.where(both_emails & (email[a] != email[b]), scores - 0.2, scores)
+        scores = np.where(both_emails & (email[a] == email[b]), 1.0, scores)
+
+        return np.clip(scores, 0.0, 1.0)
+
+    def find_duplicates(self, candidates: Iterable[DuplicateCandidate]) -> List[DuplicatePair]:
+        """
+        Find potential duplicate pairs.
+
+        Args:
+            candidates: Entities to compare
+
+        Returns:
+            Pairs scoring at least ``threshold``, highest score first
+        """
+        candidates = list(candidates)
+        self.stats['entities'] += len(candidates)
+
+        pairs, columns = self.candidate_pairs(candidates)
+        self.stats['candidate_pairs'] += len(pairs)
+        if not len(pairs):
+            return []
+
+        # Score in chunks so the signature gathers stay bounded in memory
+        kept_pairs = []
+        kept_scores = []
+        for start in range(0, len(pairs), self.score_chunk_size):
+            chunk = pairs[start:start + self.score_chunk_size]
+            scores = self.score_pairs(chunk, columns)
+            keep = scores >= self.threshold
+            kept_pairs.append(chunk[keep])
+            kept_scores.append(scores[keep])
+
+        pairs = np.concatenate(kept_pairs)
+        scores = np.concatenate(kept_scores)
+        order = np.argsort(-scores, kind='stable')
+        self.stats['duplicates_found'] += len(order)
+
+        return [
+            DuplicatePair(candidates[pairs[k, 0]].id, candidates[pairs[k, 1]].id, float(scores[k]))
+            for k in order
+        ]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get detection statistics."""
+        return self.stats.copy()
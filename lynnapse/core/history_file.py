@@ -0,0 +1,37 @@
+"""
+History files - JSON persistence for counters learned across runs.
+
+Components that learn from their own results (strategy yields, URL
+template success rates) keep their counters in a small JSON file. Writes
+go through a temporary file and an atomic rename, so a run interrupted
+mid-save leaves the previous history intact.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+
+def read_history(path: Path) -> Dict[str, Any]:
+    """
+    Read a history file.
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If it is not a JSON object
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+    return data
+
+
+def write_history(path: Path, data: Dict[str, Any]) -> None:
+    """Replace a history file atomically, creating its directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
@@ -4,61 +4,160 @@ LabNameClassifier - ML-powered lab name detection from unstructured text.
 This module implements a lightweight neural network classifier that can identify
 laboratory names and research center names from unstructured text blocks on
 faculty pages. Uses TF-IDF features and a small MLP for fast inference.
+
+Scoring is batched: all candidate blocks of a page (or of a whole department)
+are vectorized into one sparse matrix and scored with a single forward pass,
+and scores are memoized by text hash so repeated boilerplate is scored once.
+
+scikit-learn and the saved model are loaded lazily, on first use, so
+constructing a classifier (and every crawler that owns one) stays cheap.
+Models are saved with joblib and loaded memory-mapped, so worker processes
+loading the same file share one copy of the weight arrays.
+
+Two model modes are available:
+
+- ``tfidf`` (default): TF-IDF features and a small MLP, retrained from
+  scratch on the full corpus.
+- ``hashed``: stateless feature hashing and a logistic-regression SGD
+  learner. New labelled examples (e.g. harvested from crawl outcomes) are
+  folded in with ``partial_fit`` without retraining and without keeping
+  the corpus in memory, and the vocabulary is open-ended.
 """
 
 import os
 import json
+import hashlib
 import logging
 import pickle
-from typing import List, Dict, Tuple, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, List, Dict, Tuple, Optional, Sequence
 from pathlib import Path
 
 import numpy as np
-from sklearn.neural_network import MLPClassifier
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import classification_report, accuracy_score
 from bs4 import BeautifulSoup
-import joblib
 
 logger = logging.getLogger(__name__)
 
+CLASSIFIER_MODES = ("tfidf", "hashed")
+DEFAULT_MODEL_PATHS = {
+    "tfidf": "models/lab_classifier.pkl",
+    "hashed": "models/lab_classifier_hashed.pkl",
+}
+HASHED_FEATURES = 2 ** 18
+
 
 class LabNameClassifier:
     """Lightweight ML classifier for detecting lab names in text."""
     
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(self, model_path: Optional[str] = None, cache_size: int = 10000,
+                 mmap_mode: Optional[str] = "r", mode: str = "tfidf"):
         """
         Initialize the lab name classifier.
         
+        Nothing is loaded here: the saved model (or, without one, fresh
+        scikit-learn estimators) is loaded on first use.
+        
         Args:
             model_path: Path to saved model file. If None, uses default location.
+            cache_size: Number of text scores memoized (0 disables the cache)
+            mmap_mode: joblib memory-map mode for the saved weights (None
+                loads them into process memory)
+            mode: ``tfidf`` (TF-IDF + MLP) or ``hashed`` (feature hashing +
+                incremental SGD); a saved model's own mode takes precedence
         """
-        self.model_path = model_path or "models/lab_classifier.pkl"
-        self.vectorizer = TfidfVectorizer(
-            max_features=100,
-            stop_words='english',
-            ngram_range=(1, 2),  # Include bigrams for better context
-            min_df=2,  # Ignore very rare terms
-            max_df=0.8  # Ignore very common terms
-        )
-        self.model = MLPClassifier(
-            hidden_layer_sizes=(10,),
-            max_iter=500,
-            random_state=42,
-            alpha=0.01,  # L2 regularization
-            early_stopping=True,
-            validation_fraction=0.1
-        )
-        self.is_trained = False
+        if mode not in CLASSIFIER_MODES:
+            raise ValueError(f"Unknown classifier mode: {mode}")
+        self.mode = mode
+        self.model_path = model_path or DEFAULT_MODEL_PATHS[mode]
+        self.mmap_mode = mmap_mode
+        self.cache_size = cache_size
+        self._score_cache: "OrderedDict[bytes, Tuple[bool, float]]" = OrderedDict()
+        self.stats = {
+            "texts_scored": 0,
+            "cache_hits": 0,
+            "batches": 0
+        }
+        self._vectorizer = None
+        self._model = None
+        self._is_trained = False
+        self._loaded = False
+        self._load_lock = threading.Lock()
         self.feature_names = []
-        
-        # Create models directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
-        
-        # Try to load existing model
-        if os.path.exists(self.model_path):
-            self.load_model()
+    
+    def _ensure_loaded(self) -> None:
+        """Load the saved model the first time the classifier is used."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            if os.path.exists(self.model_path):
+                self.load_model()
+    
+    @property
+    def is_trained(self) -> bool:
+        self._ensure_loaded()
+        return self._is_trained
+    
+    @is_trained.setter
+    def is_trained(self, value: bool) -> None:
+        self._is_trained = value
+    
+    @property
+    def vectorizer(self) -> Any:
+        self._ensure_loaded()
+        if self._vectorizer is None:
+            if self.mode == "hashed":
+                from sklearn.feature_extraction.text import HashingVectorizer
+                self._vectorizer = HashingVectorizer(
+                    n_features=HASHED_FEATURES,
+                    stop_words='english',
+                    ngram_range=(1, 2),
+                    alternate_sign=False
+                )
+            else:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                self._vectorizer = TfidfVectorizer(
+                    max_features=100,
+                    stop_words='english',
+                    ngram_range=(1, 2),  # Include bigrams for better context
+                    min_df=2,  # Ignore very rare terms
+                    max_df=0.8  # Ignore very common terms
+                )
+        return self._vectorizer
+    
+    @vectorizer.setter
+    def vectorizer(self, value: Any) -> None:
+        self._vectorizer = value
+    
+    @property
+    def model(self) -> Any:
+        self._ensure_loaded()
+        if self._model is None:
+            if self.mode == "hashed":
+                from sklearn.linear_model import SGDClassifier
+                self._model = SGDClassifier(
+                    loss='log_loss',  # Logistic regression, so predict_proba works
+                    alpha=1e-4,
+                    random_state=42
+                )
+            else:
+                from sklearn.neural_network import MLPClassifier
+                self._model = MLPClassifier(
+                    hidden_layer_sizes=(10,),
+                    max_iter=500,
+                    random_state=42,
+                    alpha=0.01,  # L2 regularization
+                    early_stopping=True,
+                    validation_fraction=0.1
+                )
+        return self._model
+    
+    @model.setter
+    def model(self, value: Any) -> None:
+        self._model = value
     
     def train(self, sentences: List[str], labels: List[bool], 
               test_size: float = 0.2, verbose: bool = True) -> Dict:
@@ -80,6 +179,9 @@ class LabNameClassifier:
         if len(sentences) < 20:
             logger.warning("Very small training set - consider collecting more data")
             
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import classification_report, accuracy_score
+        
         logger.info(f"Training classifier with {len(sentences)} examples")
         
         # Split into train/test
@@ -91,8 +193,9 @@ class LabNameClassifier:
         X_train_vec = self.vectorizer.fit_transform(X_train)
         X_test_vec = self.vectorizer.transform(X_test)
         
-        # Store feature names for analysis
-        self.feature_names = self.vectorizer.get_feature_names_out()
+        # Store feature names for analysis (hashed features have none)
+        if hasattr(self.vectorizer, 'get_feature_names_out'):
+            self.feature_names = self.vectorizer.get_feature_names_out()
         
         # Train model
         logger.info("Training neural network...")
@@ -117,8 +220,67 @@ class LabNameClassifier:
                                       target_names=['Not Lab', 'Lab Name']))
         
         self.is_trained = True
+        self.clear_cache()
         return metrics
     
+    def partial_fit(self, sentences: Sequence[str], labels: Sequence[bool]) -> None:
+        """
+        Fold a batch of labelled examples into a hashed-mode model.
+        
+        Args:
+            sentences: Texts of the batch
+            labels: Boolean labels (True = lab name, False = other)
+        """
+        self._ensure_loaded()
+        if self.mode != "hashed":
+            raise ValueError("partial_fit requires mode='hashed'; the TF-IDF model must be retrained with train()")
+        if len(sentences) != len(labels):
+            raise ValueError("Number of sentences must match number of labels")
+        if not sentences:
+            return
+        
+        model = self.model
+        # Memory-mapped weights are read-only; take a private copy before updating
+        for attribute in ('coef_', 'intercept_'):
+            weights = getattr(model, attribute, None)
+            if weights is not None and not weights.flags.writeable:
+                setattr(model, attribute, np.array(weights))
+        
+        X = self.vectorizer.transform(sentences)
+        model.partial_fit(X, [bool(label) for label in labels], classes=[False, True])
+        self.is_trained = True
+        self.clear_cache()
+    
+    def learn_from_examples(self, examples: Iterable[Tuple[str, bool]],
+                            batch_size: int = 1000) -> int:
+        """
+        Stream labelled examples into a hashed-mode model in mini-batches.
+        
+        Only one batch is held in memory, so examples can come straight
+        from a crawl log or database cursor.
+        
+        Args:
+            examples: (text, is_lab_name) pairs
+            batch_size: Examples per ``partial_fit`` call
+            
+        Returns:
+            Number of examples learned
+        """
+        learned = 0
+        texts: List[str] = []
+        labels: List[bool] = []
+        for text, label in examples:
+            texts.append(text)
+            labels.append(label)
+            if len(texts) == batch_size:
+                self.partial_fit(texts, labels)
+                learned += len(texts)
+                texts, labels = [], []
+        if texts:
+            self.partial_fit(texts, labels)
+            learned += len(texts)
+        return learned
+    
     def predict(self, sentence: str) -> Tuple[bool, float]:
         """
         Predict if a sentence contains a lab name.
@@ -131,21 +293,16 @@ class LabNameClassifier:
         """
         if not self.is_trained:
             raise ValueError("Model not trained. Call train() first or load existing model.")
-            
-        # Vectorize input
-        X = self.vectorizer.transform([sentence])
-        
-        # Get prediction and confidence
-        prediction = self.model.predict(X)[0]
-        probabilities = self.model.predict_proba(X)[0]
-        confidence = probabilities.max()
         
-        return bool(prediction), float(confidence)
+        return self.predict_batch([sentence])[0]
     
-    def predict_batch(self, sentences: List[str]) -> List[Tuple[bool, float]]:
+    def predict_batch(self, sentences: Sequence[str]) -> List[Tuple[bool, float]]:
         """
         Predict for multiple sentences efficiently.
         
+        Sentences not in the score cache are deduplicated, vectorized into
+        one matrix and scored with a single ``predict_proba`` call.
+        
         Args:
             sentences: List of sentences to classify
             
@@ -154,17 +311,93 @@ class LabNameClassifier:
         """
         if not self.is_trained:
             raise ValueError("Model not trained.")
-            
-        # Vectorize all sentences at once
-        X = self.vectorizer.transform(sentences)
         
-        # Get predictions and probabilities
-        predictions = self.model.predict(X)
+        keys = [self._text_key(sentence) for sentence in sentences]
+        scores: Dict[bytes, Tuple[bool, float]] = {}
+        pending: Dict[bytes, str] = {}
+        
+        for key, sentence in zip(keys, sentences):
+            if key in scores or key in pending:
+                continue
+            cached = self._score_cache.get(key)
+            if cached is not None:
+                self._score_cache.move_to_end(key)
+                scores[key] = cached
+                self.stats["cache_hits"] += 1
+            else:
+                pending[key] = sentence
+        
+        if pending:
+            for key, score in zip(pending, self._score_texts(list(pending.values()))):
+                scores[key] = score
+                self._remember(key, score)
+        
+        return [scores[key] for key in keys]
+    
+    def _score_texts(self, texts: List[str]) -> List[Tuple[bool, float]]:
+        """Vectorize and score texts in one forward pass."""
+        X = self.vectorizer.transform(texts)
+        
+        # predict() is argmax of predict_proba, so one pass gives both
         probabilities = self.model.predict_proba(X)
-        confidences = probabilities.max(axis=1)
+        best = probabilities.argmax(axis=1)
+        predictions = self.model.classes_[best]
+        confidences = probabilities[np.arange(len(texts)), best]
         
+        self.stats["texts_scored"] += len(texts)
+        self.stats["batches"] += 1
         return [(bool(pred), float(conf)) for pred, conf in zip(predictions, confidences)]
     
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    
+    def _remember(self, key: bytes, score: Tuple[bool, float]) -> None:
+        if self.cache_size <= 0:
+            return
+        self._score_cache[key] = score
+        if len(self._score_cache) > self.cache_size:
+            self._score_cache.popitem(last=False)
+    
+    def clear_cache(self) -> None:
+        """Forget memoized scores (done automatically when the model changes)."""
+        self._score_cache.clear()
+    
+    def find_lab_names(self, text_groups: Sequence[Sequence[str]],
+                       confidence_threshold: float = 0.7,
+                       min_length: int = 10) -> List[Optional[Tuple[str, float]]]:
+        """
+        Find the first lab name in each group of text blocks.
+        
+        The blocks of all groups (e.g. every faculty member of a department)
+        are scored together in one batch.
+        
+        Args:
+            text_groups: Text blocks per owner, in reading order
+            confidence_threshold: Minimum confidence for a lab name
+            min_length: Blocks of this length or shorter are skipped
+            
+        Returns:
+            Per group, the first (text, confidence) classified as a lab name
+            above the threshold, or None
+        """
+        if not self.is_trained:
+            return [None] * len(text_groups)
+        
+        candidates = [[text for text in group if len(text) > min_length] for group in text_groups]
+        flat = [text for group in candidates for text in group]
+        scores = iter(self.predict_batch(flat)) if flat else iter(())
+        
+        results: List[Optional[Tuple[str, float]]] = []
+        for group in candidates:
+            found = None
+            for text in group:
+                is_lab, confidence = next(scores)
+                if found is None and is_lab and confidence > confidence_threshold:
+                    found = (text, confidence)
+            results.append(found)
+        return results
+    
     def scan_text_blocks(self, soup: BeautifulSoup, 
                         confidence_threshold: float = 0.7) -> List[Dict]:
         """
@@ -180,12 +413,11 @@ class LabNameClassifier:
         if not self.is_trained:
             logger.warning("Model not trained - returning empty results")
             return []
-            
-        candidates = []
         
         # Define tags that commonly contain lab names
         target_tags = ['p', 'div', 'li', 'td', 'span', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']
         
+        blocks = []
         for i, tag in enumerate(soup.find_all(target_tags)):
             text = tag.get_text(strip=True)
             
@@ -196,18 +428,26 @@ class LabNameClassifier:
             # Skip text that's obviously not a lab name
             if self._is_obviously_not_lab(text):
                 continue
-                
-            # Classify the text
-            is_lab_name, confidence = self.predict(text)
             
-            if is_lab_name and confidence >= confidence_threshold:
-                candidates.append({
-                    "text": text,
-                    "confidence": confidence,
-                    "tag": tag.name,
-                    "position": i,
-                    "length": len(text)
-                })
+            blocks.append((i, tag.name, text))
+        
+        if not blocks:
+            return []
+        
+        # Classify all blocks of the page in one batch
+        scores = self.predict_batch([text for _, _, text in blocks])
+        
+        candidates = [
+            {
+                "text": text,
+                "confidence": confidence,
+                "tag": tag_name,
+                "position": i,
+                "length": len(text)
+            }
+            for (i, tag_name, text), (is_lab_name, confidence) in zip(blocks, scores)
+            if is_lab_name and confidence >= confidence_threshold
+        ]
         
         # Sort by confidence descending
         return sorted(candidates, key=lambda x: x["confidence"], reverse=True)
@@ -258,21 +498,31 @@ class LabNameClassifier:
         return feature_weights[:top_n]
     
     def save_model(self, path: Optional[str] = None) -> None:
-        """Save the trained model and vectorizer."""
+        """
+        Save the trained model and vectorizer.
+        
+        The file is written uncompressed with joblib, which stores the
+        weight arrays so that they can be memory-mapped on load.
+        """
+        import joblib
+        
         save_path = path or self.model_path
         
         if not self.is_trained:
             raise ValueError("Cannot save untrained model")
             
         model_data = {
+            'mode': self.mode,
             'vectorizer': self.vectorizer,
             'model': self.model,
             'is_trained': self.is_trained,
             'feature_names': self.feature_names
         }
         
-        with open(save_path, 'wb') as f:
-            pickle.dump(model_data, f)
+        save_dir = os.path.dirname(save_path)
+        if save_dir:
+            os.makedirs(save_dir, exist_ok=True)
+        joblib.dump(model_data, save_path)
             
         logger.info(f"Model saved to {save_path}")
     
@@ -280,19 +530,30 @@ class LabNameClassifier:
         """
         Load a previously saved model.
         
+        joblib files are memory-mapped according to ``mmap_mode``; plain
+        pickles written by earlier versions still load.
+        
         Returns:
             True if loaded successfully, False otherwise
         """
+        import joblib
+        
         load_path = path or self.model_path
+        self._loaded = True
         
         try:
-            with open(load_path, 'rb') as f:
-                model_data = pickle.load(f)
+            try:
+                model_data = joblib.load(load_path, mmap_mode=self.mmap_mode)
+            except Exception:
+                with open(load_path, 'rb') as f:
+                    model_data = pickle.load(f)
                 
-            self.vectorizer = model_data['vectorizer']
-            self.model = model_data['model']
-            self.is_trained = model_data['is_trained']
+            self.mode = model_data.get('mode', 'tfidf')
+            self._vectorizer = model_data['vectorizer']
+            self._model = model_data['model']
+            self._is_trained = model_data['is_trained']
             self.feature_names = model_data.get('feature_names', [])
+            self.clear_cache()
             
             logger.info(f"Model loaded from {load_path}")
             return True
@@ -305,11 +566,20 @@ class LabNameClassifier:
         """Get information about the current model."""
         info = {
             "is_trained": self.is_trained,
+            "mode": self.mode,
             "model_path": self.model_path,
-            "vectorizer_features": len(self.feature_names) if self.feature_names else 0
+            "vectorizer_features": len(self.feature_names) if self.feature_names else 0,
+            "cached_scores": len(self._score_cache),
+            **self.stats
         }
         
-        if self.is_trained:
+        if self.is_trained and self.mode == "hashed":
+            info.update({
+                "model_type": "SGDClassifier",
+                "n_features": self.vectorizer.n_features,
+                "ngram_range": self.vectorizer.ngram_range
+            })
+        elif self.is_trained:
             info.update({
                 "model_type": "MLPClassifier",
                 "hidden_layers": self.model.hidden_layer_sizes,
@@ -21,6 +21,7 @@ from datetime import datetime
 from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 
+from .progress import ProgressCallback, report_progress
 from .website_validator import LinkType, WebsiteValidator
 
 logger = logging.getLogger(__name__)
@@ -1096,12 +1097,15 @@ class LinkEnrichmentEngine:
         
         return min(score, 1.0)  # Cap at 1.0 
 
-    async def enrich_faculty_links(self, faculty_list: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], EnrichmentReport]:
+    async def enrich_faculty_links(self, faculty_list: List[Dict[str, Any]],
+                                   progress_callback: Optional[ProgressCallback] = None) -> Tuple[List[Dict[str, Any]], EnrichmentReport]:
         """
         Enrich links for a batch of faculty members.
         
         Args:
             faculty_list: List of faculty data with validated links
+            progress_callback: Awaited with a ``"faculty_enriched"`` event as
+                each faculty member finishes
             
         Returns:
             Tuple of (enriched_faculty_list, enrichment_report)
@@ -1111,8 +1115,10 @@ class LinkEnrichmentEngine:
         enriched_faculty = []
         
         semaphore = asyncio.Semaphore(self.max_concurrent)
+        completed = 0
         
         async def enrich_faculty_member(faculty: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
             async with semaphore:
                 enriched = faculty.copy()
                 faculty_name = faculty.get('name', 'Unknown')
@@ -1212,6 +1218,12 @@ class LinkEnrichmentEngine:
                     enriched['enrichment_error'] = str(e)
                     report.failed_enrichments += 1
                 
+                completed += 1
+                await report_progress(progress_callback, "faculty_enriched", {
+                    "completed": completed,
+                    "total": len(faculty_list),
+                    "faculty": enriched
+                })
                 return enriched
         
         # Process all faculty members concurrently
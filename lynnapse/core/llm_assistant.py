@@ -7,6 +7,7 @@ faculty directory structures when traditional methods fail.
 
 import json
 import logging
+import time
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from openai import AsyncOpenAI
@@ -14,6 +15,7 @@ from bs4 import BeautifulSoup
 import httpx
 
 from lynnapse.config.settings import get_settings
+from .llm_discovery_cache import LLMDiscoveryCache, get_llm_discovery_cache
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +34,25 @@ class LLMDiscoveryResult:
 class LLMAssistant:
     """OpenAI-powered assistant for university structure discovery."""
     
-    def __init__(self, cache_client: Optional[Any] = None):
-        """Initialize the LLM assistant."""
+    def __init__(self, cache_client: Optional[Any] = None,
+                 discovery_cache: Optional[LLMDiscoveryCache] = None):
+        """
+        Initialize the LLM assistant.
+        
+        Args:
+            cache_client: Shared crawler cache (unused here)
+            discovery_cache: Persistent discovery cache; defaults to the global
+                cache when ``llm_cache_enabled`` is set
+        """
         settings = get_settings()
+        self.discovery_cache = discovery_cache
         if not settings.openai_api_key:
             logger.warning("OpenAI API key not configured. LLM assistant will be disabled.")
             self.client = None
         else:
             self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+            if self.discovery_cache is None and settings.llm_cache_enabled:
+                self.discovery_cache = get_llm_discovery_cache()
 
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the LLM assistant."""
@@ -97,6 +110,20 @@ Return a JSON object with the following structure:
             logger.warning("LLM client not available, skipping LLM discovery.")
             return None
             
+        cache_key = LLMDiscoveryCache.make_key(university_name, department_name)
+        if self.discovery_cache is not None:
+            cached = self.discovery_cache.get(cache_key)
+            if cached:
+                logger.info(f"Using cached LLM discovery for {university_name}")
+                return LLMDiscoveryResult(
+                    faculty_directory_paths=cached["faculty_directory_paths"],
+                    department_paths=cached["department_paths"],
+                    confidence_score=cached["confidence_score"],
+                    reasoning=cached["reasoning"] or "",
+                    cost_estimate=cached["cost_estimate"],
+                    cached=True
+                )
+            
         logger.info(f"Using LLM to discover faculty directories for {university_name}")
         
         try:
@@ -130,7 +157,7 @@ Return a JSON object with the following structure:
             
             data = json.loads(response_content)
             
-            return LLMDiscoveryResult(
+            result = LLMDiscoveryResult(
                 faculty_directory_paths=data.get("faculty_directory_paths", []),
                 department_paths=data.get("department_paths", {}),
                 confidence_score=data.get("confidence_score", 0.0),
@@ -138,6 +165,16 @@ Return a JSON object with the following structure:
                 cost_estimate=0.0, # Cost estimation can be added here
                 cached=False
             )
+            
+            if self.discovery_cache is not None:
+                self.discovery_cache.put(
+                    cache_key,
+                    {**asdict(result), "discovery_timestamp": time.time()},
+                    university_name=university_name,
+                    department_name=department_name
+                )
+            
+            return result
 
         except Exception as e:
             logger.error(f"Error communicating with LLM: {e}")
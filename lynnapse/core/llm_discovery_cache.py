@@ -0,0 +1,290 @@
+"""
+LLM Discovery Cache
+
+Persistent cache of LLM university structure discoveries, so the same
+university/department is not sent to the model twice within the TTL.
+
+Entries are rows in an embedded SQLite database (WAL mode) indexed by
+cache key and discovery timestamp, which keeps lookups, expiry and
+summaries to single queries. The per-discovery JSON files written by
+earlier versions (``cache/llm_discoveries/*.json``) are imported once on
+first open and can be re-imported with ``import_json_dir``.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union
+
+from lynnapse.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMDiscoveryCache:
+    """SQLite-backed cache of LLM discovery results."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS discoveries (
+            cache_key TEXT PRIMARY KEY,
+            university_name TEXT,
+            department_name TEXT,
+            faculty_directory_paths TEXT NOT NULL,
+            department_paths TEXT NOT NULL,
+            confidence_score REAL NOT NULL DEFAULT 0,
+            reasoning TEXT,
+            cost_estimate REAL NOT NULL DEFAULT 0,
+            discovery_timestamp REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_discoveries_timestamp ON discoveries (discovery_timestamp);
+        CREATE TABLE IF NOT EXISTS metadata (
+            name TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    def __init__(self, db_path: str = "cache/llm_discoveries.db",
+                 legacy_dir: Optional[str] = None,
+                 ttl: Optional[float] = None,
+                 timeout: float = 30.0):
+        """
+        Initialize the discovery cache.
+
+        Args:
+            db_path: SQLite database file
+            legacy_dir: Directory of JSON cache files to import on first open
+                (defaults to the database path without its suffix)
+            ttl: Seconds an entry stays valid (defaults to ``llm_cache_ttl``)
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.legacy_dir = Path(legacy_dir) if legacy_dir else self.db_path.with_suffix("")
+        self.ttl = ttl if ttl is not None else get_settings().llm_cache_ttl
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=timeout, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+        self._migrate_legacy_json()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def make_key(university_name: str, department_name: Optional[str] = None) -> str:
+        """Create the cache key for a university/department discovery."""
+        parts = [university_name, department_name or "general"]
+        cleaned = []
+        for part in parts:
+            part = "".join(c for c in part.lower() if c.isalnum() or c in (' ', '-', '_')).strip()
+            cleaned.append(part.replace(' ', '_'))
+        return "_".join(cleaned)
+
+    @staticmethod
+    def _row_to_entry(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a database row into a cache entry dictionary."""
+        return {
+            'cache_key': row["cache_key"],
+            'university_name': row["university_name"],
+            'department_name': row["department_name"],
+            'faculty_directory_paths': json.loads(row["faculty_directory_paths"]),
+            'department_paths': json.loads(row["department_paths"]),
+            'confidence_score': row["confidence_score"],
+            'reasoning': row["reasoning"],
+            'cost_estimate': row["cost_estimate"],
+            'discovery_timestamp': row["discovery_timestamp"]
+        }
+
+    def get(self, cache_key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached discovery if it has not expired.
+
+        Args:
+            cache_key: Key from ``make_key``
+            max_age: Maximum age in seconds (defaults to the cache TTL)
+
+        Returns:
+            Cache entry dictionary, or None when missing or expired
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM discoveries WHERE cache_key = ? AND discovery_timestamp >= ?",
+                (cache_key, time.time() - max_age)
+            ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def put(self, cache_key: str, data: Dict[str, Any],
+            university_name: Optional[str] = None,
+            department_name: Optional[str] = None) -> None:
+        """
+        Store a discovery result.
+
+        Args:
+            cache_key: Key from ``make_key``
+            data: Discovery data (faculty_directory_paths, department_paths,
+                confidence_score, reasoning, cost_estimate and optionally
+                discovery_timestamp)
+            university_name: University the discovery belongs to
+            department_name: Department the discovery belongs to
+        """
+        with self._lock, self._conn:
+            self._write_entry(cache_key, data, university_name, department_name)
+
+    def _write_entry(self, cache_key: str, data: Dict[str, Any],
+                     university_name: Optional[str], department_name: Optional[str]) -> None:
+        """Insert or replace one entry inside the caller's transaction."""
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO discoveries (
+                cache_key, university_name, department_name, faculty_directory_paths,
+                department_paths, confidence_score, reasoning, cost_estimate, discovery_timestamp
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                cache_key,
+                university_name,
+                department_name,
+                json.dumps(data.get('faculty_directory_paths', [])),
+                json.dumps(data.get('department_paths', [])),
+                data.get('confidence_score') or 0.0,
+                data.get('reasoning'),
+                data.get('cost_estimate') or 0.0,
+                data.get('discovery_timestamp') or time.time()
+            )
+        )
+
+    def list_entries(self) -> List[Dict[str, Any]]:
+        """List all entries, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM discoveries ORDER BY discovery_timestamp DESC"
+            ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    def get_summary(self, fresh_hours: float = 24.0) -> Dict[str, Any]:
+        """
+        Summarize the cache in a single query.
+
+        Args:
+            fresh_hours: Age below which an entry counts as fresh
+
+        Returns:
+            Dictionary with total, fresh and old entry counts and total cost
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT COUNT(*) AS total,
+                       COALESCE(SUM(cost_estimate), 0) AS total_cost,
+                       COALESCE(SUM(discovery_timestamp >= ?), 0) AS fresh
+                FROM discoveries
+                """,
+                (time.time() - fresh_hours * 3600,)
+            ).fetchone()
+
+        return {
+            'total_entries': row["total"],
+            'total_cost': row["total_cost"],
+            'fresh_entries': row["fresh"],
+            'old_entries': row["total"] - row["fresh"]
+        }
+
+    def delete_expired(self, max_age: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Delete entries older than ``max_age`` seconds.
+
+        Args:
+            max_age: Maximum age in seconds (defaults to the cache TTL)
+
+        Returns:
+            Key and age in hours of each deleted entry
+        """
+        max_age = self.ttl if max_age is None else max_age
+        now = time.time()
+        cutoff = now - max_age
+
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT cache_key, discovery_timestamp FROM discoveries WHERE discovery_timestamp < ?",
+                (cutoff,)
+            ).fetchall()
+            self._conn.execute("DELETE FROM discoveries WHERE discovery_timestamp < ?", (cutoff,))
+
+        return [
+            {'cache_key': row["cache_key"], 'age_hours': (now - row["discovery_timestamp"]) / 3600}
+            for row in rows
+        ]
+
+    def clear(self) -> int:
+        """Delete every entry and return how many were removed."""
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM discoveries").rowcount
+
+    def import_json_dir(self, directory: Union[str, Path]) -> int:
+        """
+        Import per-discovery JSON files written by earlier versions.
+
+        The file stem becomes the cache key; existing keys are replaced.
+
+        Args:
+            directory: Directory containing ``*.json`` cache files
+
+        Returns:
+            Number of entries imported
+        """
+        with self._lock, self._conn:
+            return self._import_json_dir(Path(directory))
+
+    def _import_json_dir(self, directory: Path) -> int:
+        """Import a JSON cache directory inside the caller's transaction."""
+        imported = 0
+        for cache_file in directory.glob("*.json"):
+            try:
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+                self._write_entry(cache_file.stem, data, None, None)
+                imported += 1
+            except Exception as e:
+                logger.warning(f"Failed to import cache file {cache_file}: {e}")
+        return imported
+
+    def _migrate_legacy_json(self) -> None:
+        """Import the legacy JSON cache directory once, if it exists."""
+        if not self.legacy_dir.is_dir():
+            return
+
+        with self._lock, self._conn:
+            migrated = self._conn.execute(
+                "SELECT value FROM metadata WHERE name = 'json_migrated_from'"
+            ).fetchone()
+            if migrated:
+                return
+
+            imported = self._import_json_dir(self.legacy_dir)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metadata (name, value) VALUES ('json_migrated_from', ?)",
+                (str(self.legacy_dir.absolute()),)
+            )
+
+        logger.info(f"Migrated {imported} LLM discoveries from {self.legacy_dir}")
+
+
+# Global instance
+_cache_instance = None
+
+def get_llm_discovery_cache() -> LLMDiscoveryCache:
+    """Get the global LLM discovery cache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = LLMDiscoveryCache()
+    return _cache_instance
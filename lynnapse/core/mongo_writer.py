@@ -5,10 +5,15 @@ Handles all MongoDB operations for the Lynnapse scraping system
 with proper error handling, upsert logic, and data validation.
 """
 
+import hashlib
+import json
 import logging
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
 from bson import ObjectId
+from bson.errors import InvalidId
+from pydantic import BaseModel
+from pymongo import UpdateOne
 
 from lynnapse.db import get_client
 from lynnapse.models import Program, Faculty, LabSite, ScrapeJob
@@ -16,6 +21,64 @@ from lynnapse.models import Program, Faculty, LabSite, ScrapeJob
 
 logger = logging.getLogger(__name__)
 
+# Collection holding one pre-aggregated statistics document per university
+STATS_COLLECTION = "university_stats"
+
+# Model and composite upsert key for each collection written by the scrapers
+UPSERT_SPECS = {
+    "programs": (Program, ("university_name", "program_name", "department")),
+    "faculty": (Faculty, ("name", "program_id")),
+    "lab_sites": (LabSite, ("faculty_id", "lab_url")),
+}
+
+# Fields left out of content hashes because they change on every scrape
+HASH_EXCLUDED_FIELDS = {"id", "scraped_at", "updated_at", "page_load_time"}
+
+# Blob fields left out of paginated reads unless explicitly requested
+LARGE_FIELDS = {
+    "faculty": ("raw_data",),
+    "lab_sites": ("raw_data", "page_content"),
+}
+
+UPSERT_LOG_PREFIXES = {
+    "inserted": "Inserted new",
+    "changed": "Updated existing",
+    "unchanged": "Unchanged",
+}
+
+# Faculty fields whose presence is tracked in the statistics document
+FACULTY_STAT_FIELDS = {
+    "faculty_with_email": "email",
+    "faculty_with_personal_website": "personal_website",
+    "faculty_with_lab": "lab_name",
+}
+
+
+def _normalize_for_hash(value: Any) -> Any:
+    """Normalize a value so that equivalent content hashes identically."""
+    if isinstance(value, dict):
+        return {str(k): _normalize_for_hash(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_for_hash(v) for v in value]
+    if isinstance(value, str):
+        return " ".join(value.split())
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def compute_content_hash(model: BaseModel) -> str:
+    """
+    Compute a stable hash of a model's content.
+    
+    Scrape timestamps and other volatile fields are excluded and strings
+    are whitespace-normalized, so rescraping identical content yields the
+    same hash.
+    """
+    content = _normalize_for_hash(model.dict(exclude=HASH_EXCLUDED_FIELDS))
+    serialized = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
 
 class MongoWriter:
     """Handles all MongoDB write operations for scraped data."""
@@ -24,6 +87,8 @@ class MongoWriter:
         """Initialize the MongoDB writer."""
         self.client = None
         self.database = None
+        self._program_universities: Dict[str, Optional[str]] = {}
+        self.reset_write_counts()
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -35,26 +100,68 @@ class MongoWriter:
         await self.close()
     
     async def connect(self) -> None:
-        """Connect to MongoDB."""
+        """Borrow the process-wide MongoDB client."""
         try:
             self.client = await get_client()
             self.database = await self.client.get_database()
-            logger.info("MongoWriter connected to database")
+            logger.debug("MongoWriter attached to shared database client")
         except Exception as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
     
     async def close(self) -> None:
-        """Close MongoDB connection."""
-        if self.client:
-            await self.client.close()
-            logger.info("MongoWriter disconnected from database")
+        """
+        Release the shared client.
+        
+        The connection pool is owned by the client registry and stays open
+        for other writers; it is closed by ``close_loop_database_connection``
+        at the end of a flow, or ``close_database_connection`` on shutdown.
+        """
+        self.client = None
+        self.database = None
     
     async def ensure_connection(self) -> None:
         """Ensure database connection is active."""
-        if not self.database:
+        if self.database is None:
             await self.connect()
     
+    def prepare_upsert(self, collection: str,
+                       data: Dict[str, Any]) -> Tuple[BaseModel, Dict[str, Any], Dict[str, Any]]:
+        """
+        Validate a document and build its composite-key upsert.
+        
+        The update document carries the record's ``content_hash`` so that
+        unchanged records can be detected before they are rewritten.
+        
+        Args:
+            collection: Target collection (one of ``UPSERT_SPECS``)
+            data: Raw document data
+            
+        Returns:
+            Tuple of (validated model, filter key, update document)
+        """
+        if collection not in UPSERT_SPECS:
+            raise ValueError(f"Unsupported upsert collection: {collection}")
+        
+        model_class, key_fields = UPSERT_SPECS[collection]
+        model = model_class(**data)
+        
+        now = datetime.utcnow()
+        filter_key = {field: getattr(model, field) for field in key_fields}
+        update_doc = {
+            "$set": {
+                **model.dict(exclude={"id"}),
+                "content_hash": compute_content_hash(model),
+                "updated_at": now,
+                "last_seen_at": now
+            },
+            "$setOnInsert": {
+                "created_at": now
+            }
+        }
+        
+        return model, filter_key, update_doc
+    
     async def upsert_program(self, program_data: Dict[str, Any]) -> str:
         """
         Upsert a program record.
@@ -68,43 +175,13 @@ class MongoWriter:
         await self.ensure_connection()
         
         try:
-            # Validate data using Pydantic model
-            program = Program(**program_data)
+            program, program_id, outcome, _ = await self._upsert_document("programs", program_data)
             
-            # Create composite key for upsert
-            filter_key = {
-                "university_name": program.university_name,
-                "program_name": program.program_name,
-                "department": program.department
-            }
-            
-            # Prepare update document
-            update_doc = {
-                "$set": {
-                    **program.dict(exclude={"id"}),
-                    "updated_at": datetime.utcnow()
-                },
-                "$setOnInsert": {
-                    "created_at": datetime.utcnow()
-                }
-            }
-            
-            # Perform upsert
-            result = await self.database.programs.update_one(
-                filter_key,
-                update_doc,
-                upsert=True
-            )
-            
-            if result.upserted_id:
-                program_id = str(result.upserted_id)
-                logger.info(f"Inserted new program: {program.program_name}")
-            else:
-                # Find the existing document to get its ID
-                existing = await self.database.programs.find_one(filter_key)
-                program_id = str(existing["_id"])
-                logger.info(f"Updated existing program: {program.program_name}")
+            if outcome == "inserted":
+                self._program_universities[program_id] = program.university_name
+                await self._increment_statistics(program.university_name, {"programs": 1})
             
+            logger.info(f"{UPSERT_LOG_PREFIXES[outcome]} program: {program.program_name}")
             return program_id
             
         except Exception as e:
@@ -124,42 +201,14 @@ class MongoWriter:
         await self.ensure_connection()
         
         try:
-            # Validate data using Pydantic model
-            faculty = Faculty(**faculty_data)
-            
-            # Create composite key for upsert
-            filter_key = {
-                "name": faculty.name,
-                "program_id": faculty.program_id
-            }
-            
-            # Prepare update document
-            update_doc = {
-                "$set": {
-                    **faculty.dict(exclude={"id"}),
-                    "updated_at": datetime.utcnow()
-                },
-                "$setOnInsert": {
-                    "created_at": datetime.utcnow()
-                }
-            }
-            
-            # Perform upsert
-            result = await self.database.faculty.update_one(
-                filter_key,
-                update_doc,
-                upsert=True
+            faculty, faculty_id, outcome, previous = await self._upsert_document(
+                "faculty", faculty_data, FACULTY_STAT_FIELDS.values()
             )
             
-            if result.upserted_id:
-                faculty_id = str(result.upserted_id)
-                logger.info(f"Inserted new faculty: {faculty.name}")
-            else:
-                # Find the existing document to get its ID
-                existing = await self.database.faculty.find_one(filter_key)
-                faculty_id = str(existing["_id"])
-                logger.info(f"Updated existing faculty: {faculty.name}")
+            if outcome != "unchanged":
+                await self._update_faculty_statistics(faculty, previous)
             
+            logger.info(f"{UPSERT_LOG_PREFIXES[outcome]} faculty: {faculty.name}")
             return faculty_id
             
         except Exception as e:
@@ -179,48 +228,74 @@ class MongoWriter:
         await self.ensure_connection()
         
         try:
-            # Validate data using Pydantic model
-            lab_site = LabSite(**lab_data)
-            
-            # Create composite key for upsert
-            filter_key = {
-                "faculty_id": lab_site.faculty_id,
-                "lab_url": lab_site.lab_url
-            }
-            
-            # Prepare update document
-            update_doc = {
-                "$set": {
-                    **lab_site.dict(exclude={"id"}),
-                    "updated_at": datetime.utcnow()
-                },
-                "$setOnInsert": {
-                    "created_at": datetime.utcnow()
-                }
-            }
+            lab_site, lab_id, outcome, _ = await self._upsert_document("lab_sites", lab_data)
             
-            # Perform upsert
-            result = await self.database.lab_sites.update_one(
-                filter_key,
-                update_doc,
-                upsert=True
-            )
-            
-            if result.upserted_id:
-                lab_id = str(result.upserted_id)
-                logger.info(f"Inserted new lab site: {lab_site.lab_name}")
-            else:
-                # Find the existing document to get its ID
-                existing = await self.database.lab_sites.find_one(filter_key)
-                lab_id = str(existing["_id"])
-                logger.info(f"Updated existing lab site: {lab_site.lab_name}")
+            if outcome == "inserted":
+                university_name = await self._get_program_university(lab_site.program_id)
+                await self._increment_statistics(university_name, {"lab_sites": 1})
             
+            logger.info(f"{UPSERT_LOG_PREFIXES[outcome]} lab site: {lab_site.lab_name}")
             return lab_id
             
         except Exception as e:
             logger.error(f"Failed to upsert lab site: {e}")
             raise
     
+    async def _upsert_document(self, collection: str, data: Dict[str, Any],
+                               tracked_fields=()) -> Tuple[BaseModel, str, str, Optional[Dict[str, Any]]]:
+        """
+        Upsert one document, skipping the rewrite when its content is unchanged.
+        
+        Args:
+            collection: Target collection (one of ``UPSERT_SPECS``)
+            data: Raw document data
+            tracked_fields: Extra fields to return from the previous version
+            
+        Returns:
+            Tuple of (validated model, document ID, outcome, previous
+            document). The outcome is "inserted", "changed" or "unchanged".
+        """
+        model, filter_key, update_doc = self.prepare_upsert(collection, data)
+        content_hash = update_doc["$set"]["content_hash"]
+        target = self.database[collection]
+        
+        projection = {"content_hash": 1, **{field: 1 for field in tracked_fields}}
+        previous = await target.find_one(filter_key, projection)
+        
+        if previous and previous.get("content_hash") == content_hash:
+            # Identical content: only record that the record was seen again
+            await target.update_one(
+                {"_id": previous["_id"]},
+                {"$set": {"last_seen_at": update_doc["$set"]["last_seen_at"]}}
+            )
+            outcome = "unchanged"
+            document_id = previous["_id"]
+        else:
+            result = await target.update_one(filter_key, update_doc, upsert=True)
+            if result.upserted_id:
+                outcome = "inserted"
+                document_id = result.upserted_id
+            else:
+                outcome = "changed"
+                if previous is None:
+                    # Inserted concurrently between the lookup and the upsert
+                    previous = await target.find_one(filter_key, projection)
+                document_id = previous["_id"]
+        
+        self.write_counts[collection][outcome] += 1
+        return model, str(document_id), outcome, previous
+    
+    def get_write_counts(self) -> Dict[str, Dict[str, int]]:
+        """Get inserted/changed/unchanged counts per collection for this writer."""
+        return {collection: counts.copy() for collection, counts in self.write_counts.items()}
+    
+    def reset_write_counts(self) -> None:
+        """Reset the per-run write counts."""
+        self.write_counts = {
+            collection: {"inserted": 0, "changed": 0, "unchanged": 0}
+            for collection in UPSERT_SPECS
+        }
+    
     async def create_scrape_job(self, job_data: Dict[str, Any]) -> str:
         """
         Create a new scrape job record.
@@ -310,6 +385,120 @@ class MongoWriter:
             logger.error(f"Failed to bulk upsert faculty: {e}")
             raise
     
+    async def bulk_upsert(self, collection: str,
+                          documents: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Upsert many documents into one collection with a single bulk write.
+        
+        Args:
+            collection: Target collection (one of ``UPSERT_SPECS``)
+            documents: Raw document dictionaries
+            
+        Returns:
+            Counts of inserted, changed and unchanged documents
+        """
+        prepared = [self.prepare_upsert(collection, document) for document in documents]
+        return await self.execute_upserts(collection, prepared)
+    
+    async def execute_upserts(self, collection: str,
+                              prepared: List[Tuple[BaseModel, Dict[str, Any], Dict[str, Any]]]) -> Dict[str, int]:
+        """
+        Write upserts built by ``prepare_upsert`` as one unordered bulk write.
+        
+        The stored content hashes of the batch are read first; records whose
+        hash is unchanged only get their ``last_seen_at`` touched. Cached
+        statistics of the affected universities are dropped so they are
+        recomputed on the next read.
+        
+        Args:
+            collection: Target collection
+            prepared: Output of ``prepare_upsert`` for each document
+            
+        Returns:
+            Counts of inserted, changed and unchanged documents
+        """
+        await self.ensure_connection()
+        
+        counts = {"inserted": 0, "changed": 0, "unchanged": 0}
+        if not prepared:
+            return counts
+        
+        try:
+            _, key_fields = UPSERT_SPECS[collection]
+            stored_hashes = await self._get_stored_hashes(
+                collection, key_fields, [filter_key for _, filter_key, _ in prepared]
+            )
+            
+            operations = []
+            changed_models = []
+            for model, filter_key, update_doc in prepared:
+                key = tuple(filter_key[field] for field in key_fields)
+                if stored_hashes.get(key) == update_doc["$set"]["content_hash"]:
+                    operations.append(UpdateOne(
+                        filter_key,
+                        {"$set": {"last_seen_at": update_doc["$set"]["last_seen_at"]}}
+                    ))
+                    counts["unchanged"] += 1
+                else:
+                    operations.append(UpdateOne(filter_key, update_doc, upsert=True))
+                    changed_models.append(model)
+            
+            result = await self.database[collection].bulk_write(operations, ordered=False)
+            
+            counts["inserted"] = result.upserted_count
+            counts["changed"] = len(changed_models) - result.upserted_count
+            for outcome, count in counts.items():
+                self.write_counts[collection][outcome] += count
+            
+            if changed_models:
+                await self._invalidate_statistics(collection, changed_models)
+            
+            logger.info(f"Bulk upserted {len(operations)} {collection} records: "
+                        f"{counts['inserted']} inserted, {counts['changed']} changed, "
+                        f"{counts['unchanged']} unchanged")
+            return counts
+            
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert {collection}: {e}")
+            raise
+    
+    async def get_document_ids(self, collection: str,
+                               filter_keys: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Look up document IDs by composite upsert key.
+        
+        Args:
+            collection: Collection to search (one of ``UPSERT_SPECS``)
+            filter_keys: Upsert keys as built by ``prepare_upsert``
+            
+        Returns:
+            ID of each key's document (None if it is not stored), in order
+        """
+        await self.ensure_connection()
+        if not filter_keys:
+            return []
+        
+        _, key_fields = UPSERT_SPECS[collection]
+        projection = {"_id": 1, **{field: 1 for field in key_fields}}
+        cursor = self.database[collection].find({"$or": filter_keys}, projection)
+        
+        stored = {}
+        async for document in cursor:
+            stored[tuple(document.get(field) for field in key_fields)] = str(document["_id"])
+        return [stored.get(tuple(key[field] for field in key_fields)) for key in filter_keys]
+    
+    async def _get_stored_hashes(self, collection: str, key_fields,
+                                 filter_keys: List[Dict[str, Any]]) -> Dict[tuple, str]:
+        """Fetch stored content hashes for a batch, keyed by composite key."""
+        projection = {"_id": 0, "content_hash": 1, **{field: 1 for field in key_fields}}
+        cursor = self.database[collection].find({"$or": filter_keys}, projection)
+        
+        stored = {}
+        async for document in cursor:
+            key = tuple(document.get(field) for field in key_fields)
+            stored[key] = document.get("content_hash")
+        return stored
+    
     async def get_program_by_name(self, university_name: str, 
                                  program_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -339,64 +528,197 @@ class MongoWriter:
             logger.error(f"Failed to get program: {e}")
             raise
     
-    async def get_faculty_by_program(self, program_id: str) -> List[Dict[str, Any]]:
+    async def get_faculty_by_program(self, program_id: str,
+                                     fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get all faculty for a specific program.
         
+        Loads the whole result into memory; use ``iter_faculty_by_program``
+        to stream large programs.
+        
         Args:
             program_id: Program ID
+            fields: Fields to return (all fields when omitted)
             
         Returns:
             List of faculty documents
         """
-        await self.ensure_connection()
-        
         try:
-            cursor = self.database.faculty.find({"program_id": program_id})
-            faculty_list = []
-            
-            async for faculty in cursor:
-                faculty["id"] = str(faculty["_id"])
-                faculty_list.append(faculty)
-            
-            return faculty_list
+            return [
+                faculty async for faculty in self.iter_faculty_by_program(
+                    program_id, fields=fields, include_large_fields=True
+                )
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get faculty for program {program_id}: {e}")
             raise
     
-    async def get_lab_sites_by_faculty(self, faculty_id: str) -> List[Dict[str, Any]]:
+    async def get_lab_sites_by_faculty(self, faculty_id: str,
+                                       fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Get all lab sites for a specific faculty member.
         
         Args:
             faculty_id: Faculty ID
+            fields: Fields to return (all fields when omitted)
             
         Returns:
             List of lab site documents
         """
-        await self.ensure_connection()
-        
         try:
-            cursor = self.database.lab_sites.find({"faculty_id": faculty_id})
-            lab_sites = []
-            
-            async for lab_site in cursor:
-                lab_site["id"] = str(lab_site["_id"])
-                lab_sites.append(lab_site)
-            
-            return lab_sites
+            return [
+                lab_site async for lab_site in self.iter_lab_sites_by_faculty(
+                    faculty_id, fields=fields, include_large_fields=True
+                )
+            ]
             
         except Exception as e:
             logger.error(f"Failed to get lab sites for faculty {faculty_id}: {e}")
             raise
     
-    async def get_scraping_statistics(self, university_name: str) -> Dict[str, Any]:
+    def iter_faculty_by_program(self, program_id: str,
+                                fields: Optional[List[str]] = None,
+                                include_large_fields: bool = False,
+                                page_size: int = 100,
+                                after: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream faculty for a program in keyset-paginated batches.
+        
+        Args:
+            program_id: Program ID
+            fields: Fields to return; when omitted, every field except the
+                large blobs in ``LARGE_FIELDS`` is returned
+            include_large_fields: Also return the large blob fields
+            page_size: Documents fetched per round trip
+            after: Resume after this cursor (a document ID)
+            
+        Returns:
+            Async iterator over faculty documents
+        """
+        return self._iter_keyset(
+            "faculty", {"program_id": program_id},
+            self._build_projection("faculty", fields, include_large_fields),
+            page_size, after
+        )
+    
+    def iter_lab_sites_by_faculty(self, faculty_id: str,
+                                  fields: Optional[List[str]] = None,
+                                  include_large_fields: bool = False,
+                                  page_size: int = 100,
+                                  after: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream lab sites for a faculty member in keyset-paginated batches.
+        
+        Args:
+            faculty_id: Faculty ID
+            fields: Fields to return; when omitted, every field except the
+                large blobs in ``LARGE_FIELDS`` is returned
+            include_large_fields: Also return the large blob fields
+            page_size: Documents fetched per round trip
+            after: Resume after this cursor (a document ID)
+            
+        Returns:
+            Async iterator over lab site documents
+        """
+        return self._iter_keyset(
+            "lab_sites", {"faculty_id": faculty_id},
+            self._build_projection("lab_sites", fields, include_large_fields),
+            page_size, after
+        )
+    
+    async def get_faculty_page(self, program_id: str,
+                               fields: Optional[List[str]] = None,
+                               page_size: int = 50,
+                               after: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get one page of faculty for a program.
+        
+        Args:
+            program_id: Program ID
+            fields: Fields to return (large blobs are excluded when omitted)
+            page_size: Maximum documents in the page
+            after: Cursor returned with the previous page
+            
+        Returns:
+            Dictionary with ``items`` and ``next_cursor`` (None on the last page)
+        """
+        items, next_cursor = await self._fetch_page(
+            "faculty", {"program_id": program_id},
+            self._build_projection("faculty", fields, False),
+            page_size, self._parse_cursor(after)
+        )
+        return {"items": items, "next_cursor": next_cursor}
+    
+    @staticmethod
+    def _build_projection(collection: str, fields: Optional[List[str]],
+                          include_large_fields: bool) -> Optional[Dict[str, int]]:
+        """Build an inclusion projection, or exclude the collection's blobs."""
+        if fields:
+            return {field: 1 for field in fields}
+        if include_large_fields:
+            return None
+        return {field: 0 for field in LARGE_FIELDS.get(collection, ())} or None
+    
+    @staticmethod
+    def _parse_cursor(after: Optional[str]) -> Any:
+        """Turn an opaque page cursor back into an ``_id`` value."""
+        if after is None:
+            return None
+        try:
+            return ObjectId(after)
+        except (InvalidId, TypeError):
+            return after
+    
+    async def _fetch_page(self, collection: str, query: Dict[str, Any],
+                          projection: Optional[Dict[str, int]], page_size: int,
+                          last_id: Any) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch the page of documents following ``last_id`` in ``_id`` order."""
+        await self.ensure_connection()
+        
+        page_query = dict(query)
+        if last_id is not None:
+            page_query["_id"] = {"$gt": last_id}
+        
+        cursor = self.database[collection].find(page_query, projection).sort("_id", 1).limit(page_size)
+        
+        items = []
+        async for document in cursor:
+            document["id"] = str(document["_id"])
+            items.append(document)
+        
+        next_cursor = items[-1]["id"] if len(items) == page_size else None
+        return items, next_cursor
+    
+    async def _iter_keyset(self, collection: str, query: Dict[str, Any],
+                           projection: Optional[Dict[str, int]], page_size: int,
+                           after: Optional[str]) -> AsyncIterator[Dict[str, Any]]:
+        """Yield documents page by page, resuming from the last seen ``_id``."""
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        
+        last_id = self._parse_cursor(after)
+        while True:
+            items, next_cursor = await self._fetch_page(collection, query, projection, page_size, last_id)
+            for document in items:
+                yield document
+            if next_cursor is None:
+                return
+            last_id = items[-1]["_id"]
+    
+    async def get_scraping_statistics(self, university_name: str,
+                                      refresh: bool = False) -> Dict[str, Any]:
         """
         Get scraping statistics for a university.
         
+        Reads the pre-aggregated statistics document maintained by the
+        upsert methods. The document is computed with a server-side
+        aggregation the first time it is requested, or when ``refresh``
+        is set.
+        
         Args:
             university_name: University name
+            refresh: Recompute the counts from the source collections
             
         Returns:
             Statistics dictionary
@@ -404,58 +726,169 @@ class MongoWriter:
         await self.ensure_connection()
         
         try:
-            # Count programs
-            program_count = await self.database.programs.count_documents({
-                "university_name": university_name
-            })
+            counts = None
+            if not refresh:
+                counts = await self.database[STATS_COLLECTION].find_one(
+                    {"_id": university_name}
+                )
             
-            # Count faculty
-            faculty_count = 0
-            faculty_with_email = 0
-            faculty_with_website = 0
-            faculty_with_lab = 0
+            if counts is None:
+                counts = await self.refresh_scraping_statistics(university_name)
             
-            # Get program IDs for this university
-            programs = await self.database.programs.find(
-                {"university_name": university_name}, 
-                {"_id": 1}
-            ).to_list(None)
+            return self._format_statistics(university_name, counts)
             
-            program_ids = [str(p["_id"]) for p in programs]
+        except Exception as e:
+            logger.error(f"Failed to get scraping statistics: {e}")
+            raise
+    
+    async def refresh_scraping_statistics(self, university_name: str) -> Dict[str, Any]:
+        """
+        Recompute and store the statistics document for a university.
+        
+        Faculty counts come from a single ``$facet`` aggregation that only
+        projects the tracked fields, so no faculty documents are sent to
+        the client.
+        
+        Args:
+            university_name: University name
             
-            if program_ids:
-                # Faculty statistics
-                faculty_cursor = self.database.faculty.find(
-                    {"program_id": {"$in": program_ids}}
-                )
-                
-                async for faculty in faculty_cursor:
-                    faculty_count += 1
-                    if faculty.get("email"):
-                        faculty_with_email += 1
-                    if faculty.get("personal_website"):
-                        faculty_with_website += 1
-                    if faculty.get("lab_name"):
-                        faculty_with_lab += 1
-            
-            # Count lab sites
-            lab_sites_count = await self.database.lab_sites.count_documents({
+        Returns:
+            Raw counts dictionary as stored in the statistics collection
+        """
+        await self.ensure_connection()
+        
+        programs = await self.database.programs.find(
+            {"university_name": university_name},
+            {"_id": 1}
+        ).to_list(None)
+        program_ids = [str(p["_id"]) for p in programs]
+        
+        counts = {
+            "programs": len(program_ids),
+            "faculty": 0,
+            "lab_sites": 0,
+            **{stat: 0 for stat in FACULTY_STAT_FIELDS}
+        }
+        
+        if program_ids:
+            facets = {"faculty": [{"$count": "n"}]}
+            for stat, field in FACULTY_STAT_FIELDS.items():
+                facets[stat] = [
+                    {"$match": {field: {"$nin": [None, ""]}}},
+                    {"$count": "n"}
+                ]
+            
+            pipeline = [
+                {"$match": {"program_id": {"$in": program_ids}}},
+                {"$project": {"_id": 0, **{field: 1 for field in FACULTY_STAT_FIELDS.values()}}},
+                {"$facet": facets}
+            ]
+            
+            async for result in self.database.faculty.aggregate(pipeline):
+                for stat, buckets in result.items():
+                    counts[stat] = buckets[0]["n"] if buckets else 0
+            
+            counts["lab_sites"] = await self.database.lab_sites.count_documents({
                 "program_id": {"$in": program_ids}
-            }) if program_ids else 0
-            
-            return {
-                "university_name": university_name,
-                "programs": program_count,
-                "faculty": faculty_count,
-                "faculty_with_email": faculty_with_email,
-                "faculty_with_personal_website": faculty_with_website,
-                "faculty_with_lab": faculty_with_lab,
-                "lab_sites": lab_sites_count,
-                "email_capture_rate": (faculty_with_email / faculty_count * 100) if faculty_count > 0 else 0,
-                "website_detection_rate": (faculty_with_website / faculty_count * 100) if faculty_count > 0 else 0,
-                "lab_detection_rate": (faculty_with_lab / faculty_count * 100) if faculty_count > 0 else 0
-            }
-            
+            })
+        
+        counts["updated_at"] = datetime.utcnow()
+        await self.database[STATS_COLLECTION].replace_one(
+            {"_id": university_name},
+            counts,
+            upsert=True
+        )
+        
+        return counts
+    
+    async def _get_program_university(self, program_id: str) -> Optional[str]:
+        """Resolve (and memoize) the university name for a program ID."""
+        if program_id in self._program_universities:
+            return self._program_universities[program_id]
+        
+        university_name = None
+        try:
+            program = await self.database.programs.find_one(
+                {"_id": ObjectId(program_id)},
+                {"university_name": 1}
+            )
+            if program:
+                university_name = program.get("university_name")
+        except InvalidId:
+            logger.debug(f"Program ID is not an ObjectId: {program_id}")
+        
+        self._program_universities[program_id] = university_name
+        return university_name
+    
+    async def _increment_statistics(self, university_name: Optional[str],
+                                    deltas: Dict[str, int]) -> None:
+        """
+        Apply counter deltas to a university's statistics document.
+        
+        Only existing documents are updated; a missing document is built
+        from scratch by the next ``get_scraping_statistics`` call, so
+        partial counters are never created.
+        """
+        deltas = {key: value for key, value in deltas.items() if value}
+        if not university_name or not deltas:
+            return
+        
+        try:
+            await self.database[STATS_COLLECTION].update_one(
+                {"_id": university_name},
+                {"$inc": deltas, "$set": {"updated_at": datetime.utcnow()}}
+            )
         except Exception as e:
-            logger.error(f"Failed to get scraping statistics: {e}")
-            raise 
\ No newline at end of file
+            # Statistics are advisory; never fail a write because of them
+            logger.warning(f"Failed to update statistics for {university_name}: {e}")
+    
+    async def _invalidate_statistics(self, collection: str, models: List[BaseModel]) -> None:
+        """Drop the statistics documents of universities touched by a bulk write."""
+        universities = set()
+        for model in models:
+            if collection == "programs":
+                universities.add(model.university_name)
+            else:
+                universities.add(await self._get_program_university(model.program_id))
+        universities.discard(None)
+        
+        if universities:
+            try:
+                await self.database[STATS_COLLECTION].delete_many(
+                    {"_id": {"$in": sorted(universities)}}
+                )
+            except Exception as e:
+                logger.warning(f"Failed to invalidate statistics: {e}")
+    
+    async def _update_faculty_statistics(self, faculty: Faculty,
+                                         previous: Optional[Dict[str, Any]]) -> None:
+        """Update statistics counters after a faculty upsert."""
+        deltas = {"faculty": 1 if previous is None else 0}
+        for stat, field in FACULTY_STAT_FIELDS.items():
+            had_value = bool(previous.get(field)) if previous else False
+            deltas[stat] = int(bool(getattr(faculty, field))) - int(had_value)
+        
+        if any(deltas.values()):
+            university_name = await self._get_program_university(faculty.program_id)
+            await self._increment_statistics(university_name, deltas)
+    
+    @staticmethod
+    def _format_statistics(university_name: str, counts: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the public statistics payload from raw counts."""
+        faculty_count = counts.get("faculty", 0)
+        faculty_with_email = counts.get("faculty_with_email", 0)
+        faculty_with_website = counts.get("faculty_with_personal_website", 0)
+        faculty_with_lab = counts.get("faculty_with_lab", 0)
+        
+        return {
+            "university_name": university_name,
+            "programs": counts.get("programs", 0),
+            "faculty": faculty_count,
+            "faculty_with_email": faculty_with_email,
+            "faculty_with_personal_website": faculty_with_website,
+            "faculty_with_lab": faculty_with_lab,
+            "lab_sites": counts.get("lab_sites", 0),
+            "email_capture_rate": (faculty_with_email / faculty_count * 100) if faculty_count > 0 else 0,
+            "website_detection_rate": (faculty_with_website / faculty_count * 100) if faculty_count > 0 else 0,
+            "lab_detection_rate": (faculty_with_lab / faculty_count * 100) if faculty_count > 0 else 0
+        }
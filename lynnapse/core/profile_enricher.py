@@ -17,6 +17,7 @@ import httpx
 from bs4 import BeautifulSoup, Tag
 
 from .data_cleaner import DataCleaner
+from .progress import ProgressCallback, report_progress
 from .website_validator import WebsiteValidator, validate_faculty_websites
 
 logger = logging.getLogger(__name__)
@@ -49,12 +50,15 @@ class ProfileEnricher:
             'social': ['twitter', 'linkedin', 'facebook', 'researchgate']
         }
     
-    async def enrich_sparse_faculty_data(self, faculty_list: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    async def enrich_sparse_faculty_data(self, faculty_list: List[Dict[str, Any]],
+                                         progress_callback: Optional[ProgressCallback] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Enrich sparse faculty data by scraping profile pages and finding additional links.
         
         Args:
             faculty_list: List of faculty dictionaries with basic info
+            progress_callback: Awaited with a ``"faculty_enriched"`` event as
+                each faculty member finishes
             
         Returns:
             Tuple of (enriched_faculty_list, enrichment_report)
@@ -75,10 +79,26 @@ class ProfileEnricher:
         # Create semaphore for concurrent requests
         semaphore = asyncio.Semaphore(self.max_concurrent)
         
+        completed = 0
+        
+        async def enrich_and_report(faculty: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal completed
+            enriched = None
+            try:
+                enriched = await self._enrich_single_faculty(faculty, semaphore, stats)
+                return enriched
+            finally:
+                completed += 1
+                await report_progress(progress_callback, "faculty_enriched", {
+                    "completed": completed,
+                    "total": len(faculty_list),
+                    "faculty": enriched
+                })
+        
         # Process faculty concurrently
         tasks = []
         for faculty in faculty_list:
-            task = self._enrich_single_faculty(faculty, semaphore, stats)
+            task = enrich_and_report(faculty)
             tasks.append(task)
         
         enriched_faculty = await asyncio.gather(*tasks, return_exceptions=True)
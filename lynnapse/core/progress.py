@@ -0,0 +1,36 @@
+"""
+Progress callbacks for long-running crawls and enrichment passes.
+
+Crawlers and enrichers accept an optional ``progress_callback`` and await
+it with an event name and a JSON-serializable payload as work completes
+(a department scraped, a faculty member enriched). The web job queue uses
+this to stream progress and partial records to the browser; command-line
+callers simply leave it unset.
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+async def report_progress(callback: Optional[ProgressCallback], event: str, data: Dict[str, Any]) -> None:
+    """
+    Await a progress callback, if one was given.
+
+    A failing callback is logged and otherwise ignored so progress reporting
+    can never break the crawl it reports on.
+
+    Args:
+        callback: Callback passed by the caller, or None
+        event: Event name, e.g. ``"department"``
+        data: Event payload
+    """
+    if callback is None:
+        return
+    try:
+        await callback(event, data)
+    except Exception as e:
+        logger.warning(f"Progress callback failed for {event} event: {e}")
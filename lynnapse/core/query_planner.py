@@ -0,0 +1,112 @@
+"""
+Query Planner - Order link discovery strategies by how often they pay off.
+
+Secondary link discovery can try several strategies per faculty member
+(university domain paths, direct academic profile URLs, search engine
+queries). The planner keeps per-strategy yield counters and orders the
+strategies by their smoothed hit rate, so the strategy most likely to
+produce a high-confidence link runs first and later ones are skipped once
+it does. With a ``history_path`` the yields of past runs seed the ordering
+of the next one.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from .history_file import read_history, write_history
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_COUNTERS = ("runs", "hits", "candidates", "validations", "validated")
+
+
+class QueryPlanner:
+    """Orders strategies by historical hit rate and records their yield."""
+
+    def __init__(self, history_path: Optional[Union[str, Path]] = None,
+                 prior_hits: float = 1.0, prior_misses: float = 1.0):
+        """
+        Initialize the planner.
+
+        Args:
+            history_path: File holding strategy yields from earlier runs
+            prior_hits: Pseudo-count of hits for strategies with no history
+            prior_misses: Pseudo-count of misses for strategies with no history
+        """
+        self.history_path = Path(history_path) if history_path else None
+        self.prior_hits = prior_hits
+        self.prior_misses = prior_misses
+        self.strategies: Dict[str, Dict[str, int]] = {}
+
+        if self.history_path and self.history_path.exists():
+            self.load()
+
+    def _counters(self, strategy: str) -> Dict[str, int]:
+        counters = self.strategies.get(strategy)
+        if counters is None:
+            counters = self.strategies[strategy] = dict.fromkeys(STRATEGY_COUNTERS, 0)
+        return counters
+
+    def hit_rate(self, strategy: str) -> float:
+        """Smoothed fraction of runs of ``strategy`` that produced a hit."""
+        counters = self.strategies.get(strategy, {})
+        hits = counters.get("hits", 0) + self.prior_hits
+        runs = counters.get("runs", 0) + self.prior_hits + self.prior_misses
+        return hits / runs
+
+    def order(self, strategies: Sequence[str]) -> List[str]:
+        """
+        Order distinct strategies by hit rate, best first.
+
+        Ties keep the given order, so the caller's default order applies
+        until there is history to go on.
+        """
+        distinct = list(dict.fromkeys(strategies))
+        return sorted(distinct, key=self.hit_rate, reverse=True)
+
+    def record(self, strategy: str, candidates: int, validations: int,
+               validated: int, hit: bool) -> None:
+        """
+        Record one run of a strategy for one faculty member.
+
+        Args:
+            strategy: Strategy name
+            candidates: Candidate URLs the strategy produced
+            validations: Candidates that were validated over the network
+            validated: Candidates that passed validation
+            hit: Whether a candidate reached the confidence threshold
+        """
+        counters = self._counters(strategy)
+        counters["runs"] += 1
+        counters["hits"] += int(hit)
+        counters["candidates"] += candidates
+        counters["validations"] += validations
+        counters["validated"] += validated
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-strategy counters with hit rate and validated-per-run yield."""
+        return {
+            strategy: {
+                **counters,
+                "hit_rate": round(self.hit_rate(strategy), 3),
+                "yield": round(counters["validated"] / counters["runs"], 3) if counters["runs"] else 0.0
+            }
+            for strategy, counters in self.strategies.items()
+        }
+
+    def load(self) -> None:
+        """Merge strategy yields from earlier runs; a bad file is logged and skipped."""
+        try:
+            data = read_history(self.history_path)
+            for strategy, counters in data.get("strategies", {}).items():
+                target = self._counters(strategy)
+                for key in STRATEGY_COUNTERS:
+                    target[key] = int(counters.get(key, 0))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Could not load query planner history from {self.history_path}: {e}")
+
+    def save(self) -> None:
+        """Persist strategy yields for the next run, if the planner has a history file."""
+        if self.history_path:
+            write_history(self.history_path, {"strategies": self.strategies})
@@ -0,0 +1,115 @@
+"""
+Rate Limiter - Process-wide token buckets for external backends.
+
+Search engines throttle per client, not per coroutine, so every finder or
+crawler in the process that talks to the same backend has to draw from one
+shared budget. ``get_rate_limiter`` returns that shared bucket by name.
+
+Buckets hand out reservations under a thread lock and callers sleep until
+their slot, so a bucket works across event loops (e.g. several
+``asyncio.run`` calls in one CLI process) and serves waiters in FIFO order.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket with reservation-based waiting."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the bucket (full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.stats = {
+            "acquired": 0,
+            "waited": 0,
+            "total_wait_seconds": 0.0
+        }
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take ``tokens`` from the bucket, borrowing against future refills.
+
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.rate)
+
+            self.stats["acquired"] += 1
+            if wait > 0:
+                self.stats["waited"] += 1
+                self.stats["total_wait_seconds"] += wait
+            return wait
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Wait until ``tokens`` are available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            logger.debug(f"Rate limiting: waiting {wait:.1f} seconds")
+            await asyncio.sleep(wait)
+        return wait
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get bucket configuration and usage statistics."""
+        return {"rate": self.rate, "capacity": self.capacity, **self.stats}
+
+
+_rate_limiters: Dict[str, TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str, rate: Optional[float] = None, capacity: float = 1.0) -> TokenBucket:
+    """
+    Get the process-wide token bucket for a backend.
+
+    The first call for ``name`` creates the bucket with ``rate`` and
+    ``capacity``; later calls share it and ignore their arguments.
+
+    Args:
+        name: Backend name, e.g. ``duckduckgo``
+        rate: Tokens per second (required on first use)
+        capacity: Maximum burst size
+
+    Returns:
+        The shared TokenBucket
+    """
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(name)
+        if bucket is None:
+            if rate is None:
+                raise ValueError(f"No rate limiter configured for {name}")
+            bucket = _rate_limiters[name] = TokenBucket(rate, capacity)
+        return bucket
+
+
+def reset_rate_limiters() -> None:
+    """Forget all shared buckets (mainly for tests)."""
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
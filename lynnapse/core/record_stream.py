@@ -0,0 +1,417 @@
+"""
+Record Stream - Incremental reading and writing of faculty record files.
+
+The data CLI tools read faculty records from JSON files (a bare array, or
+an object holding the array under ``faculty``, ``enhanced_faculty`` and
+similar keys) or from JSONL files, one record per line. Records are read
+one at a time and results are written as each batch finishes, so a run
+holds one batch in memory instead of the whole input and output.
+
+JSON input is decoded with ``json.JSONDecoder.raw_decode`` over a sliding
+text buffer: each record is decoded on its own and released once it has
+been consumed. JSONL output is append-only, so an interrupted run can be
+resumed by skipping the records that were already written.
+"""
+
+import json
+import os
+import re
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Union
+
+# Keys that hold the records array in result files, in the order they are
+# commonly produced by the scrape / enhance / enrich / process commands
+RECORD_KEYS = ("faculty", "enhanced_faculty", "enriched_faculty", "processed_faculty", "results")
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+_DECODER = json.JSONDecoder()
+_NON_WHITESPACE = re.compile(r"\S")
+
+
+class RecordDecodeError(ValueError):
+    """An input file is not valid JSON or JSONL record data."""
+
+
+def is_jsonl(file_path: Union[str, Path]) -> bool:
+    """Whether a file holds one JSON record per line, judged by its suffix."""
+    return Path(file_path).suffix.lower() in JSONL_SUFFIXES
+
+
+class _TextBuffer:
+    """Sliding window over a text file for incremental JSON decoding."""
+
+    def __init__(self, handle: TextIO, chunk_size: int):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read more text, dropping what was consumed; False at end of file."""
+        if self.eof:
+            return False
+        # Read at least as much as is buffered so retries on a large value stay linear
+        chunk = self.handle.read(max(self.chunk_size, len(self.text) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of file)."""
+        while True:
+            match = _NON_WHITESPACE.search(self.text, self.pos)
+            if match:
+                self.pos = match.start()
+                return self.text[self.pos]
+            self.pos = len(self.text)
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of file"
+            raise RecordDecodeError(f"Expected one of {chars!r}, found {found}")
+        self.pos += 1
+        return char
+
+    def decode(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as e:
+                if self.fill():
+                    continue
+                raise RecordDecodeError(f"invalid JSON value ({e.msg})") from e
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(buf: _TextBuffer) -> Iterator[Any]:
+    """Yield the elements of the array starting at the buffer position."""
+    buf.expect("[")
+    if buf.peek() == "]":
+        buf.pos += 1
+        return
+    while True:
+        yield buf.decode()
+        if buf.expect(",]") == "]":
+            return
+
+
+def iter_json_records(file_path: Union[str, Path],
+                      record_keys: Sequence[str] = RECORD_KEYS,
+                      chunk_size: int = 1024 * 1024) -> Iterator[Any]:
+    """
+    Yield the records of a JSON result file one at a time.
+
+    Args:
+        file_path: JSON file holding a records array, or an object with
+            the array under the first of ``record_keys`` it contains
+        record_keys: Object keys that may hold the records array
+        chunk_size: Characters read from the file at a time
+
+    Yields:
+        Decoded records. An object without a records array is yielded
+        as a single record.
+    """
+    with open(file_path, "r", encoding="utf-8") as handle:
+        buf = _TextBuffer(handle, chunk_size)
+        first = buf.peek()
+
+        if first == "[":
+            yield from _iter_array(buf)
+            return
+        if first != "{":
+            raise RecordDecodeError(f"{file_path} does not contain a JSON array or object")
+
+        # Walk the top-level object until a records array shows up
+        buf.pos += 1
+        fields: Dict[str, Any] = {}
+        if buf.peek() != "}":
+            while True:
+                key = buf.decode()
+                buf.expect(":")
+                if key in record_keys and buf.peek() == "[":
+                    yield from _iter_array(buf)
+                    return
+                fields[key] = buf.decode()
+                if buf.expect(",}") == "}":
+                    break
+
+        yield fields
+
+
+def iter_jsonl_records(file_path: Union[str, Path]) -> Iterator[Any]:
+    """
+    Yield the records of a JSONL file, skipping blank lines.
+
+    Args:
+        file_path: File with one JSON record per line
+
+    Yields:
+        Decoded records
+    """
+    with open(file_path, "r", encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise RecordDecodeError(f"{file_path}:{line_number}: invalid JSON record ({e.msg})") from e
+
+
+def read_records(file_path: Union[str, Path], skip: int = 0,
+                 record_keys: Sequence[str] = RECORD_KEYS) -> Iterator[Any]:
+    """
+    Yield the records of a JSON or JSONL file.
+
+    Args:
+        file_path: Input file; ``.jsonl`` / ``.ndjson`` files are read line by line
+        skip: Number of leading records to skip (to resume an interrupted run)
+        record_keys: Object keys that may hold the records array of a JSON file
+
+    Yields:
+        Decoded records
+    """
+    if is_jsonl(file_path):
+        records = iter_jsonl_records(file_path)
+    else:
+        records = iter_json_records(file_path, record_keys)
+    return islice(records, skip, None)
+
+
+def iter_batches(records: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Group records into lists of at most ``batch_size``.
+
+    Args:
+        records: Records to group
+        batch_size: Maximum records per batch
+
+    Yields:
+        Record batches
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def count_written_records(file_path: Union[str, Path]) -> int:
+    """
+    Count the complete records of a JSONL output file.
+
+    A trailing partial line, left by a run interrupted mid-write, is
+    truncated so that appending continues from a clean record boundary.
+
+    Args:
+        file_path: JSONL output file (missing files count as empty)
+
+    Returns:
+        Number of complete records in the file
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        return 0
+
+    count = 0
+    complete_bytes = 0
+    with open(file_path, "rb") as handle:
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break
+            complete_bytes += len(line)
+            if line.strip():
+                count += 1
+
+    if complete_bytes < file_path.stat().st_size:
+        with open(file_path, "r+b") as handle:
+            handle.truncate(complete_bytes)
+
+    return count
+
+
+class JsonlRecordWriter:
+    """Append records to a JSONL file, one line per record."""
+
+    def __init__(self, file_path: Union[str, Path], append: bool = False):
+        """
+        Open the output file.
+
+        Args:
+            file_path: JSONL output file
+            append: Continue an existing file instead of replacing it
+        """
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._file = open(self.file_path, "a" if append else "w", encoding="utf-8")
+
+    def write(self, records: Iterable[Any]) -> None:
+        """Write a batch of records and flush them to disk."""
+        lines = [json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records]
+        self._file.write("".join(lines))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.count += len(lines)
+
+    def close(self, footer: Optional[Dict[str, Any]] = None) -> None:
+        """Close the file. JSONL files hold records only, so ``footer`` is ignored."""
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class JsonRecordWriter:
+    """
+    Write records into a JSON object (or bare array) as they arrive.
+
+    The document is written to ``<file>.partial`` and renamed into place
+    by ``close``, so an interrupted run never leaves a truncated file
+    under the final name.
+    """
+
+    def __init__(self, file_path: Union[str, Path], header: Optional[Dict[str, Any]] = None,
+                 records_key: Optional[str] = "faculty", indent: Optional[int] = 2):
+        """
+        Open the output file.
+
+        Args:
+            file_path: JSON output file
+            header: Fields written before the records array
+            records_key: Key of the records array; None writes a bare array
+            indent: Indentation of the header, footer and each record
+        """
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.records_key = records_key
+        self.indent = indent
+        self.count = 0
+        self._partial_path = self.file_path.with_name(self.file_path.name + ".partial")
+        self._file = open(self._partial_path, "w", encoding="utf-8")
+
+        if records_key is None:
+            self._file.write("[")
+        else:
+            self._file.write("{")
+            for key, value in (header or {}).items():
+                self._file.write(f"\n{self._field(key, value)},")
+            self._file.write(f"\n{json.dumps(records_key)}: [")
+
+    def _dumps(self, value: Any) -> str:
+        return json.dumps(value, indent=self.indent, ensure_ascii=False, default=str)
+
+    def _field(self, key: str, value: Any) -> str:
+        return f"{json.dumps(key)}: {self._dumps(value)}"
+
+    def write(self, records: Iterable[Any]) -> None:
+        """Append a batch of records to the array."""
+        parts = []
+        for record in records:
+            parts.append(",\n" if self.count else "\n")
+            parts.append(self._dumps(record))
+            self.count += 1
+        self._file.write("".join(parts))
+        self._file.flush()
+
+    def close(self, footer: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Finish the document and move it into place.
+
+        Args:
+            footer: Fields written after the records array (ignored for
+                bare arrays), e.g. summaries known only at the end
+        """
+        if self._file.closed:
+            return
+        self._file.write("\n]")
+        if self.records_key is not None:
+            for key, value in (footer or {}).items():
+                self._file.write(f",\n{self._field(key, value)}")
+            self._file.write("\n}")
+        self._file.write("\n")
+        self._file.close()
+        os.replace(self._partial_path, self.file_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        elif not self._file.closed:
+            # Leave the partial file for inspection; the final path is untouched
+            self._file.close()
+        return False
+
+
+def open_record_writer(file_path: Union[str, Path], header: Optional[Dict[str, Any]] = None,
+                       records_key: Optional[str] = "faculty",
+                       append: bool = False) -> Union[JsonlRecordWriter, JsonRecordWriter]:
+    """
+    Open a record writer matching the output file suffix.
+
+    Args:
+        file_path: Output file; ``.jsonl`` / ``.ndjson`` files get one record per line
+        header: Fields written before the records of a JSON file
+        records_key: Key of the records array in a JSON file
+        append: Continue an existing JSONL file (JSON files cannot be appended to)
+
+    Returns:
+        JsonlRecordWriter or JsonRecordWriter
+    """
+    if is_jsonl(file_path):
+        return JsonlRecordWriter(file_path, append=append)
+    if append:
+        raise ValueError(f"Cannot append to {file_path}: resuming requires JSONL output")
+    return JsonRecordWriter(file_path, header=header, records_key=records_key)
+
+
+def merge_stats(total: Dict[str, Any], batch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add the numeric counters of one batch's stats into a running total.
+
+    Nested dictionaries are merged recursively; non-numeric values keep
+    the latest batch's value.
+
+    Args:
+        total: Running totals (updated in place)
+        batch: Stats of one batch
+
+    Returns:
+        The updated totals
+    """
+    for key, value in batch.items():
+        current = total.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float, dict)):
+            total[key] = value
+        elif isinstance(value, dict):
+            total[key] = merge_stats(dict(current) if isinstance(current, dict) else {}, value)
+        elif isinstance(current, (int, float)) and not isinstance(current, bool):
+            total[key] = current + value
+        else:
+            total[key] = value
+    return total
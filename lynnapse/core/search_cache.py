@@ -0,0 +1,237 @@
+"""
+Search Cache - Persistent, shared cache of external search results.
+
+Lab URL searches (Bing / SerpAPI) and DuckDuckGo link searches are slow,
+rate limited and sometimes paid for, and the same queries come back every
+time a university is enriched again. Results are stored in an embedded
+SQLite database (WAL mode) so they survive restarts and are shared by every
+process using the same file, with a small in-memory LRU in front of it for
+repeated lookups within a run.
+
+Keys are built from the normalized query text (case, whitespace and Unicode
+form folded), so trivially different spellings of a query share an entry.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from lynnapse.config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Fold case, Unicode form and whitespace so equivalent queries match."""
+    return " ".join(unicodedata.normalize("NFKC", query).casefold().split())
+
+
+class SearchResultCache:
+    """SQLite-backed search result cache with an in-memory LRU front tier."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS search_results (
+            cache_key TEXT PRIMARY KEY,
+            query TEXT,
+            results TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_search_results_expires ON search_results (expires_at);
+    """
+
+    def __init__(self, db_path: str = "cache/search_results.db",
+                 ttl: Optional[float] = None,
+                 memory_size: int = 1024,
+                 timeout: float = 30.0):
+        """
+        Initialize the search cache.
+
+        Args:
+            db_path: SQLite database file, shared by all processes using it
+            ttl: Default seconds an entry stays valid (defaults to ``search_cache_ttl``)
+            memory_size: Entries kept in the in-memory LRU (0 disables it)
+            timeout: Seconds to wait for a lock held by another process
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl if ttl is not None else get_settings().search_cache_ttl
+        self.memory_size = memory_size
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=timeout, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+        self.stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "expired": 0
+        }
+        self.delete_expired()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def make_key(namespace: str, query: str, **params: Any) -> str:
+        """
+        Create the cache key for a search.
+
+        Args:
+            namespace: Search backend or caller, e.g. ``duckduckgo``
+            query: Query text (normalized before hashing)
+            **params: Other request parameters that change the results
+
+        Returns:
+            ``<namespace>:<hash>`` key
+        """
+        key_string = normalize_query(query)
+        if params:
+            key_string += "|" + json.dumps(params, sort_keys=True)
+        return f"{namespace}:{hashlib.md5(key_string.encode()).hexdigest()}"
+
+    def _remember(self, cache_key: str, expires_at: float, payload: str) -> None:
+        """Put an entry in the in-memory tier, evicting the least recently used."""
+        if self.memory_size <= 0:
+            return
+        self._memory[cache_key] = (expires_at, payload)
+        self._memory.move_to_end(cache_key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached results if they have not expired.
+
+        Args:
+            cache_key: Key from ``make_key``
+
+        Returns:
+            Cached results (a fresh copy), or None when missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                expires_at, payload = entry
+                if expires_at > now:
+                    self._memory.move_to_end(cache_key)
+                    self.stats["memory_hits"] += 1
+                    return json.loads(payload)
+                del self._memory[cache_key]
+
+            row = self._conn.execute(
+                "SELECT results, expires_at FROM search_results WHERE cache_key = ? AND expires_at > ?",
+                (cache_key, now)
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            payload, expires_at = row
+            self._remember(cache_key, expires_at, payload)
+            self.stats["disk_hits"] += 1
+        return json.loads(payload)
+
+    def put(self, cache_key: str, results: List[Dict[str, Any]],
+            query: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        """
+        Store search results.
+
+        Args:
+            cache_key: Key from ``make_key``
+            results: JSON-serializable results
+            query: Original query text (stored for inspection)
+            ttl: Seconds the entry stays valid (defaults to the cache TTL)
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        payload = json.dumps(results, default=str)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results (cache_key, query, results, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (cache_key, query, payload, now, expires_at)
+            )
+            self._remember(cache_key, expires_at, payload)
+            self.stats["writes"] += 1
+
+    def delete_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        now = time.time()
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM search_results WHERE expires_at <= ?", (now,)
+            ).rowcount
+            for cache_key in [k for k, (expires_at, _) in self._memory.items() if expires_at <= now]:
+                del self._memory[cache_key]
+            self.stats["expired"] += removed
+        return removed
+
+    def clear(self, namespace: Optional[str] = None) -> int:
+        """
+        Delete cached entries.
+
+        Args:
+            namespace: Only delete keys from this namespace (default: all)
+
+        Returns:
+            Number of entries removed from the database
+        """
+        with self._lock, self._conn:
+            if namespace is None:
+                removed = self._conn.execute("DELETE FROM search_results").rowcount
+                self._memory.clear()
+            else:
+                prefix = f"{namespace}:"
+                removed = self._conn.execute(
+                    "DELETE FROM search_results WHERE substr(cache_key, 1, ?) = ?",
+                    (len(prefix), prefix)
+                ).rowcount
+                for cache_key in [k for k in self._memory if k.startswith(prefix)]:
+                    del self._memory[cache_key]
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and entry counts."""
+        with self._lock:
+            disk_entries = self._conn.execute("SELECT COUNT(*) FROM search_results").fetchone()[0]
+            memory_entries = len(self._memory)
+            stats = dict(self.stats)
+
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        hits = stats["memory_hits"] + stats["disk_hits"]
+        return {
+            **stats,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "memory_entries": memory_entries,
+            "disk_entries": disk_entries
+        }
+
+
+# Global instance
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+def get_search_cache() -> SearchResultCache:
+    """Get the global search result cache instance."""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = SearchResultCache()
+    return _cache_instance
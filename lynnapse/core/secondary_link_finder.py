@@ -3,22 +3,36 @@ Secondary Link Finder for Faculty with Poor Quality Links
 
 This module performs targeted searches to find better academic links for faculty
 members who only have social media links, broken links, or unknown links.
+
+Faculty are processed concurrently. Searches from every finder in the process
+draw from one shared token bucket for the search backend, and each faculty
+member's direct URL candidates are validated while their searches run.
+DuckDuckGo results are kept in the shared persistent search cache.
 """
 
 import asyncio
 import aiohttp
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Any
 from urllib.parse import urlparse, urljoin, quote_plus
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 import time
 import json
 
 from .website_validator import WebsiteValidator, LinkType, LinkValidation
+from .rate_limiter import get_rate_limiter
+from .query_planner import QueryPlanner
+from .search_cache import SearchResultCache, get_search_cache
 
 logger = logging.getLogger(__name__)
 
+# Candidates validated per faculty member
+MAX_VALIDATED_CANDIDATES = 10
+
+# Strategies that build candidate URLs without a search engine, in default order
+DIRECT_STRATEGIES = ('domain_discovery', 'direct_academic')
+
 @dataclass
 class SearchResult:
     """Result from a search engine query."""
@@ -49,18 +63,63 @@ class SecondaryLinkFinder:
     4. Research interest matching
     """
     
-    def __init__(self, timeout: int = 15, max_concurrent: int = 2):
+    def __init__(self, timeout: int = 15, max_concurrent: int = 2,
+                 faculty_concurrency: int = 8, per_host_limit: int = 4,
+                 confidence_threshold: float = 0.8,
+                 query_planner: Optional[QueryPlanner] = None,
+                 prefetch_below: float = 0.6,
+                 search_cache: Optional[SearchResultCache] = None,
+                 use_search_cache: bool = True):
+        """
+        Initialize the finder.
+        
+        Args:
+            timeout: Timeout for network operations in seconds
+            max_concurrent: Concurrent validations per faculty member
+            faculty_concurrency: Faculty members processed at the same time
+            per_host_limit: Concurrent validation requests per host, shared
+                by all faculty (protects university servers)
+            confidence_threshold: Validated confidence at which no further
+                strategies are tried for a faculty member
+            query_planner: Planner ordering strategies by hit rate (pass one
+                with a history_path to keep the order between runs)
+            prefetch_below: Start the next search while validating a strategy
+                whose hit rate is below this, hiding search latency
+            search_cache: Cache for DuckDuckGo results (defaults to the
+                shared persistent search cache)
+            use_search_cache: Whether to cache DuckDuckGo results at all
+        """
         self.timeout = timeout
         self.max_concurrent = max_concurrent
+        self.faculty_concurrency = max(1, faculty_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
         self.session: Optional[aiohttp.ClientSession] = None
         self.validator = None
-        
-        # Rate limiting for search engines
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.confidence_threshold = confidence_threshold
+        self.query_planner = query_planner or QueryPlanner()
+        self.prefetch_below = prefetch_below
+        self.search_cache = search_cache
+        self.use_search_cache = use_search_cache
+        
+        # Rate limiting for search engines, shared by every finder in the process
         self.last_search_time = 0
         self.min_search_interval = 5.0  # 5 seconds between searches
+        self.search_rate_limiter = get_rate_limiter(
+            'duckduckgo', rate=1.0 / self.min_search_interval, capacity=1
+        )
         self.search_count = 0
         self.max_searches_per_faculty = 2  # Limit searches per faculty
         
+        self.stats = {
+            "faculty_processed": 0,
+            "faculty_enhanced": 0,
+            "searches": 0,
+            "search_cache_hits": 0,
+            "candidates_validated": 0,
+            "early_exits": 0
+        }
+        
         # Search patterns for different link types (prioritize academic sources)
         self.search_patterns = {
             'google_scholar': [
@@ -99,6 +158,7 @@ class SecondaryLinkFinder:
         )
         self.validator = WebsiteValidator(timeout=self.timeout, max_concurrent=self.max_concurrent)
         await self.validator.__aenter__()
+        self._host_semaphores = {}
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -107,6 +167,7 @@ class SecondaryLinkFinder:
             await self.validator.__aexit__(exc_type, exc_val, exc_tb)
         if self.session:
             await self.session.close()
+        self.query_planner.save()
 
     def safe_get_field(self, faculty: Dict[str, Any], field: str, default: str = '') -> str:
         """Safely get a field from faculty data, handling None values."""
@@ -165,16 +226,11 @@ class SecondaryLinkFinder:
         return queries
 
     async def wait_for_rate_limit(self):
-        """Implement rate limiting for search requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_search_time
-        
-        if time_since_last < self.min_search_interval:
-            wait_time = self.min_search_interval - time_since_last
-            logger.info(f"Rate limiting: waiting {wait_time:.1f} seconds")
-            await asyncio.sleep(wait_time)
-        
+        """Wait for a slot in the process-wide search rate limit."""
+        await self.search_rate_limiter.acquire()
         self.last_search_time = time.time()
+        self.search_count += 1
+        self.stats["searches"] += 1
 
     async def search_duckduckgo(self, query: str, max_results: int = 5) -> List[SearchResult]:
         """
@@ -183,6 +239,19 @@ class SecondaryLinkFinder:
         if not self.session:
             return []
         
+        cache = None
+        cache_key = SearchResultCache.make_key('duckduckgo', query, max_results=max_results)
+        if self.use_search_cache:
+            try:
+                cache = self.search_cache or get_search_cache()
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    self.stats["search_cache_hits"] += 1
+                    return [SearchResult(**result) for result in cached]
+            except Exception as e:
+                logger.warning(f"Search cache lookup failed for query '{query}': {e}")
+                cache = None
+        
         try:
             await self.wait_for_rate_limit()
             
@@ -195,11 +264,19 @@ class SecondaryLinkFinder:
                     return []
                 
                 html = await response.text()
-                return self.parse_duckduckgo_lite_results(html, max_results)
-                
+                results = self.parse_duckduckgo_lite_results(html, max_results)
+            
         except Exception as e:
             logger.error(f"DuckDuckGo search error for query '{query}': {e}")
             return []
+        
+        # Empty pages are often throttling responses, so only cache real results
+        if cache is not None and results:
+            try:
+                cache.put(cache_key, [asdict(result) for result in results], query=query)
+            except Exception as e:
+                logger.warning(f"Search cache store failed for query '{query}': {e}")
+        return results
 
     def parse_duckduckgo_lite_results(self, html: str, max_results: int = 5) -> List[SearchResult]:
         """Parse DuckDuckGo lite search results from HTML."""
@@ -355,9 +432,9 @@ class SecondaryLinkFinder:
         
         return candidates
 
-    async def find_better_links(self, faculty: Dict[str, Any]) -> List[LinkCandidate]:
+    async def find_direct_candidates(self, faculty: Dict[str, Any]) -> List[LinkCandidate]:
         """
-        Find better links for a faculty member using multiple strategies.
+        Build candidate URLs without calling a search engine.
         """
         all_candidates = []
         faculty_name = self.safe_get_field(faculty, 'name')
@@ -378,39 +455,61 @@ class SecondaryLinkFinder:
         except Exception as e:
             logger.error(f"Academic profile generation failed for {faculty_name}: {e}")
         
+        return all_candidates
+
+    def search_result_candidates(self, query: str, search_results: List[SearchResult]) -> List[LinkCandidate]:
+        """Turn search engine results into link candidates."""
+        candidates = []
+        for result in search_results:
+            # Higher confidence for academic domains
+            base_confidence = 0.7 if any(domain in result.url.lower() 
+                                       for domain in ['scholar.google', 'researchgate', 'orcid', '.edu']) else 0.4
+            
+            candidates.append(LinkCandidate(
+                url=result.url,
+                source='search_engine',
+                query=query,
+                title=result.title,
+                snippet=result.snippet,
+                confidence=base_confidence - (result.rank * 0.1)
+            ))
+        return candidates
+
+    async def find_search_candidates(self, faculty: Dict[str, Any]) -> List[LinkCandidate]:
+        """
+        Run a limited number of search engine queries for candidate URLs.
+        """
+        candidates = []
+        faculty_name = self.safe_get_field(faculty, 'name')
+        queries = self.generate_search_queries(faculty)
+        search_count = 0
+        
+        for query, expected_type, strategy in queries[:self.max_searches_per_faculty]:
+            if search_count >= self.max_searches_per_faculty:
+                break
+                
+            try:
+                search_results = await self.search_with_fallback(query, max_results=3)
+                search_count += 1
+                candidates.extend(self.search_result_candidates(query, search_results))
+                
+                logger.info(f"Search for {faculty_name}: found {len(search_results)} results")
+                
+            except Exception as e:
+                logger.error(f"Search failed for {faculty_name} with query '{query}': {e}")
+                continue
+        
+        return candidates
+
+    async def find_better_links(self, faculty: Dict[str, Any]) -> List[LinkCandidate]:
+        """
+        Find better links for a faculty member using multiple strategies.
+        """
+        all_candidates = await self.find_direct_candidates(faculty)
+        
         # Strategy 3: Limited search engine queries (only if we don't have enough candidates)
         if len(all_candidates) < 5:
-            queries = self.generate_search_queries(faculty)
-            search_count = 0
-            
-            for query, expected_type, strategy in queries[:self.max_searches_per_faculty]:
-                if search_count >= self.max_searches_per_faculty:
-                    break
-                    
-                try:
-                    search_results = await self.search_with_fallback(query, max_results=3)
-                    search_count += 1
-                    
-                    for result in search_results:
-                        # Higher confidence for academic domains
-                        base_confidence = 0.7 if any(domain in result.url.lower() 
-                                                   for domain in ['scholar.google', 'researchgate', 'orcid', '.edu']) else 0.4
-                        
-                        candidate = LinkCandidate(
-                            url=result.url,
-                            source='search_engine',
-                            query=query,
-                            title=result.title,
-                            snippet=result.snippet,
-                            confidence=base_confidence - (result.rank * 0.1)
-                        )
-                        all_candidates.append(candidate)
-                    
-                    logger.info(f"Search for {faculty_name}: found {len(search_results)} results")
-                    
-                except Exception as e:
-                    logger.error(f"Search failed for {faculty_name} with query '{query}': {e}")
-                    continue
+            all_candidates.extend(await self.find_search_candidates(faculty))
         
         return all_candidates
 
@@ -469,6 +568,14 @@ class SecondaryLinkFinder:
         
         return candidates
 
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Semaphore limiting concurrent requests to the URL's host."""
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return semaphore
+
     async def validate_and_rank_candidates(self, candidates: List[LinkCandidate]) -> List[LinkCandidate]:
         """
         Validate link candidates and rank them by quality.
@@ -482,12 +589,13 @@ class SecondaryLinkFinder:
         semaphore = asyncio.Semaphore(max(1, self.max_concurrent // 2))
         
         async def validate_candidate(candidate: LinkCandidate) -> Optional[LinkCandidate]:
-            async with semaphore:
+            async with semaphore, self._host_semaphore(candidate.url):
                 try:
                     # Add small delay to avoid overwhelming target servers
                     await asyncio.sleep(0.5)
                     
                     validation = await self.validator.validate_link(candidate.url)
+                    self.stats["candidates_validated"] += 1
                     
                     if validation.is_accessible and validation.link_type != LinkType.SOCIAL_MEDIA:
                         candidate.link_type = validation.link_type
@@ -516,7 +624,7 @@ class SecondaryLinkFinder:
                     return None
         
         # Validate candidates with limited concurrency
-        tasks = [validate_candidate(candidate) for candidate in candidates[:10]]  # Limit to top 10
+        tasks = [validate_candidate(candidate) for candidate in candidates[:MAX_VALIDATED_CANDIDATES]]
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Filter successful validations
@@ -529,86 +637,267 @@ class SecondaryLinkFinder:
         
         return validated_candidates
 
-    async def enhance_faculty_links(self, faculty_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def plan_strategies(self, faculty: Dict[str, Any]) -> List[Tuple[str, Optional[str]]]:
         """
-        Enhance faculty data by finding better links for those with poor quality links.
+        Plan the strategies to try for a faculty member, most promising first.
+        
+        Returns:
+            List of (strategy, query) steps; query is None for direct strategies
         """
-        enhanced_faculty = []
+        queries_by_strategy: Dict[str, List[str]] = {}
+        for query, expected_type, strategy in self.generate_search_queries(faculty):
+            queries_by_strategy.setdefault(strategy, []).append(query)
+        
+        steps = []
+        for strategy in self.query_planner.order(list(DIRECT_STRATEGIES) + list(queries_by_strategy)):
+            if strategy in DIRECT_STRATEGIES:
+                steps.append((strategy, None))
+            else:
+                steps.extend((strategy, query) for query in queries_by_strategy[strategy])
+        return steps
+
+    async def direct_strategy_candidates(self, strategy: str, faculty: Dict[str, Any]) -> List[LinkCandidate]:
+        """Build the candidates of one direct (non-search) strategy."""
+        faculty_name = self.safe_get_field(faculty, 'name')
+        try:
+            if strategy == 'domain_discovery':
+                return await self.discover_university_domain_links(faculty)
+            return await self.generate_direct_academic_links(faculty)
+        except Exception as e:
+            logger.error(f"{strategy} failed for {faculty_name}: {e}")
+            return []
+
+    async def search_strategy_candidates(self, query: str) -> List[LinkCandidate]:
+        """Run one search query and turn its results into candidates."""
+        try:
+            return self.search_result_candidates(query, await self.search_with_fallback(query, max_results=3))
+        except Exception as e:
+            logger.error(f"Search failed for query '{query}': {e}")
+            return []
+
+    async def validate_until_confident(self, candidates: List[LinkCandidate]) -> Tuple[List[LinkCandidate], int, bool]:
+        """
+        Validate candidates in order, stopping once one reaches the threshold.
         
-        for faculty in faculty_data:
-            enhanced = faculty.copy()
-            faculty_name = self.safe_get_field(faculty, 'name')
-            
-            # Check if this faculty member needs better links
-            needs_enhancement = (
-                faculty.get('needs_secondary_scraping', False) or
-                faculty.get('secondary_scraping_priority') in ['high', 'medium']
-            )
+        Candidates are validated in chunks as large as the per-faculty
+        validation concurrency, so stopping early costs no latency.
+        
+        Returns:
+            (validated candidates, number of candidates checked, whether the
+            threshold was reached)
+        """
+        chunk_size = max(1, self.max_concurrent // 2)
+        validated = []
+        checked = 0
+        
+        for start in range(0, len(candidates), chunk_size):
+            chunk = candidates[start:start + chunk_size]
+            chunk_validated = await self.validate_and_rank_candidates(chunk)
+            checked += len(chunk)
+            validated.extend(chunk_validated)
+            if any(c.confidence >= self.confidence_threshold for c in chunk_validated):
+                return validated, checked, True
+        
+        return validated, checked, False
+
+    async def find_validated_links(self, faculty: Dict[str, Any]) -> List[LinkCandidate]:
+        """
+        Find and validate better links for one faculty member.
+        
+        Strategies run in the order given by the query planner and stop as
+        soon as a candidate reaches ``confidence_threshold``. While a strategy
+        with a low hit rate is being validated, the next search query is
+        already running, so a likely miss does not add search latency.
+        
+        Returns:
+            Validated candidates, best first
+        """
+        steps = self.plan_strategies(faculty)
+        validated: List[LinkCandidate] = []
+        budget = MAX_VALIDATED_CANDIDATES
+        searches = 0
+        search_tasks: Dict[int, asyncio.Task] = {}
+        
+        def start_search(index: int) -> None:
+            nonlocal searches
+            searches += 1
+            search_tasks[index] = asyncio.create_task(self.search_strategy_candidates(steps[index][1]))
+        
+        def next_search(after: int) -> Optional[int]:
+            for index in range(after + 1, len(steps)):
+                if steps[index][1] is not None and index not in search_tasks:
+                    return index
+            return None
+        
+        try:
+            for index, (strategy, query) in enumerate(steps):
+                if budget <= 0:
+                    break
+                
+                if query is None:
+                    candidates = await self.direct_strategy_candidates(strategy, faculty)
+                else:
+                    if index not in search_tasks:
+                        if searches >= self.max_searches_per_faculty:
+                            continue
+                        start_search(index)
+                    candidates = await search_tasks.pop(index)
+                
+                candidates = candidates[:budget]
+                upcoming = next_search(index)
+                if (upcoming is not None and budget > len(candidates) and
+                        searches < self.max_searches_per_faculty and
+                        self.query_planner.hit_rate(strategy) < self.prefetch_below):
+                    start_search(upcoming)
+                
+                step_validated, checked, hit = await self.validate_until_confident(candidates)
+                budget -= checked
+                validated.extend(step_validated)
+                self.query_planner.record(strategy, candidates=len(candidates), validations=checked,
+                                          validated=len(step_validated), hit=hit)
+                
+                if hit:
+                    self.stats["early_exits"] += 1
+                    break
+        finally:
+            for task in search_tasks.values():
+                task.cancel()
+            await asyncio.gather(*search_tasks.values(), return_exceptions=True)
+        
+        validated.sort(key=lambda x: x.confidence, reverse=True)
+        return validated
+
+    def apply_validated_links(self, enhanced: Dict[str, Any], validated: List[LinkCandidate]) -> None:
+        """Record the best candidates on a faculty record and upgrade its primary links."""
+        # Add the best candidates to faculty data
+        best_candidates = validated[:3]  # Top 3 candidates
+        
+        enhanced['secondary_link_candidates'] = [
+            {
+                'url': c.url,
+                'type': c.link_type.value if c.link_type else 'unknown',
+                'confidence': c.confidence,
+                'source': c.source,
+                'title': c.title,
+                'query': c.query
+            } for c in best_candidates
+        ]
+        
+        # Update primary links if we found better ones
+        for candidate in best_candidates:
+            if candidate.link_type == LinkType.GOOGLE_SCHOLAR and candidate.confidence > 0.8:
+                current_website = self.safe_get_field(enhanced, 'personal_website')
+                current_validation = enhanced.get('personal_website_validation', {})
+                
+                if (not current_website or 
+                    current_validation.get('type') == 'social_media' or
+                    current_validation.get('confidence', 0) < candidate.confidence):
+                    enhanced['personal_website'] = candidate.url
+                    enhanced['personal_website_source'] = 'secondary_scraping'
             
-            if needs_enhancement:
-                logger.info(f"Finding better links for {faculty_name}")
+            elif candidate.link_type == LinkType.PERSONAL_WEBSITE and candidate.confidence > 0.7:
+                current_website = self.safe_get_field(enhanced, 'personal_website')
+                current_validation = enhanced.get('personal_website_validation', {})
                 
-                try:
-                    # Find candidate links
-                    candidates = await self.find_better_links(faculty)
-                    
-                    if candidates:
-                        # Validate and rank candidates
-                        validated = await self.validate_and_rank_candidates(candidates)
-                        
-                        if validated:
-                            # Add the best candidates to faculty data
-                            best_candidates = validated[:3]  # Top 3 candidates
-                            
-                            enhanced['secondary_link_candidates'] = [
-                                {
-                                    'url': c.url,
-                                    'type': c.link_type.value if c.link_type else 'unknown',
-                                    'confidence': c.confidence,
-                                    'source': c.source,
-                                    'title': c.title,
-                                    'query': c.query
-                                } for c in best_candidates
-                            ]
-                            
-                            # Update primary links if we found better ones
-                            for candidate in best_candidates:
-                                if candidate.link_type == LinkType.GOOGLE_SCHOLAR and candidate.confidence > 0.8:
-                                    current_website = self.safe_get_field(enhanced, 'personal_website')
-                                    current_validation = enhanced.get('personal_website_validation', {})
-                                    
-                                    if (not current_website or 
-                                        current_validation.get('type') == 'social_media' or
-                                        current_validation.get('confidence', 0) < candidate.confidence):
-                                        enhanced['personal_website'] = candidate.url
-                                        enhanced['personal_website_source'] = 'secondary_scraping'
-                                
-                                elif candidate.link_type == LinkType.PERSONAL_WEBSITE and candidate.confidence > 0.7:
-                                    current_website = self.safe_get_field(enhanced, 'personal_website')
-                                    current_validation = enhanced.get('personal_website_validation', {})
-                                    
-                                    if (not current_website or
-                                        current_validation.get('confidence', 0) < candidate.confidence):
-                                        enhanced['personal_website'] = candidate.url
-                                        enhanced['personal_website_source'] = 'secondary_scraping'
-                                
-                                elif candidate.link_type == LinkType.LAB_WEBSITE and candidate.confidence > 0.7:
-                                    enhanced['lab_website'] = candidate.url
-                                    enhanced['lab_website_source'] = 'secondary_scraping'
-                            
-                            logger.info(f"Enhanced {faculty_name} with {len(validated)} potential links")
-                        else:
-                            logger.info(f"No valid links found for {faculty_name}")
-                    else:
-                        logger.info(f"No candidates found for {faculty_name}")
-                    
-                except Exception as e:
-                    logger.error(f"Link enhancement failed for {faculty_name}: {e}")
+                if (not current_website or
+                    current_validation.get('confidence', 0) < candidate.confidence):
+                    enhanced['personal_website'] = candidate.url
+                    enhanced['personal_website_source'] = 'secondary_scraping'
             
-            enhanced_faculty.append(enhanced)
+            elif candidate.link_type == LinkType.LAB_WEBSITE and candidate.confidence > 0.7:
+                enhanced['lab_website'] = candidate.url
+                enhanced['lab_website_source'] = 'secondary_scraping'
+
+    async def enhance_single_faculty(self, faculty: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enhance one faculty member if their links need it.
+        
+        Returns:
+            Copy of the faculty record, with secondary link candidates added
+        """
+        enhanced = faculty.copy()
+        faculty_name = self.safe_get_field(faculty, 'name')
+        
+        # Check if this faculty member needs better links
+        needs_enhancement = (
+            faculty.get('needs_secondary_scraping', False) or
+            faculty.get('secondary_scraping_priority') in ['high', 'medium']
+        )
+        
+        if needs_enhancement:
+            logger.info(f"Finding better links for {faculty_name}")
+            
+            try:
+                validated = await self.find_validated_links(faculty)
+                
+                if validated:
+                    self.apply_validated_links(enhanced, validated)
+                    self.stats["faculty_enhanced"] += 1
+                    logger.info(f"Enhanced {faculty_name} with {len(validated)} potential links")
+                else:
+                    logger.info(f"No valid links found for {faculty_name}")
+                
+            except Exception as e:
+                logger.error(f"Link enhancement failed for {faculty_name}: {e}")
+        
+        self.stats["faculty_processed"] += 1
+        return enhanced
+
+    async def iter_enhanced_faculty(self, faculty_data: List[Dict[str, Any]]) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Enhance faculty concurrently, yielding each result as it completes.
+        
+        Up to ``faculty_concurrency`` faculty members are in flight at once.
+        
+        Yields:
+            (index in faculty_data, enhanced faculty record) in completion order
+        """
+        pending = iter(enumerate(faculty_data))
+        results: asyncio.Queue = asyncio.Queue()
+        done = object()
+        
+        async def worker():
+            try:
+                for index, faculty in pending:
+                    await results.put((index, await self.enhance_single_faculty(faculty)))
+            finally:
+                await results.put(done)
+        
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.faculty_concurrency, len(faculty_data)))]
+        remaining = len(workers)
+        try:
+            while remaining:
+                item = await results.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def enhance_faculty_links(self, faculty_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enhance faculty data by finding better links for those with poor quality links.
+        
+        Faculty are processed concurrently; the result keeps the input order.
+        """
+        enhanced_faculty: List[Optional[Dict[str, Any]]] = [None] * len(faculty_data)
+        
+        async for index, enhanced in self.iter_enhanced_faculty(faculty_data):
+            enhanced_faculty[index] = enhanced
         
         return enhanced_faculty
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get processing statistics, including the shared search rate limiter and strategy yields."""
+        return {
+            **self.stats,
+            "search_rate_limiter": self.search_rate_limiter.get_stats(),
+            "strategies": self.query_planner.get_stats()
+        }
+
 
 # Convenience function for easy integration
 async def enhance_faculty_with_secondary_scraping(faculty_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -4,10 +4,12 @@ SiteSearchTask - Cost-effective external search for lab URLs.
 This module implements external web search capabilities using multiple APIs
 (Bing, SerpAPI) with intelligent caching, cost tracking, and quota management
 to find lab URLs when local heuristics fail.
+
+Results are cached for 30 days in the shared persistent search cache
+(``search_cache.get_search_cache``) unless another cache client is given.
 """
 
 import asyncio
-import hashlib
 import json
 import logging
 import time
@@ -19,6 +21,8 @@ import aiohttp
 import asyncio
 from datetime import datetime, timedelta
 
+from .search_cache import SearchResultCache, get_search_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,12 +48,13 @@ class SiteSearchTask:
         Args:
             bing_api_key: Bing Web Search API key
             serpapi_key: SerpAPI key (fallback)
-            cache_client: Cache client (Redis/MongoDB/dict)
+            cache_client: Cache client (SearchResultCache/Redis-like/dict);
+                defaults to the shared persistent search cache
             enable_cache: Whether to use caching
         """
         self.bing_api_key = bing_api_key or os.getenv('BING_API_KEY')
         self.serpapi_key = serpapi_key or os.getenv('SERPAPI_KEY')
-        self.cache_client = cache_client or {}  # In-memory dict fallback
+        self.cache_client = cache_client  # Opened on first use when None
         self.enable_cache = enable_cache
         
         # Usage tracking
@@ -89,7 +94,8 @@ class SiteSearchTask:
         Returns:
             List of dicts with keys: url, title, snippet, confidence
         """
-        # Create cache key
+        # Construct search query
+        query = self._construct_search_query(faculty_name, lab_name, university)
         cache_key = self._create_cache_key(faculty_name, lab_name, university)
         
         # Check cache first
@@ -97,19 +103,16 @@ class SiteSearchTask:
             cached_results = await self._get_from_cache(cache_key)
             if cached_results is not None:
                 self.session_stats["cache_hits"] += 1
-                logger.info("cache_hit", faculty=faculty_name, lab=lab_name)
+                logger.info(f"cache_hit faculty={faculty_name} lab={lab_name}")
                 return cached_results
         
         self.session_stats["cache_misses"] += 1
         
         # Rate limiting check
         if not await self._check_rate_limit():
-            logger.warning("rate_limit_exceeded", faculty=faculty_name)
+            logger.warning(f"rate_limit_exceeded faculty={faculty_name}")
             return []
         
-        # Construct search query
-        query = self._construct_search_query(faculty_name, lab_name, university)
-        
         # Try APIs in order of preference
         results = []
         search_successful = False
@@ -122,12 +125,10 @@ class SiteSearchTask:
                     search_successful = True
                     self.session_stats["bing_queries"] += 1
                     self.total_cost += self.BING_COST_PER_QUERY
-                    logger.info("bing_search_success", 
-                               faculty=faculty_name, 
-                               results=len(results),
-                               cost=self.BING_COST_PER_QUERY)
+                    logger.info(f"bing_search_success faculty={faculty_name} "
+                                f"results={len(results)} cost={self.BING_COST_PER_QUERY}")
             except Exception as e:
-                logger.error("bing_search_failed", faculty=faculty_name, error=str(e))
+                logger.error(f"bing_search_failed faculty={faculty_name} error={str(e)}")
         
         # Try SerpAPI as fallback
         if self.serpapi_key and not search_successful:
@@ -137,12 +138,10 @@ class SiteSearchTask:
                     search_successful = True
                     self.session_stats["serpapi_queries"] += 1
                     self.total_cost += self.SERPAPI_COST_PER_QUERY
-                    logger.info("serpapi_search_success",
-                               faculty=faculty_name,
-                               results=len(results),
-                               cost=self.SERPAPI_COST_PER_QUERY)
+                    logger.info(f"serpapi_search_success faculty={faculty_name} "
+                                f"results={len(results)} cost={self.SERPAPI_COST_PER_QUERY}")
             except Exception as e:
-                logger.error("serpapi_search_failed", faculty=faculty_name, error=str(e))
+                logger.error(f"serpapi_search_failed faculty={faculty_name} error={str(e)}")
         
         # Update statistics
         if search_successful:
@@ -150,7 +149,7 @@ class SiteSearchTask:
             self.quota_used += 1
         else:
             self.session_stats["failed_searches"] += 1
-            logger.warning("all_search_apis_failed", faculty=faculty_name)
+            logger.warning(f"all_search_apis_failed faculty={faculty_name}")
         
         # Post-process and score results
         scored_results = self._score_search_results(results, faculty_name, lab_name)
@@ -208,7 +207,7 @@ class SiteSearchTask:
                     logger.error("bing_api_quota_exceeded")
                     return []
                 else:
-                    logger.error("bing_api_error", status=response.status)
+                    logger.error(f"bing_api_error status={response.status}")
                     return []
     
     async def _search_serpapi(self, query: str, max_results: int) -> List[Dict]:
@@ -230,7 +229,7 @@ class SiteSearchTask:
                     data = await response.json()
                     return self._parse_serpapi_results(data)
                 else:
-                    logger.error("serpapi_error", status=response.status)
+                    logger.error(f"serpapi_error status={response.status}")
                     return []
     
     def _parse_bing_results(self, data: Dict) -> List[Dict]:
@@ -319,23 +318,32 @@ class SiteSearchTask:
         return sorted(scored_results, key=lambda x: x["confidence"], reverse=True)
     
     def _create_cache_key(self, faculty_name: str, lab_name: str, university: str) -> str:
-        """Create a unique cache key for the search query."""
-        key_string = f"{faculty_name}|{lab_name}|{university}".lower()
-        return f"search:{hashlib.md5(key_string.encode()).hexdigest()}"
+        """Create a unique cache key from the normalized search query."""
+        query = self._construct_search_query(faculty_name, lab_name, university)
+        return SearchResultCache.make_key("search", query)
+    
+    def _get_cache_client(self) -> Any:
+        """Get the cache client, opening the shared search cache on first use."""
+        if self.cache_client is None:
+            self.cache_client = get_search_cache()
+        return self.cache_client
     
     async def _get_from_cache(self, cache_key: str) -> Optional[List[Dict]]:
         """Get results from cache."""
         try:
-            if hasattr(self.cache_client, 'get'):
-                # Redis-like interface
-                cached_data = await self.cache_client.get(cache_key)
-                if cached_data:
-                    return json.loads(cached_data)
-            else:
+            cache_client = self._get_cache_client()
+            if isinstance(cache_client, SearchResultCache):
+                return cache_client.get(cache_key)
+            elif isinstance(cache_client, dict):
                 # Dictionary interface
-                cached_entry = self.cache_client.get(cache_key)
+                cached_entry = cache_client.get(cache_key)
                 if cached_entry and cached_entry.get('expires_at', 0) > time.time():
                     return cached_entry['data']
+            else:
+                # Redis-like interface
+                cached_data = await cache_client.get(cache_key)
+                if cached_data:
+                    return json.loads(cached_data)
         except Exception as e:
             logger.warning(f"cache_get_failed key={cache_key} error={str(e)}")
         
@@ -345,21 +353,24 @@ class SiteSearchTask:
         """Store results in cache with 30-day expiration."""
         try:
             cache_duration = 30 * 24 * 3600  # 30 days
+            cache_client = self._get_cache_client()
             
-            if hasattr(self.cache_client, 'setex'):
-                # Redis-like interface
-                await self.cache_client.setex(
-                    cache_key, cache_duration, json.dumps(results)
-                )
-            else:
+            if isinstance(cache_client, SearchResultCache):
+                cache_client.put(cache_key, results, ttl=cache_duration)
+            elif isinstance(cache_client, dict):
                 # Dictionary interface
-                self.cache_client[cache_key] = {
+                cache_client[cache_key] = {
                     'data': results,
                     'expires_at': time.time() + cache_duration,
                     'cached_at': time.time()
                 }
+            else:
+                # Redis-like interface
+                await cache_client.setex(
+                    cache_key, cache_duration, json.dumps(results)
+                )
         except Exception as e:
-            logger.warning("cache_store_failed", key=cache_key, error=str(e))
+            logger.warning(f"cache_store_failed key={cache_key} error={str(e)}")
     
     async def _check_rate_limit(self) -> bool:
         """Check if we're within rate limits."""
@@ -399,7 +410,9 @@ class SiteSearchTask:
             "api_availability": {
                 "bing_available": bool(self.bing_api_key),
                 "serpapi_available": bool(self.serpapi_key)
-            }
+            },
+            "cache": (self.cache_client.get_stats()
+                      if isinstance(self.cache_client, SearchResultCache) else None)
         }
     
     def estimate_cost(self, num_queries: int) -> Dict:
@@ -419,20 +432,23 @@ class SiteSearchTask:
         cleared_count = 0
         
         try:
-            if hasattr(self.cache_client, 'flushdb'):
-                # Redis-like interface
-                await self.cache_client.flushdb()
-                cleared_count = -1  # Unknown count
-            else:
+            cache_client = self._get_cache_client()
+            if isinstance(cache_client, SearchResultCache):
+                cleared_count = cache_client.clear(namespace="search")
+            elif isinstance(cache_client, dict):
                 # Dictionary interface
-                search_keys = [k for k in self.cache_client.keys() if k.startswith('search:')]
+                search_keys = [k for k in cache_client.keys() if k.startswith('search:')]
                 for key in search_keys:
-                    del self.cache_client[key]
+                    del cache_client[key]
                 cleared_count = len(search_keys)
+            else:
+                # Redis-like interface
+                await cache_client.flushdb()
+                cleared_count = -1  # Unknown count
                 
-            logger.info("cache_cleared", count=cleared_count)
+            logger.info(f"cache_cleared count={cleared_count}")
         except Exception as e:
-            logger.error("cache_clear_failed", error=str(e))
+            logger.error(f"cache_clear_failed error={str(e)}")
         
         return cleared_count
 
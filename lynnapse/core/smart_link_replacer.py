@@ -9,18 +9,36 @@ Intelligent discovery and replacement of missing faculty links:
 - Lab affiliations
 
 Uses advanced search heuristics and LLM assistance when available.
+
+Guessed direct URLs are generated from templates; templates that keep
+failing on a university's domain are negative-cached (see
+``url_template_stats``) and pruned before any request is made.
 """
 
 import asyncio
 import aiohttp
 import re
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
 from urllib.parse import quote, urljoin
 import json
 
+from .url_template_stats import UrlTemplateStats
+
 logger = logging.getLogger(__name__)
 
+# Stats domain for Scholar templates, which do not depend on the university
+SCHOLAR_DOMAIN = 'scholar.google.com'
+
+
+@lru_cache(maxsize=None)
+def _template_field_names(template: str) -> FrozenSet[str]:
+    """Names of the fields a URL template uses."""
+    return frozenset(field for _, field, _, _ in Formatter().parse(template) if field)
+
+
 class SmartLinkReplacer:
     """
     Smart link discovery and replacement for faculty with missing links.
@@ -32,10 +50,41 @@ class SmartLinkReplacer:
     - Lab/research group affiliations
     """
     
-    def __init__(self, timeout: int = 30, max_concurrent: int = 3):
+    # Direct URL guesses; fields are filled from the faculty name and university domain
+    SCHOLAR_URL_TEMPLATES = (
+        "https://scholar.google.com/citations?user={first}{last}",
+        "https://scholar.google.com/citations?user={first_initial}{last}",
+        "https://scholar.google.com/citations?user={last}{first_initial}",
+    )
+    
+    PERSONAL_WEBSITE_URL_TEMPLATES = (
+        "https://www.{domain}/~{first}{last}",
+        "https://www.{domain}/~{last}",
+        "https://www.{domain}/people/{first}-{last}",
+        "https://www.{domain}/faculty/{first}-{last}",
+        "https://{first}{last}.{domain}",
+        "https://{last}.{domain}",
+    )
+    
+    def __init__(self, timeout: int = 30, max_concurrent: int = 3,
+                 template_stats: Optional[UrlTemplateStats] = None):
+        """
+        Initialize the replacer.
+        
+        Args:
+            timeout: Timeout per request in seconds
+            max_concurrent: Maximum concurrent requests
+            template_stats: Per-domain URL template success rates (pass one
+                with a history_path to keep them between runs)
+        """
         self.timeout = timeout
         self.max_concurrent = max_concurrent
         self.session = None
+        self.template_stats = template_stats or UrlTemplateStats()
+        self.stats = {
+            "direct_urls_checked": 0,
+            "direct_urls_found": 0
+        }
         
         # Search patterns for different types of links
         self.scholar_search_patterns = [
@@ -86,6 +135,7 @@ class SmartLinkReplacer:
         """Async context manager exit."""
         if self.session:
             await self.session.close()
+        self.template_stats.save()
     
     async def find_google_scholar_profile(self, name: str, university: str) -> Optional[str]:
         """
@@ -107,12 +157,11 @@ class SmartLinkReplacer:
             university_short = self._get_university_short_name(university)
             
             # Try direct Google Scholar URL patterns first
-            direct_urls = self._generate_scholar_direct_urls(name, university_domain, university_short)
-            
-            for url in direct_urls:
-                if await self._verify_scholar_url(url, name):
-                    logger.info(f"Found Scholar profile via direct URL: {url}")
-                    return url
+            candidates = self._generate_scholar_direct_candidates(name, university_domain, university_short)
+            url = await self._try_direct_candidates(SCHOLAR_DOMAIN, candidates, name, self._verify_scholar_url)
+            if url:
+                logger.info(f"Found Scholar profile via direct URL: {url}")
+                return url
             
             # Try search-based discovery
             search_urls = await self._search_for_scholar_profile(name, university, university_domain, university_short)
@@ -148,12 +197,11 @@ class SmartLinkReplacer:
             university_short = self._get_university_short_name(university)
             
             # Try direct URL patterns first
-            direct_urls = self._generate_personal_website_urls(name, university_domain, university_short)
-            
-            for url in direct_urls:
-                if await self._verify_personal_website(url, name):
-                    logger.info(f"Found personal website via direct URL: {url}")
-                    return url
+            candidates = self._generate_personal_website_candidates(name, university_domain, university_short)
+            url = await self._try_direct_candidates(university_domain, candidates, name, self._verify_personal_website)
+            if url:
+                logger.info(f"Found personal website via direct URL: {url}")
+                return url
             
             # Try search-based discovery
             search_urls = await self._search_for_personal_website(name, university, university_domain, university_short)
@@ -260,45 +308,80 @@ class SmartLinkReplacer:
             else:
                 return university.split()[0]
     
-    def _generate_scholar_direct_urls(self, name: str, university_domain: str, university_short: str) -> List[str]:
-        """Generate potential direct Google Scholar URLs."""
-        urls = []
-        
+    def _template_fields(self, name: str, university_domain: str) -> Dict[str, str]:
+        """Fields available to URL templates."""
         # Clean name for URL generation
         first_name = name.split()[0].lower() if name.split() else ""
         last_name = name.split()[-1].lower() if len(name.split()) > 1 else ""
         
-        # Common Scholar URL patterns
-        patterns = [
-            f"https://scholar.google.com/citations?user={first_name}{last_name}",
-            f"https://scholar.google.com/citations?user={first_name[0]}{last_name}",
-            f"https://scholar.google.com/citations?user={last_name}{first_name[0]}",
-        ]
-        
-        urls.extend(patterns)
-        return urls
+        return {
+            'first': first_name,
+            'last': last_name,
+            'first_initial': first_name[:1],
+            'domain': university_domain
+        }
     
-    def _generate_personal_website_urls(self, name: str, university_domain: str, university_short: str) -> List[str]:
-        """Generate potential personal website URLs."""
-        urls = []
+    def _generate_template_candidates(self, templates: Tuple[str, ...], stats_domain: str,
+                                      name: str, university_domain: str) -> List[Tuple[str, str]]:
+        """
+        Fill URL templates, dropping those negative-cached for the domain.
         
-        # Clean name for URL generation
-        first_name = name.split()[0].lower() if name.split() else ""
-        last_name = name.split()[-1].lower() if len(name.split()) > 1 else ""
-        full_name_clean = name.lower().replace(' ', '')
+        Templates using a field the name does not provide (e.g. ``{last}``
+        for a single-word name) are skipped, so they are neither tried nor
+        recorded against the domain.
         
-        # Common personal website patterns
-        patterns = [
-            f"https://www.{university_domain}/~{first_name}{last_name}",
-            f"https://www.{university_domain}/~{last_name}",
-            f"https://www.{university_domain}/people/{first_name}-{last_name}",
-            f"https://www.{university_domain}/faculty/{first_name}-{last_name}",
-            f"https://{first_name}{last_name}.{university_domain}",
-            f"https://{last_name}.{university_domain}",
+        Returns:
+            (template, url) pairs, most successful template first
+        """
+        fields = self._template_fields(name, university_domain)
+        candidates = [
+            (template, template.format(**fields)) for template in templates
+            if all(fields[field] for field in _template_field_names(template))
         ]
+        return self.template_stats.prune(stats_domain, candidates)
+    
+    def _generate_scholar_direct_candidates(self, name: str, university_domain: str,
+                                            university_short: str) -> List[Tuple[str, str]]:
+        """Generate (template, url) pairs for direct Google Scholar URLs."""
+        return self._generate_template_candidates(
+            self.SCHOLAR_URL_TEMPLATES, SCHOLAR_DOMAIN, name, university_domain
+        )
+    
+    def _generate_personal_website_candidates(self, name: str, university_domain: str,
+                                              university_short: str) -> List[Tuple[str, str]]:
+        """Generate (template, url) pairs for personal website URLs."""
+        return self._generate_template_candidates(
+            self.PERSONAL_WEBSITE_URL_TEMPLATES, university_domain, name, university_domain
+        )
+    
+    def _generate_scholar_direct_urls(self, name: str, university_domain: str, university_short: str) -> List[str]:
+        """Generate potential direct Google Scholar URLs."""
+        return [url for _, url in self._generate_scholar_direct_candidates(name, university_domain, university_short)]
+    
+    def _generate_personal_website_urls(self, name: str, university_domain: str, university_short: str) -> List[str]:
+        """Generate potential personal website URLs."""
+        return [url for _, url in self._generate_personal_website_candidates(name, university_domain, university_short)]
+    
+    async def _try_direct_candidates(self, stats_domain: str, candidates: List[Tuple[str, str]],
+                                     name: str, verify) -> Optional[str]:
+        """
+        Verify direct URL candidates in order, recording each template's outcome.
         
-        urls.extend(patterns)
-        return urls
+        Returns:
+            First verified URL, or None
+        """
+        for template, url in candidates:
+            self.stats["direct_urls_checked"] += 1
+            verified = await verify(url, name)
+            self.template_stats.record(stats_domain, template, verified)
+            if verified:
+                self.stats["direct_urls_found"] += 1
+                return url
+        return None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get direct URL counters and template pruning statistics."""
+        return {**self.stats, "templates": self.template_stats.get_stats()}
     
     async def _verify_scholar_url(self, url: str, name: str) -> bool:
         """Verify that a Google Scholar URL belongs to the correct person."""
@@ -393,7 +476,8 @@ class SmartLinkReplacer:
 # Convenience functions for easy integration
 async def find_missing_faculty_links(faculty_list: List[Dict[str, Any]], 
                                    timeout: int = 30,
-                                   max_concurrent: int = 3) -> List[Dict[str, Any]]:
+                                   max_concurrent: int = 3,
+                                   template_stats_path: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Find and add missing links for faculty members.
     
@@ -401,11 +485,15 @@ async def find_missing_faculty_links(faculty_list: List[Dict[str, Any]],
         faculty_list: List of faculty data
         timeout: Timeout per request
         max_concurrent: Maximum concurrent requests
+        template_stats_path: JSON file keeping URL template success rates
+            between runs
         
     Returns:
         Faculty list with discovered links added
     """
-    async with SmartLinkReplacer(timeout=timeout, max_concurrent=max_concurrent) as replacer:
+    template_stats = UrlTemplateStats(history_path=template_stats_path)
+    async with SmartLinkReplacer(timeout=timeout, max_concurrent=max_concurrent,
+                                 template_stats=template_stats) as replacer:
         enhanced_faculty = []
         
         for faculty in faculty_list:
@@ -23,7 +23,7 @@ from bs4 import BeautifulSoup
 import httpx
 
 from lynnapse.config.settings import get_settings
-from .university_structure_db import UniversityStructureDB
+from .university_structure_db import get_university_structure_db
 from .link_heuristics import LinkHeuristics
 
 logger = logging.getLogger(__name__)
@@ -129,7 +129,7 @@ class UniversityAdapter:
             }
         )
         self.llm_assistant = None # Will be set by the crawler
-        self.structure_db = UniversityStructureDB()
+        self.structure_db = get_university_structure_db()
         self.link_heuristics = LinkHeuristics()
     
     def set_llm_assistant(self, llm_assistant: Any):
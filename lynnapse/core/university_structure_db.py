@@ -3,15 +3,20 @@ University Structure Database
 
 This module provides persistent storage for university structure information,
 including discovered faculty directory paths and department structures.
+
+Structures live in an embedded SQLite database in WAL mode, so lookups and
+updates touch a single row and several worker processes can share the file.
+The JSON file used by earlier versions is imported once on first open.
 """
 
 import json
 import logging
+import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, asdict
-from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
@@ -33,17 +38,66 @@ class UniversityStructure:
 class UniversityStructureDB:
     """Persistent database for university structure information."""
     
-    def __init__(self, db_path: str = "db/university_structures.json"):
-        """Initialize the university structure database."""
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS structures (
+            key TEXT PRIMARY KEY,
+            university_name TEXT NOT NULL,
+            base_url TEXT NOT NULL,
+            faculty_directory_paths TEXT NOT NULL,
+            department_paths TEXT NOT NULL,
+            departments TEXT NOT NULL,
+            discovery_method TEXT NOT NULL,
+            confidence_score REAL NOT NULL,
+            last_updated REAL NOT NULL,
+            discovery_count INTEGER NOT NULL DEFAULT 1,
+            faculty_path_count INTEGER NOT NULL DEFAULT 0,
+            department_count INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_structures_last_updated ON structures (last_updated);
+        CREATE INDEX IF NOT EXISTS idx_structures_name ON structures (university_name COLLATE NOCASE);
+        CREATE TABLE IF NOT EXISTS metadata (
+            name TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+    
+    def __init__(self, db_path: str = "db/university_structures.db",
+                 legacy_json_path: Optional[str] = None,
+                 timeout: float = 30.0):
+        """
+        Initialize the university structure database.
+        
+        Args:
+            db_path: SQLite database file. A ``.json`` path is treated as the
+                legacy store and the database is created beside it.
+            legacy_json_path: JSON store to import on first open (defaults to
+                the database path with a ``.json`` suffix)
+            timeout: Seconds to wait for a lock held by another process
+        """
         self.db_path = Path(db_path)
+        if self.db_path.suffix == ".json":
+            legacy_json_path = legacy_json_path or str(self.db_path)
+            self.db_path = self.db_path.with_suffix(".db")
+        self.legacy_json_path = Path(legacy_json_path) if legacy_json_path else self.db_path.with_suffix(".json")
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # In-memory cache
-        self._structures: Dict[str, UniversityStructure] = {}
-        self._load_database()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        
+        self._migrate_legacy_json()
         
         logger.info(f"University structure database initialized: {self.db_path.absolute()}")
-        logger.info(f"Loaded {len(self._structures)} university structures")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
     
     def _create_key(self, university_name: str, base_url: str = "") -> str:
         """Create a unique key for a university."""
@@ -52,40 +106,131 @@ class UniversityStructureDB:
         clean_name = clean_name.replace(' ', '_')
         return clean_name
     
-    def _load_database(self) -> None:
-        """Load the database from disk."""
-        try:
-            if self.db_path.exists():
-                with open(self.db_path, 'r') as f:
-                    data = json.load(f)
-                
-                for key, structure_data in data.items():
-                    try:
-                        self._structures[key] = UniversityStructure(**structure_data)
-                    except Exception as e:
-                        logger.warning(f"Failed to load structure for {key}: {e}")
-                        
-        except Exception as e:
-            logger.error(f"Failed to load university structure database: {e}")
-            self._structures = {}
+    def _transaction(self):
+        """Run a write transaction that holds the database write lock from the start."""
+        return _ImmediateTransaction(self._conn, self._lock)
     
-    def _save_database(self) -> None:
-        """Save the database to disk."""
-        try:
-            data = {}
-            for key, structure in self._structures.items():
-                data[key] = asdict(structure)
-            
-            # Write atomically
-            temp_path = self.db_path.with_suffix('.tmp')
-            with open(temp_path, 'w') as f:
-                json.dump(data, f, indent=2)
+    @staticmethod
+    def _row_to_structure(row: sqlite3.Row) -> UniversityStructure:
+        """Convert a database row into a UniversityStructure."""
+        return UniversityStructure(
+            university_name=row["university_name"],
+            base_url=row["base_url"],
+            faculty_directory_paths=json.loads(row["faculty_directory_paths"]),
+            department_paths=json.loads(row["department_paths"]),
+            departments=json.loads(row["departments"]),
+            discovery_method=row["discovery_method"],
+            confidence_score=row["confidence_score"],
+            last_updated=row["last_updated"],
+            discovery_count=row["discovery_count"]
+        )
+    
+    def _read_structure(self, key: str) -> Optional[UniversityStructure]:
+        """Point read of a single structure by key."""
+        row = self._conn.execute("SELECT * FROM structures WHERE key = ?", (key,)).fetchone()
+        return self._row_to_structure(row) if row else None
+    
+    def _write_structure(self, key: str, structure: UniversityStructure) -> None:
+        """Insert or replace a single structure row."""
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO structures (
+                key, university_name, base_url, faculty_directory_paths, department_paths,
+                departments, discovery_method, confidence_score, last_updated,
+                discovery_count, faculty_path_count, department_count
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                key,
+                structure.university_name,
+                structure.base_url,
+                json.dumps(structure.faculty_directory_paths),
+                json.dumps(structure.department_paths),
+                json.dumps(structure.departments),
+                structure.discovery_method,
+                structure.confidence_score,
+                structure.last_updated,
+                structure.discovery_count,
+                len(structure.faculty_directory_paths),
+                len(structure.departments)
+            )
+        )
+    
+    def _migrate_legacy_json(self) -> None:
+        """Import the legacy JSON store once, if it exists."""
+        if not self.legacy_json_path.exists():
+            return
+        
+        with self._transaction():
+            migrated = self._conn.execute(
+                "SELECT value FROM metadata WHERE name = 'json_migrated_from'"
+            ).fetchone()
+            if migrated:
+                return
             
-            temp_path.replace(self.db_path)
-            logger.debug(f"Saved {len(self._structures)} structures to database")
+            imported = self._import_json(self.legacy_json_path)
+            self._conn.execute(
+                "INSERT INTO metadata (name, value) VALUES ('json_migrated_from', ?)",
+                (str(self.legacy_json_path.absolute()),)
+            )
+        
+        logger.info(f"Migrated {imported} university structures from {self.legacy_json_path}")
+    
+    def import_json(self, json_path: Union[str, Path]) -> int:
+        """
+        Import structures from a JSON store written by earlier versions.
+        
+        Existing rows with the same key are replaced.
+        
+        Args:
+            json_path: Path to the JSON file
             
+        Returns:
+            Number of structures imported
+        """
+        with self._transaction():
+            return self._import_json(Path(json_path))
+    
+    def _import_json(self, json_path: Path) -> int:
+        """Import a JSON store inside the caller's transaction."""
+        try:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
         except Exception as e:
-            logger.error(f"Failed to save university structure database: {e}")
+            logger.error(f"Failed to read university structure JSON {json_path}: {e}")
+            return 0
+        
+        imported = 0
+        for key, structure_data in data.items():
+            try:
+                self._write_structure(key, UniversityStructure(**structure_data))
+                imported += 1
+            except Exception as e:
+                logger.warning(f"Failed to load structure for {key}: {e}")
+        
+        return imported
+    
+    def export_json(self, json_path: Union[str, Path]) -> int:
+        """
+        Export all structures to a JSON file in the legacy format.
+        
+        Args:
+            json_path: Destination path
+            
+        Returns:
+            Number of structures exported
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM structures ORDER BY key").fetchall()
+        
+        data = {row["key"]: asdict(self._row_to_structure(row)) for row in rows}
+        json_path = Path(json_path)
+        temp_path = json_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        temp_path.replace(json_path)
+        
+        return len(data)
     
     def store_structure(self, 
                        university_name: str,
@@ -100,62 +245,61 @@ class UniversityStructureDB:
         key = self._create_key(university_name, base_url)
         current_time = time.time()
         
-        if key in self._structures:
-            # Update existing structure
-            structure = self._structures[key]
-            
-            # Merge faculty paths (keep unique)
-            all_faculty_paths = list(set(structure.faculty_directory_paths + faculty_directory_paths))
-            
-            # Merge department paths
-            all_dept_paths = department_paths or []
-            if structure.department_paths:
-                all_dept_paths = list(set(structure.department_paths + all_dept_paths))
-            
-            # Merge departments
-            all_departments = structure.departments.copy()
-            if departments:
-                for dept_name, paths in departments.items():
-                    if dept_name in all_departments:
-                        all_departments[dept_name] = list(set(all_departments[dept_name] + paths))
-                    else:
-                        all_departments[dept_name] = paths
+        with self._transaction():
+            structure = self._read_structure(key)
             
-            # Update structure
-            structure.faculty_directory_paths = all_faculty_paths
-            structure.department_paths = all_dept_paths
-            structure.departments = all_departments
-            structure.discovery_method = discovery_method  # Update to latest method
-            structure.confidence_score = max(structure.confidence_score, confidence_score)
-            structure.last_updated = current_time
-            structure.discovery_count += 1
-            
-            logger.info(f"Updated structure for {university_name} (discovery #{structure.discovery_count})")
-            
-        else:
-            # Create new structure
-            structure = UniversityStructure(
-                university_name=university_name,
-                base_url=base_url,
-                faculty_directory_paths=faculty_directory_paths,
-                department_paths=department_paths or [],
-                departments=departments or {},
-                discovery_method=discovery_method,
-                confidence_score=confidence_score,
-                last_updated=current_time,
-                discovery_count=1
-            )
+            if structure:
+                # Merge faculty paths (keep unique)
+                all_faculty_paths = list(set(structure.faculty_directory_paths + faculty_directory_paths))
+                
+                # Merge department paths
+                all_dept_paths = department_paths or []
+                if structure.department_paths:
+                    all_dept_paths = list(set(structure.department_paths + all_dept_paths))
+                
+                # Merge departments
+                all_departments = structure.departments.copy()
+                if departments:
+                    for dept_name, paths in departments.items():
+                        if dept_name in all_departments:
+                            all_departments[dept_name] = list(set(all_departments[dept_name] + paths))
+                        else:
+                            all_departments[dept_name] = paths
+                
+                # Update structure
+                structure.faculty_directory_paths = all_faculty_paths
+                structure.department_paths = all_dept_paths
+                structure.departments = all_departments
+                structure.discovery_method = discovery_method  # Update to latest method
+                structure.confidence_score = max(structure.confidence_score, confidence_score)
+                structure.last_updated = current_time
+                structure.discovery_count += 1
+                
+                logger.info(f"Updated structure for {university_name} (discovery #{structure.discovery_count})")
+                
+            else:
+                # Create new structure
+                structure = UniversityStructure(
+                    university_name=university_name,
+                    base_url=base_url,
+                    faculty_directory_paths=faculty_directory_paths,
+                    department_paths=department_paths or [],
+                    departments=departments or {},
+                    discovery_method=discovery_method,
+                    confidence_score=confidence_score,
+                    last_updated=current_time,
+                    discovery_count=1
+                )
+                
+                logger.info(f"Stored new structure for {university_name}")
             
-            self._structures[key] = structure
-            logger.info(f"Stored new structure for {university_name}")
-        
-        # Save to disk
-        self._save_database()
+            self._write_structure(key, structure)
     
     def get_structure(self, university_name: str, base_url: str = "") -> Optional[UniversityStructure]:
         """Get university structure information."""
         key = self._create_key(university_name, base_url)
-        return self._structures.get(key)
+        with self._lock:
+            return self._read_structure(key)
     
     def get_faculty_paths(self, university_name: str, department_name: str = None) -> List[str]:
         """Get faculty directory paths for a university/department."""
@@ -185,39 +329,54 @@ class UniversityStructureDB:
     
     def add_department_paths(self, university_name: str, department_name: str, paths: List[str]) -> None:
         """Add specific paths for a department."""
-        structure = self.get_structure(university_name)
-        if not structure:
-            logger.warning(f"No structure found for {university_name} to add department paths")
-            return
-        
-        dept_key = department_name.lower()
-        if dept_key in structure.departments:
-            structure.departments[dept_key] = list(set(structure.departments[dept_key] + paths))
-        else:
-            structure.departments[dept_key] = paths
+        key = self._create_key(university_name)
         
-        structure.last_updated = time.time()
-        self._save_database()
+        with self._transaction():
+            structure = self._read_structure(key)
+            if not structure:
+                logger.warning(f"No structure found for {university_name} to add department paths")
+                return
+            
+            dept_key = department_name.lower()
+            if dept_key in structure.departments:
+                structure.departments[dept_key] = list(set(structure.departments[dept_key] + paths))
+            else:
+                structure.departments[dept_key] = paths
+            
+            structure.last_updated = time.time()
+            self._write_structure(key, structure)
         
         logger.info(f"Added {len(paths)} paths for {department_name} at {university_name}")
     
-    def list_universities(self) -> List[Dict[str, Any]]:
-        """List all universities in the database."""
-        universities = []
-        for structure in self._structures.values():
-            universities.append({
-                'name': structure.university_name,
-                'base_url': structure.base_url,
-                'faculty_paths': len(structure.faculty_directory_paths),
-                'departments': len(structure.departments),
-                'discovery_method': structure.discovery_method,
-                'confidence': structure.confidence_score,
-                'last_updated': time.strftime('%Y-%m-%d %H:%M:%S', 
-                                             time.localtime(structure.last_updated)),
-                'discovery_count': structure.discovery_count
-            })
+    def list_universities(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List universities in the database, most recently updated first."""
+        query = """
+            SELECT university_name, base_url, faculty_path_count, department_count,
+                   discovery_method, confidence_score, last_updated, discovery_count
+            FROM structures ORDER BY last_updated DESC
+        """
+        params = ()
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (limit,)
+        
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
         
-        return sorted(universities, key=lambda x: x['last_updated'], reverse=True)
+        return [
+            {
+                'name': row["university_name"],
+                'base_url': row["base_url"],
+                'faculty_paths': row["faculty_path_count"],
+                'departments': row["department_count"],
+                'discovery_method': row["discovery_method"],
+                'confidence': row["confidence_score"],
+                'last_updated': time.strftime('%Y-%m-%d %H:%M:%S', 
+                                             time.localtime(row["last_updated"])),
+                'discovery_count': row["discovery_count"]
+            }
+            for row in rows
+        ]
         
     def get_departments(self, university_name: str) -> List[str]:
         """Get all known departments for a university."""
@@ -229,55 +388,81 @@ class UniversityStructureDB:
     
     def search_universities(self, query: str) -> List[str]:
         """Search for universities by name."""
-        query_lower = query.lower()
-        matches = []
-        
-        for structure in self._structures.values():
-            if query_lower in structure.university_name.lower():
-                matches.append(structure.university_name)
+        pattern = "%" + query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT university_name FROM structures WHERE lower(university_name) LIKE ? ESCAPE '\\'",
+                (pattern,)
+            ).fetchall()
         
-        return sorted(matches)
+        return sorted(row["university_name"] for row in rows)
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics."""
-        total_universities = len(self._structures)
-        total_departments = sum(len(s.departments) for s in self._structures.values())
-        total_faculty_paths = sum(len(s.faculty_directory_paths) for s in self._structures.values())
-        
-        discovery_methods = defaultdict(int)
-        for structure in self._structures.values():
-            discovery_methods[structure.discovery_method] += 1
+        with self._lock:
+            totals = self._conn.execute(
+                """
+                SELECT COUNT(*) AS universities,
+                       COALESCE(SUM(department_count), 0) AS departments,
+                       COALESCE(SUM(faculty_path_count), 0) AS faculty_paths,
+                       COALESCE(MAX(last_updated), 0) AS last_update
+                FROM structures
+                """
+            ).fetchone()
+            methods = self._conn.execute(
+                "SELECT discovery_method, COUNT(*) AS n FROM structures GROUP BY discovery_method"
+            ).fetchall()
         
         return {
-            'total_universities': total_universities,
-            'total_departments': total_departments,
-            'total_faculty_paths': total_faculty_paths,
-            'discovery_methods': dict(discovery_methods),
+            'total_universities': totals["universities"],
+            'total_departments': totals["departments"],
+            'total_faculty_paths': totals["faculty_paths"],
+            'discovery_methods': {row["discovery_method"]: row["n"] for row in methods},
             'database_path': str(self.db_path.absolute()),
-            'last_update': max((s.last_updated for s in self._structures.values()), default=0)
+            'last_update': totals["last_update"]
         }
     
     def cleanup_old_entries(self, max_age_days: int = 30) -> int:
         """Clean up old entries that haven't been updated recently."""
         cutoff_time = time.time() - (max_age_days * 24 * 3600)
-        removed_count = 0
-        
-        keys_to_remove = []
-        for key, structure in self._structures.items():
-            if structure.last_updated < cutoff_time and structure.discovery_count == 1:
-                keys_to_remove.append(key)
         
-        for key in keys_to_remove:
-            del self._structures[key]
-            removed_count += 1
+        with self._transaction():
+            cursor = self._conn.execute(
+                "DELETE FROM structures WHERE last_updated < ? AND discovery_count = 1",
+                (cutoff_time,)
+            )
+            removed_count = cursor.rowcount
         
         if removed_count > 0:
-            self._save_database()
             logger.info(f"Cleaned up {removed_count} old university structures")
         
         return removed_count
 
 
+class _ImmediateTransaction:
+    """Context manager for a ``BEGIN IMMEDIATE`` transaction on a shared connection."""
+    
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self.conn = conn
+        self.lock = lock
+    
+    def __enter__(self):
+        self.lock.acquire()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self.lock.release()
+            raise
+        return self.conn
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        finally:
+            self.lock.release()
+        return False
+
+
 # Global instance
 _db_instance = None
 
@@ -0,0 +1,140 @@
+"""
+URL Template Stats - Learn which guessed URL patterns a domain actually uses.
+
+Link discovery guesses faculty URLs from templates (``/~{last}``,
+``/people/{first}-{last}``, ``{last}.{domain}``, ...) and verifies each guess
+over the network. Most universities use only one or two of these layouts,
+so the rest produce a stream of 404s for every faculty member.
+
+This module records per-domain success counts for every template. A
+template that keeps failing on a domain without ever succeeding there is
+negative-cached for a while and pruned from candidate generation, and the
+remaining templates are tried in order of success rate. Given a
+``history_path``, a domain's dead templates stay pruned in later runs
+until their negative-cache entry expires.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .history_file import read_history, write_history
+
+logger = logging.getLogger(__name__)
+
+
+class UrlTemplateStats:
+    """Per-domain URL template success rates with a negative cache."""
+
+    def __init__(self, history_path: Optional[Union[str, Path]] = None,
+                 min_failures: int = 5, negative_ttl: float = 7 * 24 * 3600):
+        """
+        Initialize the template stats.
+
+        Args:
+            history_path: File of per-domain template outcomes kept across runs
+            min_failures: Consecutive failures (with no success ever) after
+                which a template is negative-cached for a domain
+            negative_ttl: Seconds a template stays negative-cached before it
+                is probed again
+        """
+        self.history_path = Path(history_path) if history_path else None
+        self.min_failures = min_failures
+        self.negative_ttl = negative_ttl
+        self.domains: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self.stats = {
+            "pruned": 0,
+            "negative_cached": 0
+        }
+
+        if self.history_path and self.history_path.exists():
+            self.load()
+
+    def _entry(self, domain: str, template: str) -> Dict[str, float]:
+        templates = self.domains.setdefault(domain.lower(), {})
+        entry = templates.get(template)
+        if entry is None:
+            entry = templates[template] = {
+                "attempts": 0, "successes": 0, "consecutive_failures": 0, "negative_until": 0.0
+            }
+        return entry
+
+    def success_rate(self, domain: str, template: str) -> float:
+        """Smoothed success rate of a template on a domain."""
+        entry = self.domains.get(domain.lower(), {}).get(template, {})
+        return (entry.get("successes", 0) + 1) / (entry.get("attempts", 0) + 2)
+
+    def is_negative(self, domain: str, template: str) -> bool:
+        """Whether a template is currently negative-cached for a domain."""
+        entry = self.domains.get(domain.lower(), {}).get(template)
+        return bool(entry) and entry["negative_until"] > time.time()
+
+    def prune(self, domain: str, candidates: Sequence[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """
+        Drop negative-cached templates and order the rest by success rate.
+
+        Args:
+            domain: Domain the candidates were generated for
+            candidates: (template, url) pairs in default order
+
+        Returns:
+            Remaining (template, url) pairs, most successful template first
+        """
+        kept = [(template, url) for template, url in candidates if not self.is_negative(domain, template)]
+        self.stats["pruned"] += len(candidates) - len(kept)
+        return sorted(kept, key=lambda candidate: self.success_rate(domain, candidate[0]), reverse=True)
+
+    def record(self, domain: str, template: str, success: bool) -> None:
+        """
+        Record whether a URL generated from a template was verified.
+
+        Args:
+            domain: Domain the URL was generated for
+            template: Template the URL came from
+            success: Whether verification succeeded
+        """
+        entry = self._entry(domain, template)
+        entry["attempts"] += 1
+        if success:
+            entry["successes"] += 1
+            entry["consecutive_failures"] = 0
+            entry["negative_until"] = 0.0
+            return
+
+        entry["consecutive_failures"] += 1
+        if not entry["successes"] and entry["consecutive_failures"] >= self.min_failures:
+            entry["negative_until"] = time.time() + self.negative_ttl
+            self.stats["negative_cached"] += 1
+            logger.debug(f"Negative-caching URL template {template} for {domain}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pruning counters and the negative-cached templates per domain."""
+        return {
+            **self.stats,
+            "domains": len(self.domains),
+            "negative_templates": {
+                domain: sorted(t for t in templates if self.is_negative(domain, t))
+                for domain, templates in self.domains.items()
+                if any(self.is_negative(domain, t) for t in templates)
+            }
+        }
+
+    def load(self) -> None:
+        """Restore per-domain template outcomes; an unreadable file just starts fresh."""
+        try:
+            data = read_history(self.history_path)
+            for domain, templates in data.get("domains", {}).items():
+                for template, counters in templates.items():
+                    self._entry(domain, template).update(
+                        {key: counters[key] for key in ("attempts", "successes",
+                                                         "consecutive_failures", "negative_until")
+                         if key in counters}
+                    )
+        except (OSError, ValueError, AttributeError, TypeError) as e:
+            logger.warning(f"Could not load URL template stats from {self.history_path}: {e}")
+
+    def save(self) -> None:
+        """Save template outcomes and negative-cache expiries, when a path is set."""
+        if self.history_path:
+            write_history(self.history_path, {"domains": self.domains})
@@ -0,0 +1,265 @@
+"""
+WriteBehindQueue - Batched, asynchronous persistence for pipeline stages.
+
+Scraping stages put documents on a bounded queue and carry on; a
+background flusher drains the queue in batches (by size or by time)
+through MongoWriter bulk upserts. A full queue blocks producers so a
+slow database applies backpressure instead of growing memory, and
+closing the queue flushes everything that is still pending.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from .mongo_writer import MongoWriter
+
+
+logger = logging.getLogger(__name__)
+
+# Sentinel placed on the queue to stop the flusher after draining
+_SHUTDOWN = object()
+
+
+class WriteBehindQueue:
+    """Bounded async queue that persists documents in bulk batches."""
+
+    def __init__(self,
+                 writer: Optional[MongoWriter] = None,
+                 max_queue_size: int = 1000,
+                 batch_size: int = 100,
+                 flush_interval: float = 1.0,
+                 max_retries: int = 2,
+                 retry_delay: float = 0.5):
+        """
+        Initialize the write-behind queue.
+
+        Args:
+            writer: Connected MongoWriter to flush through. When omitted the
+                queue creates and owns its own writer.
+            max_queue_size: Maximum number of pending documents before
+                producers are blocked
+            batch_size: Maximum number of documents per bulk write
+            flush_interval: Maximum seconds a partial batch waits before
+                it is flushed
+            max_retries: Retries for a failed bulk write
+            retry_delay: Base delay between retries in seconds
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.writer = writer
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+        self._owns_writer = writer is None
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # (collection, upsert key) of documents whose last write was dropped
+        self._failed_keys: Set[Tuple[str, tuple]] = set()
+
+        # Statistics tracking
+        self.stats = {
+            "documents_queued": 0,
+            "documents_written": 0,
+            "documents_failed": 0,
+            "batches_flushed": 0,
+            "batches_failed": 0,
+            "backpressure_waits": 0,
+            "peak_queue_depth": 0,
+            "last_flush_latency_ms": 0.0,
+            "max_flush_latency_ms": 0.0,
+            "total_flush_latency_ms": 0.0,
+            "inserted": 0,
+            "changed": 0,
+            "unchanged": 0
+        }
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - flushes all pending documents."""
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the background flusher."""
+        if self._flusher is not None:
+            return
+
+        if self.writer is None:
+            self.writer = MongoWriter()
+        await self.writer.ensure_connection()
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._closed = False
+        self._flusher = asyncio.create_task(self._run())
+        logger.info(f"Write-behind queue started (capacity={self.max_queue_size}, "
+                    f"batch_size={self.batch_size}, flush_interval={self.flush_interval}s)")
+
+    async def put(self, collection: str, document: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a document for upsert.
+
+        The document is validated immediately so that bad records are
+        reported to the producer. Waits while the queue is full.
+
+        Args:
+            collection: Target collection (see ``MongoWriter.prepare_upsert``)
+            document: Raw document data
+
+        Returns:
+            The document's upsert key, for ``stored_ids`` once flushed
+        """
+        if self._flusher is None or self._closed:
+            raise RuntimeError("Write-behind queue is not running")
+
+        prepared = self.writer.prepare_upsert(collection, document)
+
+        if self._queue.full():
+            self.stats["backpressure_waits"] += 1
+        await self._queue.put((collection, prepared))
+
+        self.stats["documents_queued"] += 1
+        self.stats["peak_queue_depth"] = max(self.stats["peak_queue_depth"], self._queue.qsize())
+        return prepared[1]
+
+    async def flush(self) -> None:
+        """Wait until every document queued so far has been written."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush pending documents and stop the flusher."""
+        if self._flusher is None:
+            return
+
+        self._closed = True
+        await self._queue.put(_SHUTDOWN)
+        await self._flusher
+        self._flusher = None
+
+        if self._owns_writer and self.writer is not None:
+            await self.writer.close()
+
+        logger.info(f"Write-behind queue closed: {self.stats['documents_written']} written, "
+                    f"{self.stats['documents_failed']} failed")
+
+    async def stored_ids(self, collection: str, filter_keys: List[Dict[str, Any]]) -> List[str]:
+        """
+        Look up the IDs of queued documents that were actually written.
+
+        Call after ``flush`` or ``close``, while the writer is connected.
+        Documents dropped after failed bulk writes are left out.
+
+        Args:
+            collection: Collection the documents were queued for
+            filter_keys: Upsert keys returned by ``put``
+
+        Returns:
+            IDs of the written documents, in the order of ``filter_keys``,
+            with each document listed once
+        """
+        written: Dict[tuple, Dict[str, Any]] = {}
+        for key in filter_keys:
+            identity = tuple(key.values())
+            if (collection, identity) not in self._failed_keys:
+                written.setdefault(identity, key)
+        if not written:
+            return []
+        ids = await self.writer.get_document_ids(collection, list(written.values()))
+        return [document_id for document_id in ids if document_id is not None]
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of documents currently waiting to be flushed."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics including depth and flush latency."""
+        stats = self.stats.copy()
+        stats["queue_depth"] = self.queue_depth
+        stats["average_flush_latency_ms"] = (
+            stats["total_flush_latency_ms"] / stats["batches_flushed"]
+            if stats["batches_flushed"] else 0.0
+        )
+        return stats
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and write them until shut down."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            batch = []
+            item = await self._queue.get()
+            if item is _SHUTDOWN:
+                stopping = True
+            else:
+                batch.append(item)
+
+            # Fill the batch until it is full or the flush interval elapses
+            deadline = loop.time() + self.flush_interval
+            while not stopping and len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _SHUTDOWN:
+                    stopping = True
+                else:
+                    batch.append(item)
+
+            if batch:
+                await self._write_batch(batch)
+
+            for _ in range(len(batch) + (1 if stopping else 0)):
+                self._queue.task_done()
+
+    async def _write_batch(self, batch: List[Tuple[str, Tuple]]) -> None:
+        """Write one batch, grouped by collection, recording latency."""
+        by_collection = defaultdict(list)
+        for collection, prepared in batch:
+            by_collection[collection].append(prepared)
+
+        start_time = time.perf_counter()
+
+        for collection, prepared in by_collection.items():
+            for attempt in range(self.max_retries + 1):
+                try:
+                    counts = await self.writer.execute_upserts(collection, prepared)
+                    self.stats["documents_written"] += len(prepared)
+                    self._failed_keys.difference_update((collection, tuple(filter_key.values()))
+                                                        for _, filter_key, _ in prepared)
+                    for outcome in ("inserted", "changed", "unchanged"):
+                        self.stats[outcome] += counts.get(outcome, 0)
+                    break
+                except Exception as e:
+                    if attempt < self.max_retries:
+                        logger.warning(f"Bulk write to {collection} failed (attempt {attempt + 1}), retrying: {e}")
+                        await asyncio.sleep(self.retry_delay * (attempt + 1))
+                    else:
+                        logger.error(f"Dropping {len(prepared)} {collection} documents after "
+                                     f"{self.max_retries + 1} failed attempts: {e}")
+                        self.stats["documents_failed"] += len(prepared)
+                        self._failed_keys.update((collection, tuple(filter_key.values()))
+                                                 for _, filter_key, _ in prepared)
+                        self.stats["batches_failed"] += 1
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        self.stats["batches_flushed"] += 1
+        self.stats["last_flush_latency_ms"] = latency_ms
+        self.stats["max_flush_latency_ms"] = max(self.stats["max_flush_latency_ms"], latency_ms)
+        self.stats["total_flush_latency_ms"] += latency_ms
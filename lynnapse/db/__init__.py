@@ -2,7 +2,18 @@
 Database package for Lynnapse MongoDB connections and operations.
 """
 
-from .mongodb import MongoDBClient, get_client
+from .mongodb import (
+    MongoDBClient,
+    MongoClientRegistry,
+    get_client,
+    get_database,
+    get_pool_metrics,
+    get_connection_target,
+    configure_database,
+    close_database_connection,
+    close_loop_database_connection,
+    database_lifespan
+)
 
 # Repository imports - will be added later
 # from .repositories import (
@@ -14,7 +25,15 @@ from .mongodb import MongoDBClient, get_client
 
 __all__ = [
     "MongoDBClient",
+    "MongoClientRegistry",
     "get_client",
+    "get_database",
+    "get_pool_metrics",
+    "get_connection_target",
+    "configure_database",
+    "close_database_connection",
+    "close_loop_database_connection",
+    "database_lifespan",
     # "ProgramRepository",
     # "FacultyRepository", 
     # "LabSiteRepository",
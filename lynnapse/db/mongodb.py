@@ -2,38 +2,143 @@
 MongoDB client and database connection setup for Lynnapse.
 """
 
+import asyncio
 import os
 import logging
-from typing import Optional
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Tuple
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
 from pymongo.errors import ConnectionFailure
 
 
 logger = logging.getLogger(__name__)
 
 
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Connection pool event listener that keeps running pool counters."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {
+            "connections_created": 0,
+            "connections_closed": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "checkout_failures": 0,
+            "pool_clears": 0
+        }
+    
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            self.counters[counter] += 1
+    
+    def get_metrics(self) -> Dict[str, int]:
+        """Get a snapshot of the pool counters."""
+        with self._lock:
+            metrics = self.counters.copy()
+        metrics["open_connections"] = metrics["connections_created"] - metrics["connections_closed"]
+        metrics["in_use"] = metrics["checkouts"] - metrics["checkins"]
+        return metrics
+    
+    def pool_created(self, event):
+        pass
+    
+    def pool_ready(self, event):
+        pass
+    
+    def pool_cleared(self, event):
+        self._increment("pool_clears")
+    
+    def pool_closed(self, event):
+        pass
+    
+    def connection_created(self, event):
+        self._increment("connections_created")
+    
+    def connection_ready(self, event):
+        pass
+    
+    def connection_closed(self, event):
+        self._increment("connections_closed")
+    
+    def connection_check_out_started(self, event):
+        pass
+    
+    def connection_check_out_failed(self, event):
+        self._increment("checkout_failures")
+    
+    def connection_checked_out(self, event):
+        self._increment("checkouts")
+    
+    def connection_checked_in(self, event):
+        self._increment("checkins")
+
+
 class MongoDBClient:
     """MongoDB client wrapper for Lynnapse."""
     
-    def __init__(self, connection_string: Optional[str] = None):
-        """Initialize MongoDB client."""
+    def __init__(self, connection_string: Optional[str] = None,
+                 database_name: Optional[str] = None,
+                 max_pool_size: int = 10,
+                 max_idle_time_ms: Optional[int] = 60000,
+                 timeout_ms: int = 30000,
+                 heartbeat_frequency_ms: int = 10000):
+        """
+        Initialize MongoDB client.
+        
+        Args:
+            connection_string: MongoDB URL (defaults to ``MONGODB_URL``)
+            database_name: Database name (defaults to ``MONGODB_DATABASE``)
+            max_pool_size: Maximum connections in the pool
+            max_idle_time_ms: Close pooled connections idle for this long
+            timeout_ms: Server selection and connect timeout
+            heartbeat_frequency_ms: Interval between server monitor checks
+        """
         self.connection_string = connection_string or os.getenv(
             "MONGODB_URL", 
             "mongodb://localhost:27017"
         )
-        self.database_name = os.getenv("MONGODB_DATABASE", "lynnapse")
+        self.database_name = database_name or os.getenv("MONGODB_DATABASE", "lynnapse")
+        self.max_pool_size = max_pool_size
+        self.max_idle_time_ms = max_idle_time_ms
+        self.timeout_ms = timeout_ms
+        self.heartbeat_frequency_ms = heartbeat_frequency_ms
+        self.pool_listener = PoolMetricsListener()
         self.client: Optional[AsyncIOMotorClient] = None
         self.database: Optional[AsyncIOMotorDatabase] = None
     
+    @classmethod
+    def from_config(cls, config) -> "MongoDBClient":
+        """Create a client using the database settings of a ProductionConfig."""
+        return cls(
+            connection_string=config.mongodb_url,
+            database_name=config.mongodb_database,
+            max_pool_size=config.mongodb_pool_size,
+            max_idle_time_ms=config.mongodb_max_idle_time_ms,
+            timeout_ms=config.mongodb_timeout_ms,
+            heartbeat_frequency_ms=config.mongodb_heartbeat_frequency_ms
+        )
+    
     async def connect(self) -> None:
         """Connect to MongoDB."""
         try:
-            self.client = AsyncIOMotorClient(self.connection_string)
+            self.client = AsyncIOMotorClient(
+                self.connection_string,
+                maxPoolSize=self.max_pool_size,
+                maxIdleTimeMS=self.max_idle_time_ms,
+                serverSelectionTimeoutMS=self.timeout_ms,
+                connectTimeoutMS=self.timeout_ms,
+                heartbeatFrequencyMS=self.heartbeat_frequency_ms,
+                event_listeners=[self.pool_listener]
+            )
             self.database = self.client[self.database_name]
             
             # Test the connection
             await self.client.admin.command('ping')
-            logger.info(f"Connected to MongoDB database: {self.database_name}")
+            logger.info(f"Connected to MongoDB database: {self.database_name} "
+                        f"(max_pool_size={self.max_pool_size})")
             
         except ConnectionFailure as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
@@ -43,17 +148,29 @@ class MongoDBClient:
         """Disconnect from MongoDB."""
         if self.client:
             self.client.close()
+            self.client = None
+            self.database = None
             logger.info("Disconnected from MongoDB")
     
     async def get_database(self) -> AsyncIOMotorDatabase:
         """Get the database instance."""
-        if not self.database:
+        if self.database is None:
             await self.connect()
         return self.database
     
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Get connection pool metrics for this client."""
+        return {
+            "database": self.database_name,
+            "connected": self.client is not None,
+            "max_pool_size": self.max_pool_size,
+            "max_idle_time_ms": self.max_idle_time_ms,
+            **self.pool_listener.get_metrics()
+        }
+    
     async def create_indexes(self) -> None:
         """Create database indexes for better performance."""
-        if not self.database:
+        if self.database is None:
             await self.connect()
         
         # Program indexes
@@ -69,6 +186,10 @@ class MongoDBClient:
             ("program_id", 1),
             ("name", 1)
         ])
+        await self.database.faculty.create_index([
+            ("program_id", 1),
+            ("_id", 1)
+        ])
         await self.database.faculty.create_index("email")
         await self.database.faculty.create_index("profile_url")
         await self.database.faculty.create_index("scraped_at")
@@ -78,6 +199,10 @@ class MongoDBClient:
             ("faculty_id", 1),
             ("lab_url", 1)
         ], unique=True)
+        await self.database.lab_sites.create_index([
+            ("faculty_id", 1),
+            ("_id", 1)
+        ])
         await self.database.lab_sites.create_index("program_id")
         await self.database.lab_sites.create_index("scraped_at")
         
@@ -92,7 +217,7 @@ class MongoDBClient:
     async def health_check(self) -> bool:
         """Check if the database connection is healthy."""
         try:
-            if not self.database:
+            if self.database is None:
                 await self.connect()
             await self.client.admin.command('ping')
             return True
@@ -101,36 +226,152 @@ class MongoDBClient:
             return False
 
 
-# Global client instance
-_mongodb_client: Optional[MongoDBClient] = None
+class MongoClientRegistry:
+    """
+    Process-wide registry of shared MongoDB clients.
+    
+    Writers and readers borrow the client for the running event loop
+    instead of opening their own, so the connection pool is set up once
+    per process. Motor clients are bound to an event loop, so a process
+    that runs several loops (e.g. worker threads) gets one client per loop.
+    """
+    
+    def __init__(self):
+        self._config = None
+        self._clients: Dict[int, Tuple[asyncio.AbstractEventLoop, MongoDBClient]] = {}
+    
+    def configure(self, config=None) -> None:
+        """
+        Set the configuration used for clients created from now on.
+        
+        Args:
+            config: ProductionConfig to take database settings from. When
+                omitted, pool settings come from
+                ``ProductionConfig.from_environment()`` and the URL and
+                database name from ``MONGODB_URL``/``MONGODB_DATABASE``.
+        """
+        self._config = config
+    
+    def _create_client(self) -> MongoDBClient:
+        if self._config is not None:
+            return MongoDBClient.from_config(self._config)
+        
+        from lynnapse.config.production import ProductionConfig
+        
+        config = ProductionConfig.from_environment()
+        return MongoDBClient(
+            max_pool_size=config.mongodb_pool_size,
+            max_idle_time_ms=config.mongodb_max_idle_time_ms,
+            timeout_ms=config.mongodb_timeout_ms,
+            heartbeat_frequency_ms=config.mongodb_heartbeat_frequency_ms
+        )
+    
+    async def get_client(self) -> MongoDBClient:
+        """Get the shared client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(id(loop))
+        
+        if entry is None or entry[0] is not loop:
+            client = self._create_client()
+            self._clients[id(loop)] = (loop, client)
+            try:
+                await client.connect()
+            except Exception:
+                self._clients.pop(id(loop), None)
+                raise
+            return client
+        
+        return entry[1]
+    
+    async def close(self) -> None:
+        """Close the client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.pop(id(loop), None)
+        if entry is not None:
+            await entry[1].disconnect()
+    
+    async def close_all(self) -> None:
+        """Close every registered client."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for _, client in clients:
+            await client.disconnect()
+    
+    def get_connection_target(self) -> Dict[str, str]:
+        """URL and database of the running loop's client, or of the one it would get."""
+        entry = self._clients.get(id(asyncio.get_running_loop()))
+        client = entry[1] if entry is not None else self._create_client()
+        return {"url": client.connection_string, "database": client.database_name}
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Get pool metrics for every registered client."""
+        return {
+            "clients": len(self._clients),
+            "pools": [client.get_pool_metrics() for _, client in self._clients.values()]
+        }
+
+
+# Global client registry
+_registry = MongoClientRegistry()
+
+
+def configure_database(config=None) -> None:
+    """Configure the shared client registry (e.g. from a ProductionConfig)."""
+    _registry.configure(config)
 
 
 async def get_database() -> AsyncIOMotorDatabase:
     """Get the global database instance."""
-    global _mongodb_client
-    
-    if not _mongodb_client:
-        _mongodb_client = MongoDBClient()
-        await _mongodb_client.connect()
-    
-    return await _mongodb_client.get_database()
+    client = await _registry.get_client()
+    return await client.get_database()
 
 
 async def get_client() -> MongoDBClient:
     """Get the global MongoDB client instance."""
-    global _mongodb_client
-    
-    if not _mongodb_client:
-        _mongodb_client = MongoDBClient()
-        await _mongodb_client.connect()
-    
-    return _mongodb_client
+    return await _registry.get_client()
+
+
+def get_connection_target() -> Dict[str, str]:
+    """Get the URL and database name the shared client connects to."""
+    return _registry.get_connection_target()
+
+
+def get_pool_metrics() -> Dict[str, Any]:
+    """Get connection pool metrics for the shared clients."""
+    return _registry.get_pool_metrics()
 
 
 async def close_database_connection() -> None:
-    """Close the global database connection."""
-    global _mongodb_client
+    """
+    Close the shared clients of every event loop.
+    
+    Only the owner of the process (e.g. the web app on shutdown) should
+    call this; flows and workers close their own loop's client with
+    ``close_loop_database_connection``.
+    """
+    await _registry.close_all()
+
+
+async def close_loop_database_connection() -> None:
+    """Close the shared client of the running event loop only."""
+    await _registry.close()
+
+
+@asynccontextmanager
+async def database_lifespan(config=None):
+    """
+    Manage the shared database clients for the lifetime of a process.
+    
+    Closes the clients of every event loop on exit, so it belongs around
+    the process entry point (app or CLI command), not around a flow.
     
-    if _mongodb_client:
-        await _mongodb_client.disconnect()
-        _mongodb_client = None 
\ No newline at end of file
+    Usage:
+        async with database_lifespan():
+            ...  # MongoWriter instances borrow the shared client
+    """
+    if config is not None:
+        configure_database(config)
+    try:
+        yield
+    finally:
+        await close_database_connection()
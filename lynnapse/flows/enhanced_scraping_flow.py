@@ -25,12 +25,14 @@ from prefect.blocks.system import Secret
 from lynnapse.config.seeds import SeedLoader
 from lynnapse.core import (
     MongoWriter,
+    WriteBehindQueue,
     AdaptiveFacultyCrawler, 
     UniversityAdapter,
     SmartLinkReplacer,
     WebsiteValidator,
     LinkEnrichmentEngine
 )
+from lynnapse.db import close_loop_database_connection
 from lynnapse.models import Faculty
 from lynnapse.flows.tasks import (
     load_seeds_task,
@@ -38,6 +40,22 @@ from lynnapse.flows.tasks import (
     cleanup_task
 )
 
+# College recorded for programs and faculty when the crawler cannot tell
+DEFAULT_COLLEGE = "Unknown"
+
+
+def _faculty_document(faculty_data: Dict[str, Any], program_id: str,
+                      department_name: str, department_url: str) -> Dict[str, Any]:
+    """Fill in the Faculty fields that adaptive-crawler records lack."""
+    document = dict(faculty_data)
+    document["program_id"] = program_id
+    document["title"] = document.get("title") or ""
+    document["department"] = document.get("department") or department_name
+    document["college"] = document.get("college") or DEFAULT_COLLEGE
+    document["profile_url"] = document.get("profile_url") or ""
+    document["source_url"] = document.get("source_url") or department_url
+    return document
+
 
 @task(
     name="scrape-faculty-enhanced",
@@ -281,53 +299,117 @@ async def store_enhanced_data_task(
     enriched_faculty: List[Dict[str, Any]],
     processing_report: Dict[str, Any],
     enrichment_report: Dict[str, Any],
-    job_id: str
+    job_id: str,
+    university_name: str,
+    department_name: str
 ) -> Dict[str, Any]:
     """
     Store enhanced faculty data and reports to MongoDB.
     
+    Adaptive-crawler records carry no program, so they are filed under
+    one program per university department, upserted here.
+    
     Args:
         enriched_faculty: Faculty data with enriched links
         processing_report: Link processing report
         enrichment_report: Link enrichment report
         job_id: Scrape job ID
+        university_name: University the faculty belong to
+        department_name: Department the faculty were scraped from
         
     Returns:
         Storage operation results
+        
+    Raises:
+        RuntimeError: If none of the faculty records could be stored
     """
     logger = get_run_logger()
     logger.info(f"💾 Storing enhanced data for {len(enriched_faculty)} faculty")
     
     try:
         async with MongoWriter() as mongo_writer:
-            # Store faculty data
-            faculty_ids = []
-            for faculty_data in enriched_faculty:
-                faculty_id = await mongo_writer.store_faculty(faculty_data)
-                faculty_ids.append(faculty_id)
+            department_url = next(
+                (faculty["source_url"] for faculty in enriched_faculty if faculty.get("source_url")), ""
+            )
+            program_id = await mongo_writer.upsert_program({
+                "university_name": university_name,
+                "program_name": department_name,
+                "program_type": "department",
+                "department": department_name,
+                "college": DEFAULT_COLLEGE,
+                "program_url": department_url,
+                "faculty_directory_url": department_url or None,
+                "source_url": department_url
+            })
+            
+            # Queue faculty data; bulk writes run in the background
+            faculty_keys = []
+            faculty_invalid = 0
+            async with WriteBehindQueue(mongo_writer) as queue:
+                for faculty_data in enriched_faculty:
+                    try:
+                        document = _faculty_document(faculty_data, program_id, department_name, department_url)
+                        faculty_keys.append(await queue.put("faculty", document))
+                    except Exception as e:
+                        faculty_invalid += 1
+                        logger.warning(f"⚠️ Skipping invalid faculty record {faculty_data.get('name')}: {e}")
+            
+            queue_stats = queue.get_stats()
+            faculty_ids = await queue.stored_ids("faculty", faculty_keys)
+            faculty_stored = len(faculty_ids)
+            faculty_unstored = len(enriched_faculty) - faculty_stored
+            
+            if not faculty_unstored:
+                status = "data_stored"
+            elif faculty_stored:
+                status = "partially_stored"
+            else:
+                status = "storage_failed"
             
             # Update job with comprehensive statistics
             job_update = {
-                "enhanced_data_stored": True,
+                "enhanced_data_stored": faculty_stored > 0,
                 "faculty_processed": len(enriched_faculty),
+                "faculty_stored": faculty_stored,
+                "faculty_unstored": faculty_unstored,
+                "faculty_invalid": faculty_invalid,
                 "faculty_ids": faculty_ids,
+                "program_id": program_id,
                 "processing_report": processing_report,
                 "enrichment_report": enrichment_report,
                 "storage_timestamp": datetime.utcnow().isoformat(),
-                "status": "data_stored"
+                "status": status
             }
             
             await mongo_writer.update_scrape_job(job_id, job_update)
             
+            if faculty_unstored and not faculty_stored:
+                raise RuntimeError(
+                    f"None of {len(enriched_faculty)} faculty records were stored "
+                    f"({faculty_invalid} invalid, {queue_stats['documents_failed']} failed bulk writes)"
+                )
+            
             storage_results = {
-                "faculty_stored": len(faculty_ids),
+                "status": status,
+                "faculty_stored": faculty_stored,
+                "faculty_unstored": faculty_unstored,
+                "faculty_invalid": faculty_invalid,
                 "faculty_ids": faculty_ids,
+                "program_id": program_id,
+                "write_counts": mongo_writer.get_write_counts()["faculty"],
+                "write_behind": queue_stats,
                 "reports_stored": True,
                 "job_updated": True,
                 "storage_timestamp": datetime.utcnow().isoformat()
             }
             
-            logger.info(f"✅ Successfully stored {len(faculty_ids)} faculty records")
+            if faculty_unstored:
+                logger.warning(f"⚠️ Stored {faculty_stored} of {len(enriched_faculty)} faculty records "
+                               f"({faculty_invalid} invalid, {queue_stats['documents_failed']} failed bulk writes)")
+            else:
+                logger.info(f"✅ Successfully stored {faculty_stored} faculty records "
+                            f"({queue_stats['batches_flushed']} batches, "
+                            f"avg flush {queue_stats['average_flush_latency_ms']:.1f}ms)")
             return storage_results
             
     except Exception as e:
@@ -488,7 +570,9 @@ async def enhanced_faculty_scraping_flow(
                         enriched_faculty=enriched_faculty,
                         processing_report=processing_report,
                         enrichment_report=enrichment_report,
-                        job_id=job_id
+                        job_id=job_id,
+                        university_name=university_name,
+                        department_name=department_name
                     )
                     
                     # Collect statistics
@@ -560,6 +644,9 @@ async def enhanced_faculty_scraping_flow(
             pass  # Don't fail the flow if we can't update job status
         
         raise
+    
+    finally:
+        await close_loop_database_connection()
 
 
 @flow(
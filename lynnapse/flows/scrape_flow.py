@@ -13,6 +13,7 @@ from prefect import flow, task
 from prefect.logging import get_run_logger
 from prefect.task_runners import ConcurrentTaskRunner
 
+from lynnapse.db import close_loop_database_connection
 from .tasks import (
     load_seeds_task,
     create_scrape_job_task,
@@ -201,6 +202,9 @@ async def main_scrape_flow(
             pass  # Don't fail the flow if we can't update job status
         
         raise
+    
+    finally:
+        await close_loop_database_connection()
 
 
 @flow(
@@ -285,11 +289,12 @@ async def program_scrape_flow(
     logger = get_run_logger()
     logger.info(f"📚 Starting program scrape: {program_id}")
     
-    # Crawl faculty
+    # Crawl faculty (inline writes, since the IDs are returned to the caller)
     faculty_ids = await crawl_faculty_task(
         program_id=program_id,
         faculty_directory_url=faculty_directory_url,
-        max_concurrent=max_concurrent_faculty
+        max_concurrent=max_concurrent_faculty,
+        write_behind=False
     )
     
     # TODO: Extract and crawl lab websites
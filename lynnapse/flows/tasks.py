@@ -18,7 +18,8 @@ from lynnapse.core import (
     FacultyCrawler, 
     LabCrawler, 
     DataCleaner, 
-    MongoWriter
+    MongoWriter,
+    WriteBehindQueue
 )
 
 
@@ -115,6 +116,8 @@ async def crawl_programs_task(university_config: Dict[str, Any],
                     except Exception as e:
                         logger.error(f"Failed to process program {program_config.get('name')}: {e}")
                         continue
+                
+                logger.info(f"Program write counts: {mongo_writer.get_write_counts()['programs']}")
         
         logger.info(f"Successfully processed {len(program_ids)} programs")
         return program_ids
@@ -127,22 +130,32 @@ async def crawl_programs_task(university_config: Dict[str, Any],
 @task(name="crawl-faculty", tags=["scraping", "faculty"])
 async def crawl_faculty_task(program_id: str, 
                            faculty_directory_url: str,
-                           max_concurrent: int = 5) -> List[str]:
+                           max_concurrent: int = 5,
+                           write_behind: bool = True) -> List[str]:
     """
     Crawl faculty for a specific program.
     
+    With ``write_behind`` enabled, records are handed to a
+    WriteBehindQueue and persisted in background bulk writes while
+    crawling continues; all pending records are flushed before the task
+    returns, and the IDs of the records that were written are looked up
+    by upsert key.
+    
     Args:
         program_id: Program ID reference
         faculty_directory_url: URL of faculty directory
         max_concurrent: Maximum concurrent crawls
+        write_behind: Persist through the write-behind queue instead of
+            one upsert per faculty member
         
     Returns:
-        List of faculty IDs
+        List of IDs of the stored faculty records
     """
     logger = get_run_logger()
     logger.info(f"Crawling faculty for program: {program_id}")
     
     faculty_ids = []
+    faculty_keys = []
     
     try:
         async with FacultyCrawler() as faculty_crawler:
@@ -155,29 +168,47 @@ async def crawl_faculty_task(program_id: str,
                 
                 logger.info(f"Discovered {len(faculty_list)} faculty members")
                 
-                # Process each faculty member
-                for faculty_data in faculty_list:
-                    try:
-                        # Add program reference
-                        faculty_data["program_id"] = program_id
-                        
-                        # Crawl detailed profile if URL available
-                        profile_url = faculty_data.get("profile_url")
-                        if profile_url:
-                            faculty_data = await faculty_crawler.crawl_faculty_profile(
-                                profile_url, 
-                                faculty_data
-                            )
-                        
-                        # Store in database
-                        faculty_id = await mongo_writer.upsert_faculty(faculty_data)
-                        faculty_ids.append(faculty_id)
-                        
-                        logger.info(f"Processed faculty: {faculty_data.get('name')}")
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to process faculty {faculty_data.get('name')}: {e}")
-                        continue
+                queue = WriteBehindQueue(mongo_writer) if write_behind else None
+                if queue:
+                    await queue.start()
+                
+                try:
+                    # Process each faculty member
+                    for faculty_data in faculty_list:
+                        try:
+                            # Add program reference
+                            faculty_data["program_id"] = program_id
+                            
+                            # Crawl detailed profile if URL available
+                            profile_url = faculty_data.get("profile_url")
+                            if profile_url:
+                                faculty_data = await faculty_crawler.crawl_faculty_profile(
+                                    profile_url, 
+                                    faculty_data
+                                )
+                            
+                            # Store in database
+                            if queue:
+                                faculty_keys.append(await queue.put("faculty", faculty_data))
+                            else:
+                                faculty_id = await mongo_writer.upsert_faculty(faculty_data)
+                                faculty_ids.append(faculty_id)
+                            
+                            logger.info(f"Processed faculty: {faculty_data.get('name')}")
+                            
+                        except Exception as e:
+                            logger.error(f"Failed to process faculty {faculty_data.get('name')}: {e}")
+                            continue
+                finally:
+                    if queue:
+                        await queue.close()
+                        logger.info(f"Write-behind stats: {queue.get_stats()}")
+                
+                if queue:
+                    # Records from batches dropped after failed writes are left out
+                    faculty_ids = await queue.stored_ids("faculty", faculty_keys)
+                
+                logger.info(f"Faculty write counts: {mongo_writer.get_write_counts()['faculty']}")
         
         logger.info(f"Successfully processed {len(faculty_ids)} faculty members")
         return faculty_ids
@@ -239,6 +270,8 @@ async def crawl_labs_task(faculty_id: str,
                     except Exception as e:
                         logger.error(f"Failed to process lab {lab_url}: {e}")
                         continue
+                
+                logger.info(f"Lab site write counts: {mongo_writer.get_write_counts()['lab_sites']}")
         
         logger.info(f"Successfully processed {len(lab_ids)} lab sites")
         return lab_ids
@@ -344,7 +344,7 @@ class DataRelationshipMap(BaseModel):
     # Duplicate detection
     potential_duplicates: Dict[str, List[str]] = Field(
         default_factory=dict, 
-        description="Potential duplicate entities by type"
+        description="Potential duplicates: faculty ID -> IDs it may duplicate"
     )
     
     # Data issues
@@ -371,7 +371,8 @@ class DataRelationshipMap(BaseModel):
                 "data_completeness": 0.78,
                 "orphaned_faculty": [],
                 "potential_duplicates": {
-                    "faculty": ["fac_123", "fac_456"]
+                    "fac_123": ["fac_456"],
+                    "fac_456": ["fac_123"]
                 }
             }
         } 
\ No newline at end of file
@@ -12,13 +12,18 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from fastapi import FastAPI, Request, Form, HTTPException, Query, UploadFile, File
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from lynnapse.scrapers.university.arizona_psychology import ArizonaPsychologyScraper
 from lynnapse.core import MongoWriter
+from lynnapse.db import close_database_connection, get_pool_metrics
 # from ..flows.scrape_flow import UniversityScrapeFlow  # Commented out to avoid Prefect dependency for now
+from .jobs import JobManager, JobProgress, QueueFullError, stream_job_events
+from .record_index import stream_records_json
+from .results_index import ResultsIndex
+from ..config.settings import get_settings
 from ..config.university_database import get_university_suggestions, get_department_suggestions, university_db
 import logging
 import os
@@ -60,6 +65,56 @@ def create_app() -> FastAPI:
         version="1.0.0"
     )
     
+    # Manifest of saved result files for the results page
+    results_index = ResultsIndex(RESULTS_DIR)
+    
+    # Long-running scrapes run in background workers, not in the request
+    settings = get_settings()
+    job_manager = JobManager(
+        workers=settings.web_job_workers,
+        max_queued=settings.web_job_queue_size,
+        track_in_mongo=settings.web_job_tracking
+    )
+    app.state.job_manager = job_manager
+    
+    async def submit_job(job_type: str, data: Dict[str, Any], default_max_faculty: int) -> JSONResponse:
+        """Validate a scrape request and queue it as a background job."""
+        university_name = data.get('university_name')
+        department_name = data.get('department_name')
+        if not university_name or not department_name:
+            return JSONResponse({
+                "success": False,
+                "message": "University name and department name are required"
+            }, status_code=400)
+        
+        try:
+            max_faculty = int(data.get('max_faculty', default_max_faculty))
+        except (TypeError, ValueError):
+            return JSONResponse({
+                "success": False,
+                "message": "max_faculty must be an integer"
+            }, status_code=400)
+        
+        params = {
+            "university_name": university_name,
+            "department_name": department_name,
+            "max_faculty": max_faculty
+        }
+        try:
+            job = await job_manager.submit(job_type, params, university_name=university_name,
+                                           program_name=department_name)
+        except QueueFullError as e:
+            return JSONResponse({"success": False, "message": str(e)}, status_code=503)
+        
+        return JSONResponse({
+            "success": True,
+            "message": f"Queued {job_type.replace('_', ' ')} for {university_name} {department_name}",
+            "job_id": job.job_id,
+            "status": job.status.value,
+            "status_url": f"/api/jobs/{job.job_id}",
+            "events_url": f"/api/jobs/{job.job_id}/events"
+        }, status_code=202)
+    
     # Setup templates and static files
     web_dir = Path(__file__).parent
     templates = Jinja2Templates(directory=web_dir / "templates")
@@ -81,6 +136,13 @@ def create_app() -> FastAPI:
             logger.info("University database initialized")
         except Exception as e:
             logger.error(f"Failed to initialize university database: {e}")
+        await job_manager.start()
+    
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        """Stop background job workers and close the shared MongoDB connection pool."""
+        await job_manager.stop()
+        await close_database_connection()
     
     @app.get("/", response_class=HTMLResponse)
     async def home(request: Request):
@@ -98,20 +160,12 @@ def create_app() -> FastAPI:
             "title": "Scrape University Data"
         })
     
-    @app.post("/api/adaptive-scrape")
-    async def start_adaptive_scrape(request: Request):
-        """Start an adaptive scraping job."""
+    async def run_adaptive_scrape(params: Dict[str, Any], progress: JobProgress) -> Dict[str, Any]:
+        """Run an adaptive scraping job in a background worker."""
         try:
-            data = await request.json()
-            university_name = data.get('university_name')
-            department_name = data.get('department_name')
-            max_faculty = int(data.get('max_faculty', 100))
-            
-            if not university_name or not department_name:
-                return JSONResponse({
-                    "success": False,
-                    "message": "University name and department name are required"
-                })
+            university_name = params['university_name']
+            department_name = params['department_name']
+            max_faculty = params['max_faculty']
             
             # Use the adaptive scraper directly (not via subprocess)
             from lynnapse.core.adaptive_faculty_crawler import AdaptiveFacultyCrawler
@@ -121,12 +175,14 @@ def create_app() -> FastAPI:
             # Create and run the adaptive crawler with comprehensive extraction
             # Always enable lab discovery and detailed profile extraction for complete results
             crawler = AdaptiveFacultyCrawler(enable_lab_discovery=True)
+            await progress.update(5, stage="scraping")
             
             try:
                 scrape_result = await crawler.scrape_university_faculty(
                     university_name=university_name,
                     department_filter=department_name,
-                    max_faculty=max_faculty if max_faculty > 0 else None
+                    max_faculty=max_faculty if max_faculty > 0 else None,
+                    progress_callback=progress.callback("scraping", 5, 85)
                 )
                 
                 logger.info(f"Scrape completed: success={scrape_result.get('success')}, faculty_count={len(scrape_result.get('faculty', []))}")
@@ -192,6 +248,8 @@ def create_app() -> FastAPI:
             finally:
                 await crawler.close()
             
+            await progress.update(90, stage="saving", items_scraped=result.get('total_count', 0))
+            
             # Save results to file only if the discovery was successful (even if no faculty)
             if result.get('success'):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -212,8 +270,9 @@ def create_app() -> FastAPI:
                 
                 with open(output_file, 'w', encoding='utf-8') as f:
                     json.dump(full_result, f, indent=2, ensure_ascii=False)
+                results_index.record(output_file, full_result)
                 
-                return JSONResponse({
+                return {
                     "success": True,
                     "message": f"Successfully scraped {result.get('total_count', 0)} faculty members from {university_name} {department_name}",
                     "data": result.get('faculty', [])[:10],  # Return first 10 for preview
@@ -222,22 +281,28 @@ def create_app() -> FastAPI:
                     "timestamp": timestamp,
                     "university": university_name,
                     "department": department_name
-                })
+                }
             else:
-                return JSONResponse({
+                return {
                     "success": False,
                     "message": result.get('message', 'Scraping failed for unknown reason')
-                })
+                }
                 
         except Exception as e:
             logger.error(f"Adaptive scraping failed: {e}")
             import traceback
             logger.error(f"Full traceback: {traceback.format_exc()}")
-            return JSONResponse({
+            return {
                 "success": False,
                 "message": f"Scraping failed: {str(e)}",
                 "error": str(e)
-            })
+            }
+    
+    @app.post("/api/adaptive-scrape", status_code=202)
+    async def start_adaptive_scrape(request: Request):
+        """Queue an adaptive scraping job and return its id."""
+        data = await request.json()
+        return await submit_job("adaptive_scrape", data, default_max_faculty=100)
 
     @app.post("/api/scrape")
     async def start_scrape(
@@ -258,15 +323,17 @@ def create_app() -> FastAPI:
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     output_file = f"scrape_results/legacy/arizona_psychology_{timestamp}.json"
                     
+                    legacy_result = {
+                        'university_name': 'University of Arizona',
+                        'department_name': 'Psychology',
+                        'faculty': faculty_data,
+                        'timestamp': timestamp,
+                        'scrape_type': 'legacy',
+                        'total_count': len(faculty_data)
+                    }
                     with open(output_file, 'w', encoding='utf-8') as f:
-                        json.dump({
-                            'university_name': 'University of Arizona',
-                            'department_name': 'Psychology',
-                            'faculty': faculty_data,
-                            'timestamp': timestamp,
-                            'scrape_type': 'legacy',
-                            'total_count': len(faculty_data)
-                        }, f, indent=2, ensure_ascii=False)
+                        json.dump(legacy_result, f, indent=2, ensure_ascii=False)
+                    results_index.record(output_file, legacy_result)
                     
                     return JSONResponse({
                         "success": True,
@@ -297,71 +364,30 @@ def create_app() -> FastAPI:
             })
     
     @app.get("/api/results")
-    async def get_results():
-        """Get recent scraping results from organized folders."""
+    async def get_results(
+        university: Optional[str] = Query(None),
+        department: Optional[str] = Query(None),
+        scrape_type: Optional[str] = Query(None),
+        limit: int = Query(10, ge=1, le=100),
+        offset: int = Query(0, ge=0)
+    ):
+        """Get recent scraping results from the results manifest."""
         try:
-            results = []
-            
-            # Look for files in both adaptive and legacy folders
-            for folder in ['scrape_results/adaptive', 'scrape_results/legacy']:
-                folder_path = Path(folder)
-                if folder_path.exists():
-                    json_files = list(folder_path.glob("*.json"))
-                    
-                    for json_file in json_files:
-                        try:
-                            with open(json_file, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            # Handle both new structured format and old format
-                            if isinstance(data, dict) and 'faculty' in data:
-                                # New structured format
-                                university = data.get('university_name', 'Unknown')
-                                department = data.get('department_name', 'Unknown')
-                                scrape_type = data.get('scrape_type', 'unknown')
-                                faculty = data.get('faculty', [])
-                                total_count = data.get('total_count', len(faculty))
-                            elif isinstance(data, list):
-                                # Old format (raw faculty list)
-                                faculty = data
-                                # Try to extract university/department from first faculty member
-                                if faculty and len(faculty) > 0:
-                                    first_faculty = faculty[0]
-                                    university = first_faculty.get('university', 'Unknown')
-                                    department = first_faculty.get('department', 'Unknown')
-                                else:
-                                    university = 'Unknown'
-                                    department = 'Unknown'
-                                scrape_type = 'legacy'
-                                total_count = len(faculty)
-                            else:
-                                # Fallback for other formats
-                                university = 'Unknown'
-                                department = 'Unknown'
-                                scrape_type = 'unknown'
-                                faculty = []
-                                total_count = 0
-                            
-                            results.append({
-                                "filename": json_file.name,
-                                "full_path": str(json_file),
-                                "timestamp": datetime.fromtimestamp(json_file.stat().st_mtime).isoformat(),
-                                "university": university,
-                                "department": department,
-                                "scrape_type": scrape_type,
-                                "count": total_count,
-                                "preview": faculty[:3] if isinstance(faculty, list) else []
-                            })
-                        except Exception as e:
-                            logger.warning(f"Failed to process {json_file}: {e}")
-                            continue
-            
-            # Sort by timestamp (newest first)
-            results.sort(key=lambda x: x['timestamp'], reverse=True)
+            results, total = await asyncio.to_thread(
+                results_index.list_results,
+                university=university,
+                department=department,
+                scrape_type=scrape_type,
+                limit=limit,
+                offset=offset
+            )
             
             return JSONResponse({
                 "success": True,
-                "results": results[:10]  # Return last 10 results
+                "results": results,
+                "total": total,
+                "limit": limit,
+                "offset": offset
             })
             
         except Exception as e:
@@ -372,59 +398,77 @@ def create_app() -> FastAPI:
             })
     
     @app.api_route("/api/results/{filename}", methods=["GET", "DELETE"])
-    async def handle_results_file(request: Request, filename: str):
-        """Handle both GET and DELETE requests for results files."""
+    async def handle_results_file(
+        request: Request,
+        filename: str,
+        offset: int = Query(0, ge=0),
+        limit: Optional[int] = Query(None, ge=1)
+    ):
+        """
+        Handle both GET and DELETE requests for results files.
+        
+        GET streams the file's faculty records (optionally a page of them
+        via offset/limit) without loading the whole file into memory.
+        """
         try:
             # Security check - ensure filename is safe
             if not filename.endswith(".json") or ".." in filename or "/" in filename:
                 raise HTTPException(status_code=400, detail="Invalid filename")
             
             # Look for the file in both folders
-            file_path = None
-            for folder in ['scrape_results/adaptive', 'scrape_results/legacy']:
-                potential_path = Path(folder) / filename
-                if potential_path.exists():
-                    file_path = potential_path
-                    break
+            file_path = results_index.find_file(filename)
             
             if not file_path:
                 raise HTTPException(status_code=404, detail="File not found")
             
             if request.method == "GET":
-                # GET: Return file contents
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                # GET: Stream the requested records straight from the file
+                record_spans = await asyncio.to_thread(results_index.get_record_spans, file_path)
                 
-                # Handle both new structured format and old format
-                if isinstance(data, dict) and 'faculty' in data:
-                    # New structured format
-                    faculty_data = data.get('faculty', [])
-                    university = data.get('university_name', 'Unknown')
-                    department = data.get('department_name', 'Unknown')
-                    scrape_type = data.get('scrape_type', 'unknown')
-                    total_count = data.get('total_count', len(faculty_data))
-                else:
-                    # Old format (raw faculty list)
+                if record_spans is None:
+                    # Unrecognized layout - fall back to loading the whole file
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
                     faculty_data = data if isinstance(data, list) else [data]
-                    university = 'Unknown'
-                    department = 'Unknown'
-                    scrape_type = 'legacy'
-                    total_count = len(faculty_data)
+                    return JSONResponse({
+                        "success": True,
+                        "filename": filename,
+                        "university": 'Unknown',
+                        "department": 'Unknown',
+                        "scrape_type": 'legacy',
+                        "count": len(faculty_data),
+                        "data": faculty_data[offset:offset + limit if limit else None],
+                        "timestamp": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    })
                 
-                return JSONResponse({
+                entry = await asyncio.to_thread(results_index.get_entry, file_path)
+                total_records = len(record_spans.spans)
+                spans = record_spans.spans[offset:offset + limit if limit else None]
+                next_offset = offset + len(spans)
+                
+                header = {
                     "success": True,
                     "filename": filename,
-                    "university": university,
-                    "department": department,
-                    "scrape_type": scrape_type,
-                    "count": total_count,
-                    "data": faculty_data,
-                    "timestamp": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
-                })
+                    "university": entry["university"],
+                    "department": entry["department"],
+                    "scrape_type": entry["scrape_type"],
+                    "count": entry["count"],
+                    "total_records": total_records,
+                    "offset": offset,
+                    "limit": limit,
+                    "next_offset": next_offset if next_offset < total_records else None,
+                    "timestamp": datetime.fromtimestamp(entry["mtime"]).isoformat()
+                }
+                
+                return StreamingResponse(
+                    stream_records_json(file_path, header, spans),
+                    media_type="application/json"
+                )
             
             elif request.method == "DELETE":
                 # DELETE: Remove the file
                 file_path.unlink()
+                results_index.remove(file_path)
                 logger.info(f"Deleted scrape results file: {filename}")
                 
                 return JSONResponse({
@@ -469,7 +513,8 @@ def create_app() -> FastAPI:
                 stats = await writer.get_scraping_statistics("University of Arizona")
                 return JSONResponse({
                     "success": True,
-                    "stats": stats
+                    "stats": stats,
+                    "database_pool": get_pool_metrics()
                 })
         except Exception as e:
             return JSONResponse({
@@ -836,10 +881,9 @@ def create_app() -> FastAPI:
                 "message": f"Failed to prepare command: {str(e)}"
             })
     
-    @app.post("/api/full-pipeline")
-    async def run_full_pipeline(request: Request):
+    async def run_full_pipeline(params: Dict[str, Any], progress: JobProgress) -> Dict[str, Any]:
         """
-        Execute the complete academic data pipeline:
+        Execute the complete academic data pipeline in a background worker:
         1. Adaptive scraping (university + department)
         2. Data enhancement (profiles, research interests, etc.)
         3. Link enrichment (metadata extraction)
@@ -847,16 +891,9 @@ def create_app() -> FastAPI:
         5. Return comprehensive results
         """
         try:
-            data = await request.json()
-            university_name = data.get('university_name')
-            department_name = data.get('department_name')
-            max_faculty = int(data.get('max_faculty', 50))
-            
-            if not university_name or not department_name:
-                return JSONResponse({
-                    "success": False,
-                    "message": "University name and department name are required"
-                })
+            university_name = params['university_name']
+            department_name = params['department_name']
+            max_faculty = params['max_faculty']
             
             logger.info(f"Starting full pipeline for {university_name} - {department_name}")
             
@@ -875,6 +912,7 @@ def create_app() -> FastAPI:
             # Stage 1: Adaptive Scraping
             logger.info("Stage 1: Adaptive Scraping")
             pipeline_results["stages"]["1_scraping"] = {"status": "running", "started_at": datetime.now().isoformat()}
+            await progress.update(5, stage="scraping", stages=pipeline_results["stages"])
             
             from lynnapse.core.adaptive_faculty_crawler import AdaptiveFacultyCrawler
             
@@ -883,15 +921,16 @@ def create_app() -> FastAPI:
                 scrape_result = await crawler.scrape_university_faculty(
                     university_name=university_name,
                     department_filter=department_name,
-                    max_faculty=max_faculty if max_faculty > 0 else None
+                    max_faculty=max_faculty if max_faculty > 0 else None,
+                    progress_callback=progress.callback("scraping", 5, 30)
                 )
                 
                 if not scrape_result.get('success') or not scrape_result.get('faculty'):
-                    return JSONResponse({
+                    return {
                         "success": False,
                         "message": f"Initial scraping failed: {scrape_result.get('message', 'Unknown error')}",
                         "pipeline_results": pipeline_results
-                    })
+                    }
                 
                 faculty_data = scrape_result['faculty']
                 pipeline_results["stages"]["1_scraping"] = {
@@ -909,6 +948,7 @@ def create_app() -> FastAPI:
             # Stage 2: Data Enhancement
             logger.info("Stage 2: Data Enhancement")
             pipeline_results["stages"]["2_enhancement"] = {"status": "running", "started_at": datetime.now().isoformat()}
+            await progress.update(30, stage="enhancement", items_scraped=len(faculty_data), stages=pipeline_results["stages"])
             
             from lynnapse.core.profile_enricher import ProfileEnricher
             from lynnapse.core.website_validator import validate_faculty_websites
@@ -919,7 +959,9 @@ def create_app() -> FastAPI:
                 
                 # Then enhance profiles
                 enricher = ProfileEnricher(max_concurrent=3, timeout=30)
-                enhanced_faculty, enhancement_stats = await enricher.enrich_sparse_faculty_data(validated_faculty)
+                enhanced_faculty, enhancement_stats = await enricher.enrich_sparse_faculty_data(
+                    validated_faculty, progress_callback=progress.callback("enhancement", 30, 50)
+                )
                 
                 pipeline_results["stages"]["2_enhancement"] = {
                     "status": "completed",
@@ -944,6 +986,7 @@ def create_app() -> FastAPI:
             # Stage 3: Comprehensive Link Enrichment (following the correct flow)
             logger.info("Stage 3: Comprehensive Link Enrichment")
             pipeline_results["stages"]["3_link_enrichment"] = {"status": "running", "started_at": datetime.now().isoformat()}
+            await progress.update(50, stage="link_enrichment", items_scraped=len(faculty_data), stages=pipeline_results["stages"])
             
             try:
                 # Complete flow: directory finding/scraping → link checking → smart link replacement → deep enrichment
@@ -958,6 +1001,7 @@ def create_app() -> FastAPI:
                 # First, apply smart link replacement for faculty with missing links
                 logger.info("Applying smart link replacement for missing faculty links...")
                 replacer = SmartLinkReplacer(timeout=30, max_concurrent=3)
+                report_smart_links = progress.callback("link_enrichment", 50, 70)
                 
                 faculty_with_smart_links = []
                 for faculty in enhanced_faculty:
@@ -992,6 +1036,11 @@ def create_app() -> FastAPI:
                         enhanced_faculty_member['social_media_profiles'] = social_profiles
                     
                     faculty_with_smart_links.append(enhanced_faculty_member)
+                    await report_smart_links("faculty_enriched", {
+                        "completed": len(faculty_with_smart_links),
+                        "total": len(enhanced_faculty),
+                        "faculty": enhanced_faculty_member
+                    })
                 
                 # Now apply deep comprehensive enrichment to all accessible links
                 logger.info("Starting deep comprehensive data extraction...")
@@ -999,7 +1048,8 @@ def create_app() -> FastAPI:
                 async with LinkEnrichmentEngine(timeout=60, max_concurrent=3) as enrichment_engine:
                     # Deep comprehensive enrichment - extract huge amounts of data
                     enriched_links_faculty, enrichment_report = await enrichment_engine.enrich_faculty_links(
-                        faculty_with_smart_links
+                        faculty_with_smart_links,
+                        progress_callback=progress.callback("link_enrichment", 70, 85)
                     )
                 
                 # Merge enriched links back with all faculty
@@ -1046,6 +1096,7 @@ def create_app() -> FastAPI:
             # Stage 4: Convert to New ID-based Architecture
             logger.info("Stage 4: Converting to ID-based Architecture")
             pipeline_results["stages"]["4_conversion"] = {"status": "running", "started_at": datetime.now().isoformat()}
+            await progress.update(85, stage="conversion", items_scraped=len(faculty_data), stages=pipeline_results["stages"])
             
             from lynnapse.core.data_manager import AcademicDataManager
             
@@ -1140,17 +1191,73 @@ def create_app() -> FastAPI:
             }
             
             # Use custom JSON serializer to handle datetime objects
-            response_json = json.dumps(response_data, default=json_serializer, ensure_ascii=False, indent=2)
-            return JSONResponse(json.loads(response_json))
+            response_json = json.dumps(response_data, default=json_serializer, ensure_ascii=False)
+            return json.loads(response_json)
             
         except Exception as e:
             logger.error(f"Full pipeline failed: {e}")
             import traceback
             logger.error(f"Full traceback: {traceback.format_exc()}")
-            return JSONResponse({
+            return {
                 "success": False,
                 "message": f"Full pipeline failed: {str(e)}",
                 "error": str(e)
-            })
+            }
+    
+    @app.post("/api/full-pipeline", status_code=202)
+    async def start_full_pipeline(request: Request):
+        """Queue a full pipeline job and return its id."""
+        data = await request.json()
+        return await submit_job("full_pipeline", data, default_max_faculty=50)
+    
+    job_manager.register("adaptive_scrape", run_adaptive_scrape)
+    job_manager.register("full_pipeline", run_full_pipeline)
+    
+    @app.get("/api/jobs")
+    async def list_jobs(limit: int = Query(50, ge=1, le=500)):
+        """List recent background jobs, newest first (without results)."""
+        return JSONResponse({
+            "jobs": [job.to_dict(include_result=False) for job in job_manager.list_jobs(limit)],
+            "stats": job_manager.get_stats()
+        })
+    
+    @app.get("/api/jobs/{job_id}")
+    async def get_job(job_id: str):
+        """Get a background job's status, progress and (once finished) result."""
+        job = job_manager.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return JSONResponse(json.loads(json.dumps(job.to_dict(), default=json_serializer, ensure_ascii=False)))
+    
+    @app.get("/api/jobs/{job_id}/events")
+    async def stream_job(job_id: str, request: Request):
+        """
+        Stream a background job's progress as server-sent events.
+        
+        Emits stage transitions, per-department faculty counts, enrichment
+        progress and partial faculty records, ending with a ``done`` event
+        carrying the result. Reconnecting clients resume from ``Last-Event-ID``.
+        """
+        job = job_manager.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        try:
+            last_event_id = int(request.headers.get("last-event-id", 0))
+        except ValueError:
+            last_event_id = 0
+        return StreamingResponse(
+            stream_job_events(job, last_event_id),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
+    @app.delete("/api/jobs/{job_id}")
+    async def cancel_job(job_id: str):
+        """Cancel a queued or running background job."""
+        job = job_manager.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        cancelled = await job_manager.cancel(job_id)
+        return JSONResponse({"success": cancelled, "job_id": job_id, "status": job.status.value})
     
-    return app 
\ No newline at end of file
+    return app 
@@ -0,0 +1,500 @@
+"""
+Background Jobs
+
+Adaptive scrapes and full pipeline runs take minutes, far longer than an
+HTTP request should stay open. They are submitted as jobs instead: the
+endpoint validates the request, queues the job and returns its id straight
+away, and a fixed number of worker tasks run queued jobs one at a time each,
+independently of request handling.
+
+Job status, progress and results are kept in memory for the status
+endpoints, and mirrored to the ``scrape_jobs`` collection through
+``MongoWriter.create_scrape_job`` / ``update_scrape_job`` when MongoDB is
+reachable. Tracking failures are logged and never fail the job.
+
+Each job also keeps a numbered log of progress events (stage transitions,
+per-department counts, enrichment progress, partial faculty records) which
+``stream_job_events`` serves as server-sent events, so the browser can
+render results while the job is still running.
+"""
+
+import asyncio
+import json
+import logging
+import traceback
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+from lynnapse.core.progress import ProgressCallback
+from lynnapse.models.scrape_job import JobStatus, ScrapeJob
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+# Progress events kept per job; a late subscriber misses the oldest ones
+MAX_JOB_EVENTS = 2000
+
+# Last event of every job
+DONE_EVENT = "done"
+
+# Fields of a faculty record included in streamed partial results
+FACULTY_PREVIEW_FIELDS = ("name", "title", "email", "department", "profile_url", "personal_website",
+                          "google_scholar_url", "lab_name", "lab_website", "research_interests")
+
+# Fields mirrored to the scrape_jobs collection on each tracking update
+TRACKED_FIELDS = ("status", "progress", "started_at", "completed_at", "duration_seconds",
+                  "items_scraped", "error_message", "error_traceback", "output_files", "metadata")
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is full."""
+
+
+def faculty_preview(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact copy of a faculty record for streaming to the browser."""
+    return {name: record[name] for name in FACULTY_PREVIEW_FIELDS if record.get(name)}
+
+
+@dataclass
+class Job:
+    """A submitted job and its in-memory state."""
+    job_id: str
+    job_type: str
+    params: Dict[str, Any]
+    record: ScrapeJob
+    result: Optional[Dict[str, Any]] = None
+    mongo_id: Optional[str] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+    events: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=MAX_JOB_EVENTS), repr=False)
+    last_event_id: int = 0
+    _event_signal: Optional[asyncio.Event] = field(default=None, repr=False)
+
+    @property
+    def status(self) -> JobStatus:
+        return JobStatus(self.record.status)
+
+    @property
+    def finished(self) -> bool:
+        return self.record.status in FINISHED_STATUSES
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """Status document returned by the job endpoints."""
+        record = self.record
+        data = {
+            "job_id": self.job_id,
+            "job_type": self.job_type,
+            "status": JobStatus(record.status).value,
+            "progress": round(record.progress, 1),
+            "stage": record.metadata.get("stage"),
+            "params": self.params,
+            "items_scraped": record.items_scraped,
+            "created_at": record.created_at.isoformat(),
+            "started_at": record.started_at.isoformat() if record.started_at else None,
+            "completed_at": record.completed_at.isoformat() if record.completed_at else None,
+            "duration_seconds": record.duration_seconds,
+            "output_files": record.output_files,
+            "error": record.error_message
+        }
+        if include_result:
+            data["result"] = self.result
+        return data
+
+    def add_event(self, event: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a progress event and wake up streaming subscribers."""
+        self.last_event_id += 1
+        entry = {"id": self.last_event_id, "event": event, "data": data}
+        self.events.append(entry)
+        if self._event_signal is not None:
+            self._event_signal.set()
+            self._event_signal = None
+        return entry
+
+    def events_after(self, event_id: int) -> List[Dict[str, Any]]:
+        """Events with an id greater than ``event_id``, oldest first."""
+        return [entry for entry in self.events if entry["id"] > event_id]
+
+    async def wait_for_events(self, event_id: int, timeout: float) -> List[Dict[str, Any]]:
+        """
+        Wait until there are events after ``event_id``.
+
+        Returns:
+            The new events, or an empty list if ``timeout`` passed first
+        """
+        if self.last_event_id <= event_id:
+            if self._event_signal is None:
+                self._event_signal = asyncio.Event()
+            try:
+                await asyncio.wait_for(self._event_signal.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        return self.events_after(event_id)
+
+
+class JobProgress:
+    """Progress reporter handed to a running job."""
+
+    def __init__(self, manager: "JobManager", job: Job):
+        self.manager = manager
+        self.job = job
+
+    async def update(self, progress: Optional[float] = None, stage: Optional[str] = None,
+                     items_scraped: Optional[int] = None, **metadata: Any) -> None:
+        """
+        Record job progress.
+
+        Args:
+            progress: Percentage complete (0-100)
+            stage: Short description of the current stage
+            items_scraped: Records produced so far
+            **metadata: Extra fields stored in the job metadata
+        """
+        record = self.job.record
+        stage_changed = stage is not None and stage != record.metadata.get("stage")
+        if progress is not None:
+            record.progress = max(0.0, min(100.0, float(progress)))
+        if stage is not None:
+            record.metadata["stage"] = stage
+        if items_scraped is not None:
+            record.items_scraped = items_scraped
+        record.metadata.update(metadata)
+        record.updated_at = datetime.utcnow()
+
+        if stage_changed:
+            self.emit("stage", stage=stage, **metadata)
+        self.emit("progress", progress=round(record.progress, 1), stage=record.metadata.get("stage"),
+                  items_scraped=record.items_scraped)
+
+        # Stage transitions are worth a database write; plain counters are not
+        if stage_changed:
+            await self.manager._track_update(self.job)
+
+    def callback(self, stage: str, start: float, end: float) -> ProgressCallback:
+        """
+        Progress callback for a crawler or enricher running as one job stage.
+
+        Department and enrichment events are republished on the job's event
+        stream, with extracted records trimmed by ``faculty_preview``, and
+        mapped onto the ``start``-``end`` slice of the job's progress.
+
+        Args:
+            stage: Job stage the callback reports for
+            start: Job progress when the stage starts
+            end: Job progress when the stage is done
+        """
+        async def on_progress(event: str, data: Dict[str, Any]) -> None:
+            if event == "departments":
+                self.emit("departments", stage=stage, departments=data["departments"])
+            elif event == "department":
+                self.emit("department", stage=stage, department=data["department"],
+                          faculty_count=data["faculty_count"], total_faculty=data["total_faculty"])
+                self.emit("faculty", stage=stage, department=data["department"],
+                          records=[faculty_preview(record) for record in data["faculty"]])
+                fraction = data["departments_done"] / max(data["departments_total"], 1)
+                await self.update(start + (end - start) * fraction, items_scraped=data["total_faculty"])
+            elif event == "faculty_enriched":
+                self.emit("enrichment", stage=stage, completed=data["completed"], total=data["total"])
+                if data.get("faculty"):
+                    self.emit("faculty", stage=stage, records=[faculty_preview(data["faculty"])])
+                await self.update(start + (end - start) * data["completed"] / max(data["total"], 1))
+
+        return on_progress
+
+    def emit(self, event: str, **data: Any) -> None:
+        """
+        Publish a progress event to subscribers of the job's event stream.
+
+        Args:
+            event: Event name, e.g. ``"department"`` or ``"faculty"``
+            **data: JSON-serializable payload
+        """
+        self.job.add_event(event, data)
+
+
+JobHandler = Callable[[Dict[str, Any], JobProgress], Awaitable[Dict[str, Any]]]
+
+
+class JobManager:
+    """Bounded queue of background jobs served by a fixed pool of workers."""
+
+    def __init__(self, workers: int = 2, max_queued: int = 50,
+                 track_in_mongo: bool = True, max_finished: int = 200,
+                 tracking_timeout: float = 5.0):
+        """
+        Initialize the manager.
+
+        Args:
+            workers: Jobs run concurrently
+            max_queued: Jobs waiting to run before submissions are refused
+            track_in_mongo: Mirror job state to the scrape_jobs collection
+            max_finished: Finished jobs kept in memory for status queries
+            tracking_timeout: Seconds to wait for a MongoDB tracking write,
+                connecting included
+        """
+        self.workers = max(1, workers)
+        self.max_queued = max(1, max_queued)
+        self.track_in_mongo = track_in_mongo
+        self.max_finished = max_finished
+        self.tracking_timeout = tracking_timeout
+
+        self.handlers: Dict[str, JobHandler] = {}
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self.stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "completed": 0,
+            "failed": 0,
+            "cancelled": 0
+        }
+
+    def register(self, job_type: str, handler: JobHandler) -> None:
+        """Register the coroutine that runs jobs of ``job_type``."""
+        self.handlers[job_type] = handler
+
+    async def start(self) -> None:
+        """Start the worker tasks (idempotent)."""
+        if self._worker_tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"lynnapse-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} background job workers")
+
+    async def stop(self) -> None:
+        """Cancel running jobs and stop the workers."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._queue = None
+
+    async def submit(self, job_type: str, params: Dict[str, Any],
+                     university_name: str = "", program_name: Optional[str] = None) -> Job:
+        """
+        Queue a job.
+
+        Args:
+            job_type: Registered job type
+            params: Parameters passed to the handler
+            university_name: University, for the scrape_jobs record
+            program_name: Department/program, for the scrape_jobs record
+
+        Returns:
+            The queued job
+
+        Raises:
+            ValueError: If no handler is registered for ``job_type``
+            QueueFullError: If ``max_queued`` jobs are already waiting
+        """
+        if job_type not in self.handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+        await self.start()
+
+        job_id = uuid.uuid4().hex
+        record = ScrapeJob(
+            job_name=f"{job_type}:{university_name}:{program_name or ''}",
+            job_type=job_type,
+            target_url=params.get("target_url", ""),
+            university_name=university_name,
+            program_name=program_name,
+            scraper_config=params,
+            scheduled_at=datetime.utcnow(),
+            metadata={"job_id": job_id, "stage": "queued"}
+        )
+        job = Job(job_id=job_id, job_type=job_type, params=params, record=record)
+
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.stats["rejected"] += 1
+            raise QueueFullError(f"Job queue is full ({self.max_queued} waiting)")
+
+        self.jobs[job_id] = job
+        job.add_event("status", {"status": JobStatus.PENDING.value})
+        self.stats["submitted"] += 1
+        self._prune_finished()
+        logger.info(f"Queued {job_type} job {job_id}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id."""
+        return self.jobs.get(job_id)
+
+    def list_jobs(self, limit: int = 50) -> List[Job]:
+        """List the most recently submitted jobs, newest first."""
+        return list(reversed(self.jobs.values()))[:limit]
+
+    async def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Returns:
+            False if the job is unknown or already finished
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+
+        if job.task is not None:
+            job.task.cancel()
+        else:
+            # Still queued: the worker skips it when it comes up
+            self._finish(job, JobStatus.CANCELLED)
+            await self._track_update(job)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue and outcome counters."""
+        running = sum(1 for job in self.jobs.values() if job.status == JobStatus.RUNNING)
+        return {
+            **self.stats,
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "running": running
+        }
+
+    async def _worker(self) -> None:
+        """Run queued jobs until cancelled."""
+        while True:
+            job = await self._queue.get()
+            try:
+                if not job.finished:
+                    # Run the job as its own task so cancel() can stop just this job;
+                    # asyncio.wait leaves it running if the worker itself is cancelled
+                    job.task = asyncio.create_task(self._run(job))
+                    try:
+                        await asyncio.wait({job.task})
+                    except asyncio.CancelledError:
+                        job.task.cancel()
+                        await asyncio.gather(job.task, return_exceptions=True)
+                        raise
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        """Run one job and record its outcome."""
+        job.record.mark_started()
+        job.record.metadata["stage"] = "starting"
+        job.add_event("status", {"status": JobStatus.RUNNING.value})
+
+        try:
+            # Inside the try so a cancel during the tracking write still finishes the job
+            await self._track_create(job)
+            result = await self.handlers[job.job_type](job.params, JobProgress(self, job))
+            job.result = result
+            output_file = (result or {}).get("output_file")
+            if output_file:
+                job.record.output_files.append(output_file)
+
+            if result is not None and result.get("success") is False:
+                self._finish(job, JobStatus.FAILED, error=result.get("message"))
+            else:
+                job.record.progress = 100.0
+                self._finish(job, JobStatus.COMPLETED)
+        except asyncio.CancelledError:
+            self._finish(job, JobStatus.CANCELLED)
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {e}")
+            job.result = {"success": False, "message": f"{job.job_type} failed: {e}", "error": str(e)}
+            self._finish(job, JobStatus.FAILED, error=str(e), error_traceback=traceback.format_exc())
+
+        await self._track_update(job)
+
+    def _finish(self, job: Job, status: JobStatus, error: Optional[str] = None,
+                error_traceback: Optional[str] = None) -> None:
+        """Move a job to a finished status."""
+        record = job.record
+        if status == JobStatus.COMPLETED:
+            record.mark_completed()
+            self.stats["completed"] += 1
+        elif status == JobStatus.FAILED:
+            record.mark_failed(error or "Unknown error", error_traceback)
+            self.stats["failed"] += 1
+        else:
+            record.status = JobStatus.CANCELLED
+            record.completed_at = datetime.utcnow()
+            record.updated_at = record.completed_at
+            self.stats["cancelled"] += 1
+        record.metadata["stage"] = status.value
+        job.add_event(DONE_EVENT, {
+            "status": status.value,
+            "error": record.error_message,
+            "result": job.result
+        })
+
+    def _prune_finished(self) -> None:
+        """Forget the oldest finished jobs beyond ``max_finished``."""
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
+
+    async def _track_create(self, job: Job) -> None:
+        """Create the scrape_jobs record for a job (best effort)."""
+        if not self.track_in_mongo:
+            return
+        from lynnapse.core.mongo_writer import MongoWriter
+
+        async def create() -> str:
+            async with MongoWriter() as writer:
+                return await writer.create_scrape_job(job.record.dict(exclude={"id"}))
+
+        try:
+            # The timeout covers connecting too, which waits out server selection
+            job.mongo_id = await asyncio.wait_for(create(), timeout=self.tracking_timeout)
+        except Exception as e:
+            logger.warning(f"Could not record job {job.job_id} in scrape_jobs: {e}")
+
+    async def _track_update(self, job: Job) -> None:
+        """Mirror a job's state to its scrape_jobs record (best effort)."""
+        if not self.track_in_mongo or job.mongo_id is None:
+            return
+        from lynnapse.core.mongo_writer import MongoWriter
+        updates = {name: getattr(job.record, name) for name in TRACKED_FIELDS}
+
+        async def update() -> None:
+            async with MongoWriter() as writer:
+                await writer.update_scrape_job(job.mongo_id, updates)
+
+        try:
+            await asyncio.wait_for(update(), timeout=self.tracking_timeout)
+        except Exception as e:
+            logger.warning(f"Could not update job {job.job_id} in scrape_jobs: {e}")
+
+
+def format_sse(entry: Dict[str, Any]) -> str:
+    """Encode a job event in the ``text/event-stream`` wire format."""
+    data = json.dumps(entry["data"], default=str, ensure_ascii=False)
+    return f"id: {entry['id']}\nevent: {entry['event']}\ndata: {data}\n\n"
+
+
+async def stream_job_events(job: Job, last_event_id: int = 0,
+                            heartbeat: float = 15.0) -> AsyncIterator[str]:
+    """
+    Yield a job's progress events as server-sent events.
+
+    Events already recorded after ``last_event_id`` are replayed first, so a
+    client reconnecting with ``Last-Event-ID`` picks up where it left off.
+    The stream ends after the job's ``done`` event.
+
+    Args:
+        job: Job to stream
+        last_event_id: Id of the last event the client has seen
+        heartbeat: Seconds between keep-alive comments while idle
+    """
+    while True:
+        entries = await job.wait_for_events(last_event_id, heartbeat)
+        if not entries:
+            yield ": keep-alive\n\n"
+            continue
+        for entry in entries:
+            last_event_id = entry["id"]
+            yield format_sse(entry)
+            if entry["event"] == DONE_EVENT:
+                return
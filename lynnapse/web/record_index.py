@@ -0,0 +1,214 @@
+"""
+Record Index
+
+Byte-offset index over the faculty records inside a result JSON file, so
+records can be served by offset/limit straight from a memory-mapped file
+instead of parsing the whole document.
+
+``find_record_spans`` walks the file once with C-level regex scans (it
+jumps from one structural character or string to the next) and returns
+the byte span of every element in the records array. ``RecordReader``
+then slices records out of an ``mmap`` of the file.
+"""
+
+import json
+import mmap
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Structural characters that change nesting or separate values
+_STRUCTURAL = re.compile(rb'[\[\]{},"]')
+# A complete JSON string, including escaped characters
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_WHITESPACE = b" \t\r\n"
+_OPEN_OBJECT, _OPEN_ARRAY, _COMMA = ord("{"), ord("["), ord(",")
+
+# Keys longer than this are never part of a record path
+_MAX_KEY_LENGTH = 256
+
+
+class RecordSpans(NamedTuple):
+    """Location of a records array and of each record inside it."""
+    array_span: Tuple[int, int]
+    spans: List[Tuple[int, int]]
+
+
+def _trim(buf: Any, start: int, end: int) -> Tuple[int, int]:
+    """Shrink a byte span to exclude surrounding whitespace."""
+    while start < end and buf[start] in _WHITESPACE:
+        start += 1
+    while end > start and buf[end - 1] in _WHITESPACE:
+        end -= 1
+    return start, end
+
+
+def detect_record_path(buf: Any) -> Tuple[str, ...]:
+    """
+    Guess where the records live in a result file.
+
+    Structured results keep them under ``faculty``; old results are a
+    bare list.
+    """
+    start, _ = _trim(buf, 0, len(buf))
+    if start < len(buf) and buf[start] == _OPEN_ARRAY:
+        return ()
+    return ("faculty",)
+
+
+def find_record_spans(buf: Any, record_path: Sequence[str] = ("faculty",)) -> Optional[RecordSpans]:
+    """
+    Find the byte spans of the records in a JSON document.
+
+    Args:
+        buf: bytes or mmap of the JSON document
+        record_path: Object keys leading to the records array; an empty
+            path means the document itself is the array
+
+    Returns:
+        RecordSpans, or None when the array is not present
+    """
+    path = tuple(key.encode() for key in record_path)
+    containers: List[int] = []
+    keys: List[Optional[bytes]] = []
+    target_depth = None
+    array_start = element_start = 0
+    spans: List[Tuple[int, int]] = []
+    pos = 0
+
+    while True:
+        match = _STRUCTURAL.search(buf, pos)
+        if match is None:
+            return None
+
+        i = match.start()
+        char = buf[i]
+
+        if char == 0x22:  # "
+            string = _STRING.match(buf, i)
+            if string is None:
+                raise ValueError(f"Unterminated string at byte {i}")
+            end = string.end()
+            if containers and containers[-1] == _OPEN_OBJECT and end - i <= _MAX_KEY_LENGTH:
+                # The last string seen in an object before a value opens is its key
+                keys[-1] = bytes(buf[i + 1:end - 1])
+            pos = end
+            continue
+
+        if char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+            if (target_depth is None and char == _OPEN_ARRAY
+                    and len(containers) == len(path)
+                    and all(c == _OPEN_OBJECT for c in containers)
+                    and tuple(keys) == path):
+                array_start = i
+                target_depth = len(containers) + 1
+                element_start = i + 1
+            containers.append(char)
+            keys.append(None)
+
+        elif char == _COMMA:
+            if len(containers) == target_depth:
+                spans.append(_trim(buf, element_start, i))
+                element_start = i + 1
+
+        else:  # closing bracket or brace
+            if len(containers) == target_depth:
+                last = _trim(buf, element_start, i)
+                if last[0] < last[1]:
+                    spans.append(last)
+                return RecordSpans((array_start, i + 1), spans)
+            containers.pop()
+            keys.pop()
+
+        pos = i + 1
+
+
+class RecordReader:
+    """Read records from a result file through a memory map."""
+
+    def __init__(self, file_path: Union[str, Path]):
+        """
+        Initialize the reader.
+
+        Args:
+            file_path: Result JSON file
+        """
+        self.file_path = Path(file_path)
+        self._file = None
+        self.buf: Any = b""
+
+    def __enter__(self):
+        self._file = open(self.file_path, 'rb')
+        if self.file_path.stat().st_size:
+            self.buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if isinstance(self.buf, mmap.mmap):
+            self.buf.close()
+        self.buf = b""
+        self._file.close()
+        return False
+
+    def find_spans(self, record_path: Optional[Sequence[str]] = None) -> Optional[RecordSpans]:
+        """Scan the file for record spans (see ``find_record_spans``)."""
+        if record_path is None:
+            record_path = detect_record_path(self.buf)
+        return find_record_spans(self.buf, record_path)
+
+    def iter_raw(self, spans: Sequence[Tuple[int, int]]) -> Iterator[bytes]:
+        """Yield the raw JSON bytes of each record span."""
+        for start, end in spans:
+            yield self.buf[start:end]
+
+    def iter_records(self, spans: Sequence[Tuple[int, int]]) -> Iterator[Any]:
+        """Yield each record span parsed as JSON."""
+        for raw in self.iter_raw(spans):
+            yield json.loads(raw)
+
+    def load_without_records(self, record_spans: RecordSpans) -> Any:
+        """Parse the document with its records array replaced by ``[]``."""
+        start, end = record_spans.array_span
+        return json.loads(b"".join((self.buf[:start], b"[]", self.buf[end:])))
+
+
+def stream_records_json(file_path: Union[str, Path],
+                        header: Dict[str, Any],
+                        spans: Sequence[Tuple[int, int]],
+                        data_key: str = "data",
+                        chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    Stream a JSON object whose ``data_key`` array holds the given records.
+
+    Records are copied from the memory-mapped file as raw bytes, so only
+    one chunk is held in memory at a time.
+
+    Args:
+        file_path: Result JSON file
+        header: Other fields of the response object
+        spans: Byte spans of the records to include
+        data_key: Key of the records array in the response
+        chunk_size: Approximate bytes per yielded chunk
+
+    Yields:
+        Chunks of the encoded JSON response
+    """
+    prefix = json.dumps(header, ensure_ascii=False, default=str)[:-1]
+    separator = ", " if header else ""
+    yield f"{prefix}{separator}{json.dumps(data_key)}: [".encode("utf-8")
+
+    with RecordReader(file_path) as reader:
+        chunk: List[bytes] = []
+        chunk_bytes = 0
+        for n, raw in enumerate(reader.iter_raw(spans)):
+            if n:
+                chunk.append(b", ")
+            chunk.append(raw)
+            chunk_bytes += len(raw)
+            if chunk_bytes >= chunk_size:
+                yield b"".join(chunk)
+                chunk, chunk_bytes = [], 0
+        if chunk:
+            yield b"".join(chunk)
+
+    yield b"]}"
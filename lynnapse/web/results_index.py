@@ -0,0 +1,468 @@
+"""
+Results Index
+
+Manifest of saved scrape result files, so the results page can list,
+filter and paginate results without opening every JSON file.
+
+Each result file gets one row (university, department, scrape type,
+faculty count, a short preview and the file mtime/size) in a small SQLite
+database kept next to the results. Rows are written when a result is
+saved and refreshed incrementally: a folder is only rescanned when its
+mtime changes (or after ``full_scan_interval``), and only files whose
+mtime or size differ from the manifest are parsed again.
+
+The same database caches each file's record byte offsets (see
+``record_index``), which lets large results be summarized and served
+page by page without loading them whole.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+from .record_index import RecordReader, RecordSpans, detect_record_path
+
+logger = logging.getLogger(__name__)
+
+RESULT_FOLDERS = ("adaptive", "legacy")
+PREVIEW_SIZE = 3
+
+
+def summarize_result(data: Any) -> Dict[str, Any]:
+    """
+    Extract the manifest fields from a result file's contents.
+
+    Handles both the structured format (a dict with a ``faculty`` list)
+    and the old format (a raw faculty list).
+
+    Args:
+        data: Parsed result file
+
+    Returns:
+        Dictionary with university, department, scrape_type, count and preview
+    """
+    if isinstance(data, dict) and 'faculty' in data:
+        # New structured format
+        faculty = data.get('faculty', [])
+        return {
+            'university': data.get('university_name', 'Unknown'),
+            'department': data.get('department_name', 'Unknown'),
+            'scrape_type': data.get('scrape_type', 'unknown'),
+            'count': data.get('total_count', len(faculty)),
+            'preview': faculty[:PREVIEW_SIZE] if isinstance(faculty, list) else []
+        }
+
+    if isinstance(data, list):
+        # Old format (raw faculty list)
+        first_faculty = data[0] if data and isinstance(data[0], dict) else {}
+        return {
+            'university': first_faculty.get('university', 'Unknown'),
+            'department': first_faculty.get('department', 'Unknown'),
+            'scrape_type': 'legacy',
+            'count': len(data),
+            'preview': data[:PREVIEW_SIZE]
+        }
+
+    # Fallback for other formats
+    return {
+        'university': 'Unknown',
+        'department': 'Unknown',
+        'scrape_type': 'unknown',
+        'count': 0,
+        'preview': []
+    }
+
+
+class ResultsIndex:
+    """SQLite manifest of scrape result files."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS results (
+            path TEXT PRIMARY KEY,
+            folder TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            university TEXT,
+            department TEXT,
+            scrape_type TEXT,
+            count INTEGER NOT NULL DEFAULT 0,
+            preview TEXT NOT NULL DEFAULT '[]',
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_results_mtime ON results (mtime);
+        CREATE INDEX IF NOT EXISTS idx_results_filename ON results (filename);
+        CREATE TABLE IF NOT EXISTS record_offsets (
+            path TEXT PRIMARY KEY,
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL,
+            array_start INTEGER NOT NULL,
+            array_end INTEGER NOT NULL,
+            spans BLOB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS folders (
+            folder TEXT PRIMARY KEY,
+            mtime REAL NOT NULL,
+            scanned_at REAL NOT NULL
+        );
+    """
+
+    def __init__(self, results_dir: str = "scrape_results",
+                 folders: Tuple[str, ...] = RESULT_FOLDERS,
+                 index_path: Optional[str] = None,
+                 full_scan_interval: float = 300.0):
+        """
+        Initialize the results index.
+
+        Args:
+            results_dir: Root results directory
+            folders: Subfolders holding result files
+            index_path: SQLite manifest file (defaults to
+                ``<results_dir>/.results_index.db``)
+            full_scan_interval: Seconds after which folders are rescanned
+                even if their mtime is unchanged (catches in-place edits)
+        """
+        self.results_dir = Path(results_dir)
+        self.folders = tuple(folders)
+        self.full_scan_interval = full_scan_interval
+        self.results_dir.mkdir(parents=True, exist_ok=True)
+
+        self.index_path = Path(index_path) if index_path else self.results_dir / ".results_index.db"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.index_path), timeout=30.0, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+        # Statistics tracking
+        self.stats = {
+            "folder_scans": 0,
+            "files_parsed": 0,
+            "files_scanned": 0,
+            "files_removed": 0
+        }
+
+    def close(self) -> None:
+        """Close the manifest database."""
+        with self._lock:
+            self._conn.close()
+
+    def _key(self, file_path: Path) -> str:
+        """Manifest key for a result file (``folder/filename``)."""
+        return f"{file_path.parent.name}/{file_path.name}"
+
+    def find_file(self, filename: str) -> Optional[Path]:
+        """
+        Locate a result file by name in the indexed folders.
+
+        Args:
+            filename: Bare file name
+
+        Returns:
+            Path to the file, or None when it does not exist
+        """
+        for folder in self.folders:
+            potential_path = self.results_dir / folder / filename
+            if potential_path.exists():
+                return potential_path
+        return None
+
+    def record(self, file_path: Union[str, Path], data: Any = None) -> None:
+        """
+        Add or update the manifest row for a result file.
+
+        Call this right after saving a result so the manifest never has to
+        reparse it.
+
+        Args:
+            file_path: Path of the saved file
+            data: Contents that were written (parsed from disk when omitted)
+        """
+        file_path = Path(file_path)
+        stat = file_path.stat()
+
+        if data is None:
+            summary = self._summarize_file(file_path, stat)
+        else:
+            summary = summarize_result(data)
+
+        with self._lock, self._conn:
+            self._write_row(file_path, summary, stat.st_mtime, stat.st_size)
+
+    def _summarize_file(self, file_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+        """
+        Summarize a result file from disk.
+
+        Only the preview records and the metadata around the records array
+        are parsed; the record offsets found on the way are cached.
+        """
+        self.stats["files_parsed"] += 1
+
+        with RecordReader(file_path) as reader:
+            record_path = detect_record_path(reader.buf)
+            record_spans = reader.find_spans(record_path)
+            if record_spans is None:
+                return summarize_result(json.loads(reader.buf))
+
+            self._store_spans(file_path, stat, record_spans)
+            preview = list(reader.iter_records(record_spans.spans[:PREVIEW_SIZE]))
+
+            if not record_path:
+                summary = summarize_result(preview)
+                summary['count'] = len(record_spans.spans)
+                return summary
+
+            head = reader.load_without_records(record_spans)
+            head['faculty'] = preview
+            head.setdefault('total_count', len(record_spans.spans))
+            return summarize_result(head)
+
+    def get_entry(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Get the manifest row for a result file, indexing it if it is stale.
+
+        Args:
+            file_path: Result file path
+
+        Returns:
+            Dictionary with university, department, scrape_type, count,
+            mtime and size
+        """
+        file_path = Path(file_path)
+        stat = file_path.stat()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM results WHERE path = ?", (self._key(file_path),)
+            ).fetchone()
+
+        if row is None or (row["mtime"], row["size"]) != (stat.st_mtime, stat.st_size):
+            self.record(file_path)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT * FROM results WHERE path = ?", (self._key(file_path),)
+                ).fetchone()
+
+        return dict(row)
+
+    def get_record_spans(self, file_path: Union[str, Path]) -> Optional[RecordSpans]:
+        """
+        Get the byte spans of a result file's records.
+
+        Cached offsets are reused while the file's mtime and size are
+        unchanged; otherwise the file is rescanned.
+
+        Args:
+            file_path: Result file path
+
+        Returns:
+            RecordSpans, or None when the file has no records array
+        """
+        file_path = Path(file_path)
+        stat = file_path.stat()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM record_offsets WHERE path = ?", (self._key(file_path),)
+            ).fetchone()
+
+        if row is not None and (row["mtime"], row["size"]) == (stat.st_mtime, stat.st_size):
+            flat = array('Q')
+            flat.frombytes(row["spans"])
+            spans = list(zip(flat[0::2], flat[1::2]))
+            return RecordSpans((row["array_start"], row["array_end"]), spans)
+
+        with RecordReader(file_path) as reader:
+            record_spans = reader.find_spans()
+
+        self.stats["files_scanned"] += 1
+        if record_spans is not None:
+            self._store_spans(file_path, stat, record_spans)
+        return record_spans
+
+    def _store_spans(self, file_path: Path, stat: os.stat_result, record_spans: RecordSpans) -> None:
+        """Cache the record offsets of a file."""
+        flat = array('Q', (offset for span in record_spans.spans for offset in span))
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO record_offsets (path, mtime, size, array_start, array_end, spans)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    self._key(file_path),
+                    stat.st_mtime,
+                    stat.st_size,
+                    record_spans.array_span[0],
+                    record_spans.array_span[1],
+                    flat.tobytes()
+                )
+            )
+
+    def remove(self, file_path: Union[str, Path]) -> None:
+        """Drop a result file from the manifest."""
+        with self._lock, self._conn:
+            key = self._key(Path(file_path))
+            self._conn.execute("DELETE FROM results WHERE path = ?", (key,))
+            self._conn.execute("DELETE FROM record_offsets WHERE path = ?", (key,))
+
+    def _write_row(self, file_path: Path, summary: Dict[str, Any], mtime: float, size: int) -> None:
+        """Insert or replace a manifest row inside the caller's transaction."""
+        self._conn.execute(
+            """
+            INSERT OR REPLACE INTO results (
+                path, folder, filename, university, department, scrape_type,
+                count, preview, mtime, size
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                self._key(file_path),
+                file_path.parent.name,
+                file_path.name,
+                summary['university'],
+                summary['department'],
+                summary['scrape_type'],
+                summary['count'],
+                json.dumps(summary['preview'], default=str),
+                mtime,
+                size
+            )
+        )
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring the manifest up to date with the result folders.
+
+        Folders whose mtime is unchanged since the last scan are skipped
+        until ``full_scan_interval`` has passed.
+
+        Args:
+            force: Rescan every folder regardless of mtimes
+        """
+        now = time.time()
+
+        for folder in self.folders:
+            folder_path = self.results_dir / folder
+            if not folder_path.is_dir():
+                continue
+
+            folder_mtime = folder_path.stat().st_mtime
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT mtime, scanned_at FROM folders WHERE folder = ?", (folder,)
+                ).fetchone()
+
+            if (not force and row and row["mtime"] == folder_mtime
+                    and now - row["scanned_at"] < self.full_scan_interval):
+                continue
+
+            self._scan_folder(folder, folder_path)
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO folders (folder, mtime, scanned_at) VALUES (?, ?, ?)",
+                    (folder, folder_mtime, now)
+                )
+
+    def _scan_folder(self, folder: str, folder_path: Path) -> None:
+        """Reparse new or modified files in a folder and drop deleted ones."""
+        self.stats["folder_scans"] += 1
+
+        with self._lock:
+            known = {
+                row["filename"]: (row["mtime"], row["size"])
+                for row in self._conn.execute(
+                    "SELECT filename, mtime, size FROM results WHERE folder = ?", (folder,)
+                )
+            }
+
+        seen = set()
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+
+                stat = entry.stat()
+                if known.get(entry.name) == (stat.st_mtime, stat.st_size):
+                    continue
+
+                try:
+                    self.record(Path(entry.path))
+                except Exception as e:
+                    logger.warning(f"Failed to index {entry.path}: {e}")
+
+        removed = [(f"{folder}/{name}",) for name in known if name not in seen]
+        if removed:
+            with self._lock, self._conn:
+                self._conn.executemany("DELETE FROM results WHERE path = ?", removed)
+                self._conn.executemany("DELETE FROM record_offsets WHERE path = ?", removed)
+            self.stats["files_removed"] += len(removed)
+
+    def list_results(self,
+                     university: Optional[str] = None,
+                     department: Optional[str] = None,
+                     scrape_type: Optional[str] = None,
+                     limit: int = 10,
+                     offset: int = 0) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        List indexed results, newest first.
+
+        Args:
+            university: Case-insensitive substring filter on university
+            department: Case-insensitive substring filter on department
+            scrape_type: Exact scrape type filter
+            limit: Page size
+            offset: Rows to skip
+
+        Returns:
+            Tuple of (page of results, total matching results)
+        """
+        self.refresh()
+
+        clauses = []
+        params: List[Any] = []
+        for column, value in (("university", university), ("department", department)):
+            if value:
+                clauses.append(f"lower({column}) LIKE ? ESCAPE '\\'")
+                escaped = value.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+        if scrape_type:
+            clauses.append("scrape_type = ?")
+            params.append(scrape_type)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM results {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT * FROM results {where} ORDER BY mtime DESC LIMIT ? OFFSET ?",
+                params + [limit, offset]
+            ).fetchall()
+
+        results = [
+            {
+                "filename": row["filename"],
+                "full_path": str(self.results_dir / row["path"]),
+                "timestamp": datetime.fromtimestamp(row["mtime"]).isoformat(),
+                "university": row["university"],
+                "department": row["department"],
+                "scrape_type": row["scrape_type"],
+                "count": row["count"],
+                "preview": json.loads(row["preview"])
+            }
+            for row in rows
+        ]
+        return results, total
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics."""
+        with self._lock:
+            indexed = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {**self.stats, "indexed_files": indexed}
+
@@ -0,0 +1,114 @@
+"""
+Performance benchmarks for university autocomplete.
+
+Builds the search index over a synthetic list the size of the full
+College Scorecard institution list, replays keystroke-by-keystroke and
+misspelled queries against it, and compares lookups with the linear
+substring scan autocomplete used before.
+"""
+
+import random
+import statistics
+import time
+
+import pytest
+
+from lynnapse.config.search_index import SearchIndex
+
+
+def build_university_names(count: int, seed: int = 11):
+    """Distinct institution-like names, e.g. 'University of North Lakewood'."""
+    rng = random.Random(seed)
+    places = ["Lake", "River", "North", "South", "East", "West", "Mount", "Saint", "Green", "Fair", "Spring",
+              "Oak", "Cedar", "Pine", "Maple", "Clear", "Rock", "Grand", "Port", "New"]
+    suffixes = ["wood", "field", "ville", "ton", "burg", "view", "dale", "haven", "ford", "brook", "ridge", "mont"]
+    templates = ["University of {}", "{} State University", "{} College", "{} Community College",
+                 "{} Institute of Technology", "{} School of Nursing", "College of {}", "{} Technical College"]
+
+    names = set()
+    while len(names) < count:
+        place = f"{rng.choice(places)}{rng.choice(suffixes)}"
+        if rng.random() < 0.5:
+            place = f"{rng.choice(places)} {place}"
+        names.add(rng.choice(templates).format(place))
+    return sorted(names, key=lambda _: rng.random())
+
+
+def keystroke_queries(names, count: int, seed: int = 5):
+    """Every prefix a user types on the way to a name, plus a typo per name."""
+    rng = random.Random(seed)
+    queries = []
+    for name in rng.sample(names, count):
+        lowered = name.lower()
+        queries += [lowered[:end] for end in range(2, len(lowered) + 1)]
+        i = rng.randrange(len(lowered) - 1)
+        queries.append(lowered[:i] + lowered[i + 1] + lowered[i] + lowered[i + 2:])
+    return queries
+
+
+def linear_scan(names, query: str, limit: int = 10):
+    """The previous autocomplete: substring match against every name."""
+    query = query.lower()
+    return [i for i, name in enumerate(names) if query in name.lower()][:limit]
+
+
+@pytest.fixture(scope="module")
+def university_names():
+    return build_university_names(7000)
+
+
+class TestAutocompleteBenchmarks:
+    """Index build, snapshot and lookup latency."""
+
+    def test_lookup_latency(self, university_names):
+        """Each keystroke is answered well under a millisecond."""
+        index = SearchIndex([[name] for name in university_names])
+        queries = keystroke_queries(university_names, 200)
+
+        timings = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query)
+            timings.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for query in queries:
+            linear_scan(university_names, query)
+        scan_mean = (time.perf_counter() - start) / len(queries)
+
+        mean = statistics.mean(timings)
+        p99 = sorted(timings)[int(len(timings) * 0.99)]
+        print(f"\n{len(queries)} queries: index mean {mean * 1000:.3f} ms, p99 {p99 * 1000:.3f} ms; "
+              f"linear scan mean {scan_mean * 1000:.3f} ms")
+
+        assert mean < 0.001
+        assert mean * 5 < scan_mean
+
+    def test_full_names_rank_first(self, university_names):
+        """Typing a whole name, or most of it, finds that name."""
+        index = SearchIndex([[name] for name in university_names])
+        for doc in range(0, len(university_names), 97):
+            name = university_names[doc]
+            assert index.search(name)[0] == doc
+            assert doc in index.search(name[:len(name) * 3 // 4], limit=50)
+
+    def test_snapshot_size_and_load(self, university_names):
+        """Loading the snapshot skips tokenizing, and it is smaller than the names themselves."""
+        documents = [[name] for name in university_names]
+
+        start = time.perf_counter()
+        index = SearchIndex(documents)
+        build_seconds = time.perf_counter() - start
+
+        snapshot = index.to_snapshot()
+        start = time.perf_counter()
+        restored = SearchIndex.from_snapshot(snapshot)
+        load_seconds = time.perf_counter() - start
+
+        names_size = sum(len(name) for name in university_names)
+        print(f"\nbuild {build_seconds * 1000:.1f} ms, snapshot load {load_seconds * 1000:.1f} ms, "
+              f"snapshot {len(snapshot) / 1024:.0f} KiB for {names_size / 1024:.0f} KiB of names")
+
+        assert load_seconds < build_seconds
+        assert len(snapshot) < names_size
+        assert restored.search("university of north") == index.search("university of north")
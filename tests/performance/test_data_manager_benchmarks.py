@@ -0,0 +1,305 @@
+"""
+Performance benchmarks for AcademicDataManager exports.
+
+Builds a synthetic dataset directly in the manager's entity maps, so the
+benchmarks measure export cost only.
+"""
+
+import json
+import random
+import time
+import tracemalloc
+
+import pytest
+
+from lynnapse.core.columnar_export import export_columnar_tables
+from lynnapse.core.data_manager import AcademicDataManager
+from lynnapse.core.duplicate_detection import DuplicateCandidate, DuplicateDetector
+from lynnapse.models.entities import FacultyEntity, LabEntity, UniversityEntity, DepartmentEntity
+from lynnapse.models.associations import FacultyLabAssociation, FacultyDepartmentAssociation
+from lynnapse.models.enrichments import ProfileEnrichment
+
+
+# Association maps an aggregated view may read from
+ASSOCIATION_MAPS = ("faculty_dept_associations", "faculty_lab_associations",
+                    "faculty_enrichment_associations")
+
+
+class CountingDict(dict):
+    """Dict that counts the records read, by key lookup or by iteration."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.reads += 1
+        return super().get(key, default)
+
+    def __iter__(self):
+        self.reads += len(self)
+        return super().__iter__()
+
+    def values(self):
+        self.reads += len(self)
+        return super().values()
+
+    def items(self):
+        self.reads += len(self)
+        return super().items()
+
+
+def build_synthetic_manager(faculty_count: int, universities: int = 20,
+                            departments_per_university: int = 10,
+                            faculty_per_lab: int = 5) -> AcademicDataManager:
+    """Populate a manager with ``faculty_count`` faculty and related rows."""
+    manager = AcademicDataManager()
+
+    for u in range(universities):
+        university = UniversityEntity(
+            id=f"univ_{u}", name=f"University {u}",
+            normalized_name=f"university {u}", domain=f"u{u}.edu",
+            website_url=f"https://u{u}.edu"
+        )
+        manager.university_entities[university.id] = university
+        for d in range(departments_per_university):
+            department = DepartmentEntity(
+                id=f"dept_{u}_{d}", name=f"Department {d}",
+                normalized_name=f"department {d}",
+                university_id=university.id
+            )
+            manager.department_entities[department.id] = department
+
+    for i in range(faculty_count):
+        u = i % universities
+        dept_id = f"dept_{u}_{i % departments_per_university}"
+        faculty = FacultyEntity(
+            id=f"fac_{i}", name=f"Faculty Member {i}",
+            normalized_name=f"faculty member {i}", email=f"faculty{i}@u{u}.edu",
+            primary_university_id=f"univ_{u}", primary_department_id=dept_id,
+            profile_url=f"https://u{u}.edu/people/{i}", source_scrape_id="bench"
+        )
+        manager.faculty_entities[faculty.id] = faculty
+
+        association = FacultyDepartmentAssociation(
+            faculty_id=faculty.id, department_id=dept_id, created_by_scrape_id="bench"
+        )
+        manager.faculty_dept_associations[association.id] = association
+
+        profile = ProfileEnrichment(
+            id=f"prof_{i}",
+            profile_url=faculty.profile_url, extraction_method="bench",
+            full_biography=f"Biography of faculty member {i}."
+        )
+        manager.profile_enrichments[profile.id] = profile
+
+        if i % faculty_per_lab == 0:
+            lab = LabEntity(
+                id=f"lab_{i}", name=f"Lab {i}", normalized_name=f"lab {i}",
+                university_id=f"univ_{u}", primary_department_id=dept_id,
+                source_scrape_id="bench"
+            )
+            manager.lab_entities[lab.id] = lab
+        lab_association = FacultyLabAssociation(
+            faculty_id=faculty.id, lab_id=f"lab_{i - i % faculty_per_lab}",
+            created_by_scrape_id="bench"
+        )
+        manager.faculty_lab_associations[lab_association.id] = lab_association
+
+    manager.rebuild_indexes()
+    return manager
+
+
+def build_legacy_records(count: int, universities: int = 20) -> list:
+    """Legacy faculty records; every tenth record repeats an earlier person."""
+    records = []
+    for i in range(count):
+        person = i - i % 10 if i % 10 == 9 else i
+        u = person % universities
+        records.append({
+            "name": f"Dr. Faculty Member {person}",
+            "university": f"University {u}",
+            "department": f"Department {person % 10}",
+            "email": f"faculty{person}@u{u}.edu",
+            "profile_url": f"https://u{u}.edu/people/{person}",
+            "lab_name": f"Lab {person // 5}",
+            "research_interests": ["memory", f"topic {person % 50}"],
+        })
+    return records
+
+
+def build_people(count: int, variant_rate: float = 0.02, seed: int = 7):
+    """
+    Random people with realistic name collisions, plus "J. Smith"-style
+    variants of some of them.
+
+    Returns:
+        Tuple of (candidates, set of variant id pairs)
+    """
+    rng = random.Random(seed)
+    syllables = ["an", "ber", "cor", "dal", "el", "fin", "gar", "hol", "is", "jen",
+                 "kar", "lo", "mor", "nel", "or", "per", "ros", "son", "tan", "vin",
+                 "al", "bri", "chen", "dra", "ek", "fa", "gu", "ha", "ito", "ju",
+                 "ki", "lin", "ma", "no", "os", "pa", "qui", "ri", "su", "wen"]
+    first_names = [rng.choice(syllables).title() + rng.choice(syllables) for _ in range(1000)]
+    last_names = [rng.choice(syllables).title() + rng.choice(syllables) + rng.choice(syllables)
+                  for _ in range(20000)]
+    topics = [f"topic{t}" for t in range(500)]
+
+    candidates = []
+    variants = set()
+    for i in range(count):
+        first, last = rng.choice(first_names), rng.choice(last_names)
+        interests = rng.sample(topics, 3)
+        candidates.append(DuplicateCandidate(f"fac_{i}", f"{first} {last}", research_interests=interests))
+        if rng.random() < variant_rate:
+            variant_id = f"var_{i}"
+            candidates.append(DuplicateCandidate(variant_id, f"{first[0]}. {last}", research_interests=interests))
+            variants.add(frozenset((f"fac_{i}", variant_id)))
+    return candidates, variants
+
+
+def dump_tables_json(manager: AcademicDataManager, output_dir) -> None:
+    """The JSON baseline: dump each table as an indented list of dicts."""
+    tables = {
+        "faculty": manager.faculty_entities,
+        "labs": manager.lab_entities,
+        "faculty_department_associations": manager.faculty_dept_associations,
+        "faculty_lab_associations": manager.faculty_lab_associations,
+        "profile_enrichments": manager.profile_enrichments,
+    }
+    for name, entities in tables.items():
+        with open(output_dir / f"{name}.json", 'w') as f:
+            json.dump([entity.dict() for entity in entities.values()], f, indent=2, default=str)
+
+
+def measure(func, *args):
+    """Run ``func`` and return (seconds, peak Python heap in MB)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def directory_size_mb(path) -> float:
+    return sum(f.stat().st_size for f in path.iterdir() if f.is_file()) / 1024 / 1024
+
+
+class TestExportBenchmarks:
+    """Columnar export versus the JSON export."""
+
+    def test_columnar_vs_json_export_50k_faculty(self, tmp_path):
+        """Parquet export beats the JSON dump of the same tables at 50k faculty."""
+        pytest.importorskip("pyarrow")
+        manager = build_synthetic_manager(50_000)
+
+        json_dir = tmp_path / "json"
+        json_dir.mkdir()
+        parquet_dir = tmp_path / "parquet"
+
+        json_time, json_peak = measure(dump_tables_json, manager, json_dir)
+        parquet_time, parquet_peak = measure(export_columnar_tables, manager, str(parquet_dir))
+
+        print(f"\n50k faculty JSON tables: {json_time:.2f}s, peak {json_peak:.1f} MB, "
+              f"{directory_size_mb(json_dir):.1f} MB on disk")
+        print(f"50k faculty Parquet:     {parquet_time:.2f}s, peak {parquet_peak:.1f} MB, "
+              f"{directory_size_mb(parquet_dir):.1f} MB on disk")
+
+        assert parquet_time < json_time
+        assert parquet_peak < json_peak
+        assert directory_size_mb(parquet_dir) < directory_size_mb(json_dir)
+
+    def test_columnar_vs_aggregated_views(self, tmp_path):
+        """Columnar export against the JSON aggregated views on a small dataset."""
+        pytest.importorskip("pyarrow")
+        manager = build_synthetic_manager(2_000)
+
+        views_time, views_peak = measure(manager.export_aggregated_views, str(tmp_path / "views"))
+        arrow_time, arrow_peak = measure(
+            manager.export_aggregated_views, str(tmp_path / "arrow"), "arrow"
+        )
+
+        print(f"\n2k faculty JSON views: {views_time:.2f}s, peak {views_peak:.1f} MB")
+        print(f"2k faculty Arrow IPC:  {arrow_time:.2f}s, peak {arrow_peak:.1f} MB")
+
+        assert arrow_time < views_time
+
+    def test_aggregated_views_scale_linearly(self):
+        """Association records read per view stay flat as the dataset grows."""
+        reads_per_view = {}
+        for size in (2_000, 16_000):
+            manager = build_synthetic_manager(size)
+            counters = [CountingDict(getattr(manager, name)) for name in ASSOCIATION_MAPS]
+            for name, counter in zip(ASSOCIATION_MAPS, counters):
+                setattr(manager, name, counter)
+
+            start = time.perf_counter()
+            views = [manager.get_faculty_aggregated_view(fid) for fid in manager.faculty_entities]
+            views += [manager.get_lab_aggregated_view(lid) for lid in manager.lab_entities]
+            elapsed = time.perf_counter() - start
+
+            reads = sum(counter.reads for counter in counters)
+            reads_per_view[size] = reads / len(views)
+            print(f"\n{size} faculty: {len(views)} views in {elapsed:.2f}s, "
+                  f"{reads_per_view[size]:.2f} association reads per view")
+
+        # Scanning every association per view would read ~8x more at 16k
+        assert reads_per_view[16_000] <= reads_per_view[2_000] * 1.1
+
+
+class TestDuplicateDetectionBenchmarks:
+    """Blocked duplicate detection scaling."""
+
+    def test_duplicate_detection_scales_near_linearly(self):
+        """Detection cost grows near-linearly and finds the injected variants."""
+        timings = {}
+        for size in (12_500, 50_000):
+            candidates, variants = build_people(size)
+            detector = DuplicateDetector()
+
+            start = time.perf_counter()
+            pairs = detector.find_duplicates(candidates)
+            timings[size] = time.perf_counter() - start
+
+            found = {frozenset((pair.id_a, pair.id_b)) for pair in pairs}
+            recall = len(variants & found) / len(variants)
+            stats = detector.get_stats()
+            print(f"\n{len(candidates)} faculty: {timings[size]:.2f}s, "
+                  f"{stats['candidate_pairs']} candidate pairs, {len(pairs)} flagged, "
+                  f"variant recall {recall:.2%}")
+
+            assert recall > 0.95
+            # All-pairs comparison would be ~n^2 / 2
+            assert stats['candidate_pairs'] < len(candidates) * 50
+
+        # 4x the entities; comparing all pairs would be ~16x slower
+        assert timings[50_000] < timings[12_500] * 8
+
+
+class TestIngestBenchmarks:
+    """Legacy ingestion scaling."""
+
+    def test_ingest_scales_linearly(self):
+        """Per-record ingest cost stays flat as the dataset grows."""
+        per_record = {}
+        for size in (2_000, 8_000, 32_000):
+            records = build_legacy_records(size)
+            manager = AcademicDataManager()
+
+            start = time.perf_counter()
+            report = manager.ingest_legacy_faculty_data(records, "bench")
+            elapsed = time.perf_counter() - start
+
+            assert report['faculty_merged'] == size // 10
+            per_record[size] = elapsed / size
+            print(f"\ningest {size} records: {elapsed:.2f}s ({per_record[size] * 1e6:.0f} us/record)")
+
+        # A quadratic scan would make the largest run ~16x slower per record
+        assert per_record[32_000] < per_record[2_000] * 3
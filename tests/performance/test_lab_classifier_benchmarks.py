@@ -0,0 +1,147 @@
+"""
+Performance benchmarks for LabNameClassifier scoring and loading.
+
+Compares per-block ``predict`` calls with batched, memoized scoring on
+synthetic faculty-page text blocks, and checks that constructing a
+crawler does not pay for loading scikit-learn.
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from lynnapse.core.lab_classifier import LabNameClassifier, create_sample_training_data
+
+
+def build_text_blocks(count: int, distinct: int, seed: int = 7):
+    """Page-like text blocks: ``distinct`` unique texts repeated up to ``count``."""
+    rng = random.Random(seed)
+    subjects = ["Neuroscience", "Robotics", "Genomics", "Climate", "Vision", "Language", "Materials"]
+    lab_words = ["Laboratory", "Research Center", "Research Group", "Lab", "Institute"]
+    filler = ["office hours are on Tuesdays", "students register online", "the department offers courses",
+              "publications are listed below", "contact the main office"]
+
+    unique = []
+    for i in range(distinct):
+        if i % 3 == 0:
+            unique.append(f"{rng.choice(subjects)} {rng.choice(lab_words)} {i}")
+        else:
+            unique.append(f"Professor {i} notes that {rng.choice(filler)} and {rng.choice(filler)}")
+    return [unique[i % distinct] for i in range(count)]
+
+
+@pytest.fixture(scope="module")
+def trained_classifier(tmp_path_factory):
+    classifier = LabNameClassifier(model_path=str(tmp_path_factory.mktemp("models") / "lab.pkl"))
+    classifier.model.early_stopping = False
+    sentences, labels = create_sample_training_data()
+    classifier.train(sentences, labels, verbose=False)
+    return classifier
+
+
+class TestLabClassifierBenchmarks:
+    """Throughput of batched vs per-block classifier scoring."""
+
+    def test_batch_scoring_throughput(self, trained_classifier):
+        """One matrix pass per page beats one transform + forward per block."""
+        blocks = build_text_blocks(2000, distinct=2000)
+
+        trained_classifier.clear_cache()
+        start = time.perf_counter()
+        looped = [trained_classifier.predict(text) for text in blocks]
+        loop_seconds = time.perf_counter() - start
+
+        trained_classifier.clear_cache()
+        start = time.perf_counter()
+        batched = trained_classifier.predict_batch(blocks)
+        batch_seconds = time.perf_counter() - start
+
+        print(f"\nper-block: {len(blocks) / loop_seconds:,.0f} blocks/s, "
+              f"batched: {len(blocks) / batch_seconds:,.0f} blocks/s")
+
+        assert [label for label, _ in batched] == [label for label, _ in looped]
+        assert [conf for _, conf in batched] == pytest.approx([conf for _, conf in looped])
+        assert batch_seconds * 10 < loop_seconds
+
+    def test_memoized_department_batch(self, trained_classifier):
+        """Repeated boilerplate across a department is scored once."""
+        blocks = build_text_blocks(20000, distinct=500)
+        groups = [blocks[i:i + 20] for i in range(0, len(blocks), 20)]
+
+        trained_classifier.clear_cache()
+        scored_before = trained_classifier.stats["texts_scored"]
+        start = time.perf_counter()
+        cold = trained_classifier.find_lab_names(groups)
+        cold_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = trained_classifier.find_lab_names(groups)
+        warm_seconds = time.perf_counter() - start
+
+        print(f"\ncold: {len(blocks) / cold_seconds:,.0f} blocks/s, "
+              f"warm: {len(blocks) / warm_seconds:,.0f} blocks/s")
+
+        assert cold == warm
+        assert trained_classifier.stats["texts_scored"] - scored_before == 500
+        assert warm_seconds < cold_seconds
+
+    def test_hashed_mode_predict_throughput(self, trained_classifier, tmp_path):
+        """The incremental hashed model scores at least as fast as TF-IDF + MLP."""
+        hashed = LabNameClassifier(model_path=str(tmp_path / "hashed.pkl"), mode="hashed", cache_size=0)
+        sentences, labels = create_sample_training_data()
+        hashed.learn_from_examples(zip(sentences, labels))
+        blocks = build_text_blocks(20000, distinct=20000)
+
+        def best_seconds(classifier):
+            timings = []
+            for _ in range(3):
+                classifier.clear_cache()
+                start = time.perf_counter()
+                classifier.predict_batch(blocks)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        tfidf_seconds = best_seconds(trained_classifier)
+        hashed_seconds = best_seconds(hashed)
+
+        print(f"\ntfidf+mlp: {len(blocks) / tfidf_seconds:,.0f} blocks/s, "
+              f"hashed+sgd: {len(blocks) / hashed_seconds:,.0f} blocks/s")
+
+        assert hashed_seconds <= tfidf_seconds * 1.2  # allow for timing noise
+
+
+IMPORT_PROBE = """
+import json, sys, time
+from lynnapse.core.adaptive_faculty_crawler import AdaptiveFacultyCrawler
+start = time.perf_counter()
+AdaptiveFacultyCrawler(enable_lab_discovery=True)
+construct_seconds = time.perf_counter() - start
+print(json.dumps({
+    "construct_seconds": construct_seconds,
+    "heavy_modules": sorted(m for m in ("sklearn", "joblib", "scipy") if m in sys.modules),
+}))
+"""
+
+
+class TestClassifierLoadingBudget:
+    """Constructing a crawler must not load the classifier's model stack."""
+
+    def test_crawler_construction_skips_sklearn(self, tmp_path):
+        repo_root = Path(__file__).resolve().parents[2]
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE],
+            capture_output=True, text=True, timeout=120, cwd=str(tmp_path),
+            env={**os.environ, "PYTHONPATH": str(repo_root)}
+        )
+        assert result.returncode == 0, result.stderr
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+
+        print(f"\ncrawler construction: {probe['construct_seconds'] * 1000:.0f} ms")
+        assert probe["heavy_modules"] == []
+        assert probe["construct_seconds"] < 0.5
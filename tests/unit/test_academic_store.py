@@ -0,0 +1,168 @@
+"""
+Unit tests for the persistent AcademicDataManager store.
+"""
+
+import pytest
+
+from lynnapse.core.academic_store import AcademicStore
+from lynnapse.core.data_manager import AcademicDataManager
+from lynnapse.models.entities import UniversityEntity
+
+
+def make_faculty(name, university="Test University", **fields):
+    return {"name": name, "university": university, "department": "Psychology", **fields}
+
+
+def make_university(index):
+    return UniversityEntity(
+        id=f"univ_{index}", name=f"University {index}", normalized_name=f"university::{index}",
+        domain=f"u{index}.edu", website_url=f"https://u{index}.edu"
+    )
+
+
+class TestStoredEntityMap:
+    """Test the dictionary behaviour of stored tables."""
+
+    def test_mapping_round_trip(self, tmp_path):
+        """Values survive a reopen and keep insertion order after updates."""
+        store = AcademicStore(str(tmp_path / "academic.db"))
+        universities = store.table("university_entities")
+        for i in range(3):
+            universities[f"univ_{i}"] = make_university(i)
+
+        updated = make_university(0)
+        updated.name = "Renamed University"
+        universities["univ_0"] = updated
+        del universities["univ_1"]
+        store.close()
+
+        universities = AcademicStore(str(tmp_path / "academic.db")).table("university_entities")
+        assert list(universities) == ["univ_0", "univ_2"]
+        assert len(universities) == 2
+        assert "univ_1" not in universities
+        assert universities["univ_0"].name == "Renamed University"
+        assert [u.id for u in universities.values()] == ["univ_0", "univ_2"]
+        with pytest.raises(KeyError):
+            universities["univ_1"]
+
+    def test_iteration_is_paged_and_cache_bounded(self, tmp_path):
+        """Iteration reads every row in pages; the LRU cache stays bounded."""
+        store = AcademicStore(str(tmp_path / "academic.db"), cache_size=5, page_size=7)
+        universities = store.table("university_entities")
+        with store.transaction():
+            for i in range(50):
+                universities[f"univ_{i}"] = make_university(i)
+
+        assert [u.id for u in universities.values()] == [f"univ_{i}" for i in range(50)]
+        for i in range(50):
+            universities[f"univ_{i}"]
+        assert len(universities._cache) == 5
+
+    def test_transaction_rolls_back(self, tmp_path):
+        """A failed transaction leaves no rows behind."""
+        store = AcademicStore(str(tmp_path / "academic.db"))
+        universities = store.table("university_entities")
+
+        with pytest.raises(RuntimeError):
+            with store.transaction():
+                universities["univ_0"] = make_university(0)
+                raise RuntimeError("boom")
+
+        assert len(universities) == 0
+        assert "univ_0" not in universities
+
+
+class TestPersistentDataManager:
+    """Test AcademicDataManager backed by a store."""
+
+    def test_incremental_ingest_across_sessions(self, tmp_path):
+        """A later session deduplicates against stored entities and persists merges."""
+        db_path = str(tmp_path / "academic.db")
+        manager = AcademicDataManager(store=AcademicStore(db_path))
+        manager.ingest_legacy_faculty_data(
+            [make_faculty("Jane Smith", email="js@test.edu", lab_name="Memory Lab")], "session_1"
+        )
+        manager.store.close()
+
+        manager = AcademicDataManager(store=AcademicStore(db_path))
+        report = manager.ingest_legacy_faculty_data([
+            make_faculty("Jane Smith", university="Elsewhere", email="js@test.edu",
+                         phone="555-0100", lab_name="Memory Lab"),
+            make_faculty("John Doe", lab_name="Memory Lab"),
+        ], "session_2")
+        manager.store.close()
+
+        assert report['faculty_merged'] == 1
+        assert report['labs_created'] == 0
+
+        manager = AcademicDataManager(store=AcademicStore(db_path))
+        faculty_id = manager.find_faculty_by_email("js@test.edu")
+        assert manager.faculty_entities[faculty_id].phone == "555-0100"
+        assert len(manager.faculty_entities) == 2
+        assert set(manager.scrape_sessions) == {"session_1", "session_2"}
+
+        lab_id = next(iter(manager.lab_entities))
+        members = {a['faculty']['name'] for a in manager.get_lab_aggregated_view(lab_id).faculty_associations}
+        assert members == {"Jane Smith", "John Doe"}
+
+    def test_views_match_in_memory_manager(self, tmp_path):
+        """Stored and in-memory managers produce the same views."""
+        records = [
+            make_faculty("Jane Smith", lab_name="Smith Lab", bio="Memory researcher.",
+                         links=[{"url": "https://smith.test.edu"}]),
+            make_faculty("John Doe", lab_name="Smith Lab", research_interests=["vision"]),
+            make_faculty("Ann Lee"),
+        ]
+        memory = AcademicDataManager()
+        memory.ingest_legacy_faculty_data(records, "session_1")
+        stored = AcademicDataManager(store=AcademicStore(str(tmp_path / "academic.db")))
+        stored.ingest_legacy_faculty_data(records, "session_1")
+
+        def metrics(manager):
+            return sorted(
+                (manager.faculty_entities[fid].name,
+                 sorted(manager.get_faculty_aggregated_view(fid).computed_metrics.items()))
+                for fid in manager.faculty_entities
+            )
+
+        assert metrics(stored) == metrics(memory)
+        stored_map = stored.generate_relationship_map()
+        memory_map = memory.generate_relationship_map()
+        assert stored_map.total_faculty == memory_map.total_faculty
+        assert stored_map.faculty_lab_associations == memory_map.faculty_lab_associations
+
+    def test_interrupted_batched_ingest_resumes(self, tmp_path):
+        """Committed batches survive an interruption and the session records where to resume."""
+        db_path = str(tmp_path / "academic.db")
+        records = [make_faculty(f"Faculty {i}", email=f"f{i}@test.edu") for i in range(7)]
+
+        def interrupted_input():
+            yield from records[:5]
+            raise KeyboardInterrupt
+
+        manager = AcademicDataManager(store=AcademicStore(db_path))
+        with pytest.raises(KeyboardInterrupt):
+            manager.ingest_legacy_faculty_data(interrupted_input(), "session_1", batch_size=2,
+                                               source="scrape.jsonl")
+        manager.store.close()
+
+        manager = AcademicDataManager(store=AcademicStore(db_path))
+        # The unfinished batch (record 4) was never committed
+        assert len(manager.faculty_entities) == 4
+        assert manager.find_interrupted_session("scrape.jsonl") == ("session_1", 4)
+        assert manager.find_interrupted_session("other.jsonl") is None
+
+        session_id, offset = manager.find_interrupted_session("scrape.jsonl")
+        report = manager.ingest_legacy_faculty_data(records[offset:], session_id, batch_size=2,
+                                                    source="scrape.jsonl", start_offset=offset)
+        manager.store.close()
+
+        manager = AcademicDataManager(store=AcademicStore(db_path))
+        session = manager.scrape_sessions["session_1"]
+        assert report['faculty_created'] == 3
+        assert len(manager.faculty_entities) == 7
+        assert session['completed'] is True
+        assert session['records_committed'] == 7
+        assert len(session['faculty_ids']) == 7
+        assert session['report']['faculty_created'] == 7
+        assert manager.find_interrupted_session("scrape.jsonl") is None
@@ -0,0 +1,132 @@
+"""
+Unit tests for AcademicDataManager ingestion and lookups.
+"""
+
+from lynnapse.core.data_manager import AcademicDataManager
+
+
+def make_faculty(name, university="Test University", **fields):
+    return {"name": name, "university": university, "department": "Psychology", **fields}
+
+
+class TestDeduplicationIndexes:
+    """Test the indexed deduplication lookups."""
+
+    def test_same_email_merges(self):
+        """Records sharing name and email merge into one entity."""
+        manager = AcademicDataManager()
+        report = manager.ingest_legacy_faculty_data([
+            make_faculty("Dr. Jane Smith", email="jsmith@test.edu"),
+            make_faculty("Jane Smith", university="Other", email="jsmith@test.edu", phone="555-0100"),
+        ], "session_1")
+
+        assert report['faculty_created'] == 1
+        assert report['faculty_merged'] == 1
+        faculty_id = manager.find_faculty_by_email("JSMITH@test.edu")
+        assert manager.faculty_entities[faculty_id].phone == "555-0100"
+
+    def test_same_name_different_email_not_merged(self):
+        """Same-named faculty at different places stay separate."""
+        manager = AcademicDataManager()
+        report = manager.ingest_legacy_faculty_data([
+            make_faculty("Jane Smith", university="Alpha University", email="js@alpha.edu"),
+            make_faculty("Jane Smith", university="Beta University", email="js@beta.edu"),
+        ], "session_1")
+
+        assert report['faculty_created'] == 2
+        assert len(manager._faculty_by_name["jane::smith"]) == 2
+
+    def test_merge_fills_email_index(self):
+        """An email learned during a merge becomes searchable."""
+        manager = AcademicDataManager()
+        manager.ingest_legacy_faculty_data([make_faculty("Jane Smith", university="test")], "s1")
+        manager.ingest_legacy_faculty_data(
+            [make_faculty("Jane Smith", university="test", email="js@test.edu")], "s2"
+        )
+
+        assert len(manager.faculty_entities) == 1
+        assert manager.find_faculty_by_email("js@test.edu") in manager.faculty_entities
+
+    def test_labs_deduplicated_by_name_and_url(self):
+        """Labs are reused by normalized name or website."""
+        manager = AcademicDataManager()
+        report = manager.ingest_legacy_faculty_data([
+            make_faculty("Jane Smith", lab_name="Memory Lab"),
+            make_faculty("John Doe", lab_name="memory lab"),
+            make_faculty("Ann Lee", lab_website="https://lab.test.edu"),
+            make_faculty("Bob Ray", lab_website="https://lab.test.edu"),
+        ], "session_1")
+
+        assert report['labs_created'] == 2
+        assert len(manager.lab_entities) == 2
+
+    def test_rebuild_indexes(self):
+        """Indexes can be rebuilt after the entity maps are filled directly."""
+        source = AcademicDataManager()
+        source.ingest_legacy_faculty_data(
+            [make_faculty("Jane Smith", email="js@test.edu", lab_name="Memory Lab")], "s1"
+        )
+
+        manager = AcademicDataManager()
+        manager.faculty_entities = dict(source.faculty_entities)
+        manager.lab_entities = dict(source.lab_entities)
+        manager.rebuild_indexes()
+
+        faculty_id = manager.find_faculty_by_email("js@test.edu")
+        university_id = manager.faculty_entities[faculty_id].primary_university_id
+        assert manager.get_faculty_ids_by_university(university_id) == {faculty_id}
+        assert manager._lab_by_name == source._lab_by_name
+
+
+class TestAdjacencyMaps:
+    """Test that aggregated views use the maintained adjacency maps."""
+
+    def build_manager(self):
+        manager = AcademicDataManager()
+        manager.ingest_legacy_faculty_data([
+            make_faculty("Jane Smith", lab_name="Smith Lab", bio="Memory researcher.",
+                         links=[{"url": "https://smith.test.edu"}]),
+            make_faculty("John Doe", lab_name="Smith Lab", research_interests=["vision"]),
+            make_faculty("Ann Lee"),
+        ], "session_1")
+        return manager
+
+    def test_faculty_view_counts(self):
+        """Faculty views include exactly their own associations."""
+        manager = self.build_manager()
+        jane = next(f for f in manager.faculty_entities.values() if f.name == "Jane Smith")
+        ann = next(f for f in manager.faculty_entities.values() if f.name == "Ann Lee")
+
+        view = manager.get_faculty_aggregated_view(jane.id)
+        assert view.computed_metrics == {'total_enrichments': 2, 'lab_count': 1, 'department_count': 1}
+
+        view = manager.get_faculty_aggregated_view(ann.id)
+        assert view.computed_metrics == {'total_enrichments': 0, 'lab_count': 0, 'department_count': 1}
+
+    def test_lab_view_members(self):
+        """Lab views list every associated faculty member."""
+        manager = self.build_manager()
+        lab_id = next(iter(manager.lab_entities))
+
+        view = manager.get_lab_aggregated_view(lab_id)
+        members = {a['faculty']['name'] for a in view.faculty_associations}
+        assert members == {"Jane Smith", "John Doe"}
+        assert view.computed_metrics['pi_count'] == 1
+        assert manager.get_department_lab_ids(manager.lab_entities[lab_id].primary_department_id) == [lab_id]
+
+    def test_rebuild_matches_incremental(self):
+        """Rebuilt adjacency maps equal the incrementally maintained ones."""
+        manager = self.build_manager()
+        incremental = (
+            manager._dept_assocs_by_faculty, manager._lab_assocs_by_faculty,
+            manager._enrichment_assocs_by_faculty, manager._faculty_assocs_by_lab,
+            manager._lab_assocs_by_department
+        )
+
+        manager.rebuild_indexes()
+
+        assert incremental == (
+            manager._dept_assocs_by_faculty, manager._lab_assocs_by_faculty,
+            manager._enrichment_assocs_by_faculty, manager._faculty_assocs_by_lab,
+            manager._lab_assocs_by_department
+        )
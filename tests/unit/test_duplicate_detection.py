@@ -0,0 +1,91 @@
+"""
+Unit tests for blocked fuzzy duplicate detection.
+"""
+
+import numpy as np
+
+from lynnapse.core.data_manager import AcademicDataManager
+from lynnapse.core.duplicate_detection import DuplicateCandidate, DuplicateDetector, name_tokens
+
+
+def pair_ids(pairs):
+    return {frozenset((pair.id_a, pair.id_b)) for pair in pairs}
+
+
+class TestDuplicateDetector:
+    """Test blocking and scoring."""
+
+    def test_name_tokens(self):
+        """Titles are dropped and accents folded."""
+        assert name_tokens("Dr. José García, PhD") == ["jose", "garcia"]
+
+    def test_initial_variants_match(self):
+        """An initial matches the full first name; a different first name does not."""
+        detector = DuplicateDetector()
+        pairs = detector.find_duplicates([
+            DuplicateCandidate("a", "John Smith"),
+            DuplicateCandidate("b", "J. Smith"),
+            DuplicateCandidate("c", "Mary Smith"),
+            DuplicateCandidate("d", "Alice Jones"),
+        ])
+
+        assert pair_ids(pairs) == {frozenset(("a", "b"))}
+
+    def test_email_overrides_name(self):
+        """A shared email is a duplicate; different emails lower the score."""
+        detector = DuplicateDetector()
+        pairs = detector.find_duplicates([
+            DuplicateCandidate("a", "Robert Chen", email="rchen@test.edu"),
+            DuplicateCandidate("b", "Bob Chen", email="rchen@test.edu"),
+            DuplicateCandidate("c", "R. Chen", email="other@test.edu"),
+        ])
+
+        scores = {frozenset((p.id_a, p.id_b)): p.score for p in pairs}
+        assert scores[frozenset(("a", "b"))] == 1.0
+        assert scores.get(frozenset(("a", "c")), 0.0) < 1.0
+
+    def test_oversized_blocks_use_window(self):
+        """Blocks past max_block_size are compared by sliding window only."""
+        detector = DuplicateDetector(max_block_size=10, window=2, bands=1, num_perm=8)
+        candidates = [DuplicateCandidate(str(i), f"John{i} Smith") for i in range(50)]
+
+        pairs, _ = detector.candidate_pairs(candidates)
+
+        assert detector.stats['windowed_blocks'] >= 1
+        assert len(pairs) < 50 * 49 // 2
+        assert np.all(pairs[:, 0] < pairs[:, 1])
+
+    def test_minhash_estimates_jaccard(self):
+        """Signature agreement tracks Jaccard similarity."""
+        detector = DuplicateDetector(num_perm=256, bands=64)
+        a = [f"t{i}" for i in range(100)]
+        b = [f"t{i}" for i in range(50, 150)]
+
+        signatures = detector.minhash([a, b, []])
+
+        agreement = (signatures[0] == signatures[1]).mean()
+        assert abs(agreement - 1 / 3) < 0.1
+        assert np.all(signatures[2] == signatures[2][0])
+
+
+class TestRelationshipMapDuplicates:
+    """Test that the relationship map reports potential duplicates."""
+
+    def test_potential_duplicates_filled(self):
+        manager = AcademicDataManager()
+        manager.ingest_legacy_faculty_data([
+            {"name": "Dr. John Smith", "university": "Alpha University", "department": "Psychology",
+             "research_interests": ["memory", "sleep"]},
+            {"name": "J. Smith", "university": "Alpha University", "department": "Neuroscience",
+             "research_interests": ["memory", "sleep"]},
+            {"name": "Alice Jones", "university": "Alpha University", "department": "Psychology"},
+        ], "session_1")
+        ids = {faculty.name: faculty.id for faculty in manager.faculty_entities.values()}
+
+        relationship_map = manager.generate_relationship_map()
+
+        assert relationship_map.potential_duplicates == {
+            ids["Dr. John Smith"]: [ids["J. Smith"]],
+            ids["J. Smith"]: [ids["Dr. John Smith"]],
+        }
+        assert manager.generate_relationship_map(detect_duplicates=False).potential_duplicates == {}
@@ -0,0 +1,349 @@
+"""
+Unit tests for the background job queue behind the scrape endpoints.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from lynnapse.core.profile_enricher import ProfileEnricher
+from lynnapse.web.jobs import JobManager, QueueFullError, stream_job_events
+
+
+def make_manager(**kwargs):
+    return JobManager(track_in_mongo=False, **kwargs)
+
+
+async def wait_finished(manager, job_id, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not manager.get(job_id).finished:
+        assert asyncio.get_running_loop().time() < deadline, "job did not finish"
+        await asyncio.sleep(0.01)
+    return manager.get(job_id)
+
+
+class TestJobManager:
+    """Submission, bounded concurrency and outcomes."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_before_job_runs(self):
+        manager = make_manager()
+        release = asyncio.Event()
+
+        async def handler(params, progress):
+            await progress.update(40, stage="scraping", items_scraped=3)
+            await release.wait()
+            return {"success": True, "total_count": params["n"], "output_file": "out.json"}
+
+        manager.register("scrape", handler)
+        try:
+            job = await manager.submit("scrape", {"n": 7}, university_name="Test University")
+            assert job.status == "pending"
+
+            await asyncio.sleep(0.05)
+            status = manager.get(job.job_id).to_dict()
+            assert status["status"] == "running"
+            assert status["stage"] == "scraping"
+            assert status["progress"] == 40
+            assert status["items_scraped"] == 3
+
+            release.set()
+            job = await wait_finished(manager, job.job_id)
+            status = job.to_dict()
+            assert status["status"] == "completed"
+            assert status["progress"] == 100
+            assert status["result"]["total_count"] == 7
+            assert status["output_files"] == ["out.json"]
+        finally:
+            await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_bounds_concurrency(self):
+        manager = make_manager(workers=2)
+        running = 0
+        peak = 0
+
+        async def handler(params, progress):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return {"success": True}
+
+        manager.register("scrape", handler)
+        try:
+            jobs = [await manager.submit("scrape", {}) for _ in range(6)]
+            for job in jobs:
+                await wait_finished(manager, job.job_id)
+        finally:
+            await manager.stop()
+
+        assert peak == 2
+        assert manager.get_stats()["completed"] == 6
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded(self):
+        manager = make_manager()
+
+        async def unsuccessful(params, progress):
+            return {"success": False, "message": "No departments found"}
+
+        async def broken(params, progress):
+            raise RuntimeError("crawler crashed")
+
+        manager.register("unsuccessful", unsuccessful)
+        manager.register("broken", broken)
+        try:
+            first = await wait_finished(manager, (await manager.submit("unsuccessful", {})).job_id)
+            second = await wait_finished(manager, (await manager.submit("broken", {})).job_id)
+        finally:
+            await manager.stop()
+
+        assert first.to_dict()["status"] == "failed"
+        assert first.to_dict()["error"] == "No departments found"
+        assert second.to_dict()["error"] == "crawler crashed"
+        assert second.result["success"] is False
+        assert second.record.error_traceback
+
+    @pytest.mark.asyncio
+    async def test_cancel_queued_and_running_jobs(self):
+        manager = make_manager(workers=1)
+
+        async def handler(params, progress):
+            await asyncio.sleep(10)
+            return {"success": True}
+
+        manager.register("scrape", handler)
+        try:
+            running = await manager.submit("scrape", {})
+            queued = await manager.submit("scrape", {})
+            await asyncio.sleep(0.02)
+
+            assert await manager.cancel(queued.job_id)
+            assert await manager.cancel(running.job_id)
+            await wait_finished(manager, running.job_id)
+
+            assert queued.status == "cancelled"
+            assert running.status == "cancelled"
+            assert not await manager.cancel(running.job_id)
+        finally:
+            await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_tracking_write_finishes_job(self):
+        manager = make_manager()
+        tracking = asyncio.Event()
+
+        async def slow_track_create(job):
+            tracking.set()
+            await asyncio.sleep(10)
+
+        async def handler(params, progress):
+            return {"success": True}
+
+        manager._track_create = slow_track_create
+        manager.register("scrape", handler)
+        try:
+            job = await manager.submit("scrape", {})
+            await asyncio.wait_for(tracking.wait(), 1)
+            assert await manager.cancel(job.job_id)
+
+            job = await wait_finished(manager, job.job_id)
+            assert job.status == "cancelled"
+            assert job.events[-1]["event"] == "done"
+        finally:
+            await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_mongo_does_not_stall_job_start(self, monkeypatch):
+        from lynnapse.core.mongo_writer import MongoWriter
+
+        async def hanging_connect(self):
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(MongoWriter, "connect", hanging_connect)
+        manager = JobManager(track_in_mongo=True, tracking_timeout=0.05)
+
+        async def handler(params, progress):
+            return {"success": True}
+
+        manager.register("scrape", handler)
+        try:
+            job = await manager.submit("scrape", {})
+            job = await wait_finished(manager, job.job_id, timeout=1.0)
+            assert job.status == "completed"
+            assert job.mongo_id is None
+        finally:
+            await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_queue_is_bounded(self):
+        manager = make_manager(workers=1, max_queued=1)
+
+        async def handler(params, progress):
+            await asyncio.sleep(10)
+
+        manager.register("scrape", handler)
+        try:
+            with pytest.raises(ValueError):
+                await manager.submit("unknown", {})
+
+            await manager.submit("scrape", {})
+            await asyncio.sleep(0.02)  # first job leaves the queue for the worker
+            await manager.submit("scrape", {})
+            with pytest.raises(QueueFullError):
+                await manager.submit("scrape", {})
+            assert manager.get_stats()["rejected"] == 1
+        finally:
+            await manager.stop()
+
+
+def parse_sse(chunks):
+    """Split a text/event-stream body into (id, event, data) tuples."""
+    events = []
+    for block in "".join(chunks).split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestJobEvents:
+    """Progress events streamed while a job runs."""
+
+    @pytest.mark.asyncio
+    async def test_stream_reports_departments_and_partial_records(self):
+        manager = make_manager()
+        release = asyncio.Event()
+
+        async def handler(params, progress):
+            report = progress.callback("scraping", 0, 80)
+            await progress.update(0, stage="scraping")
+            await report("departments", {"departments": ["Psychology", "Neuroscience"]})
+            await report("department", {
+                "department": "Psychology", "faculty_count": 2, "total_faculty": 2,
+                "departments_done": 1, "departments_total": 2,
+                "faculty": [{"name": "Ada Lovelace", "email": "ada@test.edu", "biography": "long text"},
+                            {"name": "Alan Turing"}]
+            })
+            await release.wait()
+            return {"success": True, "total_count": 2}
+
+        manager.register("scrape", handler)
+        try:
+            job = await manager.submit("scrape", {})
+            chunks = []
+
+            async def consume():
+                async for chunk in stream_job_events(job, heartbeat=0.05):
+                    chunks.append(chunk)
+
+            consumer = asyncio.create_task(consume())
+            await asyncio.sleep(0.1)
+
+            # Partial records arrive before the job finishes
+            events = parse_sse(chunks)
+            names = [name for _, name, _ in events]
+            assert "done" not in names
+            faculty = [data for _, name, data in events if name == "faculty"][0]
+            assert faculty["records"] == [{"name": "Ada Lovelace", "email": "ada@test.edu"}, {"name": "Alan Turing"}]
+            department = [data for _, name, data in events if name == "department"][0]
+            assert department["faculty_count"] == 2
+            assert manager.get(job.job_id).to_dict()["progress"] == 40
+            assert any(chunk.startswith(": keep-alive") for chunk in chunks)
+
+            release.set()
+            await asyncio.wait_for(consumer, 2)
+            events = parse_sse(chunks)
+            assert events[-1][1] == "done"
+            assert events[-1][2]["status"] == "completed"
+            assert events[-1][2]["result"]["total_count"] == 2
+            assert [event_id for event_id, _, _ in events] == list(range(1, len(events) + 1))
+
+            # A reconnecting client only gets what it missed
+            resumed = [chunk async for chunk in stream_job_events(job, last_event_id=events[-2][0])]
+            assert [name for _, name, _ in parse_sse(resumed)] == ["done"]
+        finally:
+            await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_enricher_reports_each_faculty_member(self):
+        enricher = ProfileEnricher()
+        reported = []
+
+        async def enrich(faculty, semaphore, stats):
+            return {**faculty, "enrichment_successful": True}
+
+        async def callback(event, data):
+            reported.append((event, data["completed"], data["total"], data["faculty"]["name"]))
+
+        async def broken_callback(event, data):
+            raise RuntimeError("subscriber went away")
+
+        enricher._enrich_single_faculty = enrich
+        faculty = [{"name": "Ada Lovelace"}, {"name": "Alan Turing"}]
+        enriched, stats = await enricher.enrich_sparse_faculty_data(faculty, progress_callback=callback)
+
+        assert [event for event, *_ in reported] == ["faculty_enriched"] * 2
+        assert [(completed, total) for _, completed, total, _ in reported] == [(1, 2), (2, 2)]
+        assert stats["successfully_enriched"] == 2
+
+        # A failing callback does not break enrichment
+        enriched, stats = await enricher.enrich_sparse_faculty_data(faculty, progress_callback=broken_callback)
+        assert len(enriched) == 2
+
+
+class TestJobEndpoints:
+    """Scrape endpoints queue jobs and status is polled by id."""
+
+    def test_adaptive_scrape_returns_job_id(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+        from lynnapse.web.app import create_app
+
+        monkeypatch.chdir(tmp_path)
+        app = create_app()
+        manager = app.state.job_manager
+        manager.track_in_mongo = False
+
+        async def fake_scrape(params, progress):
+            await progress.update(50, stage="scraping")
+            return {"success": True, "total_count": params["max_faculty"], "data": []}
+
+        manager.register("adaptive_scrape", fake_scrape)
+
+        with TestClient(app) as client:
+            response = client.post("/api/adaptive-scrape", json={"university_name": "Test University"})
+            assert response.status_code == 400
+
+            response = client.post("/api/adaptive-scrape", json={
+                "university_name": "Test University", "department_name": "Psychology", "max_faculty": 5
+            })
+            assert response.status_code == 202
+            submitted = response.json()
+            assert submitted["success"]
+
+            deadline = time.time() + 5
+            while True:
+                status = client.get(submitted["status_url"]).json()
+                if status["status"] == "completed" or time.time() > deadline:
+                    break
+                time.sleep(0.02)
+
+            assert status["status"] == "completed"
+            assert status["result"]["total_count"] == 5
+            assert status["params"]["department_name"] == "Psychology"
+
+            listed = client.get("/api/jobs").json()
+            assert listed["jobs"][0]["job_id"] == submitted["job_id"]
+            assert "result" not in listed["jobs"][0]
+
+            assert client.get("/api/jobs/missing").status_code == 404
+
+            with client.stream("GET", submitted["events_url"]) as stream:
+                assert stream.headers["content-type"].startswith("text/event-stream")
+                events = parse_sse(list(stream.iter_text()))
+            assert [name for _, name, _ in events if name in ("stage", "done")] == ["stage", "done"]
+            assert events[-1][2]["result"]["total_count"] == 5
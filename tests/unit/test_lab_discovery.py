@@ -210,6 +210,104 @@ class TestLabNameClassifier:
             assert isinstance(weight, float)
             assert weight >= 0
 
+    def test_predict_batch_matches_predict_and_memoizes(self, sample_training_data):
+        """Test batch scoring agrees with single predictions and caches by text."""
+        classifier = LabNameClassifier()
+        classifier.model.early_stopping = False
+        sentences, labels = sample_training_data
+        classifier.train(sentences, labels, test_size=0.3, verbose=False)
+
+        texts = ["Neuroscience Research Laboratory", "Students must register for courses",
+                 "Neuroscience Research Laboratory"]
+        batch = classifier.predict_batch(texts)
+
+        assert batch[0] == batch[2]
+        assert classifier.stats["texts_scored"] == 2  # duplicate scored once
+        assert classifier.stats["batches"] == 1
+
+        classifier.clear_cache()
+        assert [classifier.predict(text) for text in texts] == batch
+        assert classifier.stats["cache_hits"] == 1  # third predict() hit the cache
+
+    def test_find_lab_names_scores_groups_together(self, sample_training_data):
+        """Test that a department's text groups are scored in one batch."""
+        classifier = LabNameClassifier()
+        classifier.model.early_stopping = False
+        sentences, labels = sample_training_data
+        classifier.train(sentences, labels, test_size=0.3, verbose=False)
+
+        groups = [
+            ["short", "Office hours are held on Tuesdays", "Neuroscience Research Laboratory"],
+            [],
+            ["Students must register for courses"],
+        ]
+        expected = []
+        for group in groups:
+            found = None
+            for text in group:
+                if len(text) > 10:
+                    is_lab, confidence = classifier.predict(text)
+                    if is_lab and confidence > 0.5:
+                        found = (text, confidence)
+                        break
+            expected.append(found)
+
+        classifier.clear_cache()
+        batches_before = classifier.stats["batches"]
+        assert classifier.find_lab_names(groups, confidence_threshold=0.5) == expected
+        assert classifier.stats["batches"] == batches_before + 1
+
+    def test_saved_model_loads_lazily_and_memory_mapped(self, sample_training_data, tmp_path):
+        """Test that a saved model is loaded on first use, with memory-mapped weights."""
+        import numpy as np
+        import pickle
+
+        model_path = str(tmp_path / "lab_classifier.pkl")
+        trainer = LabNameClassifier(model_path=model_path)
+        trainer.model.early_stopping = False
+        sentences, labels = sample_training_data
+        trainer.train(sentences, labels, test_size=0.3, verbose=False)
+        trainer.save_model()
+        expected = trainer.predict("Neuroscience Research Laboratory")
+
+        classifier = LabNameClassifier(model_path=model_path)
+        assert classifier._model is None  # nothing loaded at construction
+        assert classifier.predict("Neuroscience Research Laboratory") == expected
+        assert isinstance(classifier.model.coefs_[0], np.memmap)
+
+        # Models pickled by earlier versions still load
+        legacy_path = tmp_path / "legacy.pkl"
+        with open(legacy_path, "wb") as f:
+            pickle.dump({"vectorizer": trainer.vectorizer, "model": trainer.model,
+                         "is_trained": True, "feature_names": trainer.feature_names}, f)
+        legacy = LabNameClassifier(model_path=str(legacy_path))
+        assert legacy.predict("Neuroscience Research Laboratory") == expected
+
+    def test_hashed_mode_learns_incrementally(self, sample_training_data, tmp_path):
+        """Test the hashed classifier folds in examples with partial_fit."""
+        model_path = str(tmp_path / "hashed.pkl")
+        classifier = LabNameClassifier(model_path=model_path, mode="hashed")
+        sentences, labels = sample_training_data
+
+        learned = classifier.learn_from_examples(zip(sentences * 10, labels * 10), batch_size=16)
+        assert learned == len(sentences) * 10
+        assert classifier.is_trained
+        assert classifier.predict("Neuroscience Research Laboratory")[0] is True
+        assert classifier.predict("Students must register for courses")[0] is False
+
+        # Unseen vocabulary can be learned without retraining
+        classifier.partial_fit(["Xylophonics Studio"] * 20, [True] * 20)
+        assert classifier.predict("Xylophonics Studio")[0] is True
+
+        classifier.save_model()
+        reloaded = LabNameClassifier(model_path=model_path)
+        assert reloaded.predict("Xylophonics Studio") == classifier.predict("Xylophonics Studio")
+        assert reloaded.mode == "hashed"
+        reloaded.partial_fit(["Office hours are by appointment"], [False])  # memory-mapped weights are copied
+
+        with pytest.raises(ValueError):
+            LabNameClassifier(model_path=str(tmp_path / "mlp.pkl")).partial_fit(["x"], [True])
+
 
 class TestSiteSearchTask:
     """Test the SiteSearchTask component."""
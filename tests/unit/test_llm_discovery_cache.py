@@ -0,0 +1,69 @@
+"""
+Unit tests for the SQLite-backed LLM discovery cache.
+"""
+
+import json
+import time
+
+from lynnapse.core.llm_discovery_cache import LLMDiscoveryCache
+
+
+def make_cache(tmp_path, **kwargs):
+    return LLMDiscoveryCache(str(tmp_path / "llm_discoveries.db"), ttl=3600, **kwargs)
+
+
+class TestLLMDiscoveryCache:
+    """Test lookups, expiry and JSON import."""
+
+    def test_key_matches_legacy_file_names(self):
+        """Keys line up with the file stems used by the JSON cache."""
+        assert LLMDiscoveryCache.make_key("University of Vermont") == "university_of_vermont_general"
+        assert LLMDiscoveryCache.make_key("MIT", "Psychology") == "mit_psychology"
+
+    def test_get_respects_ttl(self, tmp_path):
+        """Entries older than the TTL are treated as misses."""
+        cache = make_cache(tmp_path)
+        cache.put("fresh_general", {"faculty_directory_paths": ["faculty"], "cost_estimate": 0.01})
+        cache.put("stale_general", {"faculty_directory_paths": ["people"],
+                                    "discovery_timestamp": time.time() - 7200})
+
+        assert cache.get("fresh_general")["faculty_directory_paths"] == ["faculty"]
+        assert cache.get("stale_general") is None
+        assert cache.get("stale_general", max_age=10000) is not None
+        cache.close()
+
+    def test_summary_and_expiry(self, tmp_path):
+        """Summary counts and expiry run against the indexed timestamp."""
+        cache = make_cache(tmp_path)
+        cache.put("a_general", {"cost_estimate": 0.5})
+        cache.put("b_general", {"cost_estimate": 0.25, "discovery_timestamp": time.time() - 48 * 3600})
+
+        summary = cache.get_summary(fresh_hours=24)
+        assert summary == {"total_entries": 2, "total_cost": 0.75, "fresh_entries": 1, "old_entries": 1}
+
+        expired = cache.delete_expired(max_age=24 * 3600)
+        assert [entry["cache_key"] for entry in expired] == ["b_general"]
+        assert cache.get_summary()["total_entries"] == 1
+        cache.close()
+
+    def test_legacy_directory_imported_once(self, tmp_path):
+        """JSON files beside the database are imported on first open only."""
+        legacy_dir = tmp_path / "llm_discoveries"
+        legacy_dir.mkdir()
+        (legacy_dir / "mit_general.json").write_text(json.dumps({
+            "faculty_directory_paths": ["faculty"],
+            "department_paths": [],
+            "confidence_score": 0.85,
+            "cost_estimate": 0.0002,
+            "discovery_timestamp": time.time()
+        }))
+
+        cache = make_cache(tmp_path)
+        assert cache.get("mit_general")["confidence_score"] == 0.85
+        cache.clear()
+        cache.close()
+
+        reopened = make_cache(tmp_path)
+        assert reopened.list_entries() == []
+        assert reopened.import_json_dir(legacy_dir) == 1
+        reopened.close()
@@ -0,0 +1,285 @@
+"""
+Unit tests for MongoWriter.
+
+Exercises the writer against mocked Motor collections so that the
+query shapes and bookkeeping can be checked without a running mongod.
+"""
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+from lynnapse.core.mongo_writer import MongoWriter, STATS_COLLECTION
+
+
+class AsyncCursor:
+    """Minimal async iterator standing in for a Motor cursor."""
+
+    def __init__(self, documents):
+        self.documents = list(documents)
+
+    def __aiter__(self):
+        self._iter = iter(self.documents)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def to_list(self, length=None):
+        return self.documents
+
+
+class FakeDatabase:
+    """Database stand-in that hands out one MagicMock per collection."""
+
+    def __init__(self):
+        self.collections = {}
+
+    def __getitem__(self, name):
+        if name not in self.collections:
+            self.collections[name] = MagicMock(name=name)
+        return self.collections[name]
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self[name]
+
+
+def make_writer():
+    """Create a MongoWriter wired to a fake database."""
+    writer = MongoWriter()
+    writer.database = FakeDatabase()
+    return writer, writer.database.__getitem__
+
+
+class TestScrapingStatistics:
+    """Test the aggregated statistics path."""
+
+    @pytest.mark.asyncio
+    async def test_cached_statistics_document_is_used(self):
+        """A stored statistics document is returned without aggregating."""
+        writer, collection = make_writer()
+        collection(STATS_COLLECTION).find_one = AsyncMock(return_value={
+            "_id": "Test University",
+            "programs": 2,
+            "faculty": 4,
+            "faculty_with_email": 3,
+            "faculty_with_personal_website": 1,
+            "faculty_with_lab": 2,
+            "lab_sites": 5,
+        })
+
+        stats = await writer.get_scraping_statistics("Test University")
+
+        assert stats["faculty"] == 4
+        assert stats["email_capture_rate"] == 75.0
+        assert stats["lab_detection_rate"] == 50.0
+        collection("faculty").aggregate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_uses_facet_aggregation(self):
+        """Missing statistics are computed with a single $facet pipeline."""
+        writer, collection = make_writer()
+        collection(STATS_COLLECTION).find_one = AsyncMock(return_value=None)
+        collection(STATS_COLLECTION).replace_one = AsyncMock()
+        collection("programs").find.return_value = AsyncCursor([{"_id": "p1"}, {"_id": "p2"}])
+        collection("faculty").aggregate.return_value = AsyncCursor([{
+            "faculty": [{"n": 10}],
+            "faculty_with_email": [{"n": 8}],
+            "faculty_with_personal_website": [],
+            "faculty_with_lab": [{"n": 3}],
+        }])
+        collection("lab_sites").count_documents = AsyncMock(return_value=4)
+
+        stats = await writer.get_scraping_statistics("Test University")
+
+        pipeline = collection("faculty").aggregate.call_args[0][0]
+        assert pipeline[0] == {"$match": {"program_id": {"$in": ["p1", "p2"]}}}
+        assert "$facet" in pipeline[-1]
+        assert stats["programs"] == 2
+        assert stats["faculty"] == 10
+        assert stats["faculty_with_personal_website"] == 0
+        assert stats["lab_sites"] == 4
+        collection(STATS_COLLECTION).replace_one.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_faculty_update_applies_presence_deltas(self):
+        """Updating a faculty record only increments changed counters."""
+        writer, collection = make_writer()
+        writer._program_universities["p1"] = "Test University"
+        collection(STATS_COLLECTION).update_one = AsyncMock()
+
+        faculty = MagicMock(program_id="p1", email="a@test.edu",
+                            personal_website=None, lab_name="Memory Lab")
+        await writer._update_faculty_statistics(faculty, {"_id": "f1", "email": "a@test.edu"})
+
+        update = collection(STATS_COLLECTION).update_one.call_args[0][1]
+        assert update["$inc"] == {"faculty_with_lab": 1}
+
+
+class TestContentHashUpserts:
+    """Test skip-unchanged upserts."""
+
+    @staticmethod
+    def program_data(**overrides):
+        data = {
+            "university_name": "Test University",
+            "program_name": "Psychology",
+            "program_type": "graduate",
+            "department": "Psychology",
+            "college": "College of Science",
+            "program_url": "https://test.edu/psych",
+            "source_url": "https://test.edu",
+        }
+        data.update(overrides)
+        return data
+
+    def test_content_hash_ignores_scrape_timestamps(self):
+        """Rescraping identical content produces the same hash."""
+        writer = MongoWriter()
+        first = writer.prepare_upsert("programs", self.program_data())
+        second = writer.prepare_upsert("programs", self.program_data(description=None))
+        changed = writer.prepare_upsert("programs", self.program_data(description="New"))
+
+        assert first[2]["$set"]["content_hash"] == second[2]["$set"]["content_hash"]
+        assert first[2]["$set"]["content_hash"] != changed[2]["$set"]["content_hash"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_record_only_touches_last_seen(self):
+        """An upsert with an identical hash does not rewrite the document."""
+        writer, collection = make_writer()
+        _, _, update_doc = writer.prepare_upsert("programs", self.program_data())
+        collection("programs").find_one = AsyncMock(return_value={
+            "_id": "p1", "content_hash": update_doc["$set"]["content_hash"]
+        })
+        collection("programs").update_one = AsyncMock()
+
+        program_id = await writer.upsert_program(self.program_data())
+
+        assert program_id == "p1"
+        filter_key, update = collection("programs").update_one.call_args[0]
+        assert filter_key == {"_id": "p1"}
+        assert list(update["$set"]) == ["last_seen_at"]
+        assert writer.get_write_counts()["programs"]["unchanged"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_upsert_classifies_records(self):
+        """Bulk writes report inserted, changed and unchanged counts."""
+        writer, collection = make_writer()
+        same = self.program_data(program_name="Same")
+        edited = self.program_data(program_name="Edited")
+        new = self.program_data(program_name="New")
+        same_hash = writer.prepare_upsert("programs", same)[2]["$set"]["content_hash"]
+
+        collection("programs").find.return_value = AsyncCursor([
+            {"university_name": "Test University", "program_name": "Same",
+             "department": "Psychology", "content_hash": same_hash},
+            {"university_name": "Test University", "program_name": "Edited",
+             "department": "Psychology", "content_hash": "stale"},
+        ])
+        collection("programs").bulk_write = AsyncMock(return_value=MagicMock(upserted_count=1))
+        collection(STATS_COLLECTION).delete_many = AsyncMock()
+
+        counts = await writer.bulk_upsert("programs", [same, edited, new])
+
+        assert counts == {"inserted": 1, "changed": 1, "unchanged": 1}
+        operations = collection("programs").bulk_write.call_args[0][0]
+        assert operations[0]._upsert is False
+        assert operations[1]._upsert is True
+
+    @pytest.mark.asyncio
+    async def test_document_ids_looked_up_by_upsert_key(self):
+        """IDs come back in key order, None for keys that were not stored."""
+        writer, collection = make_writer()
+        collection("faculty").find.return_value = AsyncCursor([
+            {"_id": "f2", "name": "Dr. Jones", "program_id": "p1"},
+            {"_id": "f1", "name": "Dr. Smith", "program_id": "p1"},
+        ])
+
+        ids = await writer.get_document_ids("faculty", [
+            {"name": "Dr. Smith", "program_id": "p1"},
+            {"name": "Dr. Missing", "program_id": "p1"},
+            {"name": "Dr. Jones", "program_id": "p1"},
+        ])
+
+        assert ids == ["f1", None, "f2"]
+        query, projection = collection("faculty").find.call_args[0]
+        assert len(query["$or"]) == 3
+        assert projection == {"_id": 1, "name": 1, "program_id": 1}
+
+
+class KeysetCollection:
+    """Collection stand-in that serves find() pages in _id order."""
+
+    def __init__(self, documents):
+        self.documents = sorted(documents, key=lambda d: d["_id"])
+        self.queries = []
+
+    def find(self, query, projection=None):
+        self.queries.append((query, projection))
+        after = query.get("_id", {}).get("$gt")
+        matches = [
+            dict(d) for d in self.documents
+            if all(d.get(k) == v for k, v in query.items() if k != "_id")
+            and (after is None or d["_id"] > after)
+        ]
+        cursor = MagicMock()
+        cursor.sort.return_value.limit.side_effect = lambda n: AsyncCursor(matches[:n])
+        return cursor
+
+
+class TestPaginatedReads:
+    """Test projection-aware keyset-paginated reads."""
+
+    @staticmethod
+    def make_faculty(count, program_id="p1"):
+        return [
+            {"_id": f"f{i:03d}", "program_id": program_id, "name": f"Faculty {i}",
+             "raw_data": {"html": "x" * 100}}
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_iterator_walks_pages_by_id(self):
+        """Every document is yielded once across keyset pages."""
+        writer, _ = make_writer()
+        faculty = KeysetCollection(self.make_faculty(5) + self.make_faculty(2, "p2"))
+        writer.database.collections["faculty"] = faculty
+
+        names = [doc["name"] async for doc in writer.iter_faculty_by_program("p1", page_size=2)]
+
+        assert names == [f"Faculty {i}" for i in range(5)]
+        assert [query.get("_id") for query, _ in faculty.queries] == [
+            None, {"$gt": "f001"}, {"$gt": "f003"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_large_fields_excluded_by_default(self):
+        """Blob fields are projected out unless fields are requested."""
+        writer, _ = make_writer()
+        faculty = KeysetCollection(self.make_faculty(1))
+        writer.database.collections["faculty"] = faculty
+
+        [doc async for doc in writer.iter_faculty_by_program("p1")]
+        [doc async for doc in writer.iter_faculty_by_program("p1", fields=["name", "email"])]
+        await writer.get_faculty_by_program("p1")
+
+        projections = [projection for _, projection in faculty.queries]
+        assert projections == [{"raw_data": 0}, {"name": 1, "email": 1}, None]
+
+    @pytest.mark.asyncio
+    async def test_page_cursor_resumes(self):
+        """A page's next_cursor picks up where it stopped."""
+        writer, _ = make_writer()
+        writer.database.collections["faculty"] = KeysetCollection(self.make_faculty(3))
+
+        first = await writer.get_faculty_page("p1", page_size=2)
+        second = await writer.get_faculty_page("p1", page_size=2, after=first["next_cursor"])
+
+        assert [doc["id"] for doc in first["items"]] == ["f000", "f001"]
+        assert first["next_cursor"] == "f001"
+        assert [doc["id"] for doc in second["items"]] == ["f002"]
+        assert second["next_cursor"] is None
@@ -0,0 +1,116 @@
+"""
+Unit tests for the shared MongoDB client registry.
+
+Connection setup is patched out so no running mongod is required.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from lynnapse.config.production import ProductionConfig
+from lynnapse.db.mongodb import MongoDBClient, MongoClientRegistry, PoolMetricsListener
+
+
+class TestMongoClientRegistry:
+    """Test client sharing and lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_client_shared_within_event_loop(self):
+        """Repeated lookups on one loop borrow the same client."""
+        registry = MongoClientRegistry()
+        with patch.object(MongoDBClient, "connect", AsyncMock()) as connect:
+            first = await registry.get_client()
+            second = await registry.get_client()
+
+        assert first is second
+        connect.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_configured_pool_settings_applied(self):
+        """Clients are created from the configured ProductionConfig."""
+        config = ProductionConfig(mongodb_url="mongodb://db:27017",
+                                  mongodb_database="lynnapse_test",
+                                  mongodb_pool_size=42,
+                                  mongodb_max_idle_time_ms=1234)
+        registry = MongoClientRegistry()
+        registry.configure(config)
+
+        with patch.object(MongoDBClient, "connect", AsyncMock()):
+            client = await registry.get_client()
+
+        assert client.connection_string == "mongodb://db:27017"
+        assert client.database_name == "lynnapse_test"
+        assert client.max_pool_size == 42
+        assert client.max_idle_time_ms == 1234
+
+    @pytest.mark.asyncio
+    async def test_close_all_disconnects_clients(self):
+        """Closing the registry disconnects and forgets every client."""
+        registry = MongoClientRegistry()
+        with patch.object(MongoDBClient, "connect", AsyncMock()), \
+             patch.object(MongoDBClient, "disconnect", AsyncMock()) as disconnect:
+            await registry.get_client()
+            await registry.close_all()
+
+        disconnect.assert_awaited_once()
+        assert registry.get_pool_metrics()["clients"] == 0
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_other_loops_clients_open(self):
+        """A flow closing its loop's client does not disconnect other loops."""
+        registry = MongoClientRegistry()
+        with patch.object(MongoDBClient, "connect", AsyncMock()), \
+             patch.object(MongoDBClient, "disconnect", AsyncMock()) as disconnect:
+            other_loop = asyncio.new_event_loop()
+            try:
+                other_client = await asyncio.to_thread(other_loop.run_until_complete, registry.get_client())
+            finally:
+                other_loop.close()
+            await registry.get_client()
+            await registry.close()
+
+        disconnect.assert_awaited_once()
+        assert registry.get_pool_metrics()["clients"] == 1
+        assert registry._clients[id(other_loop)][1] is other_client
+
+    @pytest.mark.asyncio
+    async def test_connection_target_follows_registry_not_caller(self):
+        """The reported target is the one the registry connects to."""
+        registry = MongoClientRegistry()
+        registry.configure(ProductionConfig(mongodb_url="mongodb://registry:27017",
+                                            mongodb_database="registry_db"))
+        assert registry.get_connection_target() == {"url": "mongodb://registry:27017",
+                                                    "database": "registry_db"}
+
+        with patch.object(MongoDBClient, "connect", AsyncMock()):
+            await registry.get_client()
+        registry.configure(ProductionConfig(mongodb_url="mongodb://other:27017"))
+
+        # The live client keeps its settings until it is closed
+        assert registry.get_connection_target()["url"] == "mongodb://registry:27017"
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_is_not_cached(self):
+        """A client whose connection failed is not handed out again."""
+        registry = MongoClientRegistry()
+        with patch.object(MongoDBClient, "connect", AsyncMock(side_effect=ConnectionError)):
+            with pytest.raises(ConnectionError):
+                await registry.get_client()
+
+        assert registry.get_pool_metrics()["clients"] == 0
+
+
+def test_pool_listener_tracks_connections():
+    """Pool events are reflected in the metrics snapshot."""
+    listener = PoolMetricsListener()
+    event = MagicMock()
+    listener.connection_created(event)
+    listener.connection_created(event)
+    listener.connection_checked_out(event)
+    listener.connection_closed(event)
+
+    metrics = listener.get_metrics()
+    assert metrics["open_connections"] == 1
+    assert metrics["in_use"] == 1
@@ -0,0 +1,92 @@
+"""
+Unit tests for record byte-offset indexing and streamed result reads.
+"""
+
+import json
+
+import pytest
+
+from lynnapse.web.record_index import RecordReader, find_record_spans, stream_records_json
+
+
+TRICKY_FACULTY = [
+    {"name": "Ada, \"Countess\" [of] {Lovelace}", "html": "<p>a\\b</p>\n]}", "tags": [1, [2, 3]]},
+    {"name": "Grace Hopper", "faculty": ["not", "the", "records"]},
+    {"name": "Alan Turing", "nested": {"faculty": [{"x": 1}]}},
+]
+
+
+def write_json(path, data, indent=2):
+    path.write_text(json.dumps(data, indent=indent))
+    return path
+
+
+class TestFindRecordSpans:
+    """Test locating records inside JSON documents."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_structured_result(self, indent):
+        """Records under ``faculty`` are found despite tricky strings."""
+        document = {"university_name": "Test [U]", "metadata": {"faculty": "no"},
+                    "faculty": TRICKY_FACULTY, "total_count": 3}
+        buf = json.dumps(document, indent=indent).encode()
+
+        record_spans = find_record_spans(buf)
+
+        assert [json.loads(buf[s:e]) for s, e in record_spans.spans] == TRICKY_FACULTY
+        start, end = record_spans.array_span
+        assert json.loads(buf[start:end]) == TRICKY_FACULTY
+
+    def test_bare_list_and_nested_path(self):
+        """Old list results and nested record paths are supported."""
+        buf = json.dumps(TRICKY_FACULTY).encode()
+        assert len(find_record_spans(buf, ()).spans) == 3
+
+        pipeline = json.dumps({"final_results": {"legacy_faculty_data": TRICKY_FACULTY[:2]}}).encode()
+        spans = find_record_spans(pipeline, ("final_results", "legacy_faculty_data")).spans
+        assert [json.loads(pipeline[s:e])["name"] for s, e in spans] == ["Ada, \"Countess\" [of] {Lovelace}", "Grace Hopper"]
+
+    def test_missing_and_empty_arrays(self):
+        """A missing array returns None and an empty one has no spans."""
+        assert find_record_spans(b'{"other": [1, 2]}') is None
+        assert find_record_spans(b'{"faculty": [ ]}').spans == []
+
+
+class TestStreamedReads:
+    """Test serving records from the memory-mapped file."""
+
+    def test_stream_is_valid_json(self, tmp_path):
+        """The streamed envelope parses to the header plus selected records."""
+        path = write_json(tmp_path / "result.json", {"faculty": TRICKY_FACULTY})
+        with RecordReader(path) as reader:
+            spans = reader.find_spans().spans
+
+        body = b"".join(stream_records_json(path, {"success": True, "count": 3}, spans[1:], chunk_size=1))
+
+        assert json.loads(body) == {"success": True, "count": 3, "data": TRICKY_FACULTY[1:]}
+
+    def test_results_endpoint_pages_records(self, tmp_path, monkeypatch):
+        """/api/results/{filename} honours offset and limit."""
+        from fastapi.testclient import TestClient
+        from lynnapse.web.app import create_app
+
+        monkeypatch.chdir(tmp_path)
+        faculty = [{"name": f"Faculty {i}"} for i in range(5)]
+        (tmp_path / "scrape_results" / "adaptive").mkdir(parents=True)
+        write_json(tmp_path / "scrape_results" / "adaptive" / "big.json", {
+            "university_name": "Test University", "department_name": "Psychology",
+            "scrape_type": "adaptive", "faculty": faculty, "total_count": 5
+        })
+
+        client = TestClient(create_app())
+        response = client.get("/api/results/big.json", params={"offset": 1, "limit": 2})
+        body = response.json()
+
+        assert body["data"] == faculty[1:3]
+        assert body["university"] == "Test University"
+        assert body["total_records"] == 5
+        assert body["next_offset"] == 3
+
+        body = client.get("/api/results/big.json", params={"offset": 3}).json()
+        assert body["data"] == faculty[3:]
+        assert body["next_offset"] is None
@@ -0,0 +1,132 @@
+"""
+Unit tests for streaming record I/O.
+"""
+
+import json
+
+import pytest
+
+from lynnapse.core.record_stream import (
+    read_records, iter_json_records, iter_batches, count_written_records,
+    JsonRecordWriter, JsonlRecordWriter, open_record_writer, merge_stats, RecordDecodeError
+)
+
+
+def make_records(count):
+    return [
+        {"name": f"Faculty {i} [x]", "note": 'has "quotes", {braces} and \\ slashes', "score": 1000 + i * 0.5}
+        for i in range(count)
+    ]
+
+
+class TestReadRecords:
+    """Reading records incrementally from JSON and JSONL files."""
+
+    @pytest.mark.parametrize("chunk_size", [3, 17, 1024 * 1024])
+    def test_reads_records_array_under_any_chunk_size(self, tmp_path, chunk_size):
+        records = make_records(25)
+        path = tmp_path / "results.json"
+        path.write_text(json.dumps({
+            "metadata": {"faculty": "not the array", "count": 12345678, "tags": ["a", "b"]},
+            "enhanced_faculty": records,
+            "trailer": 1
+        }, indent=2))
+
+        assert list(iter_json_records(path, chunk_size=chunk_size)) == records
+
+    def test_bare_array_and_single_object(self, tmp_path):
+        array_path = tmp_path / "list.json"
+        array_path.write_text(json.dumps(make_records(3)))
+        single_path = tmp_path / "single.json"
+        single_path.write_text(json.dumps({"name": "Solo", "count": 3}))
+        empty_path = tmp_path / "empty.json"
+        empty_path.write_text('{"faculty": []}')
+
+        assert list(read_records(array_path)) == make_records(3)
+        assert list(read_records(single_path)) == [{"name": "Solo", "count": 3}]
+        assert list(read_records(empty_path)) == []
+
+    def test_jsonl_with_skip_and_invalid_line(self, tmp_path):
+        path = tmp_path / "records.jsonl"
+        path.write_text("\n".join(json.dumps(r) for r in make_records(5)) + "\n\n")
+
+        assert list(read_records(path, skip=3)) == make_records(5)[3:]
+
+        path.write_text('{"name": "ok"}\n{"name": \n')
+        with pytest.raises(RecordDecodeError, match=":2:"):
+            list(read_records(path))
+
+    def test_malformed_json_raises_decode_error(self, tmp_path):
+        truncated_path = tmp_path / "truncated.json"
+        truncated_path.write_text('[{"name": "A"}, {"name": ')
+        scalar_path = tmp_path / "scalar.json"
+        scalar_path.write_text("42")
+
+        for path in (truncated_path, scalar_path):
+            with pytest.raises(RecordDecodeError):
+                list(read_records(path))
+
+    def test_iter_batches(self):
+        assert list(iter_batches(iter(range(7)), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        with pytest.raises(ValueError) as excinfo:
+            list(iter_batches([], 0))
+        # Bad arguments are not reported as malformed input
+        assert not isinstance(excinfo.value, RecordDecodeError)
+
+
+class TestRecordWriters:
+    """Appending records as batches finish."""
+
+    def test_json_writer_round_trip(self, tmp_path):
+        path = tmp_path / "out.json"
+        records = make_records(5)
+
+        with JsonRecordWriter(path, header={"source": "test"}, records_key="enriched_faculty") as writer:
+            writer.write(records[:2])
+            writer.write(records[2:])
+            assert not path.exists()
+            writer.close({"summary": {"total": writer.count}})
+
+        data = json.loads(path.read_text())
+        assert data == {"source": "test", "enriched_faculty": records, "summary": {"total": 5}}
+        assert list(read_records(path)) == records
+        assert not (tmp_path / "out.json.partial").exists()
+
+    def test_json_writer_keeps_final_path_untouched_on_error(self, tmp_path):
+        path = tmp_path / "out.json"
+        with pytest.raises(RuntimeError):
+            with JsonRecordWriter(path) as writer:
+                writer.write(make_records(2))
+                raise RuntimeError("interrupted")
+
+        assert not path.exists()
+        assert (tmp_path / "out.json.partial").exists()
+
+    def test_jsonl_resume_truncates_partial_line(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        records = make_records(6)
+
+        with JsonlRecordWriter(path) as writer:
+            writer.write(records[:4])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"name": "half wri')
+
+        assert count_written_records(path) == 4
+        assert count_written_records(tmp_path / "missing.jsonl") == 0
+
+        with open_record_writer(path, append=True) as writer:
+            writer.write(records[4:])
+
+        assert list(read_records(path)) == records
+
+    def test_json_output_cannot_be_appended(self, tmp_path):
+        with pytest.raises(ValueError, match="JSONL"):
+            open_record_writer(tmp_path / "out.json", append=True)
+
+
+def test_merge_stats():
+    total = {}
+    merge_stats(total, {"processed": 2, "time": 1.5, "by_type": {"lab": 1}, "method": "a", "done": False})
+    merge_stats(total, {"processed": 3, "time": 0.5, "by_type": {"lab": 2, "scholar": 1}, "method": "b", "done": True})
+
+    assert total == {"processed": 5, "time": 2.0, "by_type": {"lab": 3, "scholar": 1}, "method": "b", "done": True}
@@ -0,0 +1,95 @@
+"""
+Unit tests for the scrape results manifest.
+"""
+
+import json
+import os
+
+import pytest
+
+from lynnapse.web.results_index import ResultsIndex
+
+
+def write_result(folder, name, university, department, count=2, mtime=None):
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / name
+    path.write_text(json.dumps({
+        "university_name": university,
+        "department_name": department,
+        "scrape_type": "adaptive",
+        "faculty": [{"name": f"Faculty {i}"} for i in range(count)],
+        "total_count": count
+    }))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return path
+
+
+@pytest.fixture
+def results_dir(tmp_path):
+    adaptive = tmp_path / "adaptive"
+    write_result(adaptive, "a.json", "Stanford University", "Psychology", mtime=1000)
+    write_result(adaptive, "b.json", "University of Vermont", "Psychology", count=5, mtime=2000)
+    write_result(tmp_path / "legacy", "c.json", "University of Arizona", "Biology", mtime=3000)
+    return tmp_path
+
+
+class TestResultsIndex:
+    """Test manifest listing, filtering and incremental refresh."""
+
+    def test_lists_newest_first_with_pagination(self, results_dir):
+        """Pages come from the manifest in mtime order."""
+        index = ResultsIndex(str(results_dir))
+
+        page, total = index.list_results(limit=2)
+        assert total == 3
+        assert [r["filename"] for r in page] == ["c.json", "b.json"]
+        assert page[1]["count"] == 5
+        assert len(page[1]["preview"]) == 3
+
+        page, _ = index.list_results(limit=2, offset=2)
+        assert [r["filename"] for r in page] == ["a.json"]
+        index.close()
+
+    def test_filters(self, results_dir):
+        """University and department filters are case-insensitive substrings."""
+        index = ResultsIndex(str(results_dir))
+
+        page, total = index.list_results(university="university of", department="psych")
+        assert total == 1
+        assert page[0]["university"] == "University of Vermont"
+        index.close()
+
+    def test_refresh_only_parses_changed_files(self, results_dir):
+        """Unchanged files are not reparsed and deleted files disappear."""
+        index = ResultsIndex(str(results_dir))
+        index.list_results()
+        assert index.stats["files_parsed"] == 3
+
+        index.list_results()
+        assert index.stats["files_parsed"] == 3
+
+        (results_dir / "adaptive" / "a.json").unlink()
+        write_result(results_dir / "adaptive", "d.json", "MIT", "Brain Sciences", mtime=4000)
+        page, total = index.list_results()
+
+        assert index.stats["files_parsed"] == 4
+        assert total == 3
+        assert page[0]["filename"] == "d.json"
+        index.close()
+
+    def test_record_avoids_reparsing_saved_results(self, results_dir):
+        """Results recorded at save time are not parsed again."""
+        index = ResultsIndex(str(results_dir))
+        index.refresh()
+
+        data = {"university_name": "Yale University", "department_name": "History", "faculty": []}
+        path = results_dir / "adaptive" / "e.json"
+        path.write_text(json.dumps(data))
+        index.record(path, data)
+        parsed = index.stats["files_parsed"]
+
+        page, _ = index.list_results(university="yale")
+        assert page[0]["count"] == 0
+        assert index.stats["files_parsed"] == parsed
+        index.close()
@@ -0,0 +1,128 @@
+"""
+Unit tests for the persistent search result cache.
+"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lynnapse.core.search_cache import SearchResultCache, normalize_query
+from lynnapse.core.site_search import SiteSearchTask
+from lynnapse.core.secondary_link_finder import SecondaryLinkFinder, SearchResult
+from lynnapse.core.rate_limiter import reset_rate_limiters
+
+
+RESULTS = [{"url": "https://lab.test.edu", "title": "Test Lab", "snippet": "Research", "confidence": 0.9}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SearchResultCache(db_path=str(tmp_path / "search.db"), ttl=60, memory_size=2)
+    yield cache
+    cache.close()
+
+
+class TestSearchResultCache:
+    """Keys, tiers, expiry and sharing."""
+
+    def test_keys_use_normalized_query(self):
+        assert normalize_query("  John   SMITH\tLab ") == "john smith lab"
+        assert SearchResultCache.make_key("ddg", "John Smith  Lab") == SearchResultCache.make_key("ddg", "john smith lab")
+        assert SearchResultCache.make_key("ddg", "q", max_results=3) != SearchResultCache.make_key("ddg", "q", max_results=5)
+        assert SearchResultCache.make_key("ddg", "q") != SearchResultCache.make_key("search", "q")
+
+    def test_memory_and_disk_tiers(self, cache):
+        cache.put("ddg:a", RESULTS, query="a")
+
+        assert cache.get("ddg:a") == RESULTS
+        assert cache.stats["memory_hits"] == 1
+
+        # Push the entry out of the two-slot LRU; the disk tier still has it
+        cache.put("ddg:b", [])
+        cache.put("ddg:c", [])
+        assert cache.get("ddg:a") == RESULTS
+        assert cache.stats["disk_hits"] == 1
+
+        assert cache.get("ddg:missing") is None
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["disk_entries"] == 3
+        assert stats["memory_entries"] == 2
+
+    def test_returned_results_are_copies(self, cache):
+        cache.put("ddg:a", RESULTS)
+        cache.get("ddg:a")[0]["url"] = "changed"
+
+        assert cache.get("ddg:a") == RESULTS
+
+    def test_ttl_expiry(self, cache):
+        cache.put("ddg:old", RESULTS, ttl=0.05)
+        cache.put("ddg:new", RESULTS)
+        time.sleep(0.1)
+
+        assert cache.get("ddg:old") is None
+        assert cache.delete_expired() == 1
+        assert cache.get("ddg:new") == RESULTS
+
+    def test_shared_between_instances(self, cache, tmp_path):
+        cache.put("ddg:shared", RESULTS)
+
+        other = SearchResultCache(db_path=str(tmp_path / "search.db"), ttl=60)
+        try:
+            assert other.get("ddg:shared") == RESULTS
+            assert other.clear(namespace="ddg") == 1
+        finally:
+            other.close()
+
+        # The other process's in-memory tier is not invalidated, the file is
+        assert SearchResultCache(db_path=str(tmp_path / "search.db")).get("ddg:shared") is None
+
+
+class TestSearchCacheIntegration:
+    """SiteSearchTask and DuckDuckGo searches served from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_site_search_cached_across_instances(self, tmp_path):
+        db_path = str(tmp_path / "search.db")
+        first = SiteSearchTask(bing_api_key="key", cache_client=SearchResultCache(db_path=db_path))
+        first._search_bing = AsyncMock(return_value=[
+            {"url": "https://smithlab.test.edu", "title": "Smith Lab", "snippet": "", "source": "bing"}
+        ])
+
+        results = await first.search_lab_urls("Dr. John Smith", "Smith Lab", "Test University")
+        assert first._search_bing.await_count == 1
+
+        # A new process with the same cache file does not query Bing again
+        second = SiteSearchTask(bing_api_key="key", cache_client=SearchResultCache(db_path=db_path))
+        second._search_bing = AsyncMock(return_value=[])
+        cached = await second.search_lab_urls("John Smith", "Smith  lab", "test university")
+
+        assert cached == results
+        assert second._search_bing.await_count == 0
+        assert second.get_usage_stats()["session_stats"]["cache_hits"] == 1
+        assert second.get_usage_stats()["cache"]["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_duckduckgo_results_cached(self, cache):
+        reset_rate_limiters()
+        finder = SecondaryLinkFinder(search_cache=cache)
+        finder.session = MagicMock()
+        finder.wait_for_rate_limit = AsyncMock()
+
+        response = MagicMock(status=200)
+        response.text = AsyncMock(return_value="<html></html>")
+        finder.session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+        finder.session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+        finder.parse_duckduckgo_lite_results = MagicMock(return_value=[
+            SearchResult(title="Jane Doe - Scholar", url="https://scholar.google.com/jd", snippet="", rank=1)
+        ])
+
+        first = await finder.search_duckduckgo('"Jane Doe" google scholar', max_results=3)
+        second = await finder.search_duckduckgo('"jane doe"  Google Scholar', max_results=3)
+
+        assert second == first
+        assert finder.wait_for_rate_limit.await_count == 1
+        assert finder.session.get.call_count == 1
+        assert finder.get_stats()["search_cache_hits"] == 1
+        reset_rate_limiters()
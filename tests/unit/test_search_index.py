@@ -0,0 +1,114 @@
+"""
+Unit tests for the autocomplete search index.
+"""
+
+import pytest
+
+from lynnapse.config.search_index import SearchIndex, normalize_name
+from lynnapse.config.university_database import University, UniversityDatabase
+
+
+NAMES = [
+    "Stanford University",
+    "University of California, Berkeley",
+    "University of California, Los Angeles",
+    "California Institute of Technology",
+    "Harvard University",
+    "Université de Montréal",
+    "Texas A&M University",
+]
+
+
+@pytest.fixture
+def index():
+    return SearchIndex([[name] for name in NAMES])
+
+
+def names(index, query, **kwargs):
+    return [NAMES[i] for i in index.search(query, **kwargs)]
+
+
+class TestSearchIndex:
+    """Prefix, word-prefix and fuzzy tiers."""
+
+    def test_normalization(self):
+        assert normalize_name("  Université de MONTRÉAL ") == "universite de montreal"
+        assert normalize_name("Texas A&M") == "texas a and m"
+        assert normalize_name("Wisconsin-Madison") == "wisconsin madison"
+
+    def test_name_prefix_ranks_before_word_prefix(self, index):
+        assert names(index, "calif") == [
+            "California Institute of Technology",
+            "University of California, Berkeley",
+            "University of California, Los Angeles",
+        ]
+
+    def test_every_word_must_match(self, index):
+        assert names(index, "univ of cal los") == ["University of California, Los Angeles"]
+        assert names(index, "berkeley calif") == ["University of California, Berkeley"]
+        assert names(index, "montreal") == ["Université de Montréal"]
+        assert names(index, "texas a&m") == ["Texas A&M University"]
+
+    def test_misspellings_matched_by_trigrams(self, index):
+        assert names(index, "harvrd") == ["Harvard University"]
+        assert names(index, "stanfrod univ") == ["Stanford University"]
+        assert names(index, "zzzz") == []
+
+    def test_limit_and_allowed(self, index):
+        assert len(index.search("univ", limit=2)) == 2
+        assert names(index, "univ", allowed={0, 4}) == ["Stanford University", "Harvard University"]
+        assert index.search("   ") == []
+
+    def test_snapshot_round_trip(self, index):
+        restored = SearchIndex.from_snapshot(index.to_snapshot())
+        for query in ("calif", "univ of cal los", "harvrd", "texas a&m"):
+            assert restored.search(query) == index.search(query)
+
+        with pytest.raises(ValueError):
+            SearchIndex.from_snapshot(b"not a snapshot")
+
+    def test_load_or_build_uses_matching_snapshot(self, tmp_path):
+        path = tmp_path / "index.snapshot"
+        documents = [[name] for name in NAMES]
+        SearchIndex.load_or_build(documents, path)
+        assert path.exists()
+
+        path.write_bytes(SearchIndex([["Only University"]]).to_snapshot())
+        # A snapshot of other names is stale and gets rebuilt
+        rebuilt = SearchIndex.load_or_build(documents, path)
+        assert rebuilt.size == len(NAMES)
+        assert SearchIndex.from_snapshot(path.read_bytes()).fingerprint == rebuilt.fingerprint
+
+
+class TestUniversityDatabaseSearch:
+    """Autocomplete on the university and department lists."""
+
+    def test_search_universities(self):
+        db = UniversityDatabase()
+        db.load_universities_from_backup()
+
+        assert [uni.name for uni in db.search_universities("stan")] == ["Stanford University"]
+        assert [uni.name for uni in db.search_universities("arizona")] == [
+            "Arizona State University", "University of Arizona"
+        ]
+        assert [uni.name for uni in db.search_universities("univ", state="ca", limit=2)] == [
+            "University of California, Berkeley", "University of California, Los Angeles"
+        ]
+        assert len(db.search_universities("", limit=5)) == 5
+
+    def test_index_follows_replaced_university_list(self):
+        db = UniversityDatabase()
+        db.load_universities_from_backup()
+        db.universities = [University(id="1", name="Reed College", city="Portland", state="Oregon",
+                                      state_code="OR", website="https://www.reed.edu", type="private-nonprofit")]
+
+        assert [uni.name for uni in db.search_universities("reed")] == ["Reed College"]
+        assert db.search_universities("stanford") == []
+
+    def test_search_departments_by_variation(self):
+        db = UniversityDatabase()
+
+        assert [dept.name for dept in db.search_departments("cs")] == ["Computer Science"]
+        assert [dept.name for dept in db.search_departments("life sci")] == ["Biology"]
+        assert [dept.name for dept in db.search_departments("psychlogy")] == ["Psychology"]
+        assert len(db.search_departments("", limit=3)) == 3
@@ -0,0 +1,228 @@
+"""
+Unit tests for concurrent faculty processing and query planning in SecondaryLinkFinder.
+
+Network calls are replaced with fixed-latency fakes so the tests measure
+how work overlaps, not how fast remote servers answer.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from lynnapse.core.secondary_link_finder import SecondaryLinkFinder, SearchResult, LinkCandidate
+from lynnapse.core.rate_limiter import TokenBucket, get_rate_limiter, reset_rate_limiters
+from lynnapse.core.query_planner import QueryPlanner
+from lynnapse.core.website_validator import LinkType
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
+
+
+def make_faculty(count):
+    return [
+        {"name": f"Faculty {i}", "university": "Test University", "needs_secondary_scraping": True}
+        for i in range(count)
+    ]
+
+
+def make_finder(direct=2, search_latency=0.1, validate_latency=0.1, validated_confidence=0.9,
+                searches=None, **kwargs):
+    """
+    Finder with fake candidate discovery, search and validation.
+
+    Domain discovery yields ``direct`` candidates, direct academic links
+    yield none, and every validated candidate gets ``validated_confidence``.
+    """
+    finder = SecondaryLinkFinder(**kwargs)
+
+    async def direct_strategy_candidates(strategy, faculty):
+        if strategy != "domain_discovery":
+            return []
+        return [
+            LinkCandidate(url=f"https://test.edu/{faculty['name']}/{i}", source="domain_discovery",
+                          query="direct", confidence=0.5)
+            for i in range(direct)
+        ]
+
+    async def search_with_fallback(query, max_results=5):
+        if searches is not None:
+            searches.append(query)
+        await asyncio.sleep(search_latency)
+        return [SearchResult(title="Profile", url=f"https://scholar.google.com/?q={query}", snippet="", rank=0)]
+
+    async def validate_and_rank_candidates(candidates):
+        await asyncio.sleep(validate_latency)
+        for candidate in candidates:
+            candidate.link_type = LinkType.LAB_WEBSITE
+            candidate.confidence = validated_confidence
+        return list(candidates)
+
+    finder.direct_strategy_candidates = direct_strategy_candidates
+    finder.search_with_fallback = search_with_fallback
+    finder.validate_and_rank_candidates = validate_and_rank_candidates
+    finder.max_searches_per_faculty = 1
+    return finder
+
+
+class TestConcurrentEnhancement:
+    """Processing several faculty members at once."""
+
+    @pytest.mark.asyncio
+    async def test_faculty_processed_concurrently_in_input_order(self):
+        faculty = make_faculty(8)
+        finder = make_finder(faculty_concurrency=8)
+
+        start = time.perf_counter()
+        enhanced = await finder.enhance_faculty_links(faculty)
+        elapsed = time.perf_counter() - start
+
+        # Sequentially this is at least 8 x 0.1s of validation
+        assert elapsed < 0.4
+        assert [f["name"] for f in enhanced] == [f["name"] for f in faculty]
+        assert all(f["lab_website_source"] == "secondary_scraping" for f in enhanced)
+        assert finder.get_stats()["faculty_processed"] == 8
+        assert finder.get_stats()["faculty_enhanced"] == 8
+
+    @pytest.mark.asyncio
+    async def test_direct_validation_overlaps_search(self):
+        finder = make_finder(search_latency=0.3, validate_latency=0.3, validated_confidence=0.5,
+                             max_concurrent=4)
+
+        start = time.perf_counter()
+        validated = await finder.find_validated_links(make_faculty(1)[0])
+        elapsed = time.perf_counter() - start
+
+        # search || direct validation, then search validation: ~0.6s instead of 0.9s
+        assert elapsed < 0.8
+        assert len(validated) == 3
+        assert any(c.source == "search_engine" for c in validated)
+
+
+    @pytest.mark.asyncio
+    async def test_results_yielded_as_they_complete(self):
+        faculty = make_faculty(3)
+        finder = SecondaryLinkFinder(faculty_concurrency=3)
+        latencies = {"Faculty 0": 0.3, "Faculty 1": 0.1, "Faculty 2": 0.2}
+
+        async def enhance_single_faculty(member):
+            await asyncio.sleep(latencies[member["name"]])
+            return member
+
+        finder.enhance_single_faculty = enhance_single_faculty
+        order = [index async for index, _ in finder.iter_enhanced_faculty(faculty)]
+
+        assert order == [1, 2, 0]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_respected(self):
+        finder = SecondaryLinkFinder(faculty_concurrency=2)
+        active = peak = 0
+
+        async def enhance_single_faculty(member):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return member
+
+        finder.enhance_single_faculty = enhance_single_faculty
+        enhanced = await finder.enhance_faculty_links(make_faculty(6))
+
+        assert len(enhanced) == 6
+        assert peak == 2
+
+
+class TestQueryPlanning:
+    """Ordering strategies by hit rate and stopping at a confident link."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_confident_candidate(self):
+        searches = []
+        finder = make_finder(direct=6, searches=searches)
+        validations = []
+        validate = finder.validate_and_rank_candidates
+
+        async def counting_validate(candidates):
+            validations.append(len(candidates))
+            return await validate(candidates)
+
+        finder.validate_and_rank_candidates = counting_validate
+        finder.query_planner.record("domain_discovery", candidates=6, validations=1, validated=1, hit=True)
+
+        validated = await finder.find_validated_links(make_faculty(1)[0])
+
+        # One chunk of one candidate reached the threshold: no more validations, no search
+        assert len(validated) == 1
+        assert validations == [1]
+        assert searches == []
+        assert finder.get_stats()["early_exits"] == 1
+        assert finder.get_stats()["strategies"]["domain_discovery"]["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_unproductive_strategies_move_down(self):
+        finder = make_finder(direct=0)
+        for _ in range(5):
+            finder.query_planner.record("domain_discovery", candidates=0, validations=0, validated=0, hit=False)
+
+        steps = finder.plan_strategies(make_faculty(1)[0])
+        strategies = [strategy for strategy, _ in steps]
+
+        assert strategies[0] == "direct_academic"
+        assert strategies[-1] == "domain_discovery"
+        assert all(query for strategy, query in steps if strategy.startswith("search_"))
+
+        await finder.find_validated_links(make_faculty(1)[0])
+        assert finder.query_planner.get_stats()["direct_academic"]["runs"] == 1
+
+    def test_planner_history_round_trip(self, tmp_path):
+        path = tmp_path / "planner.json"
+        planner = QueryPlanner(history_path=path)
+        planner.record("search_lab_website", candidates=3, validations=3, validated=2, hit=True)
+        planner.record("search_lab_website", candidates=3, validations=3, validated=0, hit=False)
+        planner.save()
+
+        reloaded = QueryPlanner(history_path=path)
+        stats = reloaded.get_stats()["search_lab_website"]
+
+        assert stats["runs"] == 2
+        assert stats["hits"] == 1
+        assert stats["yield"] == 1.0
+        assert reloaded.hit_rate("search_lab_website") == pytest.approx(0.5)
+        assert reloaded.order(["unknown", "search_lab_website"]) == ["unknown", "search_lab_website"]
+
+
+class TestSearchRateLimit:
+    """The process-wide token bucket for the search backend."""
+
+    @pytest.mark.asyncio
+    async def test_bucket_spaces_out_acquisitions(self):
+        bucket = TokenBucket(rate=20.0, capacity=1)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+        elapsed = time.perf_counter() - start
+
+        # First token is immediate, the other four arrive at 20/s
+        assert 0.18 <= elapsed < 0.4
+        assert bucket.get_stats()["acquired"] == 5
+        assert bucket.get_stats()["waited"] == 4
+
+    def test_finders_share_one_bucket(self):
+        first = SecondaryLinkFinder()
+        second = SecondaryLinkFinder()
+
+        assert first.search_rate_limiter is second.search_rate_limiter
+        assert get_rate_limiter("duckduckgo") is first.search_rate_limiter
+        assert first.search_rate_limiter.rate == pytest.approx(1.0 / first.min_search_interval)
+
+    def test_unknown_limiter_requires_rate(self):
+        with pytest.raises(ValueError):
+            get_rate_limiter("unconfigured")
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
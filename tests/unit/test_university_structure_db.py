@@ -0,0 +1,99 @@
+"""
+Unit tests for the SQLite-backed UniversityStructureDB.
+"""
+
+import json
+import multiprocessing
+
+import pytest
+
+from lynnapse.core.university_structure_db import UniversityStructureDB
+
+
+def _store_from_process(db_path, index):
+    db = UniversityStructureDB(str(db_path))
+    db.store_structure("Shared University", "https://shared.edu", [f"faculty-{index}"])
+    db.close()
+
+
+@pytest.fixture
+def legacy_json(tmp_path):
+    path = tmp_path / "university_structures.json"
+    path.write_text(json.dumps({
+        "test_university": {
+            "university_name": "Test University",
+            "base_url": "https://test.edu",
+            "faculty_directory_paths": ["faculty"],
+            "department_paths": [],
+            "departments": {"psychology": ["psychology/people"]},
+            "discovery_method": "llm",
+            "confidence_score": 0.8,
+            "last_updated": 1750000000.0,
+            "discovery_count": 1
+        }
+    }))
+    return path
+
+
+class TestUniversityStructureDB:
+    """Test storage, migration and concurrency of structure records."""
+
+    def test_legacy_json_is_migrated_once(self, tmp_path, legacy_json):
+        """The JSON store is imported on first open only."""
+        db = UniversityStructureDB(str(tmp_path / "university_structures.db"))
+        structure = db.get_structure("Test University")
+        assert structure.departments == {"psychology": ["psychology/people"]}
+
+        db.cleanup_old_entries(max_age_days=1)
+        db.close()
+
+        reopened = UniversityStructureDB(str(tmp_path / "university_structures.db"))
+        assert reopened.get_structure("Test University") is None
+        reopened.close()
+
+    def test_json_path_keeps_working(self, tmp_path, legacy_json):
+        """Passing the old JSON path opens a database beside it."""
+        db = UniversityStructureDB(str(legacy_json))
+
+        assert db.db_path == tmp_path / "university_structures.db"
+        assert db.search_universities("test") == ["Test University"]
+        db.close()
+
+    def test_store_merges_existing_structure(self, tmp_path):
+        """Rediscovering a university merges paths and bumps the count."""
+        db = UniversityStructureDB(str(tmp_path / "structures.db"))
+        db.store_structure("New University", "https://new.edu", ["faculty"], confidence_score=0.5)
+        db.store_structure("New University", "https://new.edu", ["people"],
+                           departments={"biology": ["bio/faculty"]}, confidence_score=0.9)
+
+        structure = db.get_structure("New University")
+        assert sorted(structure.faculty_directory_paths) == ["faculty", "people"]
+        assert structure.discovery_count == 2
+        assert structure.confidence_score == 0.9
+        assert db.get_faculty_paths("New University", "Biology") != []
+
+        stats = db.get_statistics()
+        assert stats["total_universities"] == 1
+        assert stats["total_departments"] == 1
+        assert stats["total_faculty_paths"] == 2
+        db.close()
+
+    def test_concurrent_processes_do_not_lose_updates(self, tmp_path):
+        """Writers in separate processes all land in the merged record."""
+        db_path = tmp_path / "structures.db"
+        UniversityStructureDB(str(db_path)).close()
+
+        processes = [
+            multiprocessing.Process(target=_store_from_process, args=(db_path, i))
+            for i in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        db = UniversityStructureDB(str(db_path))
+        structure = db.get_structure("Shared University")
+        assert structure.discovery_count == 4
+        assert len(structure.faculty_directory_paths) == 4
+        db.close()
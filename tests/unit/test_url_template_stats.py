@@ -0,0 +1,134 @@
+"""
+Unit tests for URL template learning and negative caching in SmartLinkReplacer.
+"""
+
+import time
+
+import pytest
+
+from lynnapse.core.smart_link_replacer import SmartLinkReplacer, SCHOLAR_DOMAIN
+from lynnapse.core.url_template_stats import UrlTemplateStats
+
+
+TILDE = "https://www.{domain}/~{last}"
+PEOPLE = "https://www.{domain}/people/{first}-{last}"
+
+
+class TestUrlTemplateStats:
+    """Success rates, ordering and the negative cache."""
+
+    def test_consistent_failures_are_negative_cached(self):
+        stats = UrlTemplateStats(min_failures=3)
+        for _ in range(3):
+            stats.record("test.edu", TILDE, False)
+
+        assert stats.is_negative("test.edu", TILDE)
+        assert not stats.is_negative("other.edu", TILDE)
+        assert stats.prune("test.edu", [(TILDE, "a"), (PEOPLE, "b")]) == [(PEOPLE, "b")]
+        assert stats.get_stats()["negative_templates"] == {"test.edu": [TILDE]}
+
+    def test_templates_that_ever_worked_are_kept_but_ordered_down(self):
+        stats = UrlTemplateStats(min_failures=2)
+        stats.record("test.edu", TILDE, True)
+        for _ in range(5):
+            stats.record("test.edu", TILDE, False)
+        stats.record("test.edu", PEOPLE, True)
+
+        assert not stats.is_negative("test.edu", TILDE)
+        assert stats.prune("test.edu", [(TILDE, "a"), (PEOPLE, "b")]) == [(PEOPLE, "b"), (TILDE, "a")]
+
+    def test_negative_entries_expire(self):
+        stats = UrlTemplateStats(min_failures=1, negative_ttl=0.05)
+        stats.record("test.edu", TILDE, False)
+        assert stats.is_negative("test.edu", TILDE)
+
+        time.sleep(0.1)
+        assert not stats.is_negative("test.edu", TILDE)
+
+        # One more failed probe caches it again straight away
+        stats.record("test.edu", TILDE, False)
+        assert stats.is_negative("test.edu", TILDE)
+
+    def test_history_round_trip(self, tmp_path):
+        path = tmp_path / "templates.json"
+        stats = UrlTemplateStats(history_path=path, min_failures=2)
+        stats.record("Test.EDU", TILDE, False)
+        stats.record("test.edu", TILDE, False)
+        stats.save()
+
+        assert UrlTemplateStats(history_path=path).is_negative("test.edu", TILDE)
+
+
+class TestReplacerTemplatePruning:
+    """Candidate generation skips templates a domain never uses."""
+
+    @pytest.mark.asyncio
+    async def test_working_template_tried_first(self):
+        replacer = SmartLinkReplacer()
+        requested = []
+
+        async def verify(url, name):
+            requested.append(url)
+            return "/people/" in url
+
+        replacer._verify_personal_website = verify
+        faculty = [f"Person{i} Name{i}" for i in range(10)]
+        found = [await replacer.find_personal_website(name, "University of Vermont") for name in faculty]
+
+        assert all("/people/" in url for url in found)
+        # Two ~ guesses before the first hit, then one request per faculty member
+        assert len(requested) == 3 + 9
+        assert replacer._generate_personal_website_urls("Ada Lovelace", "uvm.edu", "UVM")[0] == \
+            "https://www.uvm.edu/people/ada-lovelace"
+
+    @pytest.mark.asyncio
+    async def test_dead_templates_pruned_before_requests(self):
+        replacer = SmartLinkReplacer(template_stats=UrlTemplateStats(min_failures=3))
+        requested = []
+
+        async def verify(url, name):
+            requested.append(url)
+            return False
+
+        replacer._verify_personal_website = verify
+        for i in range(10):
+            assert await replacer.find_personal_website(f"Person{i} Name{i}", "University of Vermont") is None
+
+        templates = len(SmartLinkReplacer.PERSONAL_WEBSITE_URL_TEMPLATES)
+        # Every template is tried three times, then no more requests are made for this domain
+        assert len(requested) == 3 * templates
+        assert replacer._generate_personal_website_urls("Ada Lovelace", "uvm.edu", "UVM") == []
+        assert len(replacer._generate_personal_website_urls("Ada Lovelace", "other.edu", "UVM")) == templates
+        stats = replacer.get_stats()
+        assert stats["direct_urls_checked"] == 3 * templates
+        assert stats["templates"]["pruned"] == 7 * templates + templates
+
+    def test_scholar_templates_tracked_globally(self):
+        stats = UrlTemplateStats(min_failures=1)
+        replacer = SmartLinkReplacer(template_stats=stats)
+        template = SmartLinkReplacer.SCHOLAR_URL_TEMPLATES[0]
+        stats.record(SCHOLAR_DOMAIN, template, False)
+
+        urls = replacer._generate_scholar_direct_urls("Ada Lovelace", "stanford.edu", "Stanford")
+
+        assert "https://scholar.google.com/citations?user=adalovelace" not in urls
+        assert urls == ["https://scholar.google.com/citations?user=alovelace",
+                        "https://scholar.google.com/citations?user=lovelacea"]
+
+    @pytest.mark.asyncio
+    async def test_templates_missing_name_parts_skipped(self):
+        stats = UrlTemplateStats(min_failures=1)
+        replacer = SmartLinkReplacer(template_stats=stats)
+
+        assert replacer._generate_personal_website_urls("", "uvm.edu", "UVM") == []
+        assert replacer._generate_personal_website_urls("Plato", "uvm.edu", "UVM") == []
+        assert replacer._generate_scholar_direct_urls("Plato", "uvm.edu", "UVM") == []
+
+        async def verify(url, name):
+            return False
+
+        replacer._verify_personal_website = verify
+        assert await replacer.find_personal_website("Plato", "University of Vermont") is None
+        # A mononym is not held against the domain's ~{last} layout
+        assert "https://www.uvm.edu/~lovelace" in \
+            replacer._generate_personal_website_urls("Ada Lovelace", "uvm.edu", "UVM")
@@ -0,0 +1,133 @@
+"""
+Unit tests for the WriteBehindQueue.
+
+Uses an in-memory stand-in for MongoWriter so batching, backpressure
+and shutdown flushing can be verified deterministically.
+"""
+
+import asyncio
+import pytest
+
+from lynnapse.core.write_behind import WriteBehindQueue
+
+
+class RecordingWriter:
+    """MongoWriter stand-in that records every bulk write."""
+
+    def __init__(self, write_delay: float = 0.0, failures: int = 0):
+        self.write_delay = write_delay
+        self.failures = failures
+        self.batches = []
+
+    async def ensure_connection(self):
+        pass
+
+    def prepare_upsert(self, collection, data):
+        if "name" not in data:
+            raise ValueError("name is required")
+        return data, {"name": data["name"]}, {"$set": data}
+
+    async def execute_upserts(self, collection, prepared):
+        await asyncio.sleep(self.write_delay)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("mongod unavailable")
+        self.batches.append((collection, [model["name"] for model, _, _ in prepared]))
+        return {"inserted": len(prepared), "changed": 0, "unchanged": 0}
+
+    async def get_document_ids(self, collection, filter_keys):
+        written = {name for _, names in self.batches for name in names}
+        return [f"id-{key['name']}" if key["name"] in written else None for key in filter_keys]
+
+
+class TestWriteBehindQueue:
+    """Test the write-behind queue."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_in_batches_by_size(self):
+        """Documents are written in bulk batches of at most batch_size."""
+        writer = RecordingWriter()
+        async with WriteBehindQueue(writer, batch_size=3, flush_interval=5.0) as queue:
+            for i in range(7):
+                await queue.put("faculty", {"name": f"Faculty {i}"})
+
+        sizes = [len(names) for _, names in writer.batches]
+        assert sum(sizes) == 7
+        assert max(sizes) <= 3
+        assert queue.get_stats()["documents_written"] == 7
+
+    @pytest.mark.asyncio
+    async def test_flushes_partial_batch_after_interval(self):
+        """A partial batch is written once the flush interval elapses."""
+        writer = RecordingWriter()
+        async with WriteBehindQueue(writer, batch_size=100, flush_interval=0.05) as queue:
+            await queue.put("faculty", {"name": "Dr. Smith"})
+            await asyncio.sleep(0.2)
+            assert writer.batches == [("faculty", ["Dr. Smith"])]
+
+    @pytest.mark.asyncio
+    async def test_backpressure_when_queue_full(self):
+        """Producers wait when the queue is at capacity."""
+        writer = RecordingWriter(write_delay=0.05)
+        async with WriteBehindQueue(writer, max_queue_size=2, batch_size=1,
+                                    flush_interval=0.01) as queue:
+            for i in range(6):
+                await queue.put("faculty", {"name": f"Faculty {i}"})
+            assert queue.get_stats()["peak_queue_depth"] <= 2
+
+        stats = queue.get_stats()
+        assert stats["backpressure_waits"] > 0
+        assert stats["documents_written"] == 6
+
+    @pytest.mark.asyncio
+    async def test_invalid_documents_rejected_at_put(self):
+        """Validation errors surface to the producer immediately."""
+        async with WriteBehindQueue(RecordingWriter()) as queue:
+            with pytest.raises(ValueError):
+                await queue.put("faculty", {"title": "Professor"})
+        assert queue.get_stats()["documents_queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_retried(self):
+        """Transient bulk write failures are retried before giving up."""
+        writer = RecordingWriter(failures=1)
+        async with WriteBehindQueue(writer, retry_delay=0.0) as queue:
+            await queue.put("faculty", {"name": "Dr. Jones"})
+
+        stats = queue.get_stats()
+        assert stats["documents_written"] == 1
+        assert stats["documents_failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_put_after_close_raises(self):
+        """The queue refuses new documents once closed."""
+        queue = WriteBehindQueue(RecordingWriter())
+        await queue.start()
+        await queue.close()
+        with pytest.raises(RuntimeError):
+            await queue.put("faculty", {"name": "Late"})
+
+    @pytest.mark.asyncio
+    async def test_stored_ids_leave_out_dropped_documents(self):
+        """IDs are only reported for documents whose batch was written."""
+        writer = RecordingWriter(failures=1)
+        queue = WriteBehindQueue(writer, batch_size=2, flush_interval=5.0, max_retries=0)
+        await queue.start()
+        keys = [await queue.put("faculty", {"name": f"Faculty {i}"}) for i in range(4)]
+        await queue.close()
+
+        assert keys[0] == {"name": "Faculty 0"}
+        assert queue.get_stats()["documents_failed"] == 2
+        assert await queue.stored_ids("faculty", keys) == ["id-Faculty 2", "id-Faculty 3"]
+
+    @pytest.mark.asyncio
+    async def test_stored_ids_count_rewritten_documents_once(self):
+        """A document dropped once but written by a later batch is reported once."""
+        writer = RecordingWriter(failures=1)
+        queue = WriteBehindQueue(writer, batch_size=1, flush_interval=5.0, max_retries=0)
+        await queue.start()
+        keys = [await queue.put("faculty", {"name": "Dr. Smith"}) for _ in range(2)]
+        await queue.close()
+
+        assert queue.get_stats()["documents_failed"] == 1
+        assert await queue.stored_ids("faculty", keys) == ["id-Dr. Smith"]